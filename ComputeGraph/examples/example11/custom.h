@@ -0,0 +1,8 @@
+#ifndef _CUSTOM_H_
+#define _CUSTOM_H_
+
+#include "arm_math.h"
+
+#define GAIN 0.5f
+
+#endif
@@ -0,0 +1,77 @@
+# Native execution of the scheduler from Python.
+#
+# The sources and the sink are implemented in Python and the
+# processing is done by CMSIS-DSP functions. The scheduler is built
+# twice with different flags : the CMSIS-DSP objects are not shared
+# between the two builds.
+#
+# CMSIS-DSP is found with the CMSISDSP environment variable or
+# with the development install of the cmsisdsp package.
+import os.path
+
+import numpy as np
+
+from cmsisdsp.cg.scheduler import *
+
+BLOCK = 64
+NBSCHEDULE = 20
+
+floatType=CType(F32)
+
+### Define nodes
+gain=Constant("GAIN")
+srcA=NativePythonSource("srcA",floatType,BLOCK)
+srcB=NativePythonSource("srcB",floatType,BLOCK)
+scale=Dsp("scale",floatType,BLOCK)
+add=Dsp("add",floatType,BLOCK)
+sink=NativePythonSink("sink",floatType,BLOCK)
+
+g = Graph()
+
+g.connect(srcA.o,scale.ia)
+g.connect(gain,scale.ib)
+g.connect(scale.o,add.ia)
+g.connect(srcB.o,add.ib)
+g.connect(add.o,sink.i)
+
+conf=Configuration()
+conf.debugLimit=NBSCHEDULE
+
+sched = g.computeSchedule(config=conf)
+print("Schedule length = %d" % sched.scheduleLength)
+print("Memory usage %d bytes" % sched.memory)
+
+rng = np.random.default_rng(0)
+a = rng.uniform(-1,1,(NBSCHEDULE,BLOCK)).astype(np.float32)
+b = rng.uniform(-1,1,(NBSCHEDULE,BLOCK)).astype(np.float32)
+ref = (0.5*a + b).reshape(-1)
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+def run(flags):
+    native = sched.nativecode(os.path.join(here,"native"),conf,
+                              includes=[here],flags=flags)
+    blocks = {"srcA":iter(a),"srcB":iter(b)}
+    res = []
+
+    def source(name):
+        def f(o):
+            o[:] = next(blocks[name])
+        return(f)
+
+    native.setNode("srcA",source("srcA"))
+    native.setNode("srcB",source("srcB"))
+    native.setNode("sink",lambda i:res.append(i.copy()))
+
+    nbSchedule,error = native()
+    res = np.concatenate(res)
+    print("%-14s : %d iterations, error %d, max error %g" %
+        (" ".join(flags),nbSchedule,error,np.max(np.abs(res-ref))))
+    assert error == 0
+    assert nbSchedule == NBSCHEDULE
+    np.testing.assert_allclose(res,ref,rtol=1e-6,atol=1e-6)
+
+run(["-O3"])
+run(["-O0","-g"])
+# The objects of the first build are reused
+run(["-O3"])
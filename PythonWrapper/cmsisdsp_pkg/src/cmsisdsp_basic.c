@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_basic"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_basic
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -104,7 +106,7 @@ cmsis_arm_recip_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_mult_q7(PyObject *obj, PyObject *args)
+cmsis_arm_mult_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -112,26 +114,31 @@ cmsis_arm_mult_q7(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q7_t *pSrcB_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_mult_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mult_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -140,7 +147,7 @@ cmsis_arm_mult_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_mult_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mult_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -148,26 +155,31 @@ cmsis_arm_mult_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q15_t *pSrcB_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_mult_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mult_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -176,7 +188,7 @@ cmsis_arm_mult_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_mult_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mult_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -184,26 +196,31 @@ cmsis_arm_mult_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q31_t *pSrcB_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_mult_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mult_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -212,7 +229,7 @@ cmsis_arm_mult_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_mult_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mult_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -220,26 +237,31 @@ cmsis_arm_mult_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_mult_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mult_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -247,7 +269,7 @@ cmsis_arm_mult_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_mult_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mult_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -255,26 +277,31 @@ cmsis_arm_mult_f64(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float64_t *pSrcB_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float64_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_mult_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mult_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -284,7 +311,7 @@ cmsis_arm_mult_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_add_f32(PyObject *obj, PyObject *args)
+cmsis_arm_add_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -292,26 +319,31 @@ cmsis_arm_add_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_add_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_add_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -319,7 +351,7 @@ cmsis_arm_add_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_add_f64(PyObject *obj, PyObject *args)
+cmsis_arm_add_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -327,26 +359,31 @@ cmsis_arm_add_f64(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float64_t *pSrcB_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float64_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-    arm_add_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_add_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -359,72 +396,82 @@ For the arm_(and|xor|or)_u(32|16|8)
 
 */
 
-#define U_UN_OP(OP,TYP,EXT,NPYTYPE)                     \
-static PyObject *                                       \
-cmsis_arm_##OP##_##EXT(PyObject *obj, PyObject *args)   \
-{                                                       \
-                                                        \
-  PyObject *pSrcA=NULL;                                 \
-  TYP *pSrcA_converted=NULL;                            \
-  TYP *pDst=NULL;                                       \
-  uint32_t blockSize;                                   \
-                                                        \
-  if (PyArg_ParseTuple(args,"O",&pSrcA))                \
-  {                                                     \
-                                                        \
-    GETARGUMENT(pSrcA,NPYTYPE,TYP,TYP);                 \
-    blockSize = arraySizepSrcA ;                        \
-                                                        \
-    pDst=PyMem_Malloc(sizeof(TYP)*blockSize);           \
-                                                        \
-                                                        \
-    arm_##OP##_##EXT(pSrcA_converted,pDst,blockSize);   \
- TYP_ARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);            \
-                                                        \
-    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);\
-                                                        \
-    FREEARGUMENT(pSrcA_converted);                      \
-    Py_DECREF(pDstOBJ);                                 \
-    return(pythonResult);                               \
-                                                        \
-  }                                                     \
-  return(NULL);                                         \
+#define U_UN_OP(OP,TYP,EXT,NPYTYPE)                                         \
+static PyObject *                                                           \
+cmsis_arm_##OP##_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)       \
+{                                                                           \
+                                                                            \
+  PyObject *pSrcA=NULL;                                                     \
+  TYP *pSrcA_converted=NULL;                                                \
+  TYP *pDst=NULL;                                                           \
+  PyObject *out=NULL;                                                       \
+  uint32_t blockSize;                                                       \
+                                                                            \
+  if (PyArg_ParseTuple(args,"O",&pSrcA) && parseOutKeyword(args,kwds,&out)) \
+  {                                                                         \
+                                                                            \
+    GETARGUMENT(pSrcA,NPYTYPE,TYP,TYP);                                     \
+    blockSize = arraySizepSrcA ;                                            \
+                                                                            \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                  \
+                                                                            \
+    if (pDst)                                                               \
+    {                                                                       \
+      Py_BEGIN_ALLOW_THREADS                                                \
+      arm_##OP##_##EXT(pSrcA_converted,pDst,blockSize);                     \
+      Py_END_ALLOW_THREADS                                                  \
+    }                                                                       \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                           \
+                                                                            \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                    \
+                                                                            \
+    FREEARGUMENT(pSrcA_converted);                                          \
+    Py_XDECREF(pDstOBJ);                                                    \
+    return(pythonResult);                                                   \
+                                                                            \
+  }                                                                         \
+  return(NULL);                                                             \
 }
 
-#define U_BIN_OP(OP,TYP,EXT,NPYTYPE)                                 \
-static PyObject *                                                    \
-cmsis_arm_##OP##_##EXT(PyObject *obj, PyObject *args)                \
-{                                                                    \
-                                                                     \
-  PyObject *pSrcA=NULL;                                              \
-  TYP *pSrcA_converted=NULL;                                         \
-  PyObject *pSrcB=NULL;                                              \
-  TYP *pSrcB_converted=NULL;                                         \
-  TYP *pDst=NULL;                                                    \
-  uint32_t blockSize;                                                \
-                                                                     \
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))                     \
-  {                                                                  \
-                                                                     \
-    GETARGUMENT(pSrcA,NPYTYPE,TYP,TYP);                              \
-    GETARGUMENT(pSrcB,NPYTYPE,TYP,TYP);                              \
-    blockSize = arraySizepSrcA ;                                     \
-                                                                     \
-    pDst=PyMem_Malloc(sizeof(TYP)*blockSize);                        \
-                                                                     \
-                                                                     \
-    arm_##OP##_##EXT(pSrcA_converted,pSrcB_converted,pDst,blockSize);\
- TYP_ARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                         \
-                                                                     \
-    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);             \
-                                                                     \
-    FREEARGUMENT(pSrcA_converted);                                   \
-    FREEARGUMENT(pSrcB_converted);                                   \
-    Py_DECREF(pDstOBJ);                                              \
-    return(pythonResult);                                            \
-                                                                     \
-  }                                                                  \
-  return(NULL);                                                      \
+#define U_BIN_OP(OP,TYP,EXT,NPYTYPE)                                                \
+static PyObject *                                                                   \
+cmsis_arm_##OP##_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)               \
+{                                                                                   \
+                                                                                    \
+  PyObject *pSrcA=NULL;                                                             \
+  TYP *pSrcA_converted=NULL;                                                        \
+  PyObject *pSrcB=NULL;                                                             \
+  TYP *pSrcB_converted=NULL;                                                        \
+  TYP *pDst=NULL;                                                                   \
+  PyObject *out=NULL;                                                               \
+  uint32_t blockSize;                                                               \
+                                                                                    \
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out)) \
+  {                                                                                 \
+                                                                                    \
+    GETARGUMENT(pSrcA,NPYTYPE,TYP,TYP);                                             \
+    GETARGUMENT(pSrcB,NPYTYPE,TYP,TYP);                                             \
+    blockSize = arraySizepSrcA ;                                                    \
+                                                                                    \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                          \
+                                                                                    \
+    if (pDst)                                                                       \
+    {                                                                               \
+      Py_BEGIN_ALLOW_THREADS                                                        \
+      arm_##OP##_##EXT(pSrcA_converted,pSrcB_converted,pDst,blockSize);             \
+      Py_END_ALLOW_THREADS                                                          \
+    }                                                                               \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                                   \
+                                                                                    \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                            \
+                                                                                    \
+    FREEARGUMENT(pSrcA_converted);                                                  \
+    FREEARGUMENT(pSrcB_converted);                                                  \
+    Py_XDECREF(pDstOBJ);                                                            \
+    return(pythonResult);                                                           \
+                                                                                    \
+  }                                                                                 \
+  return(NULL);                                                                     \
 }
 
 U_BIN_OP(and,uint32_t,u32,NPY_UINT32);
@@ -444,7 +491,7 @@ U_UN_OP(not,uint16_t,u16,NPY_UINT16);
 U_UN_OP(not,uint8_t,u8,NPY_UINT8);
 
 static PyObject *
-cmsis_arm_add_q7(PyObject *obj, PyObject *args)
+cmsis_arm_add_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -452,26 +499,31 @@ cmsis_arm_add_q7(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q7_t *pSrcB_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_add_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_add_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -480,7 +532,7 @@ cmsis_arm_add_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_add_q15(PyObject *obj, PyObject *args)
+cmsis_arm_add_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -488,26 +540,31 @@ cmsis_arm_add_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q15_t *pSrcB_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_add_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_add_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -516,7 +573,7 @@ cmsis_arm_add_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_add_q31(PyObject *obj, PyObject *args)
+cmsis_arm_add_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -524,26 +581,31 @@ cmsis_arm_add_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q31_t *pSrcB_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_add_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_add_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -552,7 +614,7 @@ cmsis_arm_add_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_sub_f32(PyObject *obj, PyObject *args)
+cmsis_arm_sub_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -560,26 +622,31 @@ cmsis_arm_sub_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_sub_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sub_f32(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -587,7 +654,7 @@ cmsis_arm_sub_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_sub_f64(PyObject *obj, PyObject *args)
+cmsis_arm_sub_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -595,26 +662,31 @@ cmsis_arm_sub_f64(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float64_t *pSrcB_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float64_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-    arm_sub_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sub_f64(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -623,7 +695,7 @@ cmsis_arm_sub_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_sub_q7(PyObject *obj, PyObject *args)
+cmsis_arm_sub_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -631,26 +703,31 @@ cmsis_arm_sub_q7(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q7_t *pSrcB_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_sub_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sub_q7(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -659,7 +736,7 @@ cmsis_arm_sub_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_sub_q15(PyObject *obj, PyObject *args)
+cmsis_arm_sub_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -667,26 +744,31 @@ cmsis_arm_sub_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q15_t *pSrcB_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_sub_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sub_q15(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -695,7 +777,7 @@ cmsis_arm_sub_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_sub_q31(PyObject *obj, PyObject *args)
+cmsis_arm_sub_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -703,26 +785,31 @@ cmsis_arm_sub_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q31_t *pSrcB_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrcA ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_sub_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sub_q31(pSrcA_converted,pSrcB_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -731,31 +818,36 @@ cmsis_arm_sub_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_scale_f32(PyObject *obj, PyObject *args)
+cmsis_arm_scale_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t scale; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Of",&pSrc,&scale))
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&scale) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_scale_f32(pSrc_converted,scale,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_scale_f32(pSrc_converted,scale,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -763,31 +855,36 @@ cmsis_arm_scale_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_scale_f64(PyObject *obj, PyObject *args)
+cmsis_arm_scale_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t scale; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Od",&pSrc,&scale))
+  if (PyArg_ParseTuple(args,"Od",&pSrc,&scale) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_scale_f64(pSrc_converted,scale,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_scale_f64(pSrc_converted,scale,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -796,7 +893,7 @@ cmsis_arm_scale_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_scale_q7(PyObject *obj, PyObject *args)
+cmsis_arm_scale_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
@@ -804,24 +901,29 @@ cmsis_arm_scale_q7(PyObject *obj, PyObject *args)
   int32_t scaleFract; // input
   int32_t shift; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift))
+  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_scale_q7(pSrc_converted,(q7_t)scaleFract,(int8_t)shift,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_scale_q7(pSrc_converted,(q7_t)scaleFract,(int8_t)shift,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -830,7 +932,7 @@ cmsis_arm_scale_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_scale_q15(PyObject *obj, PyObject *args)
+cmsis_arm_scale_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
@@ -838,24 +940,29 @@ cmsis_arm_scale_q15(PyObject *obj, PyObject *args)
   q15_t scaleFract; // input
   int32_t shift; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Ohi",&pSrc,&scaleFract,&shift))
+  if (PyArg_ParseTuple(args,"Ohi",&pSrc,&scaleFract,&shift) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_scale_q15(pSrc_converted,scaleFract,(int8_t)shift,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_scale_q15(pSrc_converted,scaleFract,(int8_t)shift,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -864,7 +971,7 @@ cmsis_arm_scale_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_scale_q31(PyObject *obj, PyObject *args)
+cmsis_arm_scale_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
@@ -872,24 +979,29 @@ cmsis_arm_scale_q31(PyObject *obj, PyObject *args)
   q31_t scaleFract; // input
   int32_t shift; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift))
+  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_scale_q31(pSrc_converted,scaleFract,(int8_t)shift,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_scale_q31(pSrc_converted,scaleFract,(int8_t)shift,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -898,30 +1010,35 @@ cmsis_arm_scale_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_abs_q7(PyObject *obj, PyObject *args)
+cmsis_arm_abs_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_abs_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_abs_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -930,30 +1047,35 @@ cmsis_arm_abs_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_abs_f32(PyObject *obj, PyObject *args)
+cmsis_arm_abs_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_abs_f32(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_abs_f32(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -961,30 +1083,35 @@ cmsis_arm_abs_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_abs_f64(PyObject *obj, PyObject *args)
+cmsis_arm_abs_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_abs_f64(pSrc_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_abs_f64(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -993,30 +1120,35 @@ cmsis_arm_abs_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_abs_q15(PyObject *obj, PyObject *args)
+cmsis_arm_abs_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_abs_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_abs_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1025,30 +1157,35 @@ cmsis_arm_abs_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_abs_q31(PyObject *obj, PyObject *args)
+cmsis_arm_abs_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_abs_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_abs_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1079,7 +1216,9 @@ cmsis_arm_dot_prod_f32(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_dot_prod_f32(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("f",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -1113,7 +1252,9 @@ cmsis_arm_dot_prod_f64(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_dot_prod_f64(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("d",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -1148,7 +1289,9 @@ cmsis_arm_dot_prod_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_dot_prod_q7(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("i",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -1183,7 +1326,9 @@ cmsis_arm_dot_prod_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_dot_prod_q15(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("L",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -1218,7 +1363,9 @@ cmsis_arm_dot_prod_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_dot_prod_q31(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("L",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -1234,31 +1381,36 @@ cmsis_arm_dot_prod_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_shift_q7(PyObject *obj, PyObject *args)
+cmsis_arm_shift_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   int32_t shiftBits; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits))
+  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_shift_q7(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_shift_q7(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1267,31 +1419,36 @@ cmsis_arm_shift_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_shift_q15(PyObject *obj, PyObject *args)
+cmsis_arm_shift_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   int32_t shiftBits; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits))
+  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_shift_q15(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_shift_q15(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1300,31 +1457,36 @@ cmsis_arm_shift_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_shift_q31(PyObject *obj, PyObject *args)
+cmsis_arm_shift_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   int32_t shiftBits; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits))
+  if (PyArg_ParseTuple(args,"Oi",&pSrc,&shiftBits) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_shift_q31(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_shift_q31(pSrc_converted,(int8_t)shiftBits,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1332,31 +1494,36 @@ cmsis_arm_shift_q31(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_clip_f32(PyObject *obj, PyObject *args)
+cmsis_arm_clip_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t low,high; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Off",&pSrc,&low,&high))
+  if (PyArg_ParseTuple(args,"Off",&pSrc,&low,&high) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_clip_f32(pSrc_converted,pDst,low,high,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_clip_f32(pSrc_converted,pDst,low,high,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1364,31 +1531,36 @@ cmsis_arm_clip_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_clip_q31(PyObject *obj, PyObject *args)
+cmsis_arm_clip_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t low,high; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oii",&pSrc,&low,&high))
+  if (PyArg_ParseTuple(args,"Oii",&pSrc,&low,&high) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_clip_q31(pSrc_converted,pDst,low,high,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_clip_q31(pSrc_converted,pDst,low,high,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1397,31 +1569,36 @@ cmsis_arm_clip_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_clip_q15(PyObject *obj, PyObject *args)
+cmsis_arm_clip_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t low,high; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Ohh",&pSrc,&low,&high))
+  if (PyArg_ParseTuple(args,"Ohh",&pSrc,&low,&high) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_clip_q15(pSrc_converted,pDst,low,high,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_clip_q15(pSrc_converted,pDst,low,high,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1429,31 +1606,36 @@ cmsis_arm_clip_q15(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_clip_q7(PyObject *obj, PyObject *args)
+cmsis_arm_clip_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   int32_t low,high; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oii",&pSrc,&low,&high))
+  if (PyArg_ParseTuple(args,"Oii",&pSrc,&low,&high) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_clip_q7(pSrc_converted,pDst,(q7_t)low,(q7_t)high,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_clip_q7(pSrc_converted,pDst,(q7_t)low,(q7_t)high,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1462,31 +1644,36 @@ cmsis_arm_clip_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_offset_f32(PyObject *obj, PyObject *args)
+cmsis_arm_offset_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t offset; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Of",&pSrc,&offset))
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&offset) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_offset_f32(pSrc_converted,offset,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_offset_f32(pSrc_converted,offset,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1494,31 +1681,36 @@ cmsis_arm_offset_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_offset_f64(PyObject *obj, PyObject *args)
+cmsis_arm_offset_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t offset; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Od",&pSrc,&offset))
+  if (PyArg_ParseTuple(args,"Od",&pSrc,&offset) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_offset_f64(pSrc_converted,offset,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_offset_f64(pSrc_converted,offset,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1527,31 +1719,36 @@ cmsis_arm_offset_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_offset_q7(PyObject *obj, PyObject *args)
+cmsis_arm_offset_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   int32_t offset; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pSrc,&offset))
+  if (PyArg_ParseTuple(args,"Oi",&pSrc,&offset) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_offset_q7(pSrc_converted,(q7_t)offset,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_offset_q7(pSrc_converted,(q7_t)offset,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1560,31 +1757,36 @@ cmsis_arm_offset_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_offset_q15(PyObject *obj, PyObject *args)
+cmsis_arm_offset_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t offset; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oh",&pSrc,&offset))
+  if (PyArg_ParseTuple(args,"Oh",&pSrc,&offset) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_offset_q15(pSrc_converted,offset,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_offset_q15(pSrc_converted,offset,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1593,31 +1795,36 @@ cmsis_arm_offset_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_offset_q31(PyObject *obj, PyObject *args)
+cmsis_arm_offset_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t offset; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pSrc,&offset))
+  if (PyArg_ParseTuple(args,"Oi",&pSrc,&offset) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_offset_q31(pSrc_converted,offset,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_offset_q31(pSrc_converted,offset,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1626,30 +1833,35 @@ cmsis_arm_offset_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_negate_f32(PyObject *obj, PyObject *args)
+cmsis_arm_negate_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_negate_f32(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_negate_f32(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1657,30 +1869,35 @@ cmsis_arm_negate_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_negate_f64(PyObject *obj, PyObject *args)
+cmsis_arm_negate_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_negate_f64(pSrc_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_negate_f64(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1688,30 +1905,35 @@ cmsis_arm_negate_f64(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_negate_q7(PyObject *obj, PyObject *args)
+cmsis_arm_negate_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_negate_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_negate_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1720,30 +1942,35 @@ cmsis_arm_negate_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_negate_q15(PyObject *obj, PyObject *args)
+cmsis_arm_negate_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_negate_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_negate_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1752,30 +1979,35 @@ cmsis_arm_negate_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_negate_q31(PyObject *obj, PyObject *args)
+cmsis_arm_negate_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_negate_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_negate_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -1841,6 +2073,212 @@ cmsis_clz(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+f16 functions : the arguments are converted to np.float16 and
+the results are np.float16 arrays.
+
+*/
+#define F16_BIN_OP(OP)                                                          \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args, PyObject *kwds)             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrcA=NULL;                                                         \
+  float16_t *pSrcA_converted=NULL;                                              \
+  PyObject *pSrcB=NULL;                                                         \
+  float16_t *pSrcB_converted=NULL;                                              \
+  float16_t *pDst=NULL;                                                         \
+  PyObject *out=NULL;                                                           \
+  uint32_t blockSize;                                                           \
+                                                                                \
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))  \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrcA,NPY_HALF,float16_t,float16_t);                            \
+    GETARGUMENT(pSrcB,NPY_HALF,float16_t,float16_t);                            \
+    blockSize = arraySizepSrcA ;                                                \
+                                                                                \
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);                               \
+                                                                                \
+    if (pDst)                                                                   \
+    {                                                                           \
+      Py_BEGIN_ALLOW_THREADS                                                    \
+      arm_##OP##_f16(pSrcA_converted,pSrcB_converted,pDst,blockSize);           \
+      Py_END_ALLOW_THREADS                                                      \
+    }                                                                           \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);                              \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                        \
+                                                                                \
+    FREEARGUMENT(pSrcA_converted);                                              \
+    FREEARGUMENT(pSrcB_converted);                                              \
+    Py_XDECREF(pDstOBJ);                                                        \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+#define F16_UN_OP(OP)                                                           \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args, PyObject *kwds)             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  float16_t *pSrc_converted=NULL;                                               \
+  float16_t *pDst=NULL;                                                         \
+  PyObject *out=NULL;                                                           \
+  uint32_t blockSize;                                                           \
+                                                                                \
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))           \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);                             \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);                               \
+                                                                                \
+    if (pDst)                                                                   \
+    {                                                                           \
+      Py_BEGIN_ALLOW_THREADS                                                    \
+      arm_##OP##_f16(pSrc_converted,pDst,blockSize);                            \
+      Py_END_ALLOW_THREADS                                                      \
+    }                                                                           \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);                              \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                        \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_XDECREF(pDstOBJ);                                                        \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+/* Functions with a scalar argument like arm_scale_f16 */
+#define F16_SCALAR_OP(OP)                                                       \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args, PyObject *kwds)             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  float16_t *pSrc_converted=NULL;                                               \
+  float32_t value;                                                              \
+  float16_t *pDst=NULL;                                                         \
+  PyObject *out=NULL;                                                           \
+  uint32_t blockSize;                                                           \
+                                                                                \
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&value) && parseOutKeyword(args,kwds,&out))   \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);                             \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);                               \
+                                                                                \
+    if (pDst)                                                                   \
+    {                                                                           \
+      Py_BEGIN_ALLOW_THREADS                                                    \
+      arm_##OP##_f16(pSrc_converted,(float16_t)value,pDst,blockSize);           \
+      Py_END_ALLOW_THREADS                                                      \
+    }                                                                           \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);                              \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                        \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_XDECREF(pDstOBJ);                                                        \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+F16_BIN_OP(add);
+F16_BIN_OP(sub);
+F16_BIN_OP(mult);
+F16_UN_OP(abs);
+F16_UN_OP(negate);
+F16_SCALAR_OP(scale);
+F16_SCALAR_OP(offset);
+
+static PyObject *
+cmsis_arm_clip_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *pSrc=NULL; // input
+  float16_t *pSrc_converted=NULL; // input
+  float32_t low,high; // input
+  float16_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t blockSize; // input
+
+  if (PyArg_ParseTuple(args,"Off",&pSrc,&low,&high) && parseOutKeyword(args,kwds,&out))
+  {
+
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrc ;
+
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_clip_f16(pSrc_converted,pDst,(float16_t)low,(float16_t)high,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_dot_prod_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *pSrcA=NULL; // input
+  float16_t *pSrcA_converted=NULL; // input
+  PyObject *pSrcB=NULL; // input
+  float16_t *pSrcB_converted=NULL; // input
+  uint32_t blockSize; // input
+  float16_t result; // output
+
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  {
+
+    GETARGUMENT(pSrcA,NPY_HALF,float16_t,float16_t);
+    GETARGUMENT(pSrcB,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrcA ;
+
+    Py_BEGIN_ALLOW_THREADS
+    arm_dot_prod_f16(pSrcA_converted,pSrcB_converted,blockSize,&result);
+    Py_END_ALLOW_THREADS
+    PyObject* resultOBJ=Py_BuildValue("f",(double)result);
+
+    PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
+
+    FREEARGUMENT(pSrcA_converted);
+    FREEARGUMENT(pSrcB_converted);
+    Py_DECREF(resultOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 {"arm_recip_q31",  cmsis_arm_recip_q31, METH_VARARGS,""},
@@ -1849,81 +2287,92 @@ static PyMethodDef CMSISDSPMethods[] = {
 
 
 
-{"arm_mult_q7",  cmsis_arm_mult_q7, METH_VARARGS,""},
-{"arm_mult_q15",  cmsis_arm_mult_q15, METH_VARARGS,""},
-{"arm_mult_q31",  cmsis_arm_mult_q31, METH_VARARGS,""},
-{"arm_mult_f32",  cmsis_arm_mult_f32, METH_VARARGS,""},
-{"arm_mult_f64",  cmsis_arm_mult_f64, METH_VARARGS,""},
-
-
-{"arm_add_f32",  cmsis_arm_add_f32, METH_VARARGS,""},
-{"arm_add_f64",  cmsis_arm_add_f64, METH_VARARGS,""},
-{"arm_add_q7",  cmsis_arm_add_q7, METH_VARARGS,""},
-{"arm_add_q15",  cmsis_arm_add_q15, METH_VARARGS,""},
-{"arm_add_q31",  cmsis_arm_add_q31, METH_VARARGS,""},
-{"arm_sub_f32",  cmsis_arm_sub_f32, METH_VARARGS,""},
-{"arm_sub_f64",  cmsis_arm_sub_f64, METH_VARARGS,""},
-
-{"arm_sub_q7",  cmsis_arm_sub_q7, METH_VARARGS,""},
-{"arm_sub_q15",  cmsis_arm_sub_q15, METH_VARARGS,""},
-{"arm_sub_q31",  cmsis_arm_sub_q31, METH_VARARGS,""},
-{"arm_scale_f32",  cmsis_arm_scale_f32, METH_VARARGS,""},
-{"arm_scale_f64",  cmsis_arm_scale_f64, METH_VARARGS,""},
-{"arm_scale_q7",  cmsis_arm_scale_q7, METH_VARARGS,""},
-{"arm_scale_q15",  cmsis_arm_scale_q15, METH_VARARGS,""},
-{"arm_scale_q31",  cmsis_arm_scale_q31, METH_VARARGS,""},
-{"arm_abs_q7",  cmsis_arm_abs_q7, METH_VARARGS,""},
-{"arm_abs_f32",  cmsis_arm_abs_f32, METH_VARARGS,""},
-{"arm_abs_f64",  cmsis_arm_abs_f64, METH_VARARGS,""},
-{"arm_abs_q15",  cmsis_arm_abs_q15, METH_VARARGS,""},
-{"arm_abs_q31",  cmsis_arm_abs_q31, METH_VARARGS,""},
+{"arm_mult_q7",  (PyCFunction)(void(*)(void))cmsis_arm_mult_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mult_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mult_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mult_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mult_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mult_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mult_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mult_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mult_f64, METH_VARARGS | METH_KEYWORDS,""},
+
+
+{"arm_add_f32",  (PyCFunction)(void(*)(void))cmsis_arm_add_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_add_f64",  (PyCFunction)(void(*)(void))cmsis_arm_add_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_add_q7",  (PyCFunction)(void(*)(void))cmsis_arm_add_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_add_q15",  (PyCFunction)(void(*)(void))cmsis_arm_add_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_add_q31",  (PyCFunction)(void(*)(void))cmsis_arm_add_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sub_f32",  (PyCFunction)(void(*)(void))cmsis_arm_sub_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sub_f64",  (PyCFunction)(void(*)(void))cmsis_arm_sub_f64, METH_VARARGS | METH_KEYWORDS,""},
+
+{"arm_sub_q7",  (PyCFunction)(void(*)(void))cmsis_arm_sub_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sub_q15",  (PyCFunction)(void(*)(void))cmsis_arm_sub_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sub_q31",  (PyCFunction)(void(*)(void))cmsis_arm_sub_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_f32",  (PyCFunction)(void(*)(void))cmsis_arm_scale_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_f64",  (PyCFunction)(void(*)(void))cmsis_arm_scale_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_q7",  (PyCFunction)(void(*)(void))cmsis_arm_scale_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_q15",  (PyCFunction)(void(*)(void))cmsis_arm_scale_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_q31",  (PyCFunction)(void(*)(void))cmsis_arm_scale_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_q7",  (PyCFunction)(void(*)(void))cmsis_arm_abs_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_f32",  (PyCFunction)(void(*)(void))cmsis_arm_abs_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_f64",  (PyCFunction)(void(*)(void))cmsis_arm_abs_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_q15",  (PyCFunction)(void(*)(void))cmsis_arm_abs_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_q31",  (PyCFunction)(void(*)(void))cmsis_arm_abs_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_dot_prod_f32",  cmsis_arm_dot_prod_f32, METH_VARARGS,""},
 {"arm_dot_prod_f64",  cmsis_arm_dot_prod_f64, METH_VARARGS,""},
 
 {"arm_dot_prod_q7",  cmsis_arm_dot_prod_q7, METH_VARARGS,""},
 {"arm_dot_prod_q15",  cmsis_arm_dot_prod_q15, METH_VARARGS,""},
 {"arm_dot_prod_q31",  cmsis_arm_dot_prod_q31, METH_VARARGS,""},
-{"arm_shift_q7",  cmsis_arm_shift_q7, METH_VARARGS,""},
-{"arm_shift_q15",  cmsis_arm_shift_q15, METH_VARARGS,""},
-{"arm_shift_q31",  cmsis_arm_shift_q31, METH_VARARGS,""},
-{"arm_clip_f32",  cmsis_arm_clip_f32, METH_VARARGS,""},
-{"arm_clip_q31",  cmsis_arm_clip_q31, METH_VARARGS,""},
-{"arm_clip_q15",  cmsis_arm_clip_q15, METH_VARARGS,""},
-{"arm_clip_q7",  cmsis_arm_clip_q7, METH_VARARGS,""},
-{"arm_offset_f32",  cmsis_arm_offset_f32, METH_VARARGS,""},
-{"arm_offset_f64",  cmsis_arm_offset_f64, METH_VARARGS,""},
+{"arm_shift_q7",  (PyCFunction)(void(*)(void))cmsis_arm_shift_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_shift_q15",  (PyCFunction)(void(*)(void))cmsis_arm_shift_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_shift_q31",  (PyCFunction)(void(*)(void))cmsis_arm_shift_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_clip_f32",  (PyCFunction)(void(*)(void))cmsis_arm_clip_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_clip_q31",  (PyCFunction)(void(*)(void))cmsis_arm_clip_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_clip_q15",  (PyCFunction)(void(*)(void))cmsis_arm_clip_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_clip_q7",  (PyCFunction)(void(*)(void))cmsis_arm_clip_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_offset_f32",  (PyCFunction)(void(*)(void))cmsis_arm_offset_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_offset_f64",  (PyCFunction)(void(*)(void))cmsis_arm_offset_f64, METH_VARARGS | METH_KEYWORDS,""},
 
-{"arm_offset_q7",  cmsis_arm_offset_q7, METH_VARARGS,""},
-{"arm_offset_q15",  cmsis_arm_offset_q15, METH_VARARGS,""},
-{"arm_offset_q31",  cmsis_arm_offset_q31, METH_VARARGS,""},
-{"arm_negate_f32",  cmsis_arm_negate_f32, METH_VARARGS,""},
-{"arm_negate_f64",  cmsis_arm_negate_f64, METH_VARARGS,""},
-{"arm_negate_q7",  cmsis_arm_negate_q7, METH_VARARGS,""},
-{"arm_negate_q15",  cmsis_arm_negate_q15, METH_VARARGS,""},
-{"arm_negate_q31",  cmsis_arm_negate_q31, METH_VARARGS,""},
+{"arm_offset_q7",  (PyCFunction)(void(*)(void))cmsis_arm_offset_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_offset_q15",  (PyCFunction)(void(*)(void))cmsis_arm_offset_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_offset_q31",  (PyCFunction)(void(*)(void))cmsis_arm_offset_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_f32",  (PyCFunction)(void(*)(void))cmsis_arm_negate_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_f64",  (PyCFunction)(void(*)(void))cmsis_arm_negate_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_q7",  (PyCFunction)(void(*)(void))cmsis_arm_negate_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_q15",  (PyCFunction)(void(*)(void))cmsis_arm_negate_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_q31",  (PyCFunction)(void(*)(void))cmsis_arm_negate_q31, METH_VARARGS | METH_KEYWORDS,""},
 
 
 
 
 
 
-{"arm_and_u32",  cmsis_arm_and_u32, METH_VARARGS,""},
-{"arm_and_u16",  cmsis_arm_and_u16, METH_VARARGS,""},
-{"arm_and_u8" ,  cmsis_arm_and_u8, METH_VARARGS,""},
+{"arm_and_u32",  (PyCFunction)(void(*)(void))cmsis_arm_and_u32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_and_u16",  (PyCFunction)(void(*)(void))cmsis_arm_and_u16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_and_u8" ,  (PyCFunction)(void(*)(void))cmsis_arm_and_u8, METH_VARARGS | METH_KEYWORDS,""},
 
-{"arm_or_u32",  cmsis_arm_or_u32, METH_VARARGS,""},
-{"arm_or_u16",  cmsis_arm_or_u16, METH_VARARGS,""},
-{"arm_or_u8" ,  cmsis_arm_or_u8, METH_VARARGS,""},
+{"arm_or_u32",  (PyCFunction)(void(*)(void))cmsis_arm_or_u32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_or_u16",  (PyCFunction)(void(*)(void))cmsis_arm_or_u16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_or_u8" ,  (PyCFunction)(void(*)(void))cmsis_arm_or_u8, METH_VARARGS | METH_KEYWORDS,""},
 
-{"arm_xor_u32",  cmsis_arm_xor_u32, METH_VARARGS,""},
-{"arm_xor_u16",  cmsis_arm_xor_u16, METH_VARARGS,""},
-{"arm_xor_u8" ,  cmsis_arm_xor_u8, METH_VARARGS,""},
+{"arm_xor_u32",  (PyCFunction)(void(*)(void))cmsis_arm_xor_u32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_xor_u16",  (PyCFunction)(void(*)(void))cmsis_arm_xor_u16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_xor_u8" ,  (PyCFunction)(void(*)(void))cmsis_arm_xor_u8, METH_VARARGS | METH_KEYWORDS,""},
 
-{"arm_not_u32",  cmsis_arm_not_u32, METH_VARARGS,""},
-{"arm_not_u16",  cmsis_arm_not_u16, METH_VARARGS,""},
-{"arm_not_u8" ,  cmsis_arm_not_u8, METH_VARARGS,""},
+{"arm_not_u32",  (PyCFunction)(void(*)(void))cmsis_arm_not_u32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_not_u16",  (PyCFunction)(void(*)(void))cmsis_arm_not_u16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_not_u8" ,  (PyCFunction)(void(*)(void))cmsis_arm_not_u8, METH_VARARGS | METH_KEYWORDS,""},
 
    
+#if defined(ARM_FLOAT16_SUPPORTED)
+{"arm_add_f16",  (PyCFunction)(void(*)(void))cmsis_arm_add_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sub_f16",  (PyCFunction)(void(*)(void))cmsis_arm_sub_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mult_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mult_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_abs_f16",  (PyCFunction)(void(*)(void))cmsis_arm_abs_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_negate_f16",  (PyCFunction)(void(*)(void))cmsis_arm_negate_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_scale_f16",  (PyCFunction)(void(*)(void))cmsis_arm_scale_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_offset_f16",  (PyCFunction)(void(*)(void))cmsis_arm_offset_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_clip_f16",  (PyCFunction)(void(*)(void))cmsis_arm_clip_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_dot_prod_f16",  cmsis_arm_dot_prod_f16, METH_VARARGS,""},
+#endif
     {"ssat",  cmsis_ssat, METH_VARARGS,""},
     {"usat",  cmsis_usat, METH_VARARGS,""},
     {"clz",  cmsis_clz, METH_VARARGS,""},
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_bayes"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_bayes
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -181,7 +183,10 @@ cmsis_arm_gaussian_naive_bayes_predict_f32(PyObject *obj, PyObject *args)
     float32_t *temp=PyMem_Malloc(sizeof(float32_t)*nbClasses);
 
 
-    uint32_t res=arm_gaussian_naive_bayes_predict_f32(selfS->instance,pSrc_converted,pDst,temp);
+    uint32_t res;
+    Py_BEGIN_ALLOW_THREADS
+    res=arm_gaussian_naive_bayes_predict_f32(selfS->instance,pSrc_converted,pDst,temp);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,nbClasses,pDst);
 
     PyObject *pythonResult = Py_BuildValue("Ok",pDstOBJ,res);
@@ -197,11 +202,95 @@ cmsis_arm_gaussian_naive_bayes_predict_f32(PyObject *obj, PyObject *args)
 
 
 
+/*
+
+Prediction of all the rows of a 2D array (one feature vector per row).
+It returns the class probabilities (one row per feature vector)
+and the labels. The temporary buffer is allocated once for all
+the rows.
+
+*/
+static PyObject *
+cmsis_arm_gaussian_naive_bayes_predict_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *frames=NULL; // input
+  float32_t *frames_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  int32_t *pLabels=NULL; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"OO",&S,&frames) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_gaussian_naive_bayes_instance_f32Object *selfS = (dsp_arm_gaussian_naive_bayes_instance_f32Object *)S;
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);
+    uint32_t nbFrames = nbRowsframes;
+    uint32_t vectorDimension = selfS->instance->vectorDimension;
+    uint32_t nbClasses = selfS->instance->numberOfClasses;
+
+    if (!checkFrameLength(frames_converted,nbColsframes,vectorDimension))
+    {
+       FREEARGUMENT(frames_converted);
+       return(NULL);
+    }
+
+    /* out= is the array of probabilities */
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbFrames,nbClasses);
+
+    if (pDst)
+    {
+      float32_t *pIn = frames_converted;
+      float32_t *pOut = pDst;
+      float32_t *temp = PyMem_Malloc(sizeof(float32_t)*nbClasses);
+      pLabels = PyMem_Malloc(sizeof(int32_t)*nbFrames);
+
+      if ((temp == NULL) || (pLabels == NULL))
+      {
+        PyMem_Free(temp);
+        PyMem_Free(pLabels);
+        FREEOUTPUT(pDst);
+        FREEARGUMENT(frames_converted);
+        return(PyErr_NoMemory());
+      }
+
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < nbFrames; i++)
+      {
+        pLabels[i]=arm_gaussian_naive_bayes_predict_f32(selfS->instance,pIn,pOut,temp);
+        pIn += vectorDimension;
+        pOut += nbClasses;
+      }
+      Py_END_ALLOW_THREADS
+
+      PyMem_Free(temp);
+    }
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,nbClasses,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = NULL;
+    if (pDstOBJ)
+    {
+      INT32ARRAY1(pLabelsOBJ,nbFrames,pLabels);
+      pythonResult = Py_BuildValue("OO",pDstOBJ,pLabelsOBJ);
+      Py_DECREF(pLabelsOBJ);
+    }
+
+    FREEARGUMENT(frames_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
 
 {"arm_gaussian_naive_bayes_predict_f32",  cmsis_arm_gaussian_naive_bayes_predict_f32, METH_VARARGS,""},
+{"arm_gaussian_naive_bayes_predict_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_gaussian_naive_bayes_predict_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 
 
 
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_complexf"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_complexf
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -51,31 +53,36 @@ void typeRegistration(PyObject *module) {
 
 
 static PyObject *
-cmsis_arm_cmplx_conj_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_conj_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*2*numSamples);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,2*numSamples);
 
-    arm_cmplx_conj_f32(pSrc_converted,pDst,numSamples);
- FLOATARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_conj_f32(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -84,31 +91,36 @@ cmsis_arm_cmplx_conj_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_conj_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_conj_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,2*numSamples);
 
-    arm_cmplx_conj_q31(pSrc_converted,pDst,numSamples);
- INT32ARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_conj_q31(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -117,31 +129,36 @@ cmsis_arm_cmplx_conj_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_conj_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_conj_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,2*numSamples);
 
-
-    arm_cmplx_conj_q15(pSrc_converted,pDst,numSamples);
- INT16ARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_conj_q15(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -150,31 +167,36 @@ cmsis_arm_cmplx_conj_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_squared_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_squared_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*2*numSamples);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,numSamples);
 
-    arm_cmplx_mag_squared_f32(pSrc_converted,pDst,numSamples);
- FLOATARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_squared_f32(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -182,31 +204,36 @@ cmsis_arm_cmplx_mag_squared_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_cmplx_mag_squared_f64(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_squared_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*2*numSamples);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,numSamples);
 
-    arm_cmplx_mag_squared_f64(pSrc_converted,pDst,numSamples);
- FLOAT64ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_squared_f64(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -215,31 +242,36 @@ cmsis_arm_cmplx_mag_squared_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_squared_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_squared_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*2*numSamples);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,numSamples);
 
-
-    arm_cmplx_mag_squared_q31(pSrc_converted,pDst,numSamples);
- INT32ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_squared_q31(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -248,31 +280,36 @@ cmsis_arm_cmplx_mag_squared_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_squared_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_squared_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,numSamples);
 
-    arm_cmplx_mag_squared_q15(pSrc_converted,pDst,numSamples);
- INT16ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_squared_q15(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -286,31 +323,36 @@ cmsis_arm_cmplx_mag_squared_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*2*numSamples);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,numSamples);
 
-    arm_cmplx_mag_f32(pSrc_converted,pDst,numSamples);
- FLOATARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_f32(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -318,31 +360,36 @@ cmsis_arm_cmplx_mag_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_cmplx_mag_f64(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*2*numSamples);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,numSamples);
 
-
-    arm_cmplx_mag_f64(pSrc_converted,pDst,numSamples);
- FLOAT64ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_f64(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -351,31 +398,36 @@ cmsis_arm_cmplx_mag_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,numSamples);
 
-    arm_cmplx_mag_q31(pSrc_converted,pDst,numSamples);
- INT32ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_q31(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -384,31 +436,36 @@ cmsis_arm_cmplx_mag_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mag_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,numSamples);
 
-    arm_cmplx_mag_q15(pSrc_converted,pDst,numSamples);
- INT16ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_q15(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -416,31 +473,36 @@ cmsis_arm_cmplx_mag_q15(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_cmplx_mag_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mag_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     numSamples = arraySizepSrc ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,numSamples);
 
-
-    arm_cmplx_mag_fast_q15(pSrc_converted,pDst,numSamples);
- INT16ARRAY1(pDstOBJ,numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mag_fast_q15(pSrc_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,numSamples,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -468,7 +530,9 @@ cmsis_arm_cmplx_dot_prod_q15(PyObject *obj, PyObject *args)
     numSamples = numSamples / 2;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_cmplx_dot_prod_q15(pSrcA_converted,pSrcB_converted,numSamples,&realResult,&imagResult);
+    Py_END_ALLOW_THREADS
     PyObject* realResultOBJ=Py_BuildValue("i",realResult);
     PyObject* imagResultOBJ=Py_BuildValue("i",imagResult);
 
@@ -506,7 +570,9 @@ cmsis_arm_cmplx_dot_prod_q31(PyObject *obj, PyObject *args)
     numSamples = numSamples / 2;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_cmplx_dot_prod_q31(pSrcA_converted,pSrcB_converted,numSamples,&realResult,&imagResult);
+    Py_END_ALLOW_THREADS
     PyObject* realResultOBJ=Py_BuildValue("L",realResult);
     PyObject* imagResultOBJ=Py_BuildValue("L",imagResult);
 
@@ -544,7 +610,9 @@ cmsis_arm_cmplx_dot_prod_f32(PyObject *obj, PyObject *args)
     numSamples = numSamples / 2;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_cmplx_dot_prod_f32(pSrcA_converted,pSrcB_converted,numSamples,&realResult,&imagResult);
+    Py_END_ALLOW_THREADS
     PyObject* realResultOBJ=Py_BuildValue("f",realResult);
     PyObject* imagResultOBJ=Py_BuildValue("f",imagResult);
 
@@ -562,7 +630,7 @@ cmsis_arm_cmplx_dot_prod_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_real_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_real_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcCmplx=NULL; // input
@@ -570,9 +638,10 @@ cmsis_arm_cmplx_mult_real_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcReal=NULL; // input
   q15_t *pSrcReal_converted=NULL; // input
   q15_t *pCmplxDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal))
+  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcCmplx,NPY_INT16,int16_t,int16_t);
@@ -580,17 +649,21 @@ cmsis_arm_cmplx_mult_real_q15(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcCmplx ;
     numSamples = numSamples / 2;
 
-    pCmplxDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
-
+    GETOUTPUT(pCmplxDst,q15_t,NPY_INT16,2*numSamples);
 
-    arm_cmplx_mult_real_q15(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
- INT16ARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst);
+    if (pCmplxDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_real_q15(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pCmplxDstOBJ);
 
     FREEARGUMENT(pSrcCmplx_converted);
     FREEARGUMENT(pSrcReal_converted);
-    Py_DECREF(pCmplxDstOBJ);
+    Py_XDECREF(pCmplxDstOBJ);
     return(pythonResult);
 
   }
@@ -599,7 +672,7 @@ cmsis_arm_cmplx_mult_real_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_real_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_real_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcCmplx=NULL; // input
@@ -607,9 +680,10 @@ cmsis_arm_cmplx_mult_real_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcReal=NULL; // input
   q31_t *pSrcReal_converted=NULL; // input
   q31_t *pCmplxDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal))
+  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcCmplx,NPY_INT32,int32_t,int32_t);
@@ -617,17 +691,21 @@ cmsis_arm_cmplx_mult_real_q31(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcCmplx ;
     numSamples = numSamples / 2;
 
-    pCmplxDst=PyMem_Malloc(sizeof(q31_t)*2*numSamples);
-
+    GETOUTPUT(pCmplxDst,q31_t,NPY_INT32,2*numSamples);
 
-    arm_cmplx_mult_real_q31(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
- INT32ARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst);
+    if (pCmplxDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_real_q31(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pCmplxDstOBJ);
 
     FREEARGUMENT(pSrcCmplx_converted);
     FREEARGUMENT(pSrcReal_converted);
-    Py_DECREF(pCmplxDstOBJ);
+    Py_XDECREF(pCmplxDstOBJ);
     return(pythonResult);
 
   }
@@ -636,7 +714,7 @@ cmsis_arm_cmplx_mult_real_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_real_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_real_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcCmplx=NULL; // input
@@ -644,9 +722,10 @@ cmsis_arm_cmplx_mult_real_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcReal=NULL; // input
   float32_t *pSrcReal_converted=NULL; // input
   float32_t *pCmplxDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal))
+  if (PyArg_ParseTuple(args,"OO",&pSrcCmplx,&pSrcReal) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcCmplx,NPY_DOUBLE,double,float32_t);
@@ -654,17 +733,21 @@ cmsis_arm_cmplx_mult_real_f32(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcCmplx ;
     numSamples = numSamples / 2;
 
-    pCmplxDst=PyMem_Malloc(sizeof(float32_t)*2*numSamples);
+    GETOUTPUT(pCmplxDst,float32_t,NPY_FLOAT,2*numSamples);
 
-
-    arm_cmplx_mult_real_f32(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
- FLOATARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst);
+    if (pCmplxDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_real_f32(pSrcCmplx_converted,pSrcReal_converted,pCmplxDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pCmplxDstOBJ,2*numSamples,pCmplxDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pCmplxDstOBJ);
 
     FREEARGUMENT(pSrcCmplx_converted);
     FREEARGUMENT(pSrcReal_converted);
-    Py_DECREF(pCmplxDstOBJ);
+    Py_XDECREF(pCmplxDstOBJ);
     return(pythonResult);
 
   }
@@ -675,7 +758,7 @@ cmsis_arm_cmplx_mult_real_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_cmplx_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_cmplx_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -683,9 +766,10 @@ cmsis_arm_cmplx_mult_cmplx_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q15_t *pSrcB_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
@@ -693,17 +777,21 @@ cmsis_arm_cmplx_mult_cmplx_q15(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcA ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,2*numSamples);
 
-    arm_cmplx_mult_cmplx_q15(pSrcA_converted,pSrcB_converted,pDst,numSamples);
- INT16ARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_cmplx_q15(pSrcA_converted,pSrcB_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -712,7 +800,7 @@ cmsis_arm_cmplx_mult_cmplx_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_cmplx_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_cmplx_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -720,9 +808,10 @@ cmsis_arm_cmplx_mult_cmplx_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   q31_t *pSrcB_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
@@ -730,17 +819,21 @@ cmsis_arm_cmplx_mult_cmplx_q31(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcA ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*2*numSamples);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,2*numSamples);
 
-    arm_cmplx_mult_cmplx_q31(pSrcA_converted,pSrcB_converted,pDst,numSamples);
- INT32ARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_cmplx_q31(pSrcA_converted,pSrcB_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -749,7 +842,7 @@ cmsis_arm_cmplx_mult_cmplx_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cmplx_mult_cmplx_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_cmplx_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -757,9 +850,10 @@ cmsis_arm_cmplx_mult_cmplx_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
@@ -767,17 +861,21 @@ cmsis_arm_cmplx_mult_cmplx_f32(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcA ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*2*numSamples);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,2*numSamples);
 
-
-    arm_cmplx_mult_cmplx_f32(pSrcA_converted,pSrcB_converted,pDst,numSamples);
- FLOATARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_cmplx_f32(pSrcA_converted,pSrcB_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -785,7 +883,7 @@ cmsis_arm_cmplx_mult_cmplx_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_cmplx_mult_cmplx_f64(PyObject *obj, PyObject *args)
+cmsis_arm_cmplx_mult_cmplx_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -793,9 +891,10 @@ cmsis_arm_cmplx_mult_cmplx_f64(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float64_t *pSrcB_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t numSamples; // input
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float64_t);
@@ -803,17 +902,21 @@ cmsis_arm_cmplx_mult_cmplx_f64(PyObject *obj, PyObject *args)
     numSamples = arraySizepSrcA ;
     numSamples = numSamples / 2;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*2*numSamples);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,2*numSamples);
 
-    arm_cmplx_mult_cmplx_f64(pSrcA_converted,pSrcB_converted,pDst,numSamples);
- FLOAT64ARRAY1(pDstOBJ,2*numSamples,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_cmplx_mult_cmplx_f64(pSrcA_converted,pSrcB_converted,pDst,numSamples);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,2*numSamples,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -824,30 +927,30 @@ cmsis_arm_cmplx_mult_cmplx_f64(PyObject *obj, PyObject *args)
 static PyMethodDef CMSISDSPMethods[] = {
 
 
-{"arm_cmplx_conj_f32",  cmsis_arm_cmplx_conj_f32, METH_VARARGS,""},
-{"arm_cmplx_conj_q31",  cmsis_arm_cmplx_conj_q31, METH_VARARGS,""},
-{"arm_cmplx_conj_q15",  cmsis_arm_cmplx_conj_q15, METH_VARARGS,""},
-{"arm_cmplx_mag_squared_f32",  cmsis_arm_cmplx_mag_squared_f32, METH_VARARGS,""},
-{"arm_cmplx_mag_squared_f64",  cmsis_arm_cmplx_mag_squared_f64, METH_VARARGS,""},
-{"arm_cmplx_mag_squared_q31",  cmsis_arm_cmplx_mag_squared_q31, METH_VARARGS,""},
-{"arm_cmplx_mag_squared_q15",  cmsis_arm_cmplx_mag_squared_q15, METH_VARARGS,""},
+{"arm_cmplx_conj_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_conj_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_conj_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_conj_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_conj_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_conj_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_squared_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_squared_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_squared_f64",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_squared_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_squared_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_squared_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_squared_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_squared_q15, METH_VARARGS | METH_KEYWORDS,""},
 
 
-{"arm_cmplx_mag_f32",  cmsis_arm_cmplx_mag_f32, METH_VARARGS,""},
-{"arm_cmplx_mag_f64",  cmsis_arm_cmplx_mag_f64, METH_VARARGS,""},
-{"arm_cmplx_mag_q31",  cmsis_arm_cmplx_mag_q31, METH_VARARGS,""},
-{"arm_cmplx_mag_q15",  cmsis_arm_cmplx_mag_q15, METH_VARARGS,""},
-{"arm_cmplx_mag_fast_q15",  cmsis_arm_cmplx_mag_fast_q15, METH_VARARGS,""},
+{"arm_cmplx_mag_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_f64",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mag_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mag_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_cmplx_dot_prod_q15",  cmsis_arm_cmplx_dot_prod_q15, METH_VARARGS,""},
 {"arm_cmplx_dot_prod_q31",  cmsis_arm_cmplx_dot_prod_q31, METH_VARARGS,""},
 {"arm_cmplx_dot_prod_f32",  cmsis_arm_cmplx_dot_prod_f32, METH_VARARGS,""},
-{"arm_cmplx_mult_real_q15",  cmsis_arm_cmplx_mult_real_q15, METH_VARARGS,""},
-{"arm_cmplx_mult_real_q31",  cmsis_arm_cmplx_mult_real_q31, METH_VARARGS,""},
-{"arm_cmplx_mult_real_f32",  cmsis_arm_cmplx_mult_real_f32, METH_VARARGS,""},
-{"arm_cmplx_mult_cmplx_q15",  cmsis_arm_cmplx_mult_cmplx_q15, METH_VARARGS,""},
-{"arm_cmplx_mult_cmplx_q31",  cmsis_arm_cmplx_mult_cmplx_q31, METH_VARARGS,""},
-{"arm_cmplx_mult_cmplx_f32",  cmsis_arm_cmplx_mult_cmplx_f32, METH_VARARGS,""},
-{"arm_cmplx_mult_cmplx_f64",  cmsis_arm_cmplx_mult_cmplx_f64, METH_VARARGS,""},
+{"arm_cmplx_mult_real_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_real_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_real_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_real_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_real_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_real_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_cmplx_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_cmplx_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_cmplx_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_cmplx_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_cmplx_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_cmplx_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cmplx_mult_cmplx_f64",  (PyCFunction)(void(*)(void))cmsis_arm_cmplx_mult_cmplx_f64, METH_VARARGS | METH_KEYWORDS,""},
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
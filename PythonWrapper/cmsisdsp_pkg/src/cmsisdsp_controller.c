@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_controller"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_controller
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -810,6 +812,401 @@ cmsis_arm_inv_park_q31(PyObject *obj, PyObject *args)
 
 
 
+/*
+
+Block versions : the controller and the transforms are applied
+to each sample of arrays in one call (and the GIL is released
+during the loop). The PID state is kept by the instance between
+calls.
+
+*/
+
+/* Lengths of the arrays of a block function. The exception
+is set when the arrays have not the same length. */
+static int checkBlockLength(void *pA,uint32_t nbA,void *pB,uint32_t nbB)
+{
+    if ((pA == NULL) || (pB == NULL))
+    {
+        return(0);
+    }
+    if (nbA != nbB)
+    {
+        PyErr_SetString(PyExc_ValueError,"the arrays must have the same length");
+        return(0);
+    }
+    return(1);
+}
+
+#define FREEBLOCKARGUMENT(FIELD) \
+    if (FIELD) {FREEARGUMENT(FIELD);}
+
+#define PIDBLOCK(EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT)                         \
+static PyObject *                                                              \
+cmsis_arm_pid_block_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)       \
+{                                                                              \
+  PyObject *S=NULL; /* input */                                                \
+  PyObject *pSrc=NULL; /* input */                                             \
+  TYP *pSrc_converted=NULL; /* input */                                        \
+  TYP *pDst=NULL; /* output */                                                 \
+  PyObject *out=NULL; /* output */                                             \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))      \
+  {                                                                            \
+    dsp_arm_pid_instance_##EXT##Object *selfS =                                \
+       (dsp_arm_pid_instance_##EXT##Object *)S;                                \
+    GETARGUMENT(pSrc,SRCNPYTYPE,SRCFORMAT,TYP);                                \
+    if (pSrc_converted == NULL)                                                \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizepSrc;                                                 \
+                                                                               \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                     \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      for(uint32_t i=0; i < blockSize; i++)                                    \
+      {                                                                        \
+         pDst[i] = arm_pid_##EXT(selfS->instance,pSrc_converted[i]);           \
+      }                                                                        \
+      Py_END_ALLOW_THREADS                                                     \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                              \
+                                                                               \
+    FREEARGUMENT(pSrc_converted);                                              \
+    return((PyObject*)pDstOBJ);                                                \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+PIDBLOCK(f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double);
+PIDBLOCK(q31,q31_t,NPY_INT32,NPY_INT32,int32_t);
+PIDBLOCK(q15,q15_t,NPY_INT16,NPY_INT16,int16_t);
+
+/*
+
+Transforms with 2 or 4 input arrays and 2 output arrays.
+OP is computing sample i of the outputs X and Y.
+
+*/
+#define TRANSFORMBLOCK2(NAME,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,A,B,X,Y,OP)      \
+static PyObject *                                                              \
+cmsis_arm_##NAME(PyObject *obj, PyObject *args)                                \
+{                                                                              \
+  PyObject *A=NULL; /* input */                                                \
+  TYP *A##_converted=NULL; /* input */                                         \
+  PyObject *B=NULL; /* input */                                                \
+  TYP *B##_converted=NULL; /* input */                                         \
+  TYP *X=NULL; /* output */                                                    \
+  TYP *Y=NULL; /* output */                                                    \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OO",&A,&B))                                       \
+  {                                                                            \
+    GETARGUMENT(A,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    GETARGUMENT(B,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    if (!checkBlockLength(A##_converted,arraySize##A,                          \
+          B##_converted,arraySize##B))                                         \
+    {                                                                          \
+       FREEBLOCKARGUMENT(A##_converted);                                       \
+       FREEBLOCKARGUMENT(B##_converted);                                       \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySize##A;                                                  \
+                                                                               \
+    GETOUTPUTFROM(NULL,X,TYP,NPYTYPE,blockSize);                               \
+    GETOUTPUTFROM(NULL,Y,TYP,NPYTYPE,blockSize);                               \
+    if ((X == NULL) || (Y == NULL))                                            \
+    {                                                                          \
+       FREEOUTPUT(X);                                                          \
+       FREEOUTPUT(Y);                                                          \
+       FREEARGUMENT(A##_converted);                                            \
+       FREEARGUMENT(B##_converted);                                            \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    Py_BEGIN_ALLOW_THREADS                                                     \
+    for(uint32_t i=0; i < blockSize; i++)                                      \
+    {                                                                          \
+       OP;                                                                     \
+    }                                                                          \
+    Py_END_ALLOW_THREADS                                                       \
+    OUTPUTARRAY1(X##OBJ,blockSize,X,NPYTYPE);                                  \
+    OUTPUTARRAY1(Y##OBJ,blockSize,Y,NPYTYPE);                                  \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("OO",X##OBJ,Y##OBJ);                \
+                                                                               \
+    FREEARGUMENT(A##_converted);                                               \
+    FREEARGUMENT(B##_converted);                                               \
+    Py_XDECREF(X##OBJ);                                                        \
+    Py_XDECREF(Y##OBJ);                                                        \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+#define TRANSFORMBLOCK4(NAME,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,A,B,C,D,X,Y,OP)  \
+static PyObject *                                                              \
+cmsis_arm_##NAME(PyObject *obj, PyObject *args)                                \
+{                                                                              \
+  PyObject *A=NULL; /* input */                                                \
+  TYP *A##_converted=NULL; /* input */                                         \
+  PyObject *B=NULL; /* input */                                                \
+  TYP *B##_converted=NULL; /* input */                                         \
+  PyObject *C=NULL; /* input */                                                \
+  TYP *C##_converted=NULL; /* input */                                         \
+  PyObject *D=NULL; /* input */                                                \
+  TYP *D##_converted=NULL; /* input */                                         \
+  TYP *X=NULL; /* output */                                                    \
+  TYP *Y=NULL; /* output */                                                    \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OOOO",&A,&B,&C,&D))                               \
+  {                                                                            \
+    GETARGUMENT(A,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    GETARGUMENT(B,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    GETARGUMENT(C,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    GETARGUMENT(D,SRCNPYTYPE,SRCFORMAT,TYP);                                   \
+    if (!checkBlockLength(A##_converted,arraySize##A,                          \
+          B##_converted,arraySize##B) ||                                       \
+        !checkBlockLength(A##_converted,arraySize##A,                          \
+          C##_converted,arraySize##C) ||                                       \
+        !checkBlockLength(A##_converted,arraySize##A,                          \
+          D##_converted,arraySize##D))                                         \
+    {                                                                          \
+       FREEBLOCKARGUMENT(A##_converted);                                       \
+       FREEBLOCKARGUMENT(B##_converted);                                       \
+       FREEBLOCKARGUMENT(C##_converted);                                       \
+       FREEBLOCKARGUMENT(D##_converted);                                       \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySize##A;                                                  \
+                                                                               \
+    GETOUTPUTFROM(NULL,X,TYP,NPYTYPE,blockSize);                               \
+    GETOUTPUTFROM(NULL,Y,TYP,NPYTYPE,blockSize);                               \
+    if ((X == NULL) || (Y == NULL))                                            \
+    {                                                                          \
+       FREEOUTPUT(X);                                                          \
+       FREEOUTPUT(Y);                                                          \
+       FREEARGUMENT(A##_converted);                                            \
+       FREEARGUMENT(B##_converted);                                            \
+       FREEARGUMENT(C##_converted);                                            \
+       FREEARGUMENT(D##_converted);                                            \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    Py_BEGIN_ALLOW_THREADS                                                     \
+    for(uint32_t i=0; i < blockSize; i++)                                      \
+    {                                                                          \
+       OP;                                                                     \
+    }                                                                          \
+    Py_END_ALLOW_THREADS                                                       \
+    OUTPUTARRAY1(X##OBJ,blockSize,X,NPYTYPE);                                  \
+    OUTPUTARRAY1(Y##OBJ,blockSize,Y,NPYTYPE);                                  \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("OO",X##OBJ,Y##OBJ);                \
+                                                                               \
+    FREEARGUMENT(A##_converted);                                               \
+    FREEARGUMENT(B##_converted);                                               \
+    FREEARGUMENT(C##_converted);                                               \
+    FREEARGUMENT(D##_converted);                                               \
+    Py_XDECREF(X##OBJ);                                                        \
+    Py_XDECREF(Y##OBJ);                                                        \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+#define CONTROLLERBLOCKS(EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT)                 \
+TRANSFORMBLOCK2(clarke_block_##EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,           \
+   Ia,Ib,pIalpha,pIbeta,                                                       \
+   arm_clarke_##EXT(Ia_converted[i],Ib_converted[i],&pIalpha[i],&pIbeta[i]));  \
+TRANSFORMBLOCK2(inv_clarke_block_##EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,       \
+   Ialpha,Ibeta,pIa,pIb,                                                       \
+   arm_inv_clarke_##EXT(Ialpha_converted[i],Ibeta_converted[i],&pIa[i],&pIb[i])); \
+TRANSFORMBLOCK4(park_block_##EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,             \
+   Ialpha,Ibeta,sinVal,cosVal,pId,pIq,                                         \
+   arm_park_##EXT(Ialpha_converted[i],Ibeta_converted[i],&pId[i],&pIq[i],      \
+      sinVal_converted[i],cosVal_converted[i]));                               \
+TRANSFORMBLOCK4(inv_park_block_##EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,         \
+   Id,Iq,sinVal,cosVal,pIalpha,pIbeta,                                         \
+   arm_inv_park_##EXT(Id_converted[i],Iq_converted[i],&pIalpha[i],&pIbeta[i],  \
+      sinVal_converted[i],cosVal_converted[i]));
+
+CONTROLLERBLOCKS(f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double);
+CONTROLLERBLOCKS(q31,q31_t,NPY_INT32,NPY_INT32,int32_t);
+
+#define SINCOSBLOCK(EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT)                      \
+static PyObject *                                                              \
+cmsis_arm_sin_cos_block_##EXT(PyObject *obj, PyObject *args)                   \
+{                                                                              \
+  PyObject *theta=NULL; /* input */                                            \
+  TYP *theta_converted=NULL; /* input */                                       \
+  TYP *pSinVal=NULL; /* output */                                              \
+  TYP *pCosVal=NULL; /* output */                                              \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"O",&theta))                                       \
+  {                                                                            \
+    GETARGUMENT(theta,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    if (theta_converted == NULL)                                               \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizetheta;                                                \
+                                                                               \
+    GETOUTPUTFROM(NULL,pSinVal,TYP,NPYTYPE,blockSize);                         \
+    GETOUTPUTFROM(NULL,pCosVal,TYP,NPYTYPE,blockSize);                         \
+    if ((pSinVal == NULL) || (pCosVal == NULL))                                \
+    {                                                                          \
+       FREEOUTPUT(pSinVal);                                                    \
+       FREEOUTPUT(pCosVal);                                                    \
+       FREEARGUMENT(theta_converted);                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    Py_BEGIN_ALLOW_THREADS                                                     \
+    for(uint32_t i=0; i < blockSize; i++)                                      \
+    {                                                                          \
+       arm_sin_cos_##EXT(theta_converted[i],&pSinVal[i],&pCosVal[i]);          \
+    }                                                                          \
+    Py_END_ALLOW_THREADS                                                       \
+    OUTPUTARRAY1(pSinValOBJ,blockSize,pSinVal,NPYTYPE);                        \
+    OUTPUTARRAY1(pCosValOBJ,blockSize,pCosVal,NPYTYPE);                        \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("OO",pSinValOBJ,pCosValOBJ);        \
+                                                                               \
+    FREEARGUMENT(theta_converted);                                             \
+    Py_XDECREF(pSinValOBJ);                                                    \
+    Py_XDECREF(pCosValOBJ);                                                    \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+SINCOSBLOCK(f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double);
+SINCOSBLOCK(q31,q31_t,NPY_INT32,NPY_INT32,int32_t);
+
+/*
+
+Inner current loop of a field oriented control for each sample:
+
+- Clarke and Park transforms of the phase currents Ia, Ib
+  with the angle theta (same unit as arm_sin_cos)
+- PID controllers for the d and q errors (references - currents)
+- Inverse Park and inverse Clarke transforms of the PID outputs
+
+The references IdRef and IqRef have one value per sample or one value
+for all the samples. The result is the voltages (Va,Vb).
+
+*/
+#define FOCERROR_f32(REF,I) ((REF) - (I))
+#define FOCERROR_q31(REF,I) __QSUB((REF),(I))
+
+#define FOCBLOCK(EXT,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT)                         \
+static PyObject *                                                              \
+cmsis_arm_foc_block_##EXT(PyObject *obj, PyObject *args)                       \
+{                                                                              \
+  PyObject *Sd=NULL; /* input */                                               \
+  PyObject *Sq=NULL; /* input */                                               \
+  PyObject *Ia=NULL; /* input */                                               \
+  TYP *Ia_converted=NULL; /* input */                                          \
+  PyObject *Ib=NULL; /* input */                                               \
+  TYP *Ib_converted=NULL; /* input */                                          \
+  PyObject *theta=NULL; /* input */                                            \
+  TYP *theta_converted=NULL; /* input */                                       \
+  PyObject *IdRef=NULL; /* input */                                            \
+  TYP *IdRef_converted=NULL; /* input */                                       \
+  PyObject *IqRef=NULL; /* input */                                            \
+  TYP *IqRef_converted=NULL; /* input */                                       \
+  TYP *pVa=NULL; /* output */                                                  \
+  TYP *pVb=NULL; /* output */                                                  \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OOOOOOO",&Sd,&Sq,&Ia,&Ib,&theta,&IdRef,&IqRef))   \
+  {                                                                            \
+    dsp_arm_pid_instance_##EXT##Object *selfSd =                               \
+       (dsp_arm_pid_instance_##EXT##Object *)Sd;                               \
+    dsp_arm_pid_instance_##EXT##Object *selfSq =                               \
+       (dsp_arm_pid_instance_##EXT##Object *)Sq;                               \
+    GETARGUMENT(Ia,SRCNPYTYPE,SRCFORMAT,TYP);                                  \
+    GETARGUMENT(Ib,SRCNPYTYPE,SRCFORMAT,TYP);                                  \
+    GETARGUMENT(theta,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    GETARGUMENT(IdRef,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    GETARGUMENT(IqRef,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    /* A reference with one value is used for all the samples */              \
+    if (!checkBlockLength(Ia_converted,arraySizeIa,                            \
+          Ib_converted,arraySizeIb) ||                                         \
+        !checkBlockLength(Ia_converted,arraySizeIa,                            \
+          theta_converted,arraySizetheta) ||                                   \
+        !checkBlockLength(Ia_converted,arraySizeIa,IdRef_converted,            \
+          arraySizeIdRef == 1 ? arraySizeIa : arraySizeIdRef) ||               \
+        !checkBlockLength(Ia_converted,arraySizeIa,IqRef_converted,            \
+          arraySizeIqRef == 1 ? arraySizeIa : arraySizeIqRef))                 \
+    {                                                                          \
+       FREEBLOCKARGUMENT(Ia_converted);                                        \
+       FREEBLOCKARGUMENT(Ib_converted);                                        \
+       FREEBLOCKARGUMENT(theta_converted);                                     \
+       FREEBLOCKARGUMENT(IdRef_converted);                                     \
+       FREEBLOCKARGUMENT(IqRef_converted);                                     \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizeIa;                                                   \
+    uint32_t incIdRef = arraySizeIdRef == 1 ? 0 : 1;                           \
+    uint32_t incIqRef = arraySizeIqRef == 1 ? 0 : 1;                           \
+                                                                               \
+    GETOUTPUTFROM(NULL,pVa,TYP,NPYTYPE,blockSize);                             \
+    GETOUTPUTFROM(NULL,pVb,TYP,NPYTYPE,blockSize);                             \
+    if ((pVa == NULL) || (pVb == NULL))                                        \
+    {                                                                          \
+       FREEOUTPUT(pVa);                                                        \
+       FREEOUTPUT(pVb);                                                        \
+       FREEARGUMENT(Ia_converted);                                             \
+       FREEARGUMENT(Ib_converted);                                             \
+       FREEARGUMENT(theta_converted);                                          \
+       FREEARGUMENT(IdRef_converted);                                          \
+       FREEARGUMENT(IqRef_converted);                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    Py_BEGIN_ALLOW_THREADS                                                     \
+    for(uint32_t i=0; i < blockSize; i++)                                      \
+    {                                                                          \
+       TYP sinVal,cosVal,Ialpha,Ibeta,Id,Iq,Vd,Vq,Valpha,Vbeta;                \
+       arm_sin_cos_##EXT(theta_converted[i],&sinVal,&cosVal);                  \
+       arm_clarke_##EXT(Ia_converted[i],Ib_converted[i],&Ialpha,&Ibeta);       \
+       arm_park_##EXT(Ialpha,Ibeta,&Id,&Iq,sinVal,cosVal);                     \
+       Vd = arm_pid_##EXT(selfSd->instance,                                    \
+          FOCERROR_##EXT(IdRef_converted[i*incIdRef],Id));                     \
+       Vq = arm_pid_##EXT(selfSq->instance,                                    \
+          FOCERROR_##EXT(IqRef_converted[i*incIqRef],Iq));                     \
+       arm_inv_park_##EXT(Vd,Vq,&Valpha,&Vbeta,sinVal,cosVal);                 \
+       arm_inv_clarke_##EXT(Valpha,Vbeta,&pVa[i],&pVb[i]);                     \
+    }                                                                          \
+    Py_END_ALLOW_THREADS                                                       \
+    OUTPUTARRAY1(pVaOBJ,blockSize,pVa,NPYTYPE);                                \
+    OUTPUTARRAY1(pVbOBJ,blockSize,pVb,NPYTYPE);                                \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("OO",pVaOBJ,pVbOBJ);                \
+                                                                               \
+    FREEARGUMENT(Ia_converted);                                                \
+    FREEARGUMENT(Ib_converted);                                                \
+    FREEARGUMENT(theta_converted);                                             \
+    FREEARGUMENT(IdRef_converted);                                             \
+    FREEARGUMENT(IqRef_converted);                                             \
+    Py_XDECREF(pVaOBJ);                                                        \
+    Py_XDECREF(pVbOBJ);                                                        \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+FOCBLOCK(f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double);
+FOCBLOCK(q31,q31_t,NPY_INT32,NPY_INT32,int32_t);
+
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
@@ -838,6 +1235,22 @@ static PyMethodDef CMSISDSPMethods[] = {
 {"arm_inv_park_f32",  cmsis_arm_inv_park_f32, METH_VARARGS,""},
 {"arm_inv_park_q31",  cmsis_arm_inv_park_q31, METH_VARARGS,""},
 
+{"arm_pid_block_f32",  (PyCFunction)(void(*)(void))cmsis_arm_pid_block_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_pid_block_q31",  (PyCFunction)(void(*)(void))cmsis_arm_pid_block_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_pid_block_q15",  (PyCFunction)(void(*)(void))cmsis_arm_pid_block_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sin_cos_block_f32",  cmsis_arm_sin_cos_block_f32, METH_VARARGS,""},
+{"arm_sin_cos_block_q31",  cmsis_arm_sin_cos_block_q31, METH_VARARGS,""},
+{"arm_clarke_block_f32",  cmsis_arm_clarke_block_f32, METH_VARARGS,""},
+{"arm_clarke_block_q31",  cmsis_arm_clarke_block_q31, METH_VARARGS,""},
+{"arm_inv_clarke_block_f32",  cmsis_arm_inv_clarke_block_f32, METH_VARARGS,""},
+{"arm_inv_clarke_block_q31",  cmsis_arm_inv_clarke_block_q31, METH_VARARGS,""},
+{"arm_park_block_f32",  cmsis_arm_park_block_f32, METH_VARARGS,""},
+{"arm_park_block_q31",  cmsis_arm_park_block_q31, METH_VARARGS,""},
+{"arm_inv_park_block_f32",  cmsis_arm_inv_park_block_f32, METH_VARARGS,""},
+{"arm_inv_park_block_q31",  cmsis_arm_inv_park_block_q31, METH_VARARGS,""},
+{"arm_foc_block_f32",  cmsis_arm_foc_block_f32, METH_VARARGS,""},
+{"arm_foc_block_q31",  cmsis_arm_foc_block_q31, METH_VARARGS,""},
+
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
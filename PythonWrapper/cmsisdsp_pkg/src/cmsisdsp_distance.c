@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_distance"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_distance
+#endif
 
 #include "cmsisdsp_module.h"
 MATRIXFROMNUMPY(f32,float32_t,double,NPY_DOUBLE);
@@ -47,7 +49,7 @@ void typeRegistration(PyObject *module) {
  
 }
 
-#define FLOATDIST(NAME)                                                \
+#define FLOATDISTARG(NAME,GETARG)                                      \
 static PyObject *                                                      \
 cmsis_arm_##NAME##_f32(PyObject *obj, PyObject *args)                  \
 {                                                                      \
@@ -62,13 +64,15 @@ cmsis_arm_##NAME##_f32(PyObject *obj, PyObject *args)                  \
   if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))                       \
   {                                                                    \
                                                                        \
-    GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);                    \
-    GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);                    \
+    GETARG(pSrcA,NPY_DOUBLE,double,float32_t);                         \
+    GETARG(pSrcB,NPY_DOUBLE,double,float32_t);                         \
     blockSize = arraySizepSrcA ;                                       \
                                                                        \
                                                                        \
                                                                        \
+    Py_BEGIN_ALLOW_THREADS                                             \
     result=arm_##NAME##_f32(pSrcA_converted,pSrcB_converted,blockSize);\
+    Py_END_ALLOW_THREADS                                               \
     PyObject* resultOBJ=Py_BuildValue("f",result);                     \
                                                                        \
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);             \
@@ -82,6 +86,11 @@ cmsis_arm_##NAME##_f32(PyObject *obj, PyObject *args)                  \
   return(NULL);                                                        \
 }
 
+#define FLOATDIST(NAME) FLOATDISTARG(NAME,GETARGUMENT)
+
+/* The input vectors are modified by the kernel */
+#define FLOATDISTCOPY(NAME) FLOATDISTARG(NAME,GETARGUMENTCOPY)
+
 #define FLOAT64DIST(NAME)                                                \
 static PyObject *                                                      \
 cmsis_arm_##NAME##_f64(PyObject *obj, PyObject *args)                  \
@@ -103,7 +112,9 @@ cmsis_arm_##NAME##_f64(PyObject *obj, PyObject *args)                  \
                                                                        \
                                                                        \
                                                                        \
+    Py_BEGIN_ALLOW_THREADS                                             \
     result=arm_##NAME##_f64(pSrcA_converted,pSrcB_converted,blockSize);\
+    Py_END_ALLOW_THREADS                                               \
     PyObject* resultOBJ=Py_BuildValue("d",result);                     \
                                                                        \
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);             \
@@ -127,7 +138,7 @@ FLOATDIST(braycurtis_distance);
 FLOATDIST(canberra_distance);
 FLOATDIST(chebyshev_distance);
 FLOATDIST(cityblock_distance);
-FLOATDIST(correlation_distance);
+FLOATDISTCOPY(correlation_distance);
 FLOATDIST(cosine_distance);
 FLOATDIST(euclidean_distance);
 FLOATDIST(jensenshannon_distance);
@@ -144,7 +155,7 @@ cmsis_arm_minkowski_distance_f32(PyObject *obj, PyObject *args)
   uint32_t blockSize;                                                  
   float32_t result;                                               
                                                                        
-  if (PyArg_ParseTuple(args,"OOl",&pSrcA,&pSrcB,&w))                       
+  if (PyArg_ParseTuple(args,"OOi",&pSrcA,&pSrcB,&w))                       
   {                                                                    
                                                                        
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);                    
@@ -154,7 +165,9 @@ cmsis_arm_minkowski_distance_f32(PyObject *obj, PyObject *args)
                                                                        
                                                                        
                                                                        
+    Py_BEGIN_ALLOW_THREADS
     result=arm_minkowski_distance_f32(pSrcA_converted,pSrcB_converted,w,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("f",result);                     
                                                                        
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);             
@@ -183,7 +196,7 @@ cmsis_arm_##NAME (PyObject *obj, PyObject *args)                   \
   float32_t result;                                            \
                                                                     \
                                                                     \
-  if (PyArg_ParseTuple(args,"OOl",&pSrcA,&pSrcB,&blockSize))        \
+  if (PyArg_ParseTuple(args,"OOI",&pSrcA,&pSrcB,&blockSize))        \
   {                                                                 \
                                                                     \
     GETARGUMENT(pSrcA,NPY_UINT32,uint32_t,uint32_t);                \
@@ -191,7 +204,9 @@ cmsis_arm_##NAME (PyObject *obj, PyObject *args)                   \
                                                                     \
                                                                     \
                                                                     \
+    Py_BEGIN_ALLOW_THREADS                                         \
     result=arm_##NAME (pSrcA_converted,pSrcB_converted,blockSize); \
+    Py_END_ALLOW_THREADS                                           \
     PyObject* resultOBJ=Py_BuildValue("f",result);                  \
                                                                     \
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);          \
@@ -227,7 +242,7 @@ cmsis_arm_dtw_init_window_q7(PyObject *obj,
   arm_matrix_instance_q7 pSrc_converted; // input
    
 
-  if (PyArg_ParseTuple(args,"iiO",&winType,&winSize,&pSrc));
+  if (PyArg_ParseTuple(args,"iiO",&winType,&winSize,&pSrc))
   {
 
     q7MatrixFromNumpy(&pSrc_converted,pSrc);
@@ -249,7 +264,7 @@ cmsis_arm_dtw_init_window_q7(PyObject *obj,
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
@@ -267,7 +282,7 @@ cmsis_arm_dtw_distance_f32(PyObject *obj,
   arm_matrix_instance_f32 dtw_converted;
 
 
-  if (PyArg_ParseTuple(args,"OO",&pDist,&pWin));
+  if (PyArg_ParseTuple(args,"OO",&pDist,&pWin))
   {
 
     f32MatrixFromNumpy(&pDist_converted,pDist);
@@ -286,12 +301,14 @@ cmsis_arm_dtw_distance_f32(PyObject *obj,
     createf32Matrix(&dtw_converted,row,column);
     float32_t distance;
 
-    arm_status returnValue = 
-    arm_dtw_distance_f32(&pDist_converted,
+    arm_status returnValue;
+    Py_BEGIN_ALLOW_THREADS
+    returnValue = arm_dtw_distance_f32(&pDist_converted,
                          pWinMatrix,
                          &dtw_converted,
                          &distance
                          );
+    Py_END_ALLOW_THREADS
 
     
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -315,7 +332,7 @@ cmsis_arm_dtw_distance_f32(PyObject *obj,
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
@@ -336,9 +353,11 @@ cmsis_arm_dtw_path_f32(PyObject *obj,
      pDst=PyMem_Malloc(sizeof(int16_t)*blockSize);
 
 
+     Py_BEGIN_ALLOW_THREADS
      arm_dtw_path_f32(&pCost_converted,
                       pDst,
                       &pathLength);
+     Py_END_ALLOW_THREADS
 
      INT16ARRAY1(pDstOBJ,2*pathLength,pDst);
 
@@ -348,9 +367,957 @@ cmsis_arm_dtw_path_f32(PyObject *obj,
      Py_DECREF(pDstOBJ);
      return(pythonResult);
   }
+  return(NULL);
+}
+
+/*
+
+DTW distance without the cost matrix.
+
+Only two rows of the cost matrix are kept. The rows are along the
+longest dimension so that the workspace has min(rows,columns)
+elements. The cost of the path is the same as with
+arm_dtw_distance_f32 (symmetric2 step pattern and same window).
+
+The cells of the matrix are visited with outer index i and inner
+index j. (i,j) is (q,t) or (t,q) when the matrix is transposed.
+The strides give the position of (i,j) in the distance and
+window matrixes.
+
+The computation is abandoned (and INFINITY returned) as soon as all
+the costs of a row are bigger than bound : the cost of the path
+cannot be smaller than the smallest cost of a row.
+F32_MAX is returned when no path is allowed by the window.
+
+*/
+#define DTW_WIN(I,J) ((pWin == NULL) || (pWin[(I)*winOuter + (J)*winInner] == 1))
+
+#define DTWROLLING(NAME,ARGS,LOCALDIST)                                         \
+static float32_t NAME ARGS                                                      \
+{                                                                               \
+    float32_t *prev = pWork;                                                    \
+    float32_t *cur = pWork + nbInner;                                           \
+    float32_t *swap;                                                            \
+    float32_t rowMin;                                                           \
+                                                                                \
+    cur[0] = LOCALDIST(0,0);                                                    \
+    rowMin = cur[0];                                                            \
+    for(uint32_t j = 1; j < nbInner; j++)                                       \
+    {                                                                           \
+        cur[j] = DTW_WIN(0,j) ? cur[j-1] + LOCALDIST(0,j) : F32_MAX;            \
+        rowMin = cur[j] < rowMin ? cur[j] : rowMin;                             \
+    }                                                                           \
+                                                                                \
+    for(uint32_t i = 1; i < nbOuter; i++)                                       \
+    {                                                                           \
+        if (rowMin > bound)                                                     \
+        {                                                                       \
+            return(INFINITY);                                                   \
+        }                                                                       \
+        swap = prev;                                                            \
+        prev = cur;                                                             \
+        cur = swap;                                                             \
+                                                                                \
+        cur[0] = DTW_WIN(i,0) ? prev[0] + LOCALDIST(i,0) : F32_MAX;             \
+        rowMin = cur[0];                                                        \
+        for(uint32_t j = 1; j < nbInner; j++)                                   \
+        {                                                                       \
+            if (!DTW_WIN(i,j))                                                  \
+            {                                                                   \
+                cur[j] = F32_MAX;                                               \
+                continue;                                                       \
+            }                                                                   \
+            float32_t d = LOCALDIST(i,j);                                       \
+            cur[j] = MIN(prev[j-1] + 2.0f * d,                                  \
+                     MIN(cur[j-1]  +        d,                                  \
+                         prev[j]   +        d));                                \
+            rowMin = cur[j] < rowMin ? cur[j] : rowMin;                         \
+        }                                                                       \
+    }                                                                           \
+                                                                                \
+    return(rowMin > bound ? INFINITY : cur[nbInner-1]);                         \
+}
+
+/* Cost from a distance matrix */
+#define DTW_MATRIXDIST(I,J) pDist[(I)*distOuter + (J)*distInner]
+
+DTWROLLING(dtwRollingMatrix,
+  (const float32_t *pDist,npy_intp distOuter,npy_intp distInner,
+   const q7_t *pWin,npy_intp winOuter,npy_intp winInner,
+   uint32_t nbOuter,uint32_t nbInner,float32_t bound,float32_t *pWork),
+  DTW_MATRIXDIST);
+
+/* Cost from two sequences with the absolute difference as distance */
+#define DTW_SERIESDIST(I,J) fabsf(pOuter[(I)] - pInner[(J)])
+
+DTWROLLING(dtwRollingSeries,
+  (const float32_t *pOuter,const float32_t *pInner,
+   const q7_t *pWin,npy_intp winOuter,npy_intp winInner,
+   uint32_t nbOuter,uint32_t nbInner,float32_t bound,float32_t *pWork),
+  DTW_SERIESDIST);
+
+static PyObject *
+cmsis_arm_dtw_distance_only_f32(PyObject *obj, 
+                                PyObject *args)
+{
+
+  PyObject *pDist=NULL; // input
+  arm_matrix_instance_f32 pDist_converted; // input
+   
+  PyObject *pWin=NULL; // input
+  arm_matrix_instance_q7 pWin_converted; // input
+  PyArrayObject *pWin_converted_ref=NULL;
+  const q7_t *pWinData=NULL;
+
+  if (PyArg_ParseTuple(args,"OO",&pDist,&pWin))
+  {
+
+    GETMATRIXARGUMENT(f32,pDist);
+    if (pDist_converted.pData == NULL)
+    {
+       return(NULL);
+    }
+    uint32_t row = pDist_converted.numRows ;
+    uint32_t column = pDist_converted.numCols ;
+
+    if ((row == 0) || (column == 0))
+    {
+       PyErr_SetString(PyExc_ValueError,"the distance matrix must not be empty");
+       FREEMATRIXARGUMENT(pDist_converted);
+       return(NULL);
+    }
+
+    if (pWin != Py_None)
+    {
+       pWin_converted_ref = q7MatrixBorrowFromNumpy(&pWin_converted,pWin);
+       if ((pWin_converted.pData == NULL) || 
+           (pWin_converted.numRows != row) || 
+           (pWin_converted.numCols != column))
+       {
+          if (!PyErr_Occurred())
+          {
+             PyErr_SetString(PyExc_ValueError,"the window must have the dimensions of the distance matrix");
+          }
+          FREEMATRIXARGUMENT(pDist_converted);
+          FREEMATRIXARGUMENT(pWin_converted);
+          return(NULL);
+       }
+       pWinData = pWin_converted.pData;
+    }
+
+    /* The rows of the workspace are along the longest dimension */
+    int transposed = column > row;
+    uint32_t nbOuter = transposed ? column : row;
+    uint32_t nbInner = transposed ? row : column;
+    npy_intp outerStride = transposed ? 1 : column;
+    npy_intp innerStride = transposed ? column : 1;
+    float32_t *pWork = PyMem_Malloc(sizeof(float32_t)*2*nbInner);
+    float32_t cost;
+
+    if (pWork == NULL)
+    {
+       FREEMATRIXARGUMENT(pDist_converted);
+       if (pWin != Py_None)
+       {
+          FREEMATRIXARGUMENT(pWin_converted);
+       }
+       return(PyErr_NoMemory());
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    cost = dtwRollingMatrix(pDist_converted.pData,outerStride,innerStride,
+                            pWinData,outerStride,innerStride,
+                            nbOuter,nbInner,INFINITY,pWork);
+    Py_END_ALLOW_THREADS
+
+    arm_status returnValue = ARM_MATH_SUCCESS;
+    float32_t distance = 0.0f;
+    if (cost == F32_MAX)
+    {
+       returnValue = ARM_MATH_ARGUMENT_ERROR;
+    }
+    else
+    {
+       distance = cost / (row + column);
+    }
+
+    PyObject *pythonResult = Py_BuildValue("if",returnValue,distance);
+
+    PyMem_Free(pWork);
+    FREEMATRIXARGUMENT(pDist_converted);
+    if (pWin != Py_None)
+    {
+       FREEMATRIXARGUMENT(pWin_converted);
+    }
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+/*
+
+k nearest templates of a query for the DTW distance.
+
+The templates are the rows of a 2D array. The distance between
+samples is the absolute difference so the result is the same as
+arm_dtw_distance_f32 with the matrix of absolute differences.
+
+LB_Keogh lower bound : column t of the path is matched with
+a sample of the query in the rows allowed by the window. The
+envelope [L[t],U[t]] of those samples gives a lower bound
+of the cost of a template : the sum of the distances of the
+template samples to the envelope. The templates are processed by
+increasing lower bound and the search is stopped when the lower
+bound is bigger than the k-th best distance. The DTW computation is
+abandoned as soon as a row of the cost matrix is bigger than the
+k-th best cost.
+
+*/
+
+/* Relative margin on the lower bound for the rounding errors of the sums */
+#define DTW_LB_TOLERANCE 1.0e-4f
+
+typedef struct {
+    float32_t lb;
+    uint32_t index;
+} dtw_lb_t;
+
+static int compareLowerBounds(const void *a,const void *b)
+{
+    const dtw_lb_t *la = (const dtw_lb_t *)a;
+    const dtw_lb_t *lb = (const dtw_lb_t *)b;
+    if (la->lb != lb->lb)
+    {
+        return(la->lb < lb->lb ? -1 : 1);
+    }
+    return(la->index < lb->index ? -1 : (la->index > lb->index));
+}
+
+/* Envelope of the query for each column of the window */
+static void dtwEnvelope(const float32_t *pQuery,uint32_t queryLength,
+   uint32_t templateLength,const q7_t *pWin,
+   float32_t *pLower,float32_t *pUpper)
+{
+    for(uint32_t t = 0; t < templateLength; t++)
+    {
+        pLower[t] = INFINITY;
+        pUpper[t] = -INFINITY;
+        for(uint32_t q = 0; q < queryLength; q++)
+        {
+            if ((pWin == NULL) || (pWin[q*templateLength + t] == 1))
+            {
+                pLower[t] = pQuery[q] < pLower[t] ? pQuery[q] : pLower[t];
+                pUpper[t] = pQuery[q] > pUpper[t] ? pQuery[q] : pUpper[t];
+            }
+        }
+    }
+}
+
+static float32_t dtwLowerBound(const float32_t *pTemplate,uint32_t templateLength,
+   const float32_t *pLower,const float32_t *pUpper)
+{
+    float32_t lb = 0.0f;
+    for(uint32_t t = 0; t < templateLength; t++)
+    {
+        /* Columns without allowed samples are giving an infinite bound */
+        if (pTemplate[t] > pUpper[t])
+        {
+            lb += pTemplate[t] - pUpper[t];
+        }
+        else if (pTemplate[t] < pLower[t])
+        {
+            lb += pLower[t] - pTemplate[t];
+        }
+    }
+    return(lb);
+}
+
+/* Length of the workspace of dtwTopk (in float32_t) */
+#define DTW_TOPK_WORK(QUERYLENGTH,TEMPLATELENGTH) \
+  (2*(npy_intp)MIN((QUERYLENGTH),(TEMPLATELENGTH)) + 2*(npy_intp)(TEMPLATELENGTH))
+
+/* Return the number of templates for which the DTW was computed.
+   pWork has DTW_TOPK_WORK samples, pBounds nbTemplates elements
+   and pCost (raw costs of the k best templates) k samples. */
+static uint32_t dtwTopk(const float32_t *pQuery,uint32_t queryLength,
+   const float32_t *pTemplates,uint32_t nbTemplates,uint32_t templateLength,
+   const q7_t *pWin,uint32_t k,int32_t *pIdx,float32_t *pDist,
+   float32_t *pWork,dtw_lb_t *pBounds,float32_t *pCost)
+{
+    uint32_t nbComputed = 0;
+    int transposed = queryLength < templateLength;
+    uint32_t nbOuter = transposed ? templateLength : queryLength;
+    uint32_t nbInner = transposed ? queryLength : templateLength;
+    npy_intp winOuter = transposed ? 1 : templateLength;
+    npy_intp winInner = transposed ? templateLength : 1;
+    float32_t norm = (float32_t)(queryLength + templateLength);
+
+    float32_t *pLower = pWork + 2*nbInner;
+    float32_t *pUpper = pLower + templateLength;
+
+    for(uint32_t i = 0; i < k; i++)
+    {
+        pIdx[i] = -1;
+        pCost[i] = INFINITY;
+    }
+
+    dtwEnvelope(pQuery,queryLength,templateLength,pWin,pLower,pUpper);
+    for(uint32_t n = 0; n < nbTemplates; n++)
+    {
+        pBounds[n].lb = dtwLowerBound(pTemplates + (npy_intp)n*templateLength,
+           templateLength,pLower,pUpper);
+        pBounds[n].index = n;
+    }
+    qsort(pBounds,nbTemplates,sizeof(dtw_lb_t),compareLowerBounds);
+
+    for(uint32_t n = 0; n < nbTemplates; n++)
+    {
+        float32_t bound = pCost[k-1];
+        if (pBounds[n].lb > bound * (1.0f + DTW_LB_TOLERANCE))
+        {
+            /* Other templates have a bigger lower bound */
+            break;
+        }
+
+        uint32_t index = pBounds[n].index;
+        const float32_t *pTemplate = pTemplates + (npy_intp)index*templateLength;
+        float32_t cost = dtwRollingSeries(transposed ? pTemplate : pQuery,
+                                          transposed ? pQuery : pTemplate,
+                                          pWin,winOuter,winInner,
+                                          nbOuter,nbInner,bound,pWork);
+        nbComputed++;
+
+        /* Ties are sorted by template index */
+        /* No path when the cost is bigger than F32_MAX */
+        if ((cost >= F32_MAX) || (cost > bound) || 
+            ((cost == bound) && ((int32_t)index > pIdx[k-1]) && (pIdx[k-1] >= 0)))
+        {
+            continue;
+        }
+
+        uint32_t pos = k-1;
+        while((pos > 0) && 
+              ((pCost[pos-1] > cost) || 
+               ((pCost[pos-1] == cost) && (pIdx[pos-1] > (int32_t)index))))
+        {
+            pCost[pos] = pCost[pos-1];
+            pIdx[pos] = pIdx[pos-1];
+            pos--;
+        }
+        pCost[pos] = cost;
+        pIdx[pos] = index;
+    }
+
+    for(uint32_t i = 0; i < k; i++)
+    {
+        pDist[i] = pIdx[i] >= 0 ? pCost[i] / norm : INFINITY;
+    }
+
+    return(nbComputed);
+}
+
+static PyObject *
+cmsis_arm_dtw_topk_f32(PyObject *obj, PyObject *args)
+{
+  PyObject *pQuery=NULL; // input
+  float32_t *pQuery_converted=NULL; // input
+  PyObject *templates=NULL; // input
+  float32_t *templates_converted=NULL; // input
+  PyObject *pWin=NULL; // input
+  arm_matrix_instance_q7 pWin_converted; // input
+  PyArrayObject *pWin_converted_ref=NULL;
+  const q7_t *pWinData=NULL;
+  uint32_t k=1; // input
+
+  if (PyArg_ParseTuple(args,"OOO|I",&pQuery,&templates,&pWin,&k))
+  {
+    GETARGUMENT(pQuery,NPY_DOUBLE,double,float32_t);
+    GETFRAMESARGUMENT(templates,NPY_DOUBLE,double,float32_t);
+    uint32_t queryLength = arraySizepQuery;
+    uint32_t templateLength = nbColstemplates;
+    uint32_t nbTemplates = nbRowstemplates;
+
+    if ((pQuery_converted == NULL) || (templates_converted == NULL))
+    {
+       if (pQuery_converted) {FREEARGUMENT(pQuery_converted);}
+       if (templates_converted) {FREEARGUMENT(templates_converted);}
+       return(NULL);
+    }
+
+    if ((queryLength == 0) || (templateLength == 0) || 
+        (k == 0) || (k > nbTemplates))
+    {
+       PyErr_SetString(PyExc_ValueError,
+          "the sequences must not be empty and k must be between 1 and the number of templates");
+       FREEARGUMENT(pQuery_converted);
+       FREEARGUMENT(templates_converted);
+       return(NULL);
+    }
+
+    if (pWin != Py_None)
+    {
+       pWin_converted_ref = q7MatrixBorrowFromNumpy(&pWin_converted,pWin);
+       if ((pWin_converted.pData == NULL) || 
+           (pWin_converted.numRows != queryLength) || 
+           (pWin_converted.numCols != templateLength))
+       {
+          if (!PyErr_Occurred())
+          {
+             PyErr_SetString(PyExc_ValueError,"the window must be a query length x template length matrix");
+          }
+          FREEARGUMENT(pQuery_converted);
+          FREEARGUMENT(templates_converted);
+          FREEMATRIXARGUMENT(pWin_converted);
+          return(NULL);
+       }
+       pWinData = pWin_converted.pData;
+    }
+
+    int32_t *pIdx=PyMem_Malloc(sizeof(int32_t)*k);
+    float32_t *pDist=PyMem_Malloc(sizeof(float32_t)*k);
+    float32_t *pWork=PyMem_Malloc(sizeof(float32_t)*DTW_TOPK_WORK(queryLength,templateLength));
+    dtw_lb_t *pBounds=PyMem_Malloc(sizeof(dtw_lb_t)*nbTemplates);
+    float32_t *pCost=PyMem_Malloc(sizeof(float32_t)*k);
+    uint32_t nbComputed;
+
+    if ((pIdx == NULL) || (pDist == NULL) || (pWork == NULL) || 
+        (pBounds == NULL) || (pCost == NULL))
+    {
+       PyMem_Free(pIdx);
+       PyMem_Free(pDist);
+       PyMem_Free(pWork);
+       PyMem_Free(pBounds);
+       PyMem_Free(pCost);
+       FREEARGUMENT(pQuery_converted);
+       FREEARGUMENT(templates_converted);
+       if (pWin != Py_None)
+       {
+          FREEMATRIXARGUMENT(pWin_converted);
+       }
+       return(PyErr_NoMemory());
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    nbComputed = dtwTopk(pQuery_converted,queryLength,
+       templates_converted,nbTemplates,templateLength,
+       pWinData,k,pIdx,pDist,pWork,pBounds,pCost);
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(pWork);
+    PyMem_Free(pBounds);
+    PyMem_Free(pCost);
+
+    INT32ARRAY1(pIdxOBJ,k,pIdx);
+    FLOATARRAY1(pDistOBJ,k,pDist);
+
+    PyObject *pythonResult = Py_BuildValue("OOI",pIdxOBJ,pDistOBJ,nbComputed);
+
+    FREEARGUMENT(pQuery_converted);
+    FREEARGUMENT(templates_converted);
+    if (pWin != Py_None)
+    {
+       FREEMATRIXARGUMENT(pWin_converted);
+    }
+    Py_DECREF(pIdxOBJ);
+    Py_DECREF(pDistOBJ);
+    return(pythonResult);
+  }
+  return(NULL);
+}
+
+/*
 
+Pairwise distances between the rows of 2D arrays (like scipy cdist and pdist).
+
+The distance is selected with the name of the metric. The rows of the
+second array are processed by tiles of DIST_TILE_BYTES so that a tile
+stays in the cache while it is compared with all the rows of the first
+array. The GIL is released during the computation. The submodule batch
+is distributing the rows on several threads.
+
+f32 metrics are using float32 rows. bool metrics are using rows of
+packed bits (uint32 words) like arm_jaccard_distance.
+
+*/
+#define DIST_TILE_BYTES 32768
+
+static uint32_t distTile(uint32_t rowBytes)
+{
+    uint32_t tile = rowBytes ? DIST_TILE_BYTES / rowBytes : 1;
+    return(tile > 0 ? tile : 1);
+}
+
+/* Offset of row i of a condensed distance matrix (pdist) */
+static npy_intp condensedOffset(npy_intp i,npy_intp nb)
+{
+    return(i*nb - i*(i+1)/2);
+}
+
+/* Distance between two rows. pTmp has room for two rows. */
+typedef float32_t (*dist_f32_t)(const float32_t *pA,const float32_t *pB,
+   uint32_t blockSize,int32_t p,float32_t *pTmp);
+typedef float32_t (*dist_bool_t)(const uint32_t *pA,const uint32_t *pB,
+   uint32_t blockSize,int32_t p,float32_t *pTmp);
+
+#define DISTF32(NAME)                                                      \
+static float32_t dist_f32_##NAME(const float32_t *pA,const float32_t *pB,  \
+   uint32_t blockSize,int32_t p,float32_t *pTmp)                           \
+{                                                                          \
+    return(arm_##NAME##_distance_f32(pA,pB,blockSize));                    \
+}
+
+#define DISTBOOL(NAME)                                                     \
+static float32_t dist_bool_##NAME(const uint32_t *pA,const uint32_t *pB,   \
+   uint32_t blockSize,int32_t p,float32_t *pTmp)                           \
+{                                                                          \
+    return(arm_##NAME##_distance(pA,pB,blockSize));                        \
+}
+
+DISTF32(braycurtis);
+DISTF32(canberra);
+DISTF32(chebyshev);
+DISTF32(cityblock);
+DISTF32(cosine);
+DISTF32(euclidean);
+DISTF32(jensenshannon);
+
+/* The input vectors are modified by the kernel */
+static float32_t dist_f32_correlation(const float32_t *pA,const float32_t *pB,
+   uint32_t blockSize,int32_t p,float32_t *pTmp)
+{
+    memcpy(pTmp,pA,sizeof(float32_t)*blockSize);
+    memcpy(pTmp+blockSize,pB,sizeof(float32_t)*blockSize);
+    return(arm_correlation_distance_f32(pTmp,pTmp+blockSize,blockSize));
+}
+
+static float32_t dist_f32_minkowski(const float32_t *pA,const float32_t *pB,
+   uint32_t blockSize,int32_t p,float32_t *pTmp)
+{
+    return(arm_minkowski_distance_f32(pA,pB,p,blockSize));
+}
+
+DISTBOOL(dice);
+DISTBOOL(hamming);
+DISTBOOL(jaccard);
+DISTBOOL(kulsinski);
+DISTBOOL(rogerstanimoto);
+DISTBOOL(russellrao);
+DISTBOOL(sokalmichener);
+DISTBOOL(sokalsneath);
+DISTBOOL(yule);
+
+typedef struct {
+    const char *name;
+    dist_f32_t f;
+} metric_f32_t;
+
+typedef struct {
+    const char *name;
+    dist_bool_t f;
+} metric_bool_t;
+
+static const metric_f32_t metrics_f32[] = {
+    {"braycurtis",dist_f32_braycurtis},
+    {"canberra",dist_f32_canberra},
+    {"chebyshev",dist_f32_chebyshev},
+    {"cityblock",dist_f32_cityblock},
+    {"correlation",dist_f32_correlation},
+    {"cosine",dist_f32_cosine},
+    {"euclidean",dist_f32_euclidean},
+    {"jensenshannon",dist_f32_jensenshannon},
+    {"minkowski",dist_f32_minkowski},
+    {NULL,NULL}
+};
+
+static const metric_bool_t metrics_bool[] = {
+    {"dice",dist_bool_dice},
+    {"hamming",dist_bool_hamming},
+    {"jaccard",dist_bool_jaccard},
+    {"kulsinski",dist_bool_kulsinski},
+    {"rogerstanimoto",dist_bool_rogerstanimoto},
+    {"russellrao",dist_bool_russellrao},
+    {"sokalmichener",dist_bool_sokalmichener},
+    {"sokalsneath",dist_bool_sokalsneath},
+    {"yule",dist_bool_yule},
+    {NULL,NULL}
+};
+
+/*
+
+Tiled kernels for the f32 and bool metrics.
+rowLen is the number of elements of a row and blockSize
+the argument of the distance (number of samples or bits).
+
+*/
+#define DISTKERNELS(EXT,TYP)                                                   \
+static dist_##EXT##_t metric_##EXT(const char *name)                           \
+{                                                                              \
+    const metric_##EXT##_t *m;                                                 \
+    for(m = metrics_##EXT; m->name != NULL; m++)                               \
+    {                                                                          \
+        if (strcmp(m->name,name) == 0)                                         \
+        {                                                                      \
+            return(m->f);                                                      \
+        }                                                                      \
+    }                                                                          \
+    PyErr_Format(PyExc_ValueError,"unknown " #EXT " metric %s",name);          \
+    return(NULL);                                                              \
+}                                                                              \
+                                                                               \
+static void cdist_##EXT(dist_##EXT##_t f,                                      \
+   const TYP *pA,uint32_t nbA,const TYP *pB,uint32_t nbB,                      \
+   uint32_t rowLen,uint32_t blockSize,int32_t p,float32_t *pTmp,               \
+   float32_t *pDst)                                                            \
+{                                                                              \
+    uint32_t tile = distTile(sizeof(TYP)*rowLen);                              \
+    for(uint32_t jb=0; jb < nbB; jb += tile)                                   \
+    {                                                                          \
+        uint32_t je = jb + tile < nbB ? jb + tile : nbB;                       \
+        for(uint32_t i=0; i < nbA; i++)                                        \
+        {                                                                      \
+            const TYP *a = pA + (npy_intp)i*rowLen;                            \
+            float32_t *d = pDst + (npy_intp)i*nbB;                             \
+            for(uint32_t j=jb; j < je; j++)                                    \
+            {                                                                  \
+                d[j] = f(a,pB + (npy_intp)j*rowLen,blockSize,p,pTmp);          \
+            }                                                                  \
+        }                                                                      \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+/* Rows [first,last) of the condensed distance matrix */                       \
+static void pdist_##EXT(dist_##EXT##_t f,                                      \
+   const TYP *pX,uint32_t nb,uint32_t first,uint32_t last,                     \
+   uint32_t rowLen,uint32_t blockSize,int32_t p,float32_t *pTmp,               \
+   float32_t *pDst)                                                            \
+{                                                                              \
+    uint32_t tile = distTile(sizeof(TYP)*rowLen);                              \
+    for(uint32_t jb=first+1; jb < nb; jb += tile)                              \
+    {                                                                          \
+        uint32_t je = jb + tile < nb ? jb + tile : nb;                         \
+        uint32_t ie = je - 1 < last ? je - 1 : last;                           \
+        for(uint32_t i=first; i < ie; i++)                                     \
+        {                                                                      \
+            const TYP *a = pX + (npy_intp)i*rowLen;                            \
+            /* Index of the distance (i,j) is base + j */                      \
+            npy_intp base = condensedOffset(i,nb) - i - 1;                     \
+            uint32_t js = jb > i ? jb : i + 1;                                 \
+            for(uint32_t j=js; j < je; j++)                                    \
+            {                                                                  \
+                pDst[base + j] = f(a,pX + (npy_intp)j*rowLen,blockSize,p,pTmp);\
+            }                                                                  \
+        }                                                                      \
+    }                                                                          \
+}                                                                              \
+                                                                               \
+/* The k nearest rows of B sorted by distance. The full distance              \
+   matrix is not computed : only the k best distances of each row             \
+   of A are kept. */                                                           \
+static void topk_##EXT(dist_##EXT##_t f,                                       \
+   const TYP *pA,uint32_t nbA,const TYP *pB,uint32_t nbB,uint32_t k,           \
+   uint32_t rowLen,uint32_t blockSize,int32_t p,float32_t *pTmp,               \
+   int32_t *pIdx,float32_t *pDist)                                             \
+{                                                                              \
+    uint32_t tile = distTile(sizeof(TYP)*rowLen);                              \
+    for(npy_intp i=0; i < (npy_intp)nbA*k; i++)                                \
+    {                                                                          \
+        pIdx[i] = -1;                                                          \
+        pDist[i] = INFINITY;                                                   \
+    }                                                                          \
+    for(uint32_t jb=0; jb < nbB; jb += tile)                                   \
+    {                                                                          \
+        uint32_t je = jb + tile < nbB ? jb + tile : nbB;                       \
+        for(uint32_t i=0; i < nbA; i++)                                        \
+        {                                                                      \
+            const TYP *a = pA + (npy_intp)i*rowLen;                            \
+            int32_t *idx = pIdx + (npy_intp)i*k;                               \
+            float32_t *dist = pDist + (npy_intp)i*k;                           \
+            for(uint32_t j=jb; j < je; j++)                                    \
+            {                                                                  \
+                float32_t d = f(a,pB + (npy_intp)j*rowLen,blockSize,p,pTmp);   \
+                if (d < dist[k-1])                                             \
+                {                                                              \
+                    /* Insertion after the equal distances so that the */      \
+                    /* order is stable */                                      \
+                    uint32_t pos = k-1;                                        \
+                    while((pos > 0) && (dist[pos-1] > d))                      \
+                    {                                                          \
+                        dist[pos] = dist[pos-1];                               \
+                        idx[pos] = idx[pos-1];                                 \
+                        pos--;                                                 \
+                    }                                                          \
+                    dist[pos] = d;                                             \
+                    idx[pos] = j;                                              \
+                }                                                              \
+            }                                                                  \
+        }                                                                      \
+    }                                                                          \
 }
 
+DISTKERNELS(f32,float32_t);
+DISTKERNELS(bool,uint32_t);
+
+/*
+
+Python functions.
+For f32, the argument after the metric is the order of
+the minkowski distance (2 by default).
+For bool, it is the number of bits in a row.
+
+*/
+#define DISTFUNCTIONS(EXT,TYP,NPYTYPE,SRCFORMAT,PARAMFMT,RANGEFMT,PARAM,DEFAULT,BLOCKSIZE) \
+static int checkDistInputs_##EXT(TYP *pA,uint32_t nbColsA,                     \
+   TYP *pB,uint32_t nbColsB,int32_t PARAM)                                     \
+{                                                                              \
+    if ((pA == NULL) || (pB == NULL))                                          \
+    {                                                                          \
+       return(0);                                                              \
+    }                                                                          \
+    if (nbColsA != nbColsB)                                                    \
+    {                                                                          \
+       PyErr_SetString(PyExc_ValueError,                                       \
+          "the arrays must have the same number of columns");                  \
+       return(0);                                                              \
+    }                                                                          \
+    if (!checkDistParam_##EXT(nbColsA,PARAM))                                  \
+    {                                                                          \
+       return(0);                                                              \
+    }                                                                          \
+    return(1);                                                                 \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+cmsis_arm_cdist_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)           \
+{                                                                              \
+  PyObject *XA=NULL; /* input */                                               \
+  TYP *XA_converted=NULL; /* input */                                          \
+  PyObject *XB=NULL; /* input */                                               \
+  TYP *XB_converted=NULL; /* input */                                          \
+  const char *metric=NULL; /* input */                                         \
+  int32_t PARAM=DEFAULT; /* input */                                           \
+  float32_t *pDst=NULL; /* output */                                           \
+  PyObject *out=NULL; /* output */                                             \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OOs" PARAMFMT,&XA,&XB,&metric,&PARAM) &&          \
+      parseOutKeyword(args,kwds,&out))                                              \
+  {                                                                            \
+    dist_##EXT##_t f = metric_##EXT(metric);                                   \
+    if (f == NULL)                                                             \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    GETFRAMESARGUMENT(XA,NPYTYPE,SRCFORMAT,TYP);                               \
+    GETFRAMESARGUMENT(XB,NPYTYPE,SRCFORMAT,TYP);                               \
+    if (!checkDistInputs_##EXT(XA_converted,nbColsXA,                          \
+          XB_converted,nbColsXB,PARAM))                                        \
+    {                                                                          \
+       if (XA_converted) {FREEARGUMENT(XA_converted);}                         \
+       if (XB_converted) {FREEARGUMENT(XB_converted);}                         \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbRowsXA,nbRowsXB);                   \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      float32_t *pTmp = PyMem_Malloc(sizeof(float32_t)*(2*nbColsXA+1));        \
+      if (pTmp == NULL)                                                        \
+      {                                                                        \
+         FREEOUTPUT(pDst);                                                     \
+         FREEARGUMENT(XA_converted);                                           \
+         FREEARGUMENT(XB_converted);                                           \
+         return(PyErr_NoMemory());                                             \
+      }                                                                        \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      uint32_t rowLen = nbColsXA;                                              \
+      cdist_##EXT(f,XA_converted,nbRowsXA,XB_converted,nbRowsXB,               \
+         rowLen,BLOCKSIZE,PARAM,pTmp,pDst);                                    \
+      Py_END_ALLOW_THREADS                                                     \
+      PyMem_Free(pTmp);                                                        \
+    }                                                                          \
+    OUTPUTARRAY2D(pDstOBJ,nbRowsXA,nbRowsXB,pDst,NPY_FLOAT);                   \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                       \
+                                                                               \
+    FREEARGUMENT(XA_converted);                                                \
+    FREEARGUMENT(XB_converted);                                                \
+    Py_XDECREF(pDstOBJ);                                                       \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+cmsis_arm_pdist_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)           \
+{                                                                              \
+  PyObject *X=NULL; /* input */                                                \
+  TYP *X_converted=NULL; /* input */                                           \
+  const char *metric=NULL; /* input */                                         \
+  int32_t PARAM=DEFAULT; /* input */                                           \
+  Py_ssize_t first=0,last=-1; /* input */                                      \
+  float32_t *pDst=NULL; /* output */                                           \
+  PyObject *out=NULL; /* output */                                             \
+                                                                               \
+  if (PyArg_ParseTuple(args,"Os" PARAMFMT RANGEFMT,&X,&metric,&PARAM,&first,&last) &&    \
+      parseOutKeyword(args,kwds,&out))                                              \
+  {                                                                            \
+    dist_##EXT##_t f = metric_##EXT(metric);                                   \
+    if (f == NULL)                                                             \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    GETFRAMESARGUMENT(X,NPYTYPE,SRCFORMAT,TYP);                                \
+    if (!checkDistInputs_##EXT(X_converted,nbColsX,X_converted,nbColsX,PARAM)) \
+    {                                                                          \
+       if (X_converted) {FREEARGUMENT(X_converted);}                           \
+       return(NULL);                                                           \
+    }                                                                          \
+    if (last < 0)                                                              \
+    {                                                                          \
+       last = nbRowsX;                                                         \
+    }                                                                          \
+    if ((first < 0) || (first > last) || (last > nbRowsX))                     \
+    {                                                                          \
+       PyErr_SetString(PyExc_ValueError,"invalid range of rows");              \
+       FREEARGUMENT(X_converted);                                              \
+       return(NULL);                                                           \
+    }                                                                          \
+    npy_intp nbDist = condensedOffset(nbRowsX,nbRowsX);                        \
+                                                                               \
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,nbDist);                                \
+                                                                               \
+    /* Without out=, the distances of the rows out of the range are zero */   \
+    if (pDst && !pDst_out && ((first > 0) || (last < nbRowsX)))                \
+    {                                                                          \
+      memset(pDst,0,sizeof(float32_t)*nbDist);                                 \
+    }                                                                          \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      float32_t *pTmp = PyMem_Malloc(sizeof(float32_t)*(2*nbColsX+1));         \
+      if (pTmp == NULL)                                                        \
+      {                                                                        \
+         FREEOUTPUT(pDst);                                                     \
+         FREEARGUMENT(X_converted);                                            \
+         return(PyErr_NoMemory());                                             \
+      }                                                                        \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      uint32_t rowLen = nbColsX;                                               \
+      pdist_##EXT(f,X_converted,nbRowsX,(uint32_t)first,(uint32_t)last,        \
+         rowLen,BLOCKSIZE,PARAM,pTmp,pDst);                                    \
+      Py_END_ALLOW_THREADS                                                     \
+      PyMem_Free(pTmp);                                                        \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,nbDist,pDst,NPY_FLOAT);                               \
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                       \
+                                                                               \
+    FREEARGUMENT(X_converted);                                                 \
+    Py_XDECREF(pDstOBJ);                                                       \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+cmsis_arm_cdist_topk_##EXT(PyObject *obj, PyObject *args)                      \
+{                                                                              \
+  PyObject *XA=NULL; /* input */                                               \
+  TYP *XA_converted=NULL; /* input */                                          \
+  PyObject *XB=NULL; /* input */                                               \
+  TYP *XB_converted=NULL; /* input */                                          \
+  const char *metric=NULL; /* input */                                         \
+  uint32_t k=0; /* input */                                                    \
+  int32_t PARAM=DEFAULT; /* input */                                           \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OOsI" PARAMFMT,&XA,&XB,&metric,&k,&PARAM))        \
+  {                                                                            \
+    dist_##EXT##_t f = metric_##EXT(metric);                                   \
+    if (f == NULL)                                                             \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    GETFRAMESARGUMENT(XA,NPYTYPE,SRCFORMAT,TYP);                               \
+    GETFRAMESARGUMENT(XB,NPYTYPE,SRCFORMAT,TYP);                               \
+    if (!checkDistInputs_##EXT(XA_converted,nbColsXA,                          \
+          XB_converted,nbColsXB,PARAM))                                        \
+    {                                                                          \
+       if (XA_converted) {FREEARGUMENT(XA_converted);}                         \
+       if (XB_converted) {FREEARGUMENT(XB_converted);}                         \
+       return(NULL);                                                           \
+    }                                                                          \
+    if ((k == 0) || (k > nbRowsXB))                                            \
+    {                                                                          \
+       PyErr_SetString(PyExc_ValueError,                                       \
+          "k must be between 1 and the number of rows of XB");                 \
+       FREEARGUMENT(XA_converted);                                             \
+       FREEARGUMENT(XB_converted);                                             \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    int32_t *pIdx=PyMem_Malloc(sizeof(int32_t)*nbRowsXA*k);                    \
+    float32_t *pDist=PyMem_Malloc(sizeof(float32_t)*nbRowsXA*k);               \
+    float32_t *pTmp = PyMem_Malloc(sizeof(float32_t)*(2*nbColsXA+1));          \
+    if ((pIdx == NULL) || (pDist == NULL) || (pTmp == NULL))                   \
+    {                                                                          \
+       PyMem_Free(pIdx);                                                       \
+       PyMem_Free(pDist);                                                      \
+       PyMem_Free(pTmp);                                                       \
+       FREEARGUMENT(XA_converted);                                             \
+       FREEARGUMENT(XB_converted);                                             \
+       return(PyErr_NoMemory());                                               \
+    }                                                                          \
+                                                                               \
+    uint32_t rowLen = nbColsXA;                                                \
+    Py_BEGIN_ALLOW_THREADS                                                     \
+    topk_##EXT(f,XA_converted,nbRowsXA,XB_converted,nbRowsXB,k,                \
+       rowLen,BLOCKSIZE,PARAM,pTmp,pIdx,pDist);                                \
+    Py_END_ALLOW_THREADS                                                       \
+    PyMem_Free(pTmp);                                                          \
+                                                                               \
+    npy_intp dims[2];                                                          \
+    dims[0]=nbRowsXA;                                                          \
+    dims[1]=k;                                                                 \
+    PyArrayObject *pIdxOBJ=(PyArrayObject*)PyArray_SimpleNewFromData(2,dims,NPY_INT32,pIdx);\
+    PyArray_SetBaseObject(pIdxOBJ,PyCapsule_New(pIdx,"cmsisdsp capsule",capsule_cleanup));\
+    PyArrayObject *pDistOBJ=(PyArrayObject*)PyArray_SimpleNewFromData(2,dims,NPY_FLOAT,pDist);\
+    PyArray_SetBaseObject(pDistOBJ,PyCapsule_New(pDist,"cmsisdsp capsule",capsule_cleanup));\
+                                                                               \
+    PyObject *pythonResult = Py_BuildValue("OO",pIdxOBJ,pDistOBJ);             \
+                                                                               \
+    FREEARGUMENT(XA_converted);                                                \
+    FREEARGUMENT(XB_converted);                                                \
+    Py_DECREF(pIdxOBJ);                                                        \
+    Py_DECREF(pDistOBJ);                                                       \
+    return(pythonResult);                                                      \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+static int checkDistParam_f32(uint32_t nbCols,int32_t p)
+{
+    if (p < 1)
+    {
+       PyErr_SetString(PyExc_ValueError,"the order of the minkowski distance must be positive");
+       return(0);
+    }
+    return(1);
+}
+
+static int checkDistParam_bool(uint32_t nbCols,int32_t nbBits)
+{
+    if ((nbBits < 0) || ((uint32_t)nbBits > 32*nbCols))
+    {
+       PyErr_SetString(PyExc_ValueError,"the number of bits is bigger than the rows");
+       return(0);
+    }
+    return(1);
+}
+
+DISTFUNCTIONS(f32,float32_t,NPY_DOUBLE,double,"|i","nn",p,2,rowLen);
+DISTFUNCTIONS(bool,uint32_t,NPY_UINT32,uint32_t,"i","|nn",nbBits,0,nbBits);
+
 static PyMethodDef CMSISDSPMethods[] = {
 
     {"arm_braycurtis_distance_f32",  cmsis_arm_braycurtis_distance_f32, METH_VARARGS,""},
@@ -384,7 +1351,16 @@ static PyMethodDef CMSISDSPMethods[] = {
 
     {"arm_dtw_init_window_q7",  cmsis_arm_dtw_init_window_q7, METH_VARARGS,""},
     {"arm_dtw_distance_f32",  cmsis_arm_dtw_distance_f32, METH_VARARGS,""},
+    {"arm_dtw_distance_only_f32",  cmsis_arm_dtw_distance_only_f32, METH_VARARGS,""},
     {"arm_dtw_path_f32",  cmsis_arm_dtw_path_f32, METH_VARARGS,""},
+    {"arm_dtw_topk_f32",  cmsis_arm_dtw_topk_f32, METH_VARARGS,""},
+
+    {"arm_cdist_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cdist_f32, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_pdist_f32",  (PyCFunction)(void(*)(void))cmsis_arm_pdist_f32, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_cdist_topk_f32",  cmsis_arm_cdist_topk_f32, METH_VARARGS,""},
+    {"arm_cdist_bool",  (PyCFunction)(void(*)(void))cmsis_arm_cdist_bool, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_pdist_bool",  (PyCFunction)(void(*)(void))cmsis_arm_pdist_bool, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_cdist_topk_bool",  cmsis_arm_cdist_topk_bool, METH_VARARGS,""},
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
@@ -0,0 +1,50 @@
+/* ----------------------------------------------------------------------
+ * Project:      CMSIS DSP Python Wrapper
+ * Title:        cmsisdsp_f16.h
+ * Description:  float16_t for the host build of the Python wrapper
+ *
+ * $Date:        18 October 2026
+ * $Revision:    V1.10.0
+ *
+ * Target Processor: Cortex-M cores
+ * -------------------------------------------------------------------- */
+/*
+ * Copyright (C) 2010-2023 ARM Limited or its affiliates. All rights reserved.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the License); you may
+ * not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an AS IS BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#ifndef CMSISDSP_F16_H
+#define CMSISDSP_F16_H
+
+/*
+
+This header is included by setup.py before any other header
+(-include) for all the sources of the wrapper and of CMSIS-DSP.
+
+arm_math_types_f16.h is only defining float16_t when __fp16 is
+available (Arm hosts). On other hosts, the f16 kernels are built
+with _Float16 when the compiler is supporting it.
+Otherwise, the f16 functions are not available in the wrapper.
+
+*/
+#if !defined(DISABLEFLOAT16) && \
+    !defined(__ARM_FP16_FORMAT_IEEE) && \
+    !defined(__ARM_FP16_FORMAT_ALTERNATIVE) && \
+    defined(__FLT16_MAX__)
+  typedef _Float16 float16_t;
+  #define ARM_FLOAT16_SUPPORTED
+#endif
+
+#endif /* #ifndef CMSISDSP_F16_H */
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_fastmath"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_fastmath
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -62,7 +64,9 @@ cmsis_arm_vlog_q15(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vlog_q15(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  INT16ARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -96,7 +100,9 @@ cmsis_arm_vlog_q31(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vlog_q31(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  INT32ARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -406,7 +412,9 @@ cmsis_arm_vexp_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vexp_f32(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -437,7 +445,9 @@ cmsis_arm_vexp_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vexp_f64(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -468,7 +478,9 @@ cmsis_arm_vlog_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vlog_f32(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -499,7 +511,9 @@ cmsis_arm_vlog_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_vlog_f64(pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -591,6 +605,127 @@ cmsis_arm_atan2_f32(PyObject *obj, PyObject *args)
 }
 
 
+/*
+
+Array versions of the scalar fast math functions.
+The scalar function is applied to each sample of the array
+in C and the GIL is released during the loop.
+OP is computing pDst[i] from x (and y for the functions
+with 2 arguments).
+
+*/
+#define VFASTMATH1(NAME,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,OP)                   \
+static PyObject *                                                              \
+cmsis_arm_v##NAME(PyObject *obj, PyObject *args, PyObject *kwds)               \
+{                                                                              \
+  PyObject *pSrc=NULL; /* input */                                             \
+  TYP *pSrc_converted=NULL; /* input */                                        \
+  TYP *pDst=NULL; /* output */                                                 \
+  PyObject *out=NULL; /* output */                                             \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))          \
+  {                                                                            \
+    GETARGUMENT(pSrc,SRCNPYTYPE,SRCFORMAT,TYP);                                \
+    if (pSrc_converted == NULL)                                                \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizepSrc;                                                 \
+                                                                               \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                     \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      for(uint32_t i=0; i < blockSize; i++)                                    \
+      {                                                                        \
+         TYP x = pSrc_converted[i];                                            \
+         OP;                                                                   \
+      }                                                                        \
+      Py_END_ALLOW_THREADS                                                     \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                              \
+                                                                               \
+    FREEARGUMENT(pSrc_converted);                                              \
+    return((PyObject*)pDstOBJ);                                                \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+#define VFASTMATH2(NAME,TYP,NPYTYPE,SRCNPYTYPE,SRCFORMAT,OP)                   \
+static PyObject *                                                              \
+cmsis_arm_v##NAME(PyObject *obj, PyObject *args, PyObject *kwds)               \
+{                                                                              \
+  PyObject *pSrcY=NULL; /* input */                                            \
+  TYP *pSrcY_converted=NULL; /* input */                                       \
+  PyObject *pSrcX=NULL; /* input */                                            \
+  TYP *pSrcX_converted=NULL; /* input */                                       \
+  TYP *pDst=NULL; /* output */                                                 \
+  PyObject *out=NULL; /* output */                                             \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OO",&pSrcY,&pSrcX) && parseOutKeyword(args,kwds,&out)) \
+  {                                                                            \
+    GETARGUMENT(pSrcY,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    GETARGUMENT(pSrcX,SRCNPYTYPE,SRCFORMAT,TYP);                               \
+    if ((pSrcY_converted == NULL) || (pSrcX_converted == NULL) ||             \
+        (arraySizepSrcY != arraySizepSrcX))                                    \
+    {                                                                          \
+       if (pSrcY_converted && pSrcX_converted)                                 \
+       {                                                                       \
+          PyErr_SetString(PyExc_ValueError,                                    \
+             "the arrays must have the same length");                          \
+       }                                                                       \
+       if (pSrcY_converted) {FREEARGUMENT(pSrcY_converted);}                   \
+       if (pSrcX_converted) {FREEARGUMENT(pSrcX_converted);}                   \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizepSrcY;                                                \
+                                                                               \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                     \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      for(uint32_t i=0; i < blockSize; i++)                                    \
+      {                                                                        \
+         TYP y = pSrcY_converted[i];                                           \
+         TYP x = pSrcX_converted[i];                                           \
+         OP;                                                                   \
+      }                                                                        \
+      Py_END_ALLOW_THREADS                                                     \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                              \
+                                                                               \
+    FREEARGUMENT(pSrcY_converted);                                             \
+    FREEARGUMENT(pSrcX_converted);                                             \
+    return((PyObject*)pDstOBJ);                                                \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+VFASTMATH1(sin_f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double,pDst[i] = arm_sin_f32(x));
+VFASTMATH1(sin_q31,q31_t,NPY_INT32,NPY_INT32,int32_t,pDst[i] = arm_sin_q31(x));
+VFASTMATH1(sin_q15,q15_t,NPY_INT16,NPY_INT16,int16_t,pDst[i] = arm_sin_q15(x));
+VFASTMATH1(cos_f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double,pDst[i] = arm_cos_f32(x));
+VFASTMATH1(cos_q31,q31_t,NPY_INT32,NPY_INT32,int32_t,pDst[i] = arm_cos_q31(x));
+VFASTMATH1(cos_q15,q15_t,NPY_INT16,NPY_INT16,int16_t,pDst[i] = arm_cos_q15(x));
+
+/* The sqrt functions are writing 0 for the negative samples */
+VFASTMATH1(sqrt_f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double,arm_sqrt_f32(x,&pDst[i]));
+VFASTMATH1(sqrt_q31,q31_t,NPY_INT32,NPY_INT32,int32_t,arm_sqrt_q31(x,&pDst[i]));
+VFASTMATH1(sqrt_q15,q15_t,NPY_INT16,NPY_INT16,int16_t,arm_sqrt_q15(x,&pDst[i]));
+
+/* 0 is written when the angle is not defined */
+VFASTMATH2(atan2_f32,float32_t,NPY_FLOAT,NPY_DOUBLE,double,
+   if (arm_atan2_f32(y,x,&pDst[i]) != ARM_MATH_SUCCESS) pDst[i] = 0.0f);
+VFASTMATH2(atan2_q31,q31_t,NPY_INT32,NPY_INT32,int32_t,
+   if (arm_atan2_q31(y,x,&pDst[i]) != ARM_MATH_SUCCESS) pDst[i] = 0);
+VFASTMATH2(atan2_q15,q15_t,NPY_INT16,NPY_INT16,int16_t,
+   if (arm_atan2_q15(y,x,&pDst[i]) != ARM_MATH_SUCCESS) pDst[i] = 0);
+
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
@@ -618,6 +753,18 @@ static PyMethodDef CMSISDSPMethods[] = {
 {"arm_atan2_f32",  cmsis_arm_atan2_f32, METH_VARARGS,""},
 {"arm_atan2_q31",  cmsis_arm_atan2_q31, METH_VARARGS,""},
 {"arm_atan2_q15",  cmsis_arm_atan2_q15, METH_VARARGS,""},
+{"arm_vsin_f32",  (PyCFunction)(void(*)(void))cmsis_arm_vsin_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vsin_q31",  (PyCFunction)(void(*)(void))cmsis_arm_vsin_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vsin_q15",  (PyCFunction)(void(*)(void))cmsis_arm_vsin_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vcos_f32",  (PyCFunction)(void(*)(void))cmsis_arm_vcos_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vcos_q31",  (PyCFunction)(void(*)(void))cmsis_arm_vcos_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vcos_q15",  (PyCFunction)(void(*)(void))cmsis_arm_vcos_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vsqrt_f32",  (PyCFunction)(void(*)(void))cmsis_arm_vsqrt_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vsqrt_q31",  (PyCFunction)(void(*)(void))cmsis_arm_vsqrt_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vsqrt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_vsqrt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vatan2_f32",  (PyCFunction)(void(*)(void))cmsis_arm_vatan2_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vatan2_q31",  (PyCFunction)(void(*)(void))cmsis_arm_vatan2_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_vatan2_q15",  (PyCFunction)(void(*)(void))cmsis_arm_vatan2_q15, METH_VARARGS | METH_KEYWORDS,""},
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
@@ -26,16 +26,123 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_filtering"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_filtering
+#endif
 
 #include "cmsisdsp_module.h"
 
 NUMPYVECTORFROMBUFFER(f32,float32_t,NPY_FLOAT);
 
+/*
+
+Instances owning their buffers.
+
+The coefficients and the state are copied by the init function
+and owned by the instance. The buffers of a previous init are
+released. stateBytes and coeffsBytes are the sizes of the buffers
+and blockSize is the block size used to size the state
+(0 when the state does not depend on the block size).
+
+reset() clears the state (coefficients are kept, so an LMS filter
+keeps its adapted coefficients) and clone() creates an independent
+instance with copies of the state and coefficients.
+
+*/
+#define OWNEDBUFFERS                                                           \
+    uint32_t stateBytes;                                                       \
+    uint32_t coeffsBytes;                                                      \
+    uint32_t blockSize;
+
+#define SETOWNEDBUFFERS(STATETYP,COEFFTYP,BLOCKSIZE)                           \
+    PyMem_Free((void*)selfS->instance->pState);                                \
+    PyMem_Free((void*)selfS->instance->pCoeffs);                               \
+    selfS->instance->pState = pState_converted;                                \
+    selfS->instance->pCoeffs = pCoeffs_converted;                              \
+    selfS->stateBytes = sizeof(STATETYP)*arraySizepState;                      \
+    selfS->coeffsBytes = sizeof(COEFFTYP)*arraySizepCoeffs;                    \
+    selfS->blockSize = (BLOCKSIZE);
+
+static void *copyOwnedBuffer(const void *src,uint32_t nbBytes)
+{
+    void *dst;
+
+    if (src == NULL)
+    {
+       return(NULL);
+    }
+
+    dst = PyMem_Malloc(nbBytes);
+    if (dst != NULL)
+    {
+       memcpy(dst,src,nbBytes);
+    }
+    return(dst);
+}
+
+#define OWNEDBUFFERSMETHODS(NAME,RESETEXTRA)                                   \
+static PyObject *                                                              \
+Method_##NAME##_reset(dsp_##NAME##Object *self, PyObject *ignored)             \
+{                                                                              \
+    if (self->instance->pState)                                                \
+    {                                                                          \
+       memset(self->instance->pState,0,self->stateBytes);                      \
+    }                                                                          \
+    RESETEXTRA                                                                 \
+    Py_RETURN_NONE;                                                            \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_##NAME##_clone(dsp_##NAME##Object *self, PyObject *ignored)             \
+{                                                                              \
+    PyTypeObject *type = Py_TYPE(self);                                        \
+    dsp_##NAME##Object *res;                                                   \
+                                                                               \
+    res = (dsp_##NAME##Object *)type->tp_new(type,NULL,NULL);                  \
+    if (res == NULL)                                                           \
+    {                                                                          \
+       return(NULL);                                                           \
+    }                                                                          \
+                                                                               \
+    *res->instance = *self->instance;                                          \
+    res->instance->pState = copyOwnedBuffer(self->instance->pState,            \
+                                            self->stateBytes);                 \
+    res->instance->pCoeffs = copyOwnedBuffer(self->instance->pCoeffs,          \
+                                             self->coeffsBytes);               \
+    res->stateBytes = self->stateBytes;                                        \
+    res->coeffsBytes = self->coeffsBytes;                                      \
+    res->blockSize = self->blockSize;                                          \
+                                                                               \
+    if (((self->instance->pState != NULL) && (res->instance->pState == NULL))  \
+     || ((self->instance->pCoeffs != NULL) && (res->instance->pCoeffs == NULL)))\
+    {                                                                          \
+       Py_DECREF(res);                                                         \
+       return(PyErr_NoMemory());                                               \
+    }                                                                          \
+                                                                               \
+    return((PyObject *)res);                                                   \
+}
+
+#define OWNEDBUFFERSMETHODDEFS(NAME)                                           \
+    {"reset", (PyCFunction) Method_##NAME##_reset,METH_NOARGS,"reset"},        \
+    {"clone", (PyCFunction) Method_##NAME##_clone,METH_NOARGS,"clone"},
+
+/*
+
+Length of the next block when a signal is processed by blocks
+of at most MAXBLOCK samples (the state of the instance is sized
+for MAXBLOCK samples). MAXBLOCK is 0 for an instance not initialized :
+the kernel is called once as before.
+
+*/
+#define BLOCKLENGTH(MAXBLOCK,REMAINING)                                        \
+    ((((MAXBLOCK) == 0) || ((MAXBLOCK) > (REMAINING))) ? (REMAINING) : (MAXBLOCK))
+
 typedef struct {
     PyObject_HEAD
     arm_fir_instance_q7 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_instance_q7Object;
 
 
@@ -110,9 +217,13 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|h", kwlist,&self->instance->numTap
 GETFIELD(arm_fir_instance_q7,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_instance_q7,);
+
+
 static PyMethodDef arm_fir_instance_q7_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_fir_instance_q7_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_q7)
 
     {NULL}  /* Sentinel */
 };
@@ -124,6 +235,7 @@ DSPType(arm_fir_instance_q7,arm_fir_instance_q7_new,arm_fir_instance_q7_dealloc,
 typedef struct {
     PyObject_HEAD
     arm_fir_instance_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_instance_q15Object;
 
 
@@ -198,9 +310,13 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|h", kwlist,&self->instance->numTap
 GETFIELD(arm_fir_instance_q15,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_instance_q15,);
+
+
 static PyMethodDef arm_fir_instance_q15_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_fir_instance_q15_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -212,6 +328,7 @@ DSPType(arm_fir_instance_q15,arm_fir_instance_q15_new,arm_fir_instance_q15_deall
 typedef struct {
     PyObject_HEAD
     arm_fir_instance_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_instance_q31Object;
 
 
@@ -286,9 +403,13 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|h", kwlist,&self->instance->numTap
 GETFIELD(arm_fir_instance_q31,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_instance_q31,);
+
+
 static PyMethodDef arm_fir_instance_q31_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_fir_instance_q31_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -300,11 +421,13 @@ DSPType(arm_fir_instance_q31,arm_fir_instance_q31_new,arm_fir_instance_q31_deall
 typedef struct {
     PyObject_HEAD
     arm_fir_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_instance_f32Object;
 
 typedef struct {
     PyObject_HEAD
     arm_fir_instance_f64 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_instance_f64Object;
 
 static void
@@ -446,16 +569,24 @@ GETFIELD(arm_fir_instance_f32,numTaps,"h");
 GETFIELD(arm_fir_instance_f64,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_instance_f32,);
+
+
 static PyMethodDef arm_fir_instance_f32_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_fir_instance_f32_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_f32)
 
     {NULL}  /* Sentinel */
 };
 
+OWNEDBUFFERSMETHODS(arm_fir_instance_f64,);
+
+
 static PyMethodDef arm_fir_instance_f64_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_fir_instance_f64_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_f64)
 
     {NULL}  /* Sentinel */
 };
@@ -468,6 +599,7 @@ DSPType(arm_fir_instance_f64,arm_fir_instance_f64_new,arm_fir_instance_f64_deall
 typedef struct {
     PyObject_HEAD
     arm_biquad_casd_df1_inst_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_casd_df1_inst_q15Object;
 
 
@@ -544,10 +676,14 @@ GETFIELD(arm_biquad_casd_df1_inst_q15,numStages,"i");
 GETFIELD(arm_biquad_casd_df1_inst_q15,postShift,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_casd_df1_inst_q15,);
+
+
 static PyMethodDef arm_biquad_casd_df1_inst_q15_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_casd_df1_inst_q15_numStages,METH_NOARGS,"numStages"},
     {"postShift", (PyCFunction) Method_arm_biquad_casd_df1_inst_q15_postShift,METH_NOARGS,"postShift"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_casd_df1_inst_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -559,6 +695,7 @@ DSPType(arm_biquad_casd_df1_inst_q15,arm_biquad_casd_df1_inst_q15_new,arm_biquad
 typedef struct {
     PyObject_HEAD
     arm_biquad_casd_df1_inst_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_casd_df1_inst_q31Object;
 
 
@@ -635,10 +772,14 @@ GETFIELD(arm_biquad_casd_df1_inst_q31,numStages,"i");
 GETFIELD(arm_biquad_casd_df1_inst_q31,postShift,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_casd_df1_inst_q31,);
+
+
 static PyMethodDef arm_biquad_casd_df1_inst_q31_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_casd_df1_inst_q31_numStages,METH_NOARGS,"numStages"},
     {"postShift", (PyCFunction) Method_arm_biquad_casd_df1_inst_q31_postShift,METH_NOARGS,"postShift"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_casd_df1_inst_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -650,6 +791,7 @@ DSPType(arm_biquad_casd_df1_inst_q31,arm_biquad_casd_df1_inst_q31_new,arm_biquad
 typedef struct {
     PyObject_HEAD
     arm_biquad_casd_df1_inst_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_casd_df1_inst_f32Object;
 
 
@@ -724,9 +866,13 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|i", kwlist,&self->instance->numSta
 GETFIELD(arm_biquad_casd_df1_inst_f32,numStages,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_casd_df1_inst_f32,);
+
+
 static PyMethodDef arm_biquad_casd_df1_inst_f32_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_casd_df1_inst_f32_numStages,METH_NOARGS,"numStages"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_casd_df1_inst_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -743,6 +889,7 @@ DSPType(arm_biquad_casd_df1_inst_f32,arm_biquad_casd_df1_inst_f32_new,arm_biquad
 typedef struct {
     PyObject_HEAD
     arm_fir_decimate_instance_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_decimate_instance_q15Object;
 
 
@@ -819,10 +966,14 @@ GETFIELD(arm_fir_decimate_instance_q15,M,"i");
 GETFIELD(arm_fir_decimate_instance_q15,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_decimate_instance_q15,);
+
+
 static PyMethodDef arm_fir_decimate_instance_q15_methods[] = {
 
     {"M", (PyCFunction) Method_arm_fir_decimate_instance_q15_M,METH_NOARGS,"M"},
     {"numTaps", (PyCFunction) Method_arm_fir_decimate_instance_q15_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_decimate_instance_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -834,6 +985,7 @@ DSPType(arm_fir_decimate_instance_q15,arm_fir_decimate_instance_q15_new,arm_fir_
 typedef struct {
     PyObject_HEAD
     arm_fir_decimate_instance_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_decimate_instance_q31Object;
 
 
@@ -910,10 +1062,14 @@ GETFIELD(arm_fir_decimate_instance_q31,M,"i");
 GETFIELD(arm_fir_decimate_instance_q31,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_decimate_instance_q31,);
+
+
 static PyMethodDef arm_fir_decimate_instance_q31_methods[] = {
 
     {"M", (PyCFunction) Method_arm_fir_decimate_instance_q31_M,METH_NOARGS,"M"},
     {"numTaps", (PyCFunction) Method_arm_fir_decimate_instance_q31_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_decimate_instance_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -925,6 +1081,7 @@ DSPType(arm_fir_decimate_instance_q31,arm_fir_decimate_instance_q31_new,arm_fir_
 typedef struct {
     PyObject_HEAD
     arm_fir_decimate_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_decimate_instance_f32Object;
 
 
@@ -1001,10 +1158,14 @@ GETFIELD(arm_fir_decimate_instance_f32,M,"i");
 GETFIELD(arm_fir_decimate_instance_f32,numTaps,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_decimate_instance_f32,);
+
+
 static PyMethodDef arm_fir_decimate_instance_f32_methods[] = {
 
     {"M", (PyCFunction) Method_arm_fir_decimate_instance_f32_M,METH_NOARGS,"M"},
     {"numTaps", (PyCFunction) Method_arm_fir_decimate_instance_f32_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_decimate_instance_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -1016,6 +1177,7 @@ DSPType(arm_fir_decimate_instance_f32,arm_fir_decimate_instance_f32_new,arm_fir_
 typedef struct {
     PyObject_HEAD
     arm_fir_interpolate_instance_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_interpolate_instance_q15Object;
 
 
@@ -1092,10 +1254,14 @@ GETFIELD(arm_fir_interpolate_instance_q15,L,"i");
 GETFIELD(arm_fir_interpolate_instance_q15,phaseLength,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_interpolate_instance_q15,);
+
+
 static PyMethodDef arm_fir_interpolate_instance_q15_methods[] = {
 
     {"L", (PyCFunction) Method_arm_fir_interpolate_instance_q15_L,METH_NOARGS,"L"},
     {"phaseLength", (PyCFunction) Method_arm_fir_interpolate_instance_q15_phaseLength,METH_NOARGS,"phaseLength"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_interpolate_instance_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -1107,6 +1273,7 @@ DSPType(arm_fir_interpolate_instance_q15,arm_fir_interpolate_instance_q15_new,ar
 typedef struct {
     PyObject_HEAD
     arm_fir_interpolate_instance_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_interpolate_instance_q31Object;
 
 
@@ -1183,10 +1350,14 @@ GETFIELD(arm_fir_interpolate_instance_q31,L,"i");
 GETFIELD(arm_fir_interpolate_instance_q31,phaseLength,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_interpolate_instance_q31,);
+
+
 static PyMethodDef arm_fir_interpolate_instance_q31_methods[] = {
 
     {"L", (PyCFunction) Method_arm_fir_interpolate_instance_q31_L,METH_NOARGS,"L"},
     {"phaseLength", (PyCFunction) Method_arm_fir_interpolate_instance_q31_phaseLength,METH_NOARGS,"phaseLength"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_interpolate_instance_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -1198,6 +1369,7 @@ DSPType(arm_fir_interpolate_instance_q31,arm_fir_interpolate_instance_q31_new,ar
 typedef struct {
     PyObject_HEAD
     arm_fir_interpolate_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_fir_interpolate_instance_f32Object;
 
 
@@ -1274,10 +1446,14 @@ GETFIELD(arm_fir_interpolate_instance_f32,L,"i");
 GETFIELD(arm_fir_interpolate_instance_f32,phaseLength,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_fir_interpolate_instance_f32,);
+
+
 static PyMethodDef arm_fir_interpolate_instance_f32_methods[] = {
 
     {"L", (PyCFunction) Method_arm_fir_interpolate_instance_f32_L,METH_NOARGS,"L"},
     {"phaseLength", (PyCFunction) Method_arm_fir_interpolate_instance_f32_phaseLength,METH_NOARGS,"phaseLength"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_interpolate_instance_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -1289,6 +1465,7 @@ DSPType(arm_fir_interpolate_instance_f32,arm_fir_interpolate_instance_f32_new,ar
 typedef struct {
     PyObject_HEAD
     arm_biquad_cas_df1_32x64_ins_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_cas_df1_32x64_ins_q31Object;
 
 
@@ -1365,10 +1542,14 @@ GETFIELD(arm_biquad_cas_df1_32x64_ins_q31,numStages,"i");
 GETFIELD(arm_biquad_cas_df1_32x64_ins_q31,postShift,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_cas_df1_32x64_ins_q31,);
+
+
 static PyMethodDef arm_biquad_cas_df1_32x64_ins_q31_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_cas_df1_32x64_ins_q31_numStages,METH_NOARGS,"numStages"},
     {"postShift", (PyCFunction) Method_arm_biquad_cas_df1_32x64_ins_q31_postShift,METH_NOARGS,"postShift"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_cas_df1_32x64_ins_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -1380,6 +1561,7 @@ DSPType(arm_biquad_cas_df1_32x64_ins_q31,arm_biquad_cas_df1_32x64_ins_q31_new,ar
 typedef struct {
     PyObject_HEAD
     arm_biquad_cascade_df2T_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_cascade_df2T_instance_f32Object;
 
 
@@ -1460,6 +1642,9 @@ Method_arm_biquad_cascade_df2T_instance_f32_state(dsp_arm_biquad_cascade_df2T_in
     return(NumpyVectorFromf32Buffer(state,self->instance->numStages * 2));                                                  
 } 
 
+OWNEDBUFFERSMETHODS(arm_biquad_cascade_df2T_instance_f32,);
+
+
 static PyMethodDef arm_biquad_cascade_df2T_instance_f32_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_cascade_df2T_instance_f32_numStages,METH_NOARGS,"numStages"},
@@ -1474,6 +1659,7 @@ DSPType(arm_biquad_cascade_df2T_instance_f32,arm_biquad_cascade_df2T_instance_f3
 typedef struct {
     PyObject_HEAD
     arm_biquad_cascade_stereo_df2T_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_cascade_stereo_df2T_instance_f32Object;
 
 
@@ -1548,9 +1734,14 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|i", kwlist,&self->instance->numSta
 GETFIELD(arm_biquad_cascade_stereo_df2T_instance_f32,numStages,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_cascade_stereo_df2T_instance_f32,);
+
+
 static PyMethodDef arm_biquad_cascade_stereo_df2T_instance_f32_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_cascade_stereo_df2T_instance_f32_numStages,METH_NOARGS,"numStages"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_cascade_df2T_instance_f32)
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_cascade_stereo_df2T_instance_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -1562,6 +1753,7 @@ DSPType(arm_biquad_cascade_stereo_df2T_instance_f32,arm_biquad_cascade_stereo_df
 typedef struct {
     PyObject_HEAD
     arm_biquad_cascade_df2T_instance_f64 *instance;
+    OWNEDBUFFERS
 } dsp_arm_biquad_cascade_df2T_instance_f64Object;
 
 
@@ -1636,9 +1828,13 @@ if (PyArg_ParseTupleAndKeywords(args, kwds, "|i", kwlist,&self->instance->numSta
 GETFIELD(arm_biquad_cascade_df2T_instance_f64,numStages,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_biquad_cascade_df2T_instance_f64,);
+
+
 static PyMethodDef arm_biquad_cascade_df2T_instance_f64_methods[] = {
 
     {"numStages", (PyCFunction) Method_arm_biquad_cascade_df2T_instance_f64_numStages,METH_NOARGS,"numStages"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_cascade_df2T_instance_f64)
 
     {NULL}  /* Sentinel */
 };
@@ -2214,6 +2410,7 @@ DSPType(arm_iir_lattice_instance_f32,arm_iir_lattice_instance_f32_new,arm_iir_la
 typedef struct {
     PyObject_HEAD
     arm_lms_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_instance_f32Object;
 
 
@@ -2290,10 +2487,14 @@ GETFIELD(arm_lms_instance_f32,numTaps,"h");
 GETFIELD(arm_lms_instance_f32,mu,"f");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_instance_f32,);
+
+
 static PyMethodDef arm_lms_instance_f32_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_instance_f32_numTaps,METH_NOARGS,"numTaps"},
     {"mu", (PyCFunction) Method_arm_lms_instance_f32_mu,METH_NOARGS,"mu"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_instance_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -2305,6 +2506,7 @@ DSPType(arm_lms_instance_f32,arm_lms_instance_f32_new,arm_lms_instance_f32_deall
 typedef struct {
     PyObject_HEAD
     arm_lms_instance_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_instance_q15Object;
 
 
@@ -2383,11 +2585,15 @@ GETFIELD(arm_lms_instance_q15,mu,"h");
 GETFIELD(arm_lms_instance_q15,postShift,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_instance_q15,);
+
+
 static PyMethodDef arm_lms_instance_q15_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_instance_q15_numTaps,METH_NOARGS,"numTaps"},
     {"mu", (PyCFunction) Method_arm_lms_instance_q15_mu,METH_NOARGS,"mu"},
     {"postShift", (PyCFunction) Method_arm_lms_instance_q15_postShift,METH_NOARGS,"postShift"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_instance_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -2399,6 +2605,7 @@ DSPType(arm_lms_instance_q15,arm_lms_instance_q15_new,arm_lms_instance_q15_deall
 typedef struct {
     PyObject_HEAD
     arm_lms_instance_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_instance_q31Object;
 
 
@@ -2477,11 +2684,15 @@ GETFIELD(arm_lms_instance_q31,mu,"i");
 GETFIELD(arm_lms_instance_q31,postShift,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_instance_q31,);
+
+
 static PyMethodDef arm_lms_instance_q31_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_instance_q31_numTaps,METH_NOARGS,"numTaps"},
     {"mu", (PyCFunction) Method_arm_lms_instance_q31_mu,METH_NOARGS,"mu"},
     {"postShift", (PyCFunction) Method_arm_lms_instance_q31_postShift,METH_NOARGS,"postShift"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_instance_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -2493,6 +2704,7 @@ DSPType(arm_lms_instance_q31,arm_lms_instance_q31_new,arm_lms_instance_q31_deall
 typedef struct {
     PyObject_HEAD
     arm_lms_norm_instance_f32 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_norm_instance_f32Object;
 
 
@@ -2573,12 +2785,16 @@ GETFIELD(arm_lms_norm_instance_f32,energy,"f");
 GETFIELD(arm_lms_norm_instance_f32,x0,"f");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_norm_instance_f32,self->instance->energy = 0; self->instance->x0 = 0;);
+
+
 static PyMethodDef arm_lms_norm_instance_f32_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_norm_instance_f32_numTaps,METH_NOARGS,"numTaps"},
     {"mu", (PyCFunction) Method_arm_lms_norm_instance_f32_mu,METH_NOARGS,"mu"},
     {"energy", (PyCFunction) Method_arm_lms_norm_instance_f32_energy,METH_NOARGS,"energy"},
     {"x0", (PyCFunction) Method_arm_lms_norm_instance_f32_x0,METH_NOARGS,"x0"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_norm_instance_f32)
 
     {NULL}  /* Sentinel */
 };
@@ -2590,6 +2806,7 @@ DSPType(arm_lms_norm_instance_f32,arm_lms_norm_instance_f32_new,arm_lms_norm_ins
 typedef struct {
     PyObject_HEAD
     arm_lms_norm_instance_q31 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_norm_instance_q31Object;
 
 
@@ -2675,6 +2892,9 @@ GETFIELD(arm_lms_norm_instance_q31,energy,"i");
 GETFIELD(arm_lms_norm_instance_q31,x0,"i");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_norm_instance_q31,self->instance->energy = 0; self->instance->x0 = 0;);
+
+
 static PyMethodDef arm_lms_norm_instance_q31_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_norm_instance_q31_numTaps,METH_NOARGS,"numTaps"},
@@ -2682,6 +2902,7 @@ static PyMethodDef arm_lms_norm_instance_q31_methods[] = {
     {"postShift", (PyCFunction) Method_arm_lms_norm_instance_q31_postShift,METH_NOARGS,"postShift"},
     {"energy", (PyCFunction) Method_arm_lms_norm_instance_q31_energy,METH_NOARGS,"energy"},
     {"x0", (PyCFunction) Method_arm_lms_norm_instance_q31_x0,METH_NOARGS,"x0"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_norm_instance_q31)
 
     {NULL}  /* Sentinel */
 };
@@ -2693,6 +2914,7 @@ DSPType(arm_lms_norm_instance_q31,arm_lms_norm_instance_q31_new,arm_lms_norm_ins
 typedef struct {
     PyObject_HEAD
     arm_lms_norm_instance_q15 *instance;
+    OWNEDBUFFERS
 } dsp_arm_lms_norm_instance_q15Object;
 
 
@@ -2777,6 +2999,9 @@ GETFIELD(arm_lms_norm_instance_q15,energy,"h");
 GETFIELD(arm_lms_norm_instance_q15,x0,"h");
 
 
+OWNEDBUFFERSMETHODS(arm_lms_norm_instance_q15,self->instance->energy = 0; self->instance->x0 = 0;);
+
+
 static PyMethodDef arm_lms_norm_instance_q15_methods[] = {
 
     {"numTaps", (PyCFunction) Method_arm_lms_norm_instance_q15_numTaps,METH_NOARGS,"numTaps"},
@@ -2784,6 +3009,7 @@ static PyMethodDef arm_lms_norm_instance_q15_methods[] = {
     {"postShift", (PyCFunction) Method_arm_lms_norm_instance_q15_postShift,METH_NOARGS,"postShift"},
     {"energy", (PyCFunction) Method_arm_lms_norm_instance_q15_energy,METH_NOARGS,"energy"},
     {"x0", (PyCFunction) Method_arm_lms_norm_instance_q15_x0,METH_NOARGS,"x0"},
+    OWNEDBUFFERSMETHODDEFS(arm_lms_norm_instance_q15)
 
     {NULL}  /* Sentinel */
 };
@@ -3209,6 +3435,252 @@ DSPType(arm_fir_sparse_instance_q7,arm_fir_sparse_instance_q7_new,arm_fir_sparse
 
 
 
+/*
+
+Filter banks : several channels filtered with one call.
+
+instance[i] is the instance of channel i. The states of all the channels
+are in one contiguous matrix (one row per channel). The coefficients are
+shared by all the channels or are different for each channel
+(one row per channel).
+
+*/
+#define BANKTYPE(NAME,INST,TYP)                                                \
+typedef struct {                                                               \
+    PyObject_HEAD                                                              \
+    uint32_t nbChannels;                                                       \
+    uint32_t blockSize;                                                        \
+    INST *instance;                                                            \
+    TYP *pCoeffs;                                                              \
+    TYP *pState;                                                               \
+} dsp_##NAME##Object;                                                          \
+                                                                               \
+                                                                               \
+static void                                                                    \
+NAME##_dealloc(dsp_##NAME##Object* self)                                       \
+{                                                                              \
+    PyMem_Free(self->instance);                                                \
+    PyMem_Free(self->pCoeffs);                                                 \
+    PyMem_Free(self->pState);                                                  \
+                                                                               \
+    Py_TYPE(self)->tp_free((PyObject*)self);                                   \
+}                                                                              \
+                                                                               \
+                                                                               \
+static PyObject *                                                              \
+NAME##_new(PyTypeObject *type, PyObject *args, PyObject *kwds)                 \
+{                                                                              \
+    dsp_##NAME##Object *self;                                                  \
+                                                                               \
+    self = (dsp_##NAME##Object *)type->tp_alloc(type, 0);                      \
+                                                                               \
+    if (self != NULL) {                                                        \
+        self->nbChannels = 0;                                                  \
+        self->blockSize = 0;                                                   \
+        self->instance = NULL;                                                 \
+        self->pCoeffs = NULL;                                                  \
+        self->pState = NULL;                                                   \
+    }                                                                          \
+                                                                               \
+    return (PyObject *)self;                                                   \
+}                                                                              \
+                                                                               \
+static int                                                                     \
+NAME##_init(dsp_##NAME##Object *self, PyObject *args, PyObject *kwds)          \
+{                                                                              \
+    return 0;                                                                  \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_##NAME##_nbChannels(dsp_##NAME##Object *self, PyObject *ignored)        \
+{                                                                              \
+    return(Py_BuildValue("k",self->nbChannels));                               \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_##NAME##_blockSize(dsp_##NAME##Object *self, PyObject *ignored)         \
+{                                                                              \
+    return(Py_BuildValue("k",self->blockSize));                                \
+}                                                                              \
+                                                                               \
+static PyMethodDef NAME##_methods[] = {                                        \
+                                                                               \
+    {"nbChannels", (PyCFunction) Method_##NAME##_nbChannels,METH_NOARGS,"nbChannels"},\
+    {"blockSize", (PyCFunction) Method_##NAME##_blockSize,METH_NOARGS,"blockSize"},\
+                                                                               \
+    {NULL}  /* Sentinel */                                                     \
+};                                                                             \
+                                                                               \
+DSPType(NAME,NAME##_new,NAME##_dealloc,NAME##_init,NAME##_methods);
+
+BANKTYPE(arm_fir_bank_instance_q15,arm_fir_instance_q15,q15_t);
+BANKTYPE(arm_fir_bank_instance_q31,arm_fir_instance_q31,q31_t);
+BANKTYPE(arm_fir_bank_instance_f32,arm_fir_instance_f32,float32_t);
+BANKTYPE(arm_biquad_casd_df1_bank_inst_f32,arm_biquad_casd_df1_inst_f32,float32_t);
+
+
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+typedef struct {
+    PyObject_HEAD
+    arm_fir_instance_f16 *instance;
+    OWNEDBUFFERS
+} dsp_arm_fir_instance_f16Object;
+
+static void
+arm_fir_instance_f16_dealloc(dsp_arm_fir_instance_f16Object* self)
+{
+    if (self->instance)
+    {
+
+       if (self->instance->pState)
+       {
+          PyMem_Free(self->instance->pState);
+       }
+
+       if (self->instance->pCoeffs)
+       {
+          PyMem_Free((float16_t*)self->instance->pCoeffs);
+       }
+
+       PyMem_Free(self->instance);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyObject *
+arm_fir_instance_f16_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    dsp_arm_fir_instance_f16Object *self;
+
+    self = (dsp_arm_fir_instance_f16Object *)type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+
+        self->instance = PyMem_Malloc(sizeof(arm_fir_instance_f16));
+
+        self->instance->pState = NULL;
+        self->instance->pCoeffs = NULL;
+
+    }
+
+    return (PyObject *)self;
+}
+
+static int
+arm_fir_instance_f16_init(dsp_arm_fir_instance_f16Object *self, PyObject *args, PyObject *kwds)
+{
+
+char *kwlist[] = {
+"numTaps",NULL
+};
+
+if (PyArg_ParseTupleAndKeywords(args, kwds, "|h", kwlist,&self->instance->numTaps
+))
+    {
+
+
+    }
+    return 0;
+}
+
+GETFIELD(arm_fir_instance_f16,numTaps,"h");
+
+OWNEDBUFFERSMETHODS(arm_fir_instance_f16,);
+
+
+static PyMethodDef arm_fir_instance_f16_methods[] = {
+
+    {"numTaps", (PyCFunction) Method_arm_fir_instance_f16_numTaps,METH_NOARGS,"numTaps"},
+    OWNEDBUFFERSMETHODDEFS(arm_fir_instance_f16)
+
+    {NULL}  /* Sentinel */
+};
+
+DSPType(arm_fir_instance_f16,arm_fir_instance_f16_new,arm_fir_instance_f16_dealloc,arm_fir_instance_f16_init,arm_fir_instance_f16_methods);
+
+typedef struct {
+    PyObject_HEAD
+    arm_biquad_casd_df1_inst_f16 *instance;
+    OWNEDBUFFERS
+} dsp_arm_biquad_casd_df1_inst_f16Object;
+
+static void
+arm_biquad_casd_df1_inst_f16_dealloc(dsp_arm_biquad_casd_df1_inst_f16Object* self)
+{
+    if (self->instance)
+    {
+
+       if (self->instance->pState)
+       {
+          PyMem_Free(self->instance->pState);
+       }
+
+       if (self->instance->pCoeffs)
+       {
+          PyMem_Free((float16_t*)self->instance->pCoeffs);
+       }
+
+       PyMem_Free(self->instance);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyObject *
+arm_biquad_casd_df1_inst_f16_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    dsp_arm_biquad_casd_df1_inst_f16Object *self;
+
+    self = (dsp_arm_biquad_casd_df1_inst_f16Object *)type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+
+        self->instance = PyMem_Malloc(sizeof(arm_biquad_casd_df1_inst_f16));
+
+        self->instance->pState = NULL;
+        self->instance->pCoeffs = NULL;
+
+    }
+
+    return (PyObject *)self;
+}
+
+static int
+arm_biquad_casd_df1_inst_f16_init(dsp_arm_biquad_casd_df1_inst_f16Object *self, PyObject *args, PyObject *kwds)
+{
+
+char *kwlist[] = {
+"numStages",NULL
+};
+
+if (PyArg_ParseTupleAndKeywords(args, kwds, "|i", kwlist,&self->instance->numStages
+))
+    {
+
+
+    }
+    return 0;
+}
+
+GETFIELD(arm_biquad_casd_df1_inst_f16,numStages,"i");
+
+OWNEDBUFFERSMETHODS(arm_biquad_casd_df1_inst_f16,);
+
+
+static PyMethodDef arm_biquad_casd_df1_inst_f16_methods[] = {
+
+    {"numStages", (PyCFunction) Method_arm_biquad_casd_df1_inst_f16_numStages,METH_NOARGS,"numStages"},
+    OWNEDBUFFERSMETHODDEFS(arm_biquad_casd_df1_inst_f16)
+
+    {NULL}  /* Sentinel */
+};
+
+DSPType(arm_biquad_casd_df1_inst_f16,arm_biquad_casd_df1_inst_f16_new,arm_biquad_casd_df1_inst_f16_dealloc,arm_biquad_casd_df1_inst_f16_init,arm_biquad_casd_df1_inst_f16_methods);
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 void typeRegistration(PyObject *module) {
 
   ADDTYPE(arm_fir_instance_q7);
@@ -3219,6 +3691,14 @@ void typeRegistration(PyObject *module) {
   ADDTYPE(arm_biquad_casd_df1_inst_q15);
   ADDTYPE(arm_biquad_casd_df1_inst_q31);
   ADDTYPE(arm_biquad_casd_df1_inst_f32);
+  ADDTYPE(arm_fir_bank_instance_q15);
+  ADDTYPE(arm_fir_bank_instance_q31);
+  ADDTYPE(arm_fir_bank_instance_f32);
+  ADDTYPE(arm_biquad_casd_df1_bank_inst_f32);
+#if defined(ARM_FLOAT16_SUPPORTED)
+  ADDTYPE(arm_fir_instance_f16);
+  ADDTYPE(arm_biquad_casd_df1_inst_f16);
+#endif
   ADDTYPE(arm_fir_decimate_instance_q15);
   ADDTYPE(arm_fir_decimate_instance_q31);
   ADDTYPE(arm_fir_decimate_instance_f32);
@@ -3254,32 +3734,41 @@ void typeRegistration(PyObject *module) {
 
 
 static PyObject *
-cmsis_arm_fir_q7(PyObject *obj, PyObject *args)
+cmsis_arm_fir_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_q7Object *selfS = (dsp_arm_fir_instance_q7Object *)S;
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_fir_q7(selfS->instance,pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_q7(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3303,9 +3792,10 @@ cmsis_arm_fir_init_q7(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_instance_q7Object *selfS = (dsp_arm_fir_instance_q7Object *)S;
-    GETARGUMENT(pCoeffs,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pState,NPY_BYTE,int8_t,q7_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_BYTE,int8_t,q7_t);
+    GETARGUMENTCOPY(pState,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(q7_t,q7_t,blockSize);
 
     arm_fir_init_q7(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
     Py_RETURN_NONE;
@@ -3316,32 +3806,41 @@ cmsis_arm_fir_init_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_q15Object *selfS = (dsp_arm_fir_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_fir_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_q15(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3350,32 +3849,41 @@ cmsis_arm_fir_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_q15Object *selfS = (dsp_arm_fir_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_fir_fast_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_fast_q15(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3399,9 +3907,10 @@ cmsis_arm_fir_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_instance_q15Object *selfS = (dsp_arm_fir_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(int16_t,int16_t,blockSize);
 
     arm_status returnValue = arm_fir_init_q15(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -3417,32 +3926,41 @@ cmsis_arm_fir_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_q31Object *selfS = (dsp_arm_fir_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_fir_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_q31(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3451,32 +3969,41 @@ cmsis_arm_fir_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_q31Object *selfS = (dsp_arm_fir_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_fir_fast_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_fast_q31(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3500,9 +4027,10 @@ cmsis_arm_fir_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_instance_q31Object *selfS = (dsp_arm_fir_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(int32_t,int32_t,blockSize);
 
     arm_fir_init_q31(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
     Py_RETURN_NONE;
@@ -3513,32 +4041,41 @@ cmsis_arm_fir_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fir_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_f32Object *selfS = (dsp_arm_fir_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_fir_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_f32(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3546,32 +4083,41 @@ cmsis_arm_fir_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_fir_f64(PyObject *obj, PyObject *args)
+cmsis_arm_fir_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_instance_f64Object *selfS = (dsp_arm_fir_instance_f64Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-    arm_fir_f64(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_f64(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3595,9 +4141,10 @@ cmsis_arm_fir_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_instance_f32Object *selfS = (dsp_arm_fir_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(float32_t,float32_t,blockSize);
 
     arm_fir_init_f32(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
     Py_RETURN_NONE;
@@ -3622,9 +4169,10 @@ cmsis_arm_fir_init_f64(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_instance_f64Object *selfS = (dsp_arm_fir_instance_f64Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float64_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float64_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float64_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(float64_t,float64_t,blockSize);
 
     arm_fir_init_f64(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
     Py_RETURN_NONE;
@@ -3635,32 +4183,37 @@ cmsis_arm_fir_init_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df1_q15(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df1_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_casd_df1_inst_q15Object *selfS = (dsp_arm_biquad_casd_df1_inst_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_biquad_cascade_df1_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_q15(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3684,8 +4237,9 @@ cmsis_arm_biquad_cascade_df1_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_casd_df1_inst_q15Object *selfS = (dsp_arm_biquad_casd_df1_inst_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
+    SETOWNEDBUFFERS(int16_t,int16_t,0);
 
     arm_biquad_cascade_df1_init_q15(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted,(int8_t)postShift);
     Py_RETURN_NONE;
@@ -3696,32 +4250,37 @@ cmsis_arm_biquad_cascade_df1_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df1_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df1_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_casd_df1_inst_q15Object *selfS = (dsp_arm_biquad_casd_df1_inst_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_biquad_cascade_df1_fast_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_fast_q15(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3730,32 +4289,37 @@ cmsis_arm_biquad_cascade_df1_fast_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df1_q31(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df1_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_casd_df1_inst_q31Object *selfS = (dsp_arm_biquad_casd_df1_inst_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_biquad_cascade_df1_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_q31(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3764,32 +4328,37 @@ cmsis_arm_biquad_cascade_df1_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df1_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df1_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_casd_df1_inst_q31Object *selfS = (dsp_arm_biquad_casd_df1_inst_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_biquad_cascade_df1_fast_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_fast_q31(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3813,8 +4382,9 @@ cmsis_arm_biquad_cascade_df1_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_casd_df1_inst_q31Object *selfS = (dsp_arm_biquad_casd_df1_inst_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
+    SETOWNEDBUFFERS(int32_t,int32_t,0);
 
     arm_biquad_cascade_df1_init_q31(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted,(int8_t)postShift);
     Py_RETURN_NONE;
@@ -3825,32 +4395,37 @@ cmsis_arm_biquad_cascade_df1_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df1_f32(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df1_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_casd_df1_inst_f32Object *selfS = (dsp_arm_biquad_casd_df1_inst_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_biquad_cascade_df1_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3873,8 +4448,9 @@ cmsis_arm_biquad_cascade_df1_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_casd_df1_inst_f32Object *selfS = (dsp_arm_biquad_casd_df1_inst_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
+    SETOWNEDBUFFERS(float32_t,float32_t,0);
 
     arm_biquad_cascade_df1_init_f32(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -3886,31 +4462,38 @@ cmsis_arm_biquad_cascade_df1_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_levinson_durbin_q31(PyObject *obj, PyObject *args)
+cmsis_arm_levinson_durbin_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pPhi=NULL; // input
   q31_t *pPhi_converted=NULL; // input
   q31_t *pA=NULL; // output
+  PyObject *out=NULL; // output
   q31_t err; // output
   uint32_t nbCoefs; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pPhi,&nbCoefs))
+  if (PyArg_ParseTuple(args,"Oi",&pPhi,&nbCoefs) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pPhi,NPY_INT32,int32_t,q31_t);
 
-    pA=PyMem_Malloc(sizeof(q31_t)*nbCoefs);
-
+    GETOUTPUT(pA,q31_t,NPY_INT32,nbCoefs);
+    if (pA == NULL)
+    {
+      FREEARGUMENT(pPhi_converted);
+      return(NULL);
+    }
 
+    Py_BEGIN_ALLOW_THREADS
     arm_levinson_durbin_q31(pPhi_converted,pA,&err,nbCoefs);
-    
-    INT32ARRAY1(pAOBJ,nbCoefs,pA);
+    Py_END_ALLOW_THREADS
+
+    OUTPUTARRAY1(pAOBJ,nbCoefs,pA,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("Oi",pAOBJ,err);
 
     FREEARGUMENT(pPhi_converted);
-    Py_DECREF(pAOBJ);
+    Py_XDECREF(pAOBJ);
     return(pythonResult);
 
   }
@@ -3919,31 +4502,38 @@ cmsis_arm_levinson_durbin_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_levinson_durbin_f32(PyObject *obj, PyObject *args)
+cmsis_arm_levinson_durbin_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pPhi=NULL; // input
   float32_t *pPhi_converted=NULL; // input
   float32_t *pA=NULL; // output
+  PyObject *out=NULL; // output
   float32_t err; // output
   uint32_t nbCoefs; // input
 
-  if (PyArg_ParseTuple(args,"Oi",&pPhi,&nbCoefs))
+  if (PyArg_ParseTuple(args,"Oi",&pPhi,&nbCoefs) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pPhi,NPY_DOUBLE,double,float32_t);
 
-    pA=PyMem_Malloc(sizeof(float32_t)*nbCoefs);
-
+    GETOUTPUT(pA,float32_t,NPY_FLOAT,nbCoefs);
+    if (pA == NULL)
+    {
+      FREEARGUMENT(pPhi_converted);
+      return(NULL);
+    }
 
+    Py_BEGIN_ALLOW_THREADS
     arm_levinson_durbin_f32(pPhi_converted,pA,&err,nbCoefs);
-    
-    FLOATARRAY1(pAOBJ,nbCoefs,pA);
+    Py_END_ALLOW_THREADS
+
+    OUTPUTARRAY1(pAOBJ,nbCoefs,pA,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("Of",pAOBJ,err);
 
     FREEARGUMENT(pPhi_converted);
-    Py_DECREF(pAOBJ);
+    Py_XDECREF(pAOBJ);
     return(pythonResult);
 
   }
@@ -3953,7 +4543,7 @@ cmsis_arm_levinson_durbin_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_f32(PyObject *obj, PyObject *args)
+cmsis_arm_conv_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -3964,24 +4554,29 @@ cmsis_arm_conv_f32(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   float32_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*outputLength);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
 
-    arm_conv_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- FLOATARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -3990,7 +4585,7 @@ cmsis_arm_conv_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4000,31 +4595,36 @@ cmsis_arm_conv_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch1=NULL; // input
   q15_t *pScratch1_converted=NULL; // input
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_conv_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4035,7 +4635,7 @@ cmsis_arm_conv_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4046,24 +4646,29 @@ cmsis_arm_conv_q15(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_conv_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4072,7 +4677,7 @@ cmsis_arm_conv_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4083,24 +4688,29 @@ cmsis_arm_conv_fast_q15(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_conv_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4109,7 +4719,7 @@ cmsis_arm_conv_fast_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_fast_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_fast_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4119,31 +4729,36 @@ cmsis_arm_conv_fast_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch1=NULL; // input
   q15_t *pScratch1_converted=NULL; // input
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_conv_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4154,7 +4769,7 @@ cmsis_arm_conv_fast_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_q31(PyObject *obj, PyObject *args)
+cmsis_arm_conv_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4165,24 +4780,29 @@ cmsis_arm_conv_q31(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_conv_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4191,7 +4811,7 @@ cmsis_arm_conv_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_conv_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4202,24 +4822,29 @@ cmsis_arm_conv_fast_q31(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-
-    arm_conv_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4228,7 +4853,7 @@ cmsis_arm_conv_fast_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_opt_q7(PyObject *obj, PyObject *args)
+cmsis_arm_conv_opt_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4238,31 +4863,36 @@ cmsis_arm_conv_opt_q7(PyObject *obj, PyObject *args)
   q7_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch1=NULL; // input
   q15_t *pScratch1_converted=NULL; // input
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-
-    arm_conv_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4273,7 +4903,7 @@ cmsis_arm_conv_opt_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_q7(PyObject *obj, PyObject *args)
+cmsis_arm_conv_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4284,24 +4914,29 @@ cmsis_arm_conv_q7(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-    arm_conv_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_conv_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4310,7 +4945,7 @@ cmsis_arm_conv_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_f32(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4320,29 +4955,35 @@ cmsis_arm_conv_partial_f32(PyObject *obj, PyObject *args)
   float32_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*outputLength);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
 
-    arm_status returnValue = arm_conv_partial_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- FLOATARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4351,7 +4992,7 @@ cmsis_arm_conv_partial_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4361,6 +5002,7 @@ cmsis_arm_conv_partial_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
   PyObject *pScratch1=NULL; // input
@@ -4368,28 +5010,33 @@ cmsis_arm_conv_partial_opt_q15(PyObject *obj, PyObject *args)
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_status returnValue = arm_conv_partial_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4400,7 +5047,7 @@ cmsis_arm_conv_partial_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4410,29 +5057,35 @@ cmsis_arm_conv_partial_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_status returnValue = arm_conv_partial_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4441,7 +5094,7 @@ cmsis_arm_conv_partial_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4451,29 +5104,35 @@ cmsis_arm_conv_partial_fast_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_status returnValue = arm_conv_partial_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4482,7 +5141,7 @@ cmsis_arm_conv_partial_fast_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_fast_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_fast_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4492,6 +5151,7 @@ cmsis_arm_conv_partial_fast_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
   PyObject *pScratch1=NULL; // input
@@ -4499,28 +5159,33 @@ cmsis_arm_conv_partial_fast_opt_q15(PyObject *obj, PyObject *args)
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_status returnValue = arm_conv_partial_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4531,7 +5196,7 @@ cmsis_arm_conv_partial_fast_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_q31(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4541,29 +5206,35 @@ cmsis_arm_conv_partial_q31(PyObject *obj, PyObject *args)
   q31_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_status returnValue = arm_conv_partial_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4572,7 +5243,7 @@ cmsis_arm_conv_partial_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4582,29 +5253,35 @@ cmsis_arm_conv_partial_fast_q31(PyObject *obj, PyObject *args)
   q31_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_status returnValue = arm_conv_partial_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4613,7 +5290,7 @@ cmsis_arm_conv_partial_fast_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_opt_q7(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_opt_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4623,6 +5300,7 @@ cmsis_arm_conv_partial_opt_q7(PyObject *obj, PyObject *args)
   q7_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
   PyObject *pScratch1=NULL; // input
@@ -4630,28 +5308,33 @@ cmsis_arm_conv_partial_opt_q7(PyObject *obj, PyObject *args)
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiiiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-
-    arm_status returnValue = arm_conv_partial_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -4662,7 +5345,7 @@ cmsis_arm_conv_partial_opt_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_conv_partial_q7(PyObject *obj, PyObject *args)
+cmsis_arm_conv_partial_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -4672,29 +5355,35 @@ cmsis_arm_conv_partial_q7(PyObject *obj, PyObject *args)
   q7_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t firstIndex; // input
   uint32_t numPoints; // input
 
-  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints))
+  if (PyArg_ParseTuple(args,"OiOiii",&pSrcA,&srcALen,&pSrcB,&srcBLen,&firstIndex,&numPoints) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     uint32_t outputLength = srcALen + srcBLen - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-
-    arm_status returnValue = arm_conv_partial_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_conv_partial_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,firstIndex,numPoints);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4703,17 +5392,18 @@ cmsis_arm_conv_partial_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_decimate_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fir_decimate_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_decimate_instance_f32Object *selfS = (dsp_arm_fir_decimate_instance_f32Object *)S;
@@ -4721,16 +5411,24 @@ cmsis_arm_fir_decimate_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
     outBlockSize = arraySizepSrc / selfS->instance->M;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*outBlockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outBlockSize);
 
-    arm_fir_decimate_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_decimate_f32(selfS->instance,pSrc_converted + i,pDst + i / selfS->instance->M,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4755,9 +5453,10 @@ cmsis_arm_fir_decimate_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_decimate_instance_f32Object *selfS = (dsp_arm_fir_decimate_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(float32_t,float32_t,blockSize);
 
     arm_status returnValue = arm_fir_decimate_init_f32(selfS->instance,numTaps,(uint8_t)M,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -4773,17 +5472,18 @@ cmsis_arm_fir_decimate_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_decimate_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_decimate_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_decimate_instance_q15Object *selfS = (dsp_arm_fir_decimate_instance_q15Object *)S;
@@ -4791,16 +5491,24 @@ cmsis_arm_fir_decimate_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc;
     outBlockSize = arraySizepSrc / selfS->instance->M;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outBlockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outBlockSize);
 
-    arm_fir_decimate_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_decimate_q15(selfS->instance,pSrc_converted + i,pDst + i / selfS->instance->M,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4809,17 +5517,18 @@ cmsis_arm_fir_decimate_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_decimate_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_decimate_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_decimate_instance_q15Object *selfS = (dsp_arm_fir_decimate_instance_q15Object *)S;
@@ -4827,16 +5536,24 @@ cmsis_arm_fir_decimate_fast_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
     outBlockSize = arraySizepSrc / selfS->instance->M;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outBlockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outBlockSize);
 
-    arm_fir_decimate_fast_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_decimate_fast_q15(selfS->instance,pSrc_converted + i,pDst + i / selfS->instance->M,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4861,9 +5578,10 @@ cmsis_arm_fir_decimate_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_decimate_instance_q15Object *selfS = (dsp_arm_fir_decimate_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(int16_t,int16_t,blockSize);
 
     arm_status returnValue = arm_fir_decimate_init_q15(selfS->instance,numTaps,(uint8_t)M,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -4879,17 +5597,18 @@ cmsis_arm_fir_decimate_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_decimate_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_decimate_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_decimate_instance_q31Object *selfS = (dsp_arm_fir_decimate_instance_q31Object *)S;
@@ -4897,16 +5616,24 @@ cmsis_arm_fir_decimate_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
     outBlockSize = arraySizepSrc / selfS->instance->M;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outBlockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outBlockSize);
 
-
-    arm_fir_decimate_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_decimate_q31(selfS->instance,pSrc_converted + i,pDst + i / selfS->instance->M,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4915,17 +5642,18 @@ cmsis_arm_fir_decimate_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_decimate_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_decimate_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_decimate_instance_q31Object *selfS = (dsp_arm_fir_decimate_instance_q31Object *)S;
@@ -4933,16 +5661,24 @@ cmsis_arm_fir_decimate_fast_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc;
     outBlockSize = arraySizepSrc / selfS->instance->M;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outBlockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outBlockSize);
 
-
-    arm_fir_decimate_fast_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_decimate_fast_q31(selfS->instance,pSrc_converted + i,pDst + i / selfS->instance->M,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -4967,9 +5703,10 @@ cmsis_arm_fir_decimate_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_decimate_instance_q31Object *selfS = (dsp_arm_fir_decimate_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(int32_t,int32_t,blockSize);
 
     arm_status returnValue = arm_fir_decimate_init_q31(selfS->instance,numTaps,(uint8_t)M,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -4985,17 +5722,18 @@ cmsis_arm_fir_decimate_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_interpolate_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_interpolate_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_interpolate_instance_q15Object *selfS = (dsp_arm_fir_interpolate_instance_q15Object *)S;
@@ -5003,16 +5741,24 @@ cmsis_arm_fir_interpolate_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
     outBlockSize = arraySizepSrc * selfS->instance->L;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outBlockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outBlockSize);
 
-    arm_fir_interpolate_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_interpolate_q15(selfS->instance,pSrc_converted + i,pDst + i * selfS->instance->L,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5037,9 +5783,10 @@ cmsis_arm_fir_interpolate_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_interpolate_instance_q15Object *selfS = (dsp_arm_fir_interpolate_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
-    blockSize = arraySizepState - arraySizepCoeffs + 1;
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
+    blockSize = arraySizepState - numTaps / L + 1;
+    SETOWNEDBUFFERS(int16_t,int16_t,blockSize);
 
     arm_status returnValue = arm_fir_interpolate_init_q15(selfS->instance,(uint8_t)L,numTaps,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -5055,17 +5802,18 @@ cmsis_arm_fir_interpolate_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_interpolate_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_interpolate_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_interpolate_instance_q31Object *selfS = (dsp_arm_fir_interpolate_instance_q31Object *)S;
@@ -5073,16 +5821,24 @@ cmsis_arm_fir_interpolate_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
     outBlockSize = arraySizepSrc * selfS->instance->L;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outBlockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outBlockSize);
 
-
-    arm_fir_interpolate_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_interpolate_q31(selfS->instance,pSrc_converted + i,pDst + i * selfS->instance->L,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5107,9 +5863,10 @@ cmsis_arm_fir_interpolate_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_interpolate_instance_q31Object *selfS = (dsp_arm_fir_interpolate_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
-    blockSize = arraySizepState - arraySizepCoeffs + 1;
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
+    blockSize = arraySizepState - numTaps / L + 1;
+    SETOWNEDBUFFERS(int32_t,int32_t,blockSize);
 
     arm_status returnValue = arm_fir_interpolate_init_q31(selfS->instance,(uint8_t)L,numTaps,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -5125,17 +5882,18 @@ cmsis_arm_fir_interpolate_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_interpolate_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fir_interpolate_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
   uint32_t outBlockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_interpolate_instance_f32Object *selfS = (dsp_arm_fir_interpolate_instance_f32Object *)S;
@@ -5143,16 +5901,24 @@ cmsis_arm_fir_interpolate_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc;
     outBlockSize = arraySizepSrc * selfS->instance->L;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*outBlockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outBlockSize);
 
-    arm_fir_interpolate_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,outBlockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_interpolate_f32(selfS->instance,pSrc_converted + i,pDst + i * selfS->instance->L,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outBlockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5177,9 +5943,10 @@ cmsis_arm_fir_interpolate_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_interpolate_instance_f32Object *selfS = (dsp_arm_fir_interpolate_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
-    blockSize = arraySizepState - arraySizepCoeffs + 1;
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
+    blockSize = arraySizepState - numTaps / L + 1;
+    SETOWNEDBUFFERS(float32_t,float32_t,blockSize);
 
     arm_status returnValue = arm_fir_interpolate_init_f32(selfS->instance,(uint8_t)L,numTaps,pCoeffs_converted,pState_converted,blockSize);
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
@@ -5195,32 +5962,37 @@ cmsis_arm_fir_interpolate_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cas_df1_32x64_q31(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cas_df1_32x64_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
-  arm_biquad_cas_df1_32x64_ins_q31 *S_converted=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
+    dsp_arm_biquad_cas_df1_32x64_ins_q31Object *selfS = (dsp_arm_biquad_cas_df1_32x64_ins_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_biquad_cas_df1_32x64_q31(S_converted,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cas_df1_32x64_q31(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5233,7 +6005,6 @@ cmsis_arm_biquad_cas_df1_32x64_init_q31(PyObject *obj, PyObject *args)
 {
 
   PyObject *S=NULL; // input
-  arm_biquad_cas_df1_32x64_ins_q31 *S_converted=NULL; // input
   uint32_t numStages; // input
   PyObject *pCoeffs=NULL; // input
   q31_t *pCoeffs_converted=NULL; // input
@@ -5244,10 +6015,12 @@ cmsis_arm_biquad_cas_df1_32x64_init_q31(PyObject *obj, PyObject *args)
   if (PyArg_ParseTuple(args,"OiOOi",&S,&numStages,&pCoeffs,&pState,&postShift))
   {
 
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT64,q63_t,q63_t);
+    dsp_arm_biquad_cas_df1_32x64_ins_q31Object *selfS = (dsp_arm_biquad_cas_df1_32x64_ins_q31Object *)S;
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT64,q63_t,q63_t);
+    SETOWNEDBUFFERS(q63_t,int32_t,0);
 
-    arm_biquad_cas_df1_32x64_init_q31(S_converted,(uint8_t)numStages,pCoeffs_converted,pState_converted,(uint8_t)postShift);
+    arm_biquad_cas_df1_32x64_init_q31(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted,(uint8_t)postShift);
     Py_RETURN_NONE;
 
   }
@@ -5256,32 +6029,37 @@ cmsis_arm_biquad_cas_df1_32x64_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df2T_f32(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df2T_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_cascade_df2T_instance_f32Object *selfS = (dsp_arm_biquad_cascade_df2T_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_biquad_cascade_df2T_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df2T_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5290,32 +6068,37 @@ cmsis_arm_biquad_cascade_df2T_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_stereo_df2T_f32(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_stereo_df2T_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_cascade_stereo_df2T_instance_f32Object *selfS = (dsp_arm_biquad_cascade_stereo_df2T_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_biquad_cascade_stereo_df2T_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_stereo_df2T_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5324,32 +6107,37 @@ cmsis_arm_biquad_cascade_stereo_df2T_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_biquad_cascade_df2T_f64(PyObject *obj, PyObject *args)
+cmsis_arm_biquad_cascade_df2T_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_biquad_cascade_df2T_instance_f64Object *selfS = (dsp_arm_biquad_cascade_df2T_instance_f64Object *)S;
     GETARGUMENT(pSrc,NPY_FLOAT64,float64_t,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_biquad_cascade_df2T_f64(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df2T_f64(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5372,8 +6160,9 @@ cmsis_arm_biquad_cascade_df2T_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_cascade_df2T_instance_f32Object *selfS = (dsp_arm_biquad_cascade_df2T_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
+    SETOWNEDBUFFERS(float32_t,float32_t,0);
 
     arm_biquad_cascade_df2T_init_f32(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5398,8 +6187,9 @@ cmsis_arm_biquad_cascade_stereo_df2T_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_cascade_stereo_df2T_instance_f32Object *selfS = (dsp_arm_biquad_cascade_stereo_df2T_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
+    SETOWNEDBUFFERS(float32_t,float32_t,0);
 
     arm_biquad_cascade_stereo_df2T_init_f32(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5424,8 +6214,9 @@ cmsis_arm_biquad_cascade_df2T_init_f64(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_biquad_cascade_df2T_instance_f64Object *selfS = (dsp_arm_biquad_cascade_df2T_instance_f64Object *)S;
-    GETARGUMENT(pCoeffs,NPY_FLOAT64,float64_t,float64_t);
-    GETARGUMENT(pState,NPY_FLOAT64,float64_t,float64_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_FLOAT64,float64_t,float64_t);
+    GETARGUMENTCOPY(pState,NPY_FLOAT64,float64_t,float64_t);
+    SETOWNEDBUFFERS(float64_t,float64_t,0);
 
     arm_biquad_cascade_df2T_init_f64(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5450,8 +6241,8 @@ cmsis_arm_fir_lattice_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_lattice_instance_q15Object *selfS = (dsp_arm_fir_lattice_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
 
     arm_fir_lattice_init_q15(selfS->instance,numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5462,32 +6253,37 @@ cmsis_arm_fir_lattice_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_lattice_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fir_lattice_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_lattice_instance_q15Object *selfS = (dsp_arm_fir_lattice_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_fir_lattice_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fir_lattice_q15(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5510,8 +6306,8 @@ cmsis_arm_fir_lattice_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_lattice_instance_q31Object *selfS = (dsp_arm_fir_lattice_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
 
     arm_fir_lattice_init_q31(selfS->instance,numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5522,32 +6318,37 @@ cmsis_arm_fir_lattice_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_lattice_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fir_lattice_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_lattice_instance_q31Object *selfS = (dsp_arm_fir_lattice_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_fir_lattice_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fir_lattice_q31(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5570,8 +6371,8 @@ cmsis_arm_fir_lattice_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_lattice_instance_f32Object *selfS = (dsp_arm_fir_lattice_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
 
     arm_fir_lattice_init_f32(selfS->instance,numStages,pCoeffs_converted,pState_converted);
     Py_RETURN_NONE;
@@ -5582,32 +6383,37 @@ cmsis_arm_fir_lattice_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_lattice_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fir_lattice_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_lattice_instance_f32Object *selfS = (dsp_arm_fir_lattice_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_fir_lattice_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fir_lattice_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5616,32 +6422,37 @@ cmsis_arm_fir_lattice_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_iir_lattice_f32(PyObject *obj, PyObject *args)
+cmsis_arm_iir_lattice_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_iir_lattice_instance_f32Object *selfS = (dsp_arm_iir_lattice_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_iir_lattice_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_iir_lattice_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5667,9 +6478,9 @@ cmsis_arm_iir_lattice_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_iir_lattice_instance_f32Object *selfS = (dsp_arm_iir_lattice_instance_f32Object *)S;
-    GETARGUMENT(pkCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pvCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pkCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pvCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepkCoeffs ;
 
     arm_iir_lattice_init_f32(selfS->instance,numStages,pkCoeffs_converted,pvCoeffs_converted,pState_converted,blockSize);
@@ -5681,32 +6492,37 @@ cmsis_arm_iir_lattice_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_iir_lattice_q31(PyObject *obj, PyObject *args)
+cmsis_arm_iir_lattice_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_iir_lattice_instance_q31Object *selfS = (dsp_arm_iir_lattice_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-
-    arm_iir_lattice_q31(selfS->instance,pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_iir_lattice_q31(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5732,9 +6548,9 @@ cmsis_arm_iir_lattice_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_iir_lattice_instance_q31Object *selfS = (dsp_arm_iir_lattice_instance_q31Object *)S;
-    GETARGUMENT(pkCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pvCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pkCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pvCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepkCoeffs ;
 
     arm_iir_lattice_init_q31(selfS->instance,numStages,pkCoeffs_converted,pvCoeffs_converted,pState_converted,blockSize);
@@ -5746,32 +6562,37 @@ cmsis_arm_iir_lattice_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_iir_lattice_q15(PyObject *obj, PyObject *args)
+cmsis_arm_iir_lattice_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_iir_lattice_instance_q15Object *selfS = (dsp_arm_iir_lattice_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_iir_lattice_q15(selfS->instance,pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_iir_lattice_q15(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -5797,9 +6618,9 @@ cmsis_arm_iir_lattice_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_iir_lattice_instance_q15Object *selfS = (dsp_arm_iir_lattice_instance_q15Object *)S;
-    GETARGUMENT(pkCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pvCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pkCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pvCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepkCoeffs ;
 
     arm_iir_lattice_init_q15(selfS->instance,numStages,pkCoeffs_converted,pvCoeffs_converted,pState_converted,blockSize);
@@ -5812,7 +6633,7 @@ cmsis_arm_iir_lattice_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_f32(PyObject *obj, PyObject *args)
+cmsis_arm_lms_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -5821,30 +6642,39 @@ cmsis_arm_lms_f32(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   float32_t *pRef_converted=NULL; // input
   float32_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   float32_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_instance_f32Object *selfS = (dsp_arm_lms_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pRef,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pErr,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pErr,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pOut,float32_t,NPY_FLOAT,blockSize);
 
-    arm_lms_f32(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- FLOATARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_f32(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -5870,9 +6700,10 @@ cmsis_arm_lms_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_instance_f32Object *selfS = (dsp_arm_lms_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(float32_t,float32_t,blockSize);
 
     arm_lms_init_f32(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize);
     Py_RETURN_NONE;
@@ -5900,9 +6731,10 @@ cmsis_arm_lms_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_instance_q15Object *selfS = (dsp_arm_lms_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(int16_t,int16_t,blockSize);
 
     arm_lms_init_q15(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize,postShift);
     Py_RETURN_NONE;
@@ -5913,7 +6745,7 @@ cmsis_arm_lms_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_q15(PyObject *obj, PyObject *args)
+cmsis_arm_lms_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -5922,30 +6754,39 @@ cmsis_arm_lms_q15(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   q15_t *pRef_converted=NULL; // input
   q15_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   q15_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_instance_q15Object *selfS = (dsp_arm_lms_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pRef,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pErr,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pErr,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pOut,q15_t,NPY_INT16,blockSize);
 
-    arm_lms_q15(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- INT16ARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_q15(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -5955,7 +6796,7 @@ cmsis_arm_lms_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_q31(PyObject *obj, PyObject *args)
+cmsis_arm_lms_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -5964,30 +6805,39 @@ cmsis_arm_lms_q31(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   q31_t *pRef_converted=NULL; // input
   q31_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   q31_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_instance_q31Object *selfS = (dsp_arm_lms_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pRef,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pErr,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pErr,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(q31_t)*blockSize);
+    GETOUTPUT(pOut,q31_t,NPY_INT32,blockSize);
 
-
-    arm_lms_q31(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- INT32ARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_q31(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -6014,9 +6864,10 @@ cmsis_arm_lms_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_instance_q31Object *selfS = (dsp_arm_lms_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(int32_t,int32_t,blockSize);
 
     arm_lms_init_q31(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize,postShift);
     Py_RETURN_NONE;
@@ -6027,7 +6878,7 @@ cmsis_arm_lms_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_norm_f32(PyObject *obj, PyObject *args)
+cmsis_arm_lms_norm_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -6036,30 +6887,39 @@ cmsis_arm_lms_norm_f32(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   float32_t *pRef_converted=NULL; // input
   float32_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   float32_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_norm_instance_f32Object *selfS = (dsp_arm_lms_norm_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pRef,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pErr,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pErr,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pOut,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_lms_norm_f32(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- FLOATARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_norm_f32(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -6085,9 +6945,10 @@ cmsis_arm_lms_norm_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_norm_instance_f32Object *selfS = (dsp_arm_lms_norm_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(float32_t,float32_t,blockSize);
 
     arm_lms_norm_init_f32(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize);
     Py_RETURN_NONE;
@@ -6098,7 +6959,7 @@ cmsis_arm_lms_norm_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_norm_q31(PyObject *obj, PyObject *args)
+cmsis_arm_lms_norm_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -6107,30 +6968,39 @@ cmsis_arm_lms_norm_q31(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   q31_t *pRef_converted=NULL; // input
   q31_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   q31_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_norm_instance_q31Object *selfS = (dsp_arm_lms_norm_instance_q31Object *)S;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pRef,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pErr,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pErr,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pOut,q31_t,NPY_INT32,blockSize);
 
-    arm_lms_norm_q31(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- INT32ARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_norm_q31(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -6157,9 +7027,10 @@ cmsis_arm_lms_norm_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_norm_instance_q31Object *selfS = (dsp_arm_lms_norm_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(int32_t,int32_t,blockSize);
 
     arm_lms_norm_init_q31(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize,(uint8_t)postShift);
     Py_RETURN_NONE;
@@ -6170,7 +7041,7 @@ cmsis_arm_lms_norm_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_lms_norm_q15(PyObject *obj, PyObject *args)
+cmsis_arm_lms_norm_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -6179,30 +7050,39 @@ cmsis_arm_lms_norm_q15(PyObject *obj, PyObject *args)
   PyObject *pRef=NULL; // input
   q15_t *pRef_converted=NULL; // input
   q15_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pErr=NULL; // input
   q15_t *pErr_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr))
+  if (PyArg_ParseTuple(args,"OOOO",&S,&pSrc,&pRef,&pErr) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_lms_norm_instance_q15Object *selfS = (dsp_arm_lms_norm_instance_q15Object *)S;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pRef,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pErr,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pErr,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pOut=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pOut,q15_t,NPY_INT16,blockSize);
 
-    arm_lms_norm_q15(selfS->instance,pSrc_converted,pRef_converted,pOut,pErr_converted,blockSize);
- INT16ARRAY1(pOutOBJ,blockSize,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_lms_norm_q15(selfS->instance,pSrc_converted + i,pRef_converted + i,pOut + i,pErr_converted + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,blockSize,pOut,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(pSrc_converted);
     FREEARGUMENT(pRef_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     FREEARGUMENT(pErr_converted);
     return(pythonResult);
 
@@ -6229,9 +7109,10 @@ cmsis_arm_lms_norm_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_lms_norm_instance_q15Object *selfS = (dsp_arm_lms_norm_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1 ;
+    SETOWNEDBUFFERS(int16_t,int16_t,blockSize);
 
     arm_lms_norm_init_q15(selfS->instance,numTaps,pCoeffs_converted,pState_converted,mu,blockSize,(uint8_t)postShift);
     Py_RETURN_NONE;
@@ -6242,7 +7123,7 @@ cmsis_arm_lms_norm_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_f32(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6253,24 +7134,29 @@ cmsis_arm_correlate_f32(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   float32_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*outputLength);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
 
-
-    arm_correlate_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- FLOATARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_f32(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6278,7 +7164,7 @@ cmsis_arm_correlate_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_correlate_f64(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6289,24 +7175,29 @@ cmsis_arm_correlate_f64(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   float64_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float64_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float64_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*outputLength);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,outputLength);
 
-    arm_correlate_f64(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- FLOAT64ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_f64(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6314,7 +7205,7 @@ cmsis_arm_correlate_f64(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_correlate_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6324,28 +7215,33 @@ cmsis_arm_correlate_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch=NULL; // input
   q15_t *pScratch_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch))
+  if (PyArg_ParseTuple(args,"OiOiO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_correlate_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch_converted);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch_converted);
     return(pythonResult);
 
@@ -6355,7 +7251,7 @@ cmsis_arm_correlate_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_q15(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6366,24 +7262,29 @@ cmsis_arm_correlate_q15(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_correlate_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6392,7 +7293,7 @@ cmsis_arm_correlate_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6403,24 +7304,29 @@ cmsis_arm_correlate_fast_q15(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_correlate_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_fast_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6429,7 +7335,7 @@ cmsis_arm_correlate_fast_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_fast_opt_q15(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_fast_opt_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6439,28 +7345,33 @@ cmsis_arm_correlate_fast_opt_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch=NULL; // input
   q15_t *pScratch_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch))
+  if (PyArg_ParseTuple(args,"OiOiO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT16,int16_t,int16_t);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputLength);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-
-    arm_correlate_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch_converted);
- INT16ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_fast_opt_q15(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch_converted);
     return(pythonResult);
 
@@ -6470,7 +7381,7 @@ cmsis_arm_correlate_fast_opt_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_q31(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6481,24 +7392,29 @@ cmsis_arm_correlate_q31(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_correlate_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6507,7 +7423,7 @@ cmsis_arm_correlate_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6518,24 +7434,29 @@ cmsis_arm_correlate_fast_q31(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q31_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_INT32,int32_t,int32_t);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,int32_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputLength);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_correlate_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT32ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_fast_q31(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6544,7 +7465,7 @@ cmsis_arm_correlate_fast_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_opt_q7(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_opt_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6554,31 +7475,36 @@ cmsis_arm_correlate_opt_q7(PyObject *obj, PyObject *args)
   q7_t *pSrcB_converted=NULL; // input
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratch1=NULL; // input
   q15_t *pScratch1_converted=NULL; // input
   PyObject *pScratch2=NULL; // input
   q15_t *pScratch2_converted=NULL; // input
 
-  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2))
+  if (PyArg_ParseTuple(args,"OiOiOO",&pSrcA,&srcALen,&pSrcB,&srcBLen,&pScratch1,&pScratch2) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pScratch1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pScratch2,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pScratch2,NPY_INT16,int16_t,int16_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-    arm_correlate_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_opt_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst,pScratch1_converted,pScratch2_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch1_converted);
     FREEARGUMENT(pScratch2_converted);
     return(pythonResult);
@@ -6589,7 +7515,7 @@ cmsis_arm_correlate_opt_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_correlate_q7(PyObject *obj, PyObject *args)
+cmsis_arm_correlate_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -6600,24 +7526,29 @@ cmsis_arm_correlate_q7(PyObject *obj, PyObject *args)
   uint32_t srcBLen; // input
   q7_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OiOi",&pSrcA,&srcALen,&pSrcB,&srcBLen) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrcA,NPY_BYTE,int8_t,q7_t);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     uint32_t outputLength = 2*MAX(srcALen,srcBLen) - 1 ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*outputLength);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,outputLength);
 
-
-    arm_correlate_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
- INT8ARRAY1(pDstOBJ,outputLength,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_correlate_q7(pSrcA_converted,srcALen,pSrcB_converted,srcBLen,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -6626,35 +7557,40 @@ cmsis_arm_correlate_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fir_sparse_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fir_sparse_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   PyObject *pScratchIn=NULL; // input
   float32_t *pScratchIn_converted=NULL; // input
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OOO",&S,&pSrc,&pScratchIn))
+  if (PyArg_ParseTuple(args,"OOO",&S,&pSrc,&pScratchIn) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_fir_sparse_instance_f32Object *selfS = (dsp_arm_fir_sparse_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pScratchIn,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pScratchIn,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_fir_sparse_f32(selfS->instance,pSrc_converted,pDst,pScratchIn_converted,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fir_sparse_f32(selfS->instance,pSrc_converted,pDst,pScratchIn_converted,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratchIn_converted);
     return(pythonResult);
 
@@ -6682,9 +7618,9 @@ cmsis_arm_fir_sparse_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_sparse_instance_f32Object *selfS = (dsp_arm_fir_sparse_instance_f32Object *)S;
-    GETARGUMENT(pCoeffs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pTapDelay,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pTapDelay,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
 
     arm_fir_sparse_init_f32(selfS->instance,numTaps,pCoeffs_converted,pState_converted,pTapDelay_converted,maxDelay,blockSize);
@@ -6714,9 +7650,9 @@ cmsis_arm_fir_sparse_init_q31(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_sparse_instance_q31Object *selfS = (dsp_arm_fir_sparse_instance_q31Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pTapDelay,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pTapDelay,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
 
     arm_fir_sparse_init_q31(selfS->instance,numTaps,pCoeffs_converted,pState_converted,pTapDelay_converted,maxDelay,blockSize);
@@ -6746,9 +7682,9 @@ cmsis_arm_fir_sparse_init_q15(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_sparse_instance_q15Object *selfS = (dsp_arm_fir_sparse_instance_q15Object *)S;
-    GETARGUMENT(pCoeffs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pTapDelay,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pTapDelay,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
 
     arm_fir_sparse_init_q15(selfS->instance,numTaps,pCoeffs_converted,pState_converted,pTapDelay_converted,maxDelay,blockSize);
@@ -6778,9 +7714,9 @@ cmsis_arm_fir_sparse_init_q7(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_fir_sparse_instance_q7Object *selfS = (dsp_arm_fir_sparse_instance_q7Object *)S;
-    GETARGUMENT(pCoeffs,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pState,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(pTapDelay,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pCoeffs,NPY_BYTE,int8_t,q7_t);
+    GETARGUMENTCOPY(pState,NPY_BYTE,int8_t,q7_t);
+    GETARGUMENTCOPY(pTapDelay,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepState - arraySizepCoeffs + 1;
 
     arm_fir_sparse_init_q7(selfS->instance,numTaps,pCoeffs_converted,pState_converted,pTapDelay_converted,maxDelay,blockSize);
@@ -6809,12 +7745,14 @@ cmsis_arm_circularWrite_f32(PyObject *obj, PyObject *args)
   if (PyArg_ParseTuple(args,"OiOiOi",&circBuffer,&L,&writeOffset,&bufferInc,&src,&srcInc))
   {
 
-    GETARGUMENT(circBuffer,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(writeOffset,NPY_UINT16,uint16_t,uint16_t);
+    GETARGUMENTCOPY(circBuffer,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(writeOffset,NPY_UINT16,uint16_t,uint16_t);
     GETARGUMENT(src,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizecircBuffer ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_circularWrite_f32(circBuffer_converted,L,writeOffset_converted,bufferInc,src_converted,srcInc,blockSize);
+    Py_END_ALLOW_THREADS
     FREEARGUMENT(circBuffer_converted);
     FREEARGUMENT(writeOffset_converted);
     FREEARGUMENT(src_converted);
@@ -6843,12 +7781,14 @@ cmsis_arm_circularWrite_q15(PyObject *obj, PyObject *args)
   if (PyArg_ParseTuple(args,"OiOiOi",&circBuffer,&L,&writeOffset,&bufferInc,&src,&srcInc))
   {
 
-    GETARGUMENT(circBuffer,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(writeOffset,NPY_UINT16,uint16_t,uint16_t);
+    GETARGUMENTCOPY(circBuffer,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(writeOffset,NPY_UINT16,uint16_t,uint16_t);
     GETARGUMENT(src,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizecircBuffer ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_circularWrite_q15(circBuffer_converted,L,writeOffset_converted,bufferInc,src_converted,srcInc,blockSize);
+    Py_END_ALLOW_THREADS
     FREEARGUMENT(circBuffer_converted);
     FREEARGUMENT(writeOffset_converted);
     FREEARGUMENT(src_converted);
@@ -6877,12 +7817,14 @@ cmsis_arm_circularWrite_q7(PyObject *obj, PyObject *args)
   if (PyArg_ParseTuple(args,"OiOiOi",&circBuffer,&L,&writeOffset,&bufferInc,&src,&srcInc))
   {
 
-    GETARGUMENT(circBuffer,NPY_BYTE,int8_t,q7_t);
-    GETARGUMENT(writeOffset,NPY_UINT16,uint16_t,uint16_t);
+    GETARGUMENTCOPY(circBuffer,NPY_BYTE,int8_t,q7_t);
+    GETARGUMENTCOPY(writeOffset,NPY_UINT16,uint16_t,uint16_t);
     GETARGUMENT(src,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizecircBuffer ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_circularWrite_q7(circBuffer_converted,L,writeOffset_converted,bufferInc,src_converted,srcInc,blockSize);
+    Py_END_ALLOW_THREADS
     FREEARGUMENT(circBuffer_converted);
     FREEARGUMENT(writeOffset_converted);
     FREEARGUMENT(src_converted);
@@ -6892,107 +7834,536 @@ cmsis_arm_circularWrite_q7(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+/*
+
+Check the channels processed by a filter bank.
+A maxBlockSize of 0 means that there is no limit on the block size.
+
+*/
+static int
+checkChannels(void *pData,
+              uint32_t firstChannel,
+              uint32_t nbChannels,
+              uint32_t maxChannels,
+              uint32_t blockSize,
+              uint32_t maxBlockSize)
+{
+    if (pData == NULL)
+    {
+        return(0);
+    }
+
+    if ((firstChannel > maxChannels) || (nbChannels > maxChannels - firstChannel))
+    {
+        PyErr_Format(PyExc_ValueError,"the filter bank has only %u channels",maxChannels);
+        return(0);
+    }
+
+    if ((maxBlockSize != 0) && (blockSize > maxBlockSize))
+    {
+        PyErr_Format(PyExc_ValueError,"the filter bank has a maximum block size of %u",maxBlockSize);
+        return(0);
+    }
+    return(1);
+}
+
+/*
+
+Coefficients of a filter bank : nbCoefs shared by all channels
+or nbCoefs for each channel.
+Return the offset between the coefficients of two channels.
+
+*/
+static int
+bankCoefsOffset(uint32_t arraySize,uint32_t nbCoefs,uint32_t nbChannels,uint32_t *offset)
+{
+    if (arraySize == nbCoefs)
+    {
+        *offset = 0;
+        return(1);
+    }
+
+    if (arraySize == nbCoefs*nbChannels)
+    {
+        *offset = nbCoefs;
+        return(1);
+    }
+
+    PyErr_Format(PyExc_ValueError,"the filter bank is expecting %u coefficients per channel",nbCoefs);
+    return(0);
+}
+
+/*
+
+The state matrix gives the number of channels and the size of the state
+of each channel. The content is not used since the init functions
+of CMSIS-DSP are clearing the state.
+The old buffers are released if the instance is initialized again.
+If the allocations are failing, the instance is left without channels
+and MemoryError is raised.
+
+*/
+#define BANKINIT(NAME,TYP,NBCHANNELS,NBSTATES)                        \
+    PyMem_Free(selfS->instance);                                      \
+    PyMem_Free(selfS->pCoeffs);                                       \
+    PyMem_Free(selfS->pState);                                        \
+    selfS->nbChannels = (NBCHANNELS);                                 \
+    selfS->instance = PyMem_Malloc(sizeof(*selfS->instance)*(NBCHANNELS));\
+    selfS->pCoeffs = pCoeffs_converted;                               \
+    selfS->pState = PyMem_Malloc(sizeof(TYP)*(NBCHANNELS)*(NBSTATES));\
+    if ((selfS->instance == NULL) || (selfS->pState == NULL))         \
+    {                                                                 \
+       PyMem_Free(selfS->instance);                                   \
+       PyMem_Free(selfS->pCoeffs);                                    \
+       PyMem_Free(selfS->pState);                                     \
+       selfS->instance = NULL;                                        \
+       selfS->pCoeffs = NULL;                                         \
+       selfS->pState = NULL;                                          \
+       selfS->nbChannels = 0;                                         \
+       FREEARGUMENT(pState_converted);                                \
+       return(PyErr_NoMemory());                                      \
+    }
+
+#define FIRBANKINIT(EXT,TYP,NPYTYPE,SRCTYPE,INIT)                                           \
+static PyObject *                                                                           \
+cmsis_arm_fir_bank_init_##EXT(PyObject *obj, PyObject *args)                                \
+{                                                                                           \
+                                                                                            \
+  PyObject *S=NULL; /* input */                                                             \
+  uint16_t numTaps; /* input */                                                             \
+  PyObject *pCoeffs=NULL; /* input */                                                       \
+  TYP *pCoeffs_converted=NULL; /* input */                                                  \
+  PyObject *pState=NULL; /* input */                                                        \
+  TYP *pState_converted=NULL; /* input */                                                   \
+                                                                                            \
+  if (PyArg_ParseTuple(args,"OhOO",&S,&numTaps,&pCoeffs,&pState))                           \
+  {                                                                                         \
+                                                                                            \
+    dsp_arm_fir_bank_instance_##EXT##Object *selfS = (dsp_arm_fir_bank_instance_##EXT##Object *)S; \
+    uint32_t coefsOffset;                                                                   \
+    GETARGUMENTCOPY(pCoeffs,NPYTYPE,SRCTYPE,TYP);                                           \
+    GETFRAMESARGUMENT(pState,NPYTYPE,SRCTYPE,TYP);                                          \
+                                                                                            \
+    if (!pState_converted ||                                                                \
+        !bankCoefsOffset(arraySizepCoeffs,numTaps,nbRowspState,&coefsOffset) ||             \
+        (nbColspState < numTaps))                                                           \
+    {                                                                                       \
+       if (!PyErr_Occurred())                                                               \
+       {                                                                                    \
+          PyErr_SetString(PyExc_ValueError,"the state is too small for the number of taps"); \
+       }                                                                                    \
+       PyMem_Free(pCoeffs_converted);                                                       \
+       FREEARGUMENT(pState_converted);                                                      \
+       return(NULL);                                                                        \
+    }                                                                                       \
+                                                                                            \
+    BANKINIT(arm_fir_bank_instance_##EXT,TYP,nbRowspState,nbColspState);                    \
+    selfS->blockSize = nbColspState - numTaps + 1;                                          \
+    FREEARGUMENT(pState_converted);                                                         \
+                                                                                            \
+    arm_status returnValue = ARM_MATH_SUCCESS;                                              \
+    for(uint32_t i=0; i < selfS->nbChannels; i++)                                           \
+    {                                                                                       \
+       arm_status status = INIT(&selfS->instance[i],numTaps,                                \
+          selfS->pCoeffs + i*coefsOffset,                                                   \
+          selfS->pState + i*nbColspState,                                                   \
+          selfS->blockSize);                                                                \
+       if (status != ARM_MATH_SUCCESS)                                                      \
+       {                                                                                    \
+          returnValue = status;                                                             \
+       }                                                                                    \
+    }                                                                                       \
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);                                  \
+                                                                                            \
+    PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);                               \
+                                                                                            \
+    Py_DECREF(theReturnOBJ);                                                                \
+    return(pythonResult);                                                                   \
+                                                                                            \
+  }                                                                                         \
+  return(NULL);                                                                             \
+}
+
+/*
+
+arm_fir_init_f32 and arm_fir_init_q31 have no status
+
+*/
+static arm_status fir_bank_init_f32(arm_fir_instance_f32 *S,uint16_t numTaps,
+  const float32_t *pCoeffs,float32_t *pState,uint32_t blockSize)
+{
+   arm_fir_init_f32(S,numTaps,pCoeffs,pState,blockSize);
+   return(ARM_MATH_SUCCESS);
+}
+
+static arm_status fir_bank_init_q31(arm_fir_instance_q31 *S,uint16_t numTaps,
+  const q31_t *pCoeffs,q31_t *pState,uint32_t blockSize)
+{
+   arm_fir_init_q31(S,numTaps,pCoeffs,pState,blockSize);
+   return(ARM_MATH_SUCCESS);
+}
+
+FIRBANKINIT(q15,q15_t,NPY_INT16,int16_t,arm_fir_init_q15);
+FIRBANKINIT(q31,q31_t,NPY_INT32,int32_t,fir_bank_init_q31);
+FIRBANKINIT(f32,float32_t,NPY_DOUBLE,double,fir_bank_init_f32);
+
+static PyObject *
+cmsis_arm_biquad_cascade_df1_bank_init_f32(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint32_t numStages; // input
+  PyObject *pCoeffs=NULL; // input
+  float32_t *pCoeffs_converted=NULL; // input
+  PyObject *pState=NULL; // input
+  float32_t *pState_converted=NULL; // input
+
+  if (PyArg_ParseTuple(args,"OiOO",&S,&numStages,&pCoeffs,&pState))
+  {
+
+    dsp_arm_biquad_casd_df1_bank_inst_f32Object *selfS = (dsp_arm_biquad_casd_df1_bank_inst_f32Object *)S;
+    uint32_t coefsOffset;
+    GETARGUMENTCOPY(pCoeffs,NPY_DOUBLE,double,float32_t);
+    GETFRAMESARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+
+    if (!pState_converted ||
+        !bankCoefsOffset(arraySizepCoeffs,5*numStages,nbRowspState,&coefsOffset) ||
+        (nbColspState != 4*numStages))
+    {
+       if (!PyErr_Occurred())
+       {
+          PyErr_SetString(PyExc_ValueError,"the state must have 4 values per stage");
+       }
+       PyMem_Free(pCoeffs_converted);
+       FREEARGUMENT(pState_converted);
+       return(NULL);
+    }
+
+    BANKINIT(arm_biquad_casd_df1_bank_inst_f32,float32_t,nbRowspState,nbColspState);
+    FREEARGUMENT(pState_converted);
+
+    for(uint32_t i=0; i < selfS->nbChannels; i++)
+    {
+       arm_biquad_cascade_df1_init_f32(&selfS->instance[i],(uint8_t)numStages,
+          selfS->pCoeffs + i*coefsOffset,
+          selfS->pState + i*nbColspState);
+    }
+    Py_RETURN_NONE;
+
+  }
+  return(NULL);
+}
+
+/*
+
+Filtering of the rows of pSrc by the channels firstChannel,
+firstChannel+1, ... of the bank.
+
+*/
+#define FILTERBANK(NAME,BANK,EXT,TYP,NPYTYPE,SRCTYPE,NPYTYPE_FROMC)                         \
+static PyObject *                                                                           \
+cmsis_arm_##NAME##_bank_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)                \
+{                                                                                           \
+                                                                                            \
+  PyObject *S=NULL; /* input */                                                             \
+  PyObject *pSrc=NULL; /* input */                                                          \
+  TYP *pSrc_converted=NULL; /* input */                                                     \
+  TYP *pDst=NULL; /* output */                                                              \
+  PyObject *out=NULL; /* output */                                                          \
+  uint32_t firstChannel=0; /* input */                                                      \
+                                                                                            \
+  if (PyArg_ParseTuple(args,"OO|i",&S,&pSrc,&firstChannel) && parseOutKeyword(args,kwds,&out))   \
+  {                                                                                         \
+                                                                                            \
+    dsp_arm_##BANK##_##EXT##Object *selfS = (dsp_arm_##BANK##_##EXT##Object *)S;            \
+    GETFRAMESARGUMENT(pSrc,NPYTYPE,SRCTYPE,TYP);                                            \
+    uint32_t nbChannels = nbRowspSrc ;                                                      \
+    uint32_t blockSize = nbColspSrc ;                                                       \
+                                                                                            \
+    if (!checkChannels(pSrc_converted,firstChannel,nbChannels,                              \
+          selfS->nbChannels,blockSize,selfS->blockSize))                                    \
+    {                                                                                       \
+       FREEARGUMENT(pSrc_converted);                                                        \
+       return(NULL);                                                                        \
+    }                                                                                       \
+                                                                                            \
+    GETOUTPUT2D(pDst,TYP,NPYTYPE_FROMC,nbChannels,blockSize);                               \
+                                                                                            \
+    if (pDst)                                                                               \
+    {                                                                                       \
+      Py_BEGIN_ALLOW_THREADS                                                                \
+      for(uint32_t i=0; i < nbChannels; i++)                                                \
+      {                                                                                     \
+        arm_##NAME##_##EXT(&selfS->instance[firstChannel+i],                                \
+           pSrc_converted + i*blockSize,                                                    \
+           pDst + i*blockSize,                                                              \
+           blockSize);                                                                      \
+      }                                                                                     \
+      Py_END_ALLOW_THREADS                                                                  \
+    }                                                                                       \
+    OUTPUTARRAY2D(pDstOBJ,nbChannels,blockSize,pDst,NPYTYPE_FROMC);                         \
+                                                                                            \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                                    \
+                                                                                            \
+    FREEARGUMENT(pSrc_converted);                                                           \
+    Py_XDECREF(pDstOBJ);                                                                    \
+    return(pythonResult);                                                                   \
+                                                                                            \
+  }                                                                                         \
+  return(NULL);                                                                             \
+}
+
+FILTERBANK(fir,fir_bank_instance,q15,q15_t,NPY_INT16,int16_t,NPY_INT16);
+FILTERBANK(fir,fir_bank_instance,q31,q31_t,NPY_INT32,int32_t,NPY_INT32);
+FILTERBANK(fir,fir_bank_instance,f32,float32_t,NPY_DOUBLE,double,NPY_FLOAT);
+FILTERBANK(biquad_cascade_df1,biquad_casd_df1_bank_inst,f32,float32_t,NPY_DOUBLE,double,NPY_FLOAT);
+
+
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+f16 filters : the coefficients, state and samples are converted
+to np.float16 and the results are np.float16 arrays.
+
+*/
+static PyObject *
+cmsis_arm_fir_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *pSrc=NULL; // input
+  float16_t *pSrc_converted=NULL; // input
+  float16_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t blockSize; // input
+
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_fir_instance_f16Object *selfS = (dsp_arm_fir_instance_f16Object *)S;
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrc ;
+
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i = 0, nb; i < blockSize; i += nb)
+      {
+        nb = BLOCKLENGTH(selfS->blockSize,blockSize - i);
+        arm_fir_f16(selfS->instance,pSrc_converted + i,pDst + i,nb);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_fir_init_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint16_t numTaps; // input
+  PyObject *pCoeffs=NULL; // input
+  float16_t *pCoeffs_converted=NULL; // input
+  PyObject *pState=NULL; // input
+  float16_t *pState_converted=NULL; // input
+  uint32_t blockSize; // input
+
+  if (PyArg_ParseTuple(args,"OhOO",&S,&numTaps,&pCoeffs,&pState))
+  {
+
+    dsp_arm_fir_instance_f16Object *selfS = (dsp_arm_fir_instance_f16Object *)S;
+    GETARGUMENTCOPY(pCoeffs,NPY_HALF,float16_t,float16_t);
+    GETARGUMENTCOPY(pState,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepState - arraySizepCoeffs + 1;
+    SETOWNEDBUFFERS(float16_t,float16_t,blockSize);
+
+    arm_fir_init_f16(selfS->instance,numTaps,pCoeffs_converted,pState_converted,blockSize);
+    Py_RETURN_NONE;
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_biquad_cascade_df1_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *pSrc=NULL; // input
+  float16_t *pSrc_converted=NULL; // input
+  float16_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t blockSize; // input
+
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_biquad_casd_df1_inst_f16Object *selfS = (dsp_arm_biquad_casd_df1_inst_f16Object *)S;
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrc ;
+
+    GETOUTPUT(pDst,float16_t,NPY_HALF,blockSize);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_biquad_cascade_df1_f16(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_biquad_cascade_df1_init_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint32_t numStages; // input
+  PyObject *pCoeffs=NULL; // input
+  float16_t *pCoeffs_converted=NULL; // input
+  PyObject *pState=NULL; // input
+  float16_t *pState_converted=NULL; // input
+
+  if (PyArg_ParseTuple(args,"OiOO",&S,&numStages,&pCoeffs,&pState))
+  {
+
+    dsp_arm_biquad_casd_df1_inst_f16Object *selfS = (dsp_arm_biquad_casd_df1_inst_f16Object *)S;
+    GETARGUMENTCOPY(pCoeffs,NPY_HALF,float16_t,float16_t);
+    GETARGUMENTCOPY(pState,NPY_HALF,float16_t,float16_t);
+    SETOWNEDBUFFERS(float16_t,float16_t,0);
+
+    arm_biquad_cascade_df1_init_f16(selfS->instance,(uint8_t)numStages,pCoeffs_converted,pState_converted);
+    Py_RETURN_NONE;
+
+  }
+  return(NULL);
+}
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
-{"arm_fir_q7",  cmsis_arm_fir_q7, METH_VARARGS,""},
+{"arm_fir_q7",  (PyCFunction)(void(*)(void))cmsis_arm_fir_q7, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_init_q7",  cmsis_arm_fir_init_q7, METH_VARARGS,""},
-{"arm_fir_q15",  cmsis_arm_fir_q15, METH_VARARGS,""},
-{"arm_fir_fast_q15",  cmsis_arm_fir_fast_q15, METH_VARARGS,""},
+{"arm_fir_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_init_q15",  cmsis_arm_fir_init_q15, METH_VARARGS,""},
-{"arm_fir_q31",  cmsis_arm_fir_q31, METH_VARARGS,""},
-{"arm_fir_fast_q31",  cmsis_arm_fir_fast_q31, METH_VARARGS,""},
+{"arm_fir_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_init_q31",  cmsis_arm_fir_init_q31, METH_VARARGS,""},
-{"arm_fir_f32",  cmsis_arm_fir_f32, METH_VARARGS,""},
+{"arm_fir_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_init_f32",  cmsis_arm_fir_init_f32, METH_VARARGS,""},
-{"arm_fir_f64",  cmsis_arm_fir_f64, METH_VARARGS,""},
+{"arm_fir_f64",  (PyCFunction)(void(*)(void))cmsis_arm_fir_f64, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_init_f64",  cmsis_arm_fir_init_f64, METH_VARARGS,""},
-{"arm_biquad_cascade_df1_q15",  cmsis_arm_biquad_cascade_df1_q15, METH_VARARGS,""},
+{"arm_biquad_cascade_df1_q15",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_biquad_cascade_df1_init_q15",  cmsis_arm_biquad_cascade_df1_init_q15, METH_VARARGS,""},
-{"arm_biquad_cascade_df1_fast_q15",  cmsis_arm_biquad_cascade_df1_fast_q15, METH_VARARGS,""},
-{"arm_biquad_cascade_df1_q31",  cmsis_arm_biquad_cascade_df1_q31, METH_VARARGS,""},
-{"arm_biquad_cascade_df1_fast_q31",  cmsis_arm_biquad_cascade_df1_fast_q31, METH_VARARGS,""},
+{"arm_biquad_cascade_df1_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_df1_q31",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_df1_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_biquad_cascade_df1_init_q31",  cmsis_arm_biquad_cascade_df1_init_q31, METH_VARARGS,""},
-{"arm_biquad_cascade_df1_f32",  cmsis_arm_biquad_cascade_df1_f32, METH_VARARGS,""},
+{"arm_biquad_cascade_df1_f32",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_biquad_cascade_df1_init_f32",  cmsis_arm_biquad_cascade_df1_init_f32, METH_VARARGS,""},
 
 
 
-{"arm_conv_f32",  cmsis_arm_conv_f32, METH_VARARGS,""},
-{"arm_conv_opt_q15",  cmsis_arm_conv_opt_q15, METH_VARARGS,""},
-{"arm_conv_q15",  cmsis_arm_conv_q15, METH_VARARGS,""},
-{"arm_conv_fast_q15",  cmsis_arm_conv_fast_q15, METH_VARARGS,""},
-{"arm_conv_fast_opt_q15",  cmsis_arm_conv_fast_opt_q15, METH_VARARGS,""},
-{"arm_conv_q31",  cmsis_arm_conv_q31, METH_VARARGS,""},
-{"arm_conv_fast_q31",  cmsis_arm_conv_fast_q31, METH_VARARGS,""},
-{"arm_conv_opt_q7",  cmsis_arm_conv_opt_q7, METH_VARARGS,""},
-{"arm_conv_q7",  cmsis_arm_conv_q7, METH_VARARGS,""},
-{"arm_conv_partial_f32",  cmsis_arm_conv_partial_f32, METH_VARARGS,""},
-{"arm_conv_partial_opt_q15",  cmsis_arm_conv_partial_opt_q15, METH_VARARGS,""},
-{"arm_conv_partial_q15",  cmsis_arm_conv_partial_q15, METH_VARARGS,""},
-{"arm_conv_partial_fast_q15",  cmsis_arm_conv_partial_fast_q15, METH_VARARGS,""},
-{"arm_conv_partial_fast_opt_q15",  cmsis_arm_conv_partial_fast_opt_q15, METH_VARARGS,""},
-{"arm_conv_partial_q31",  cmsis_arm_conv_partial_q31, METH_VARARGS,""},
-{"arm_conv_partial_fast_q31",  cmsis_arm_conv_partial_fast_q31, METH_VARARGS,""},
-{"arm_conv_partial_opt_q7",  cmsis_arm_conv_partial_opt_q7, METH_VARARGS,""},
-{"arm_conv_partial_q7",  cmsis_arm_conv_partial_q7, METH_VARARGS,""},
-{"arm_fir_decimate_f32",  cmsis_arm_fir_decimate_f32, METH_VARARGS,""},
+{"arm_conv_f32",  (PyCFunction)(void(*)(void))cmsis_arm_conv_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_fast_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_fast_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_q31",  (PyCFunction)(void(*)(void))cmsis_arm_conv_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_conv_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_opt_q7",  (PyCFunction)(void(*)(void))cmsis_arm_conv_opt_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_q7",  (PyCFunction)(void(*)(void))cmsis_arm_conv_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_f32",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_fast_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_fast_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_q31",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_opt_q7",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_opt_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_conv_partial_q7",  (PyCFunction)(void(*)(void))cmsis_arm_conv_partial_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_decimate_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_decimate_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_decimate_init_f32",  cmsis_arm_fir_decimate_init_f32, METH_VARARGS,""},
-{"arm_fir_decimate_q15",  cmsis_arm_fir_decimate_q15, METH_VARARGS,""},
-{"arm_fir_decimate_fast_q15",  cmsis_arm_fir_decimate_fast_q15, METH_VARARGS,""},
+{"arm_fir_decimate_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_decimate_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_decimate_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_decimate_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_decimate_init_q15",  cmsis_arm_fir_decimate_init_q15, METH_VARARGS,""},
-{"arm_fir_decimate_q31",  cmsis_arm_fir_decimate_q31, METH_VARARGS,""},
-{"arm_fir_decimate_fast_q31",  cmsis_arm_fir_decimate_fast_q31, METH_VARARGS,""},
+{"arm_fir_decimate_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_decimate_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_decimate_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_decimate_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_decimate_init_q31",  cmsis_arm_fir_decimate_init_q31, METH_VARARGS,""},
-{"arm_fir_interpolate_q15",  cmsis_arm_fir_interpolate_q15, METH_VARARGS,""},
+{"arm_fir_interpolate_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_interpolate_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_interpolate_init_q15",  cmsis_arm_fir_interpolate_init_q15, METH_VARARGS,""},
-{"arm_fir_interpolate_q31",  cmsis_arm_fir_interpolate_q31, METH_VARARGS,""},
+{"arm_fir_interpolate_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_interpolate_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_interpolate_init_q31",  cmsis_arm_fir_interpolate_init_q31, METH_VARARGS,""},
-{"arm_fir_interpolate_f32",  cmsis_arm_fir_interpolate_f32, METH_VARARGS,""},
+{"arm_fir_interpolate_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_interpolate_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_interpolate_init_f32",  cmsis_arm_fir_interpolate_init_f32, METH_VARARGS,""},
-{"arm_biquad_cas_df1_32x64_q31",  cmsis_arm_biquad_cas_df1_32x64_q31, METH_VARARGS,""},
+{"arm_biquad_cas_df1_32x64_q31",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cas_df1_32x64_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_biquad_cas_df1_32x64_init_q31",  cmsis_arm_biquad_cas_df1_32x64_init_q31, METH_VARARGS,""},
-{"arm_biquad_cascade_df2T_f32",  cmsis_arm_biquad_cascade_df2T_f32, METH_VARARGS,""},
-{"arm_biquad_cascade_stereo_df2T_f32",  cmsis_arm_biquad_cascade_stereo_df2T_f32, METH_VARARGS,""},
-{"arm_biquad_cascade_df2T_f64",  cmsis_arm_biquad_cascade_df2T_f64, METH_VARARGS,""},
+{"arm_biquad_cascade_df2T_f32",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df2T_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_stereo_df2T_f32",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_stereo_df2T_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_df2T_f64",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df2T_f64, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_biquad_cascade_df2T_init_f32",  cmsis_arm_biquad_cascade_df2T_init_f32, METH_VARARGS,""},
 {"arm_biquad_cascade_stereo_df2T_init_f32",  cmsis_arm_biquad_cascade_stereo_df2T_init_f32, METH_VARARGS,""},
 {"arm_biquad_cascade_df2T_init_f64",  cmsis_arm_biquad_cascade_df2T_init_f64, METH_VARARGS,""},
 {"arm_fir_lattice_init_q15",  cmsis_arm_fir_lattice_init_q15, METH_VARARGS,""},
-{"arm_fir_lattice_q15",  cmsis_arm_fir_lattice_q15, METH_VARARGS,""},
+{"arm_fir_lattice_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_lattice_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_lattice_init_q31",  cmsis_arm_fir_lattice_init_q31, METH_VARARGS,""},
-{"arm_fir_lattice_q31",  cmsis_arm_fir_lattice_q31, METH_VARARGS,""},
+{"arm_fir_lattice_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_lattice_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_lattice_init_f32",  cmsis_arm_fir_lattice_init_f32, METH_VARARGS,""},
-{"arm_fir_lattice_f32",  cmsis_arm_fir_lattice_f32, METH_VARARGS,""},
-{"arm_iir_lattice_f32",  cmsis_arm_iir_lattice_f32, METH_VARARGS,""},
+{"arm_fir_lattice_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_lattice_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_iir_lattice_f32",  (PyCFunction)(void(*)(void))cmsis_arm_iir_lattice_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_iir_lattice_init_f32",  cmsis_arm_iir_lattice_init_f32, METH_VARARGS,""},
-{"arm_iir_lattice_q31",  cmsis_arm_iir_lattice_q31, METH_VARARGS,""},
+{"arm_iir_lattice_q31",  (PyCFunction)(void(*)(void))cmsis_arm_iir_lattice_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_iir_lattice_init_q31",  cmsis_arm_iir_lattice_init_q31, METH_VARARGS,""},
-{"arm_iir_lattice_q15",  cmsis_arm_iir_lattice_q15, METH_VARARGS,""},
+{"arm_iir_lattice_q15",  (PyCFunction)(void(*)(void))cmsis_arm_iir_lattice_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_iir_lattice_init_q15",  cmsis_arm_iir_lattice_init_q15, METH_VARARGS,""},
-{"arm_lms_f32",  cmsis_arm_lms_f32, METH_VARARGS,""},
+{"arm_lms_f32",  (PyCFunction)(void(*)(void))cmsis_arm_lms_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_lms_init_f32",  cmsis_arm_lms_init_f32, METH_VARARGS,""},
 {"arm_lms_init_q15",  cmsis_arm_lms_init_q15, METH_VARARGS,""},
-{"arm_lms_q15",  cmsis_arm_lms_q15, METH_VARARGS,""},
-{"arm_lms_q31",  cmsis_arm_lms_q31, METH_VARARGS,""},
+{"arm_lms_q15",  (PyCFunction)(void(*)(void))cmsis_arm_lms_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_lms_q31",  (PyCFunction)(void(*)(void))cmsis_arm_lms_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_lms_init_q31",  cmsis_arm_lms_init_q31, METH_VARARGS,""},
-{"arm_lms_norm_f32",  cmsis_arm_lms_norm_f32, METH_VARARGS,""},
+{"arm_lms_norm_f32",  (PyCFunction)(void(*)(void))cmsis_arm_lms_norm_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_lms_norm_init_f32",  cmsis_arm_lms_norm_init_f32, METH_VARARGS,""},
-{"arm_lms_norm_q31",  cmsis_arm_lms_norm_q31, METH_VARARGS,""},
+{"arm_lms_norm_q31",  (PyCFunction)(void(*)(void))cmsis_arm_lms_norm_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_lms_norm_init_q31",  cmsis_arm_lms_norm_init_q31, METH_VARARGS,""},
-{"arm_lms_norm_q15",  cmsis_arm_lms_norm_q15, METH_VARARGS,""},
+{"arm_lms_norm_q15",  (PyCFunction)(void(*)(void))cmsis_arm_lms_norm_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_lms_norm_init_q15",  cmsis_arm_lms_norm_init_q15, METH_VARARGS,""},
-{"arm_correlate_f32",  cmsis_arm_correlate_f32, METH_VARARGS,""},
-{"arm_correlate_f64",  cmsis_arm_correlate_f64, METH_VARARGS,""},
-{"arm_correlate_opt_q15",  cmsis_arm_correlate_opt_q15, METH_VARARGS,""},
-{"arm_correlate_q15",  cmsis_arm_correlate_q15, METH_VARARGS,""},
-{"arm_correlate_fast_q15",  cmsis_arm_correlate_fast_q15, METH_VARARGS,""},
-{"arm_correlate_fast_opt_q15",  cmsis_arm_correlate_fast_opt_q15, METH_VARARGS,""},
-{"arm_correlate_q31",  cmsis_arm_correlate_q31, METH_VARARGS,""},
-{"arm_correlate_fast_q31",  cmsis_arm_correlate_fast_q31, METH_VARARGS,""},
-{"arm_correlate_opt_q7",  cmsis_arm_correlate_opt_q7, METH_VARARGS,""},
-{"arm_correlate_q7",  cmsis_arm_correlate_q7, METH_VARARGS,""},
-{"arm_fir_sparse_f32",  cmsis_arm_fir_sparse_f32, METH_VARARGS,""},
+{"arm_correlate_f32",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_f64",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_q15",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_fast_opt_q15",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_fast_opt_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_q31",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_opt_q7",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_opt_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_correlate_q7",  (PyCFunction)(void(*)(void))cmsis_arm_correlate_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_sparse_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_sparse_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_fir_sparse_init_f32",  cmsis_arm_fir_sparse_init_f32, METH_VARARGS,""},
 {"arm_fir_sparse_init_q31",  cmsis_arm_fir_sparse_init_q31, METH_VARARGS,""},
 {"arm_fir_sparse_init_q15",  cmsis_arm_fir_sparse_init_q15, METH_VARARGS,""},
@@ -7002,8 +8373,23 @@ static PyMethodDef CMSISDSPMethods[] = {
 {"arm_circularWrite_q15",  cmsis_arm_circularWrite_q15, METH_VARARGS,""},
 {"arm_circularWrite_q7",  cmsis_arm_circularWrite_q7, METH_VARARGS,""},
 
-{"arm_levinson_durbin_f32",  cmsis_arm_levinson_durbin_f32, METH_VARARGS,""},
-{"arm_levinson_durbin_q31",  cmsis_arm_levinson_durbin_q31, METH_VARARGS,""},
+{"arm_levinson_durbin_f32",  (PyCFunction)(void(*)(void))cmsis_arm_levinson_durbin_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_levinson_durbin_q31",  (PyCFunction)(void(*)(void))cmsis_arm_levinson_durbin_q31, METH_VARARGS | METH_KEYWORDS,""},
+
+{"arm_fir_bank_init_q15",  cmsis_arm_fir_bank_init_q15, METH_VARARGS,""},
+{"arm_fir_bank_init_q31",  cmsis_arm_fir_bank_init_q31, METH_VARARGS,""},
+{"arm_fir_bank_init_f32",  cmsis_arm_fir_bank_init_f32, METH_VARARGS,""},
+{"arm_biquad_cascade_df1_bank_init_f32",  cmsis_arm_biquad_cascade_df1_bank_init_f32, METH_VARARGS,""},
+{"arm_fir_bank_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fir_bank_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_bank_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fir_bank_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_bank_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fir_bank_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_df1_bank_f32",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_bank_f32, METH_VARARGS | METH_KEYWORDS,""},
+#if defined(ARM_FLOAT16_SUPPORTED)
+{"arm_fir_f16",  (PyCFunction)(void(*)(void))cmsis_arm_fir_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fir_init_f16",  cmsis_arm_fir_init_f16, METH_VARARGS,""},
+{"arm_biquad_cascade_df1_f16",  (PyCFunction)(void(*)(void))cmsis_arm_biquad_cascade_df1_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_biquad_cascade_df1_init_f16",  cmsis_arm_biquad_cascade_df1_init_f16, METH_VARARGS,""},
+#endif
 
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
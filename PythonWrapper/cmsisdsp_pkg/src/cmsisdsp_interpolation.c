@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_interpolation"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_interpolation
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -816,8 +818,8 @@ cmsis_arm_spline_init_f32(PyObject *obj, PyObject *args)
 
     dsp_arm_spline_instance_f32Object *selfS = (dsp_arm_spline_instance_f32Object *)S;
 
-    GETARGUMENT(pX,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pY,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pX,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pY,NPY_DOUBLE,double,float32_t);
     n = arraySizepX ;
     float32_t * coeffs=PyMem_Malloc(sizeof(float32_t)*n*3);
     float32_t * tempBuffer=PyMem_Malloc(sizeof(float32_t)*n*2);
@@ -857,7 +859,9 @@ cmsis_arm_spline_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_spline_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,blockSize,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -870,6 +874,192 @@ cmsis_arm_spline_f32(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+/*
+
+Block versions : the interpolation is computed for arrays of
+query points in one call (and the GIL is released during the
+loop). The table of the instance (or the table argument when
+it is a native array) is used without copy.
+
+*/
+#define FREEBLOCKARGUMENT(FIELD) \
+    if (FIELD) {FREEARGUMENT(FIELD);}
+
+static PyObject *
+cmsis_arm_linear_interp_block_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+  PyObject *S=NULL; // input
+  PyObject *x=NULL; // input
+  float32_t *x_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t blockSize; // input
+
+  if (PyArg_ParseTuple(args,"OO",&S,&x) && parseOutKeyword(args,kwds,&out))
+  {
+    dsp_arm_linear_interp_instance_f32Object *selfS =
+       (dsp_arm_linear_interp_instance_f32Object *)S;
+    if (selfS->instance->pYData == NULL)
+    {
+       PyErr_SetString(PyExc_ValueError,"the instance has no table");
+       return(NULL);
+    }
+    GETARGUMENT(x,NPY_DOUBLE,double,float32_t);
+    if (x_converted == NULL)
+    {
+       return(NULL);
+    }
+    blockSize = arraySizex;
+
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < blockSize; i++)
+      {
+         pDst[i] = arm_linear_interp_f32(selfS->instance,x_converted[i]);
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
+
+    FREEARGUMENT(x_converted);
+    return((PyObject*)pDstOBJ);
+  }
+  return(NULL);
+}
+
+/* nValues is the length of the table by default */
+#define LINEARINTERPBLOCK(EXT,TYP,NPYTYPE,SRCFORMAT)                           \
+static PyObject *                                                              \
+cmsis_arm_linear_interp_block_##EXT(PyObject *obj, PyObject *args, PyObject *kwds) \
+{                                                                              \
+  PyObject *pYData=NULL; /* input */                                           \
+  TYP *pYData_converted=NULL; /* input */                                      \
+  PyObject *x=NULL; /* input */                                                \
+  q31_t *x_converted=NULL; /* input */                                         \
+  int32_t nValues=-1; /* input */                                              \
+  TYP *pDst=NULL; /* output */                                                 \
+  PyObject *out=NULL; /* output */                                             \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OO|i",&pYData,&x,&nValues) &&                     \
+      parseOutKeyword(args,kwds,&out))                                              \
+  {                                                                            \
+    GETARGUMENT(pYData,NPYTYPE,SRCFORMAT,TYP);                                 \
+    GETARGUMENT(x,NPY_INT32,int32_t,int32_t);                                  \
+    if ((pYData_converted == NULL) || (x_converted == NULL))                   \
+    {                                                                          \
+       FREEBLOCKARGUMENT(pYData_converted);                                    \
+       FREEBLOCKARGUMENT(x_converted);                                         \
+       return(NULL);                                                           \
+    }                                                                          \
+    if (nValues < 0)                                                           \
+    {                                                                          \
+       nValues = arraySizepYData;                                              \
+    }                                                                          \
+    if ((nValues == 0) || ((uint32_t)nValues > arraySizepYData))               \
+    {                                                                          \
+       PyErr_SetString(PyExc_ValueError,                                       \
+          "nValues must be between 1 and the length of the table");            \
+       FREEARGUMENT(pYData_converted);                                         \
+       FREEARGUMENT(x_converted);                                              \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizex;                                                    \
+                                                                               \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                     \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      for(uint32_t i=0; i < blockSize; i++)                                    \
+      {                                                                        \
+         pDst[i] = arm_linear_interp_##EXT(pYData_converted,x_converted[i],    \
+            nValues);                                                          \
+      }                                                                        \
+      Py_END_ALLOW_THREADS                                                     \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                              \
+                                                                               \
+    FREEARGUMENT(pYData_converted);                                            \
+    FREEARGUMENT(x_converted);                                                 \
+    return((PyObject*)pDstOBJ);                                                \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+LINEARINTERPBLOCK(q31,q31_t,NPY_INT32,int32_t);
+LINEARINTERPBLOCK(q15,q15_t,NPY_INT16,int16_t);
+LINEARINTERPBLOCK(q7,q7_t,NPY_BYTE,int8_t);
+
+/* X and Y are float32 for f32 and in 12.20 format (q31) otherwise */
+#define BILINEARINTERPBLOCK(EXT,TYP,NPYTYPE,XTYP,XNPYTYPE,XSRCFORMAT)          \
+static PyObject *                                                              \
+cmsis_arm_bilinear_interp_block_##EXT(PyObject *obj, PyObject *args, PyObject *kwds) \
+{                                                                              \
+  PyObject *S=NULL; /* input */                                                \
+  PyObject *X=NULL; /* input */                                                \
+  XTYP *X_converted=NULL; /* input */                                          \
+  PyObject *Y=NULL; /* input */                                                \
+  XTYP *Y_converted=NULL; /* input */                                          \
+  TYP *pDst=NULL; /* output */                                                 \
+  PyObject *out=NULL; /* output */                                             \
+  uint32_t blockSize; /* input */                                              \
+                                                                               \
+  if (PyArg_ParseTuple(args,"OOO",&S,&X,&Y) && parseOutKeyword(args,kwds,&out))     \
+  {                                                                            \
+    dsp_arm_bilinear_interp_instance_##EXT##Object *selfS =                    \
+       (dsp_arm_bilinear_interp_instance_##EXT##Object *)S;                    \
+    if (selfS->instance->pData == NULL)                                        \
+    {                                                                          \
+       PyErr_SetString(PyExc_ValueError,"the instance has no table");          \
+       return(NULL);                                                           \
+    }                                                                          \
+    GETARGUMENT(X,XNPYTYPE,XSRCFORMAT,XTYP);                                   \
+    GETARGUMENT(Y,XNPYTYPE,XSRCFORMAT,XTYP);                                   \
+    if ((X_converted == NULL) || (Y_converted == NULL) ||                      \
+        (arraySizeX != arraySizeY))                                            \
+    {                                                                          \
+       if (X_converted && Y_converted)                                         \
+       {                                                                       \
+          PyErr_SetString(PyExc_ValueError,                                    \
+             "the arrays must have the same length");                          \
+       }                                                                       \
+       FREEBLOCKARGUMENT(X_converted);                                         \
+       FREEBLOCKARGUMENT(Y_converted);                                         \
+       return(NULL);                                                           \
+    }                                                                          \
+    blockSize = arraySizeX;                                                    \
+                                                                               \
+    GETOUTPUT(pDst,TYP,NPYTYPE,blockSize);                                     \
+                                                                               \
+    if (pDst)                                                                  \
+    {                                                                          \
+      Py_BEGIN_ALLOW_THREADS                                                   \
+      for(uint32_t i=0; i < blockSize; i++)                                    \
+      {                                                                        \
+         pDst[i] = arm_bilinear_interp_##EXT(selfS->instance,                  \
+            X_converted[i],Y_converted[i]);                                    \
+      }                                                                        \
+      Py_END_ALLOW_THREADS                                                     \
+    }                                                                          \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPYTYPE);                              \
+                                                                               \
+    FREEARGUMENT(X_converted);                                                 \
+    FREEARGUMENT(Y_converted);                                                 \
+    return((PyObject*)pDstOBJ);                                                \
+  }                                                                            \
+  return(NULL);                                                                \
+}
+
+BILINEARINTERPBLOCK(f32,float32_t,NPY_FLOAT,float32_t,NPY_DOUBLE,double);
+BILINEARINTERPBLOCK(q31,q31_t,NPY_INT32,q31_t,NPY_INT32,int32_t);
+BILINEARINTERPBLOCK(q15,q15_t,NPY_INT16,q31_t,NPY_INT32,int32_t);
+BILINEARINTERPBLOCK(q7,q7_t,NPY_BYTE,q31_t,NPY_INT32,int32_t);
+
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
@@ -883,6 +1073,14 @@ static PyMethodDef CMSISDSPMethods[] = {
 {"arm_bilinear_interp_q31",  cmsis_arm_bilinear_interp_q31, METH_VARARGS,""},
 {"arm_bilinear_interp_q15",  cmsis_arm_bilinear_interp_q15, METH_VARARGS,""},
 {"arm_bilinear_interp_q7",  cmsis_arm_bilinear_interp_q7, METH_VARARGS,""},
+{"arm_linear_interp_block_f32",  (PyCFunction)(void(*)(void))cmsis_arm_linear_interp_block_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_linear_interp_block_q31",  (PyCFunction)(void(*)(void))cmsis_arm_linear_interp_block_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_linear_interp_block_q15",  (PyCFunction)(void(*)(void))cmsis_arm_linear_interp_block_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_linear_interp_block_q7",  (PyCFunction)(void(*)(void))cmsis_arm_linear_interp_block_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_bilinear_interp_block_f32",  (PyCFunction)(void(*)(void))cmsis_arm_bilinear_interp_block_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_bilinear_interp_block_q31",  (PyCFunction)(void(*)(void))cmsis_arm_bilinear_interp_block_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_bilinear_interp_block_q15",  (PyCFunction)(void(*)(void))cmsis_arm_bilinear_interp_block_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_bilinear_interp_block_q7",  (PyCFunction)(void(*)(void))cmsis_arm_bilinear_interp_block_q7, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_spline_f32",  cmsis_arm_spline_f32, METH_VARARGS,""},
 {"arm_spline_init_f32",  cmsis_arm_spline_init_f32, METH_VARARGS,""},
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
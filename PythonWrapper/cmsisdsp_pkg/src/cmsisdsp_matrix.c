@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_matrix"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_matrix
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -418,7 +420,7 @@ void typeRegistration(PyObject *module) {
 
 
 static PyObject *
-cmsis_arm_mat_add_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_add_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -426,36 +428,44 @@ cmsis_arm_mat_add_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
 
-  arm_matrix_instance_f32 pDst_converted; 
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_add_f32(&pSrcA_converted,&pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_add_f32(&pSrcA_converted,&pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_add_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_add_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -463,38 +473,46 @@ cmsis_arm_mat_add_q15(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q15 pSrcB_converted; // input
 
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q15MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q15,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_add_q15(&pSrcA_converted,
-        &pSrcB_converted,
-        &pDst_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_add_q15(&pSrcA_converted,
+          &pSrcB_converted,
+          &pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_add_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_add_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -502,52 +520,63 @@ cmsis_arm_mat_add_q31(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q31 pSrcB_converted; // input
 
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_add_q31(&pSrcA_converted,
-        &pSrcB_converted,
-        &pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_add_q31(&pSrcA_converted,
+          &pSrcB_converted,
+          &pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_cmplx_trans_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_trans_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_f32 pSrc_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(f32,pSrc);
     pSrc_converted.numCols = pSrc_converted.numCols / 2;
 
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows*2 ;
-    createf32Matrix(&pDst_converted,row,column);
+
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
     /*
     Dimensions in matrix instance are not correct but they are not used
     by CMSIS-DSP since the library is not compiled with ARM_MATRIX_CHECK.
@@ -557,39 +586,47 @@ cmsis_arm_mat_cmplx_trans_f32(PyObject *obj, PyObject *args)
     a bigger buffer and createf32Matrix only knows real.
 
     */
-
-    arm_status returnValue = arm_mat_cmplx_trans_f32(&pSrc_converted,&pDst_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_trans_f32(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_cmplx_trans_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_trans_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q31 pSrc_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q31,pSrc);
     pSrc_converted.numCols = pSrc_converted.numCols / 2;
 
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows*2 ;
-    createq31Matrix(&pDst_converted,row,column);
+
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
     /*
     Dimensions in matrix instance are not correct but they are not used
     by CMSIS-DSP since the library is not compiled with ARM_MATRIX_CHECK.
@@ -599,39 +636,47 @@ cmsis_arm_mat_cmplx_trans_q31(PyObject *obj, PyObject *args)
     a bigger buffer and createf32Matrix only knows real.
 
     */
-
-    arm_status returnValue = arm_mat_cmplx_trans_q31(&pSrc_converted,&pDst_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_trans_q31(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_cmplx_trans_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_trans_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q15 pSrc_converted; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q15,pSrc);
     pSrc_converted.numCols = pSrc_converted.numCols / 2;
 
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows*2 ;
-    createq15Matrix(&pDst_converted,row,column);
+
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
     /*
     Dimensions in matrix instance are not correct but they are not used
     by CMSIS-DSP since the library is not compiled with ARM_MATRIX_CHECK.
@@ -641,63 +686,76 @@ cmsis_arm_mat_cmplx_trans_q15(PyObject *obj, PyObject *args)
     a bigger buffer and createf32Matrix only knows real.
 
     */
-
-    arm_status returnValue = arm_mat_cmplx_trans_q15(&pSrc_converted,&pDst_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_trans_q15(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_cmplx_mult_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_mult_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f32 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     pSrcA_converted.numCols = pSrcA_converted.numCols / 2;
     pSrcB_converted.numCols = pSrcB_converted.numCols / 2;
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols * 2;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_cmplx_mult_f32(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_mult_f32(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_cmplx_mult_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_mult_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -706,236 +764,292 @@ cmsis_arm_mat_cmplx_mult_q15(PyObject *obj, PyObject *args)
   arm_matrix_instance_q15 pSrcB_converted; // input
   PyObject *pScratch=NULL; // input
   q15_t *pScratch_converted=NULL; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pScratch))
+  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pScratch) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q15MatrixFromNumpy(&pSrcB_converted,pSrcB);
-    GETARGUMENT(pScratch,NPY_INT16,int16_t,int16_t);
+    GETMATRIXARGUMENT(q15,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcB);
+    GETARGUMENTCOPY(pScratch,NPY_INT16,int16_t,int16_t);
     pSrcA_converted.numCols = pSrcA_converted.numCols / 2;
     pSrcB_converted.numCols = pSrcB_converted.numCols / 2;
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols * 2;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_cmplx_mult_q15(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted,pScratch_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_mult_q15(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted,pScratch_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pScratch_converted);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_cmplx_mult_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cmplx_mult_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_q31 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q31 pSrcB_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     pSrcA_converted.numCols = pSrcA_converted.numCols / 2;
     pSrcB_converted.numCols = pSrcB_converted.numCols / 2;
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols * 2;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_cmplx_mult_q31(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cmplx_mult_q31(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_trans_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_trans_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_f32 pSrc_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(f32,pSrc);
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_trans_f32(&pSrc_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_f32(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_trans_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_trans_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_f64 pSrc_converted; // input
-  arm_matrix_instance_f64 pDst_converted;
+  arm_matrix_instance_f64 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(f64,pSrc);
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows ;
-    createf64Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_trans_f64(&pSrc_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f64,pDst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_f64(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf64Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f64,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_trans_q7(PyObject *obj, PyObject *args)
+cmsis_arm_mat_trans_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q7 pSrc_converted; // input
-  arm_matrix_instance_q7 pDst_converted;
+  arm_matrix_instance_q7 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    q7MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q7,pSrc);
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows ;
-    createq7Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_trans_q7(&pSrc_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q7,pDst_converted,NPY_BYTE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_q7(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq7Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q7,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_trans_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_trans_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q15 pSrc_converted; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q15,pSrc);
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_trans_q15(&pSrc_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_q15(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_trans_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_trans_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q31 pSrc_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q31,pSrc);
     uint32_t row = pSrc_converted.numCols ;
     uint32_t column = pSrc_converted.numRows ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_trans_q31(&pSrc_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_q31(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_vec_mult_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_vec_mult_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -944,104 +1058,126 @@ cmsis_arm_mat_vec_mult_f32(PyObject *obj, PyObject *args)
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcA);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcA_converted.numCols ;
-    pDst=PyMem_Malloc(sizeof(float32_t)*row);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,row);
 
-    arm_mat_vec_mult_f32(&pSrcA_converted,pSrcB_converted,pDst);
-    FLOATARRAY1(pDstOBJ,row,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mat_vec_mult_f32(&pSrcA_converted,pSrcB_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,row,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    FREEMATRIX(&pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f32 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
-  arm_matrix_instance_f32 pDst_converted; 
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_f32(&pSrcA_converted,
-        &pSrcB_converted,
-        &pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_f32(&pSrcA_converted,
+          &pSrcB_converted,
+          &pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f64 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f64 pSrcB_converted; // input
-  arm_matrix_instance_f64 pDst_converted ;
+  arm_matrix_instance_f64 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f64MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f64,pSrcA);
+    GETMATRIXARGUMENT(f64,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createf64Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_f64(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f64,pDst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_f64(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf64Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f64,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_vec_mult_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_vec_mult_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1050,31 +1186,37 @@ cmsis_arm_mat_vec_mult_q15(PyObject *obj, PyObject *args)
   q15_t *pSrcB_converted=NULL; // input
   q15_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcA);
     GETARGUMENT(pSrcB,NPY_INT16,int16_t,q15_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcA_converted.numCols ;
-    pDst=PyMem_Malloc(sizeof(q15_t)*row);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,row);
 
-    arm_mat_vec_mult_q15(&pSrcA_converted,pSrcB_converted,pDst);
-    INT16ARRAY1(pDstOBJ,row,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mat_vec_mult_q15(&pSrcA_converted,pSrcB_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,row,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    FREEMATRIX(&pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_vec_mult_q7(PyObject *obj, PyObject *args)
+cmsis_arm_mat_vec_mult_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1083,31 +1225,37 @@ cmsis_arm_mat_vec_mult_q7(PyObject *obj, PyObject *args)
   q7_t *pSrcB_converted=NULL; // input
   q7_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q7MatrixFromNumpy(&pSrcA_converted,pSrcA);
+    GETMATRIXARGUMENT(q7,pSrcA);
     GETARGUMENT(pSrcB,NPY_BYTE,int8_t,q7_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcA_converted.numCols ;
-    pDst=PyMem_Malloc(sizeof(q7_t)*row);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,row);
 
-    arm_mat_vec_mult_q7(&pSrcA_converted,pSrcB_converted,pDst);
-    INT8ARRAY1(pDstOBJ,row,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mat_vec_mult_q7(&pSrcA_converted,pSrcB_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,row,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    FREEMATRIX(&pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_q7(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1116,39 +1264,47 @@ cmsis_arm_mat_mult_q7(PyObject *obj, PyObject *args)
   arm_matrix_instance_q7 pSrcB_converted; // input
   PyObject *pState=NULL; // input
   q7_t *pState_converted=NULL; // input
-  arm_matrix_instance_q7 pDst_converted;
+  arm_matrix_instance_q7 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState))
+  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState) && parseOutKeyword(args,kwds,&out))
   {
 
-    q7MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q7MatrixFromNumpy(&pSrcB_converted,pSrcB);
-    GETARGUMENT(pState,NPY_BYTE,int8_t,q7_t);
+    GETMATRIXARGUMENT(q7,pSrcA);
+    GETMATRIXARGUMENT(q7,pSrcB);
+    GETARGUMENTCOPY(pState,NPY_BYTE,int8_t,q7_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq7Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_q7(&pSrcA_converted,
-        &pSrcB_converted,
-        &pDst_converted,pState_converted);
+    GETOUTPUTMATRIX(q7,pDst_converted,NPY_BYTE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_q7(&pSrcA_converted,
+          &pSrcB_converted,
+          &pDst_converted,pState_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq7Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q7,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pState_converted);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1157,40 +1313,48 @@ cmsis_arm_mat_mult_q15(PyObject *obj, PyObject *args)
   arm_matrix_instance_q15 pSrcB_converted; // input
   PyObject *pState=NULL; // input
   q15_t *pState_converted=NULL; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState))
+  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q15MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q15,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcB);
     
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_q15(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted,pState_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_q15(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted,pState_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pState_converted);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_mult_fast_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_fast_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1199,38 +1363,46 @@ cmsis_arm_mat_mult_fast_q15(PyObject *obj, PyObject *args)
   arm_matrix_instance_q15 pSrcB_converted; // input
   PyObject *pState=NULL; // input
   q15_t *pState_converted=NULL; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState))
+  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q15MatrixFromNumpy(&pSrcB_converted,pSrcB);
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
+    GETMATRIXARGUMENT(q15,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcB);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,int16_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_fast_q15(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted,pState_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_fast_q15(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted,pState_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pState_converted);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_vec_mult_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_vec_mult_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1239,67 +1411,81 @@ cmsis_arm_mat_vec_mult_q31(PyObject *obj, PyObject *args)
   q31_t *pSrcB_converted=NULL; // input
   q31_t *pDst=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcA);
     GETARGUMENT(pSrcB,NPY_INT32,int32_t,q31_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcA_converted.numCols ;
-    pDst=PyMem_Malloc(sizeof(q31_t)*row);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,row);
 
-    arm_mat_vec_mult_q31(&pSrcA_converted,pSrcB_converted,pDst);
-    INT32ARRAY1(pDstOBJ,row,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mat_vec_mult_q31(&pSrcA_converted,pSrcB_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,row,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    FREEMATRIX(&pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_q31 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q31 pSrcB_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_q31(&pSrcA_converted,&pSrcB_converted,
-        &pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_q31(&pSrcA_converted,&pSrcB_converted,
+          &pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_opt_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_opt_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -1308,323 +1494,395 @@ cmsis_arm_mat_mult_opt_q31(PyObject *obj, PyObject *args)
   arm_matrix_instance_q31 pSrcB_converted; // input
   PyObject *pState=NULL; // input
   q31_t *pState_converted=NULL; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState))
+  if (PyArg_ParseTuple(args,"OOO",&pSrcA,&pSrcB,&pState) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,int32_t);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_opt_q31(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted,pState_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_opt_q31(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted,pState_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     FREEARGUMENT(pState_converted);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_mult_fast_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_mult_fast_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_q31 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q31 pSrcB_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_mult_fast_q31(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_mult_fast_q31(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_sub_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_sub_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f32 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_sub_f32(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_sub_f32(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_sub_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_sub_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f64 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f64 pSrcB_converted; // input
-  arm_matrix_instance_f64 pDst_converted;
+  arm_matrix_instance_f64 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f64MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f64,pSrcA);
+    GETMATRIXARGUMENT(f64,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createf64Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_sub_f64(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f64,pDst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_sub_f64(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf64Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f64,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_sub_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_sub_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_q15 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q15 pSrcB_converted; // input
-  arm_matrix_instance_q15 pDst_converted; 
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q15MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q15,pSrcA);
+    GETMATRIXARGUMENT(q15,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_sub_q15(&pSrcA_converted,&pSrcB_converted,
-        &pDst_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_sub_q15(&pSrcA_converted,&pSrcB_converted,
+          &pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_sub_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_sub_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_q31 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_q31 pSrcB_converted; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    q31MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(q31,pSrcA);
+    GETMATRIXARGUMENT(q31,pSrcB);
     uint32_t row = pSrcA_converted.numRows ;
     uint32_t column = pSrcB_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_sub_q31(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_sub_q31(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_scale_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_scale_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_f32 pSrc_converted; // input
   float32_t scale; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"Of",&pSrc,&scale))
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&scale) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(f32,pSrc);
     uint32_t row = pSrc_converted.numRows ;
     uint32_t column = pSrc_converted.numCols ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_scale_f32(&pSrc_converted,scale,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_scale_f32(&pSrc_converted,scale,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_scale_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mat_scale_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q15 pSrc_converted; // input
   q15_t scaleFract; // input
   int32_t shift; // input
-  arm_matrix_instance_q15 pDst_converted;
+  arm_matrix_instance_q15 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"Ohi",&pSrc,&scaleFract,&shift))
+  if (PyArg_ParseTuple(args,"Ohi",&pSrc,&scaleFract,&shift) && parseOutKeyword(args,kwds,&out))
   {
 
-    q15MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q15,pSrc);
     uint32_t row = pSrc_converted.numRows ;
     uint32_t column = pSrc_converted.numCols ;
-    createq15Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_scale_q15(&pSrc_converted,scaleFract,shift,&pDst_converted);
+    GETOUTPUTMATRIX(q15,pDst_converted,NPY_INT16,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_scale_q15(&pSrc_converted,scaleFract,shift,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq15Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q15,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_scale_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mat_scale_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   arm_matrix_instance_q31 pSrc_converted; // input
   q31_t scaleFract; // input
   int32_t shift; // input
-  arm_matrix_instance_q31 pDst_converted;
+  arm_matrix_instance_q31 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift))
+  if (PyArg_ParseTuple(args,"Oii",&pSrc,&scaleFract,&shift) && parseOutKeyword(args,kwds,&out))
   {
 
-    q31MatrixFromNumpy(&pSrc_converted,pSrc);
+    GETMATRIXARGUMENT(q31,pSrc);
     uint32_t row = pSrc_converted.numRows ;
     uint32_t column = pSrc_converted.numCols ;
-    createq31Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_scale_q31(&pSrc_converted,scaleFract,shift,&pDst_converted);
+    GETOUTPUTMATRIX(q31,pDst_converted,NPY_INT32,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_scale_q31(&pSrc_converted,scaleFract,shift,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromq31Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,q31,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_qr_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_qr_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL;
@@ -1640,8 +1898,13 @@ cmsis_arm_mat_qr_f64(PyObject *obj, PyObject *args)
 
   arm_matrix_instance_f64 Q_converted;
   arm_matrix_instance_f64 R_converted;
+  float64_t *pTau=NULL;
+  PyObject *out=NULL;
+  PyObject *outs[3];
 
-  if (PyArg_ParseTuple(args,"OdOO",&src,&threshold,&pTmpaIn,&pTmpbIn))
+  if (PyArg_ParseTuple(args,"OdOO",&src,&threshold,&pTmpaIn,&pTmpbIn) && 
+      parseOutKeyword(args,kwds,&out) && 
+      splitOutTuple(out,3,outs))
   {
 
     f64MatrixFromNumpy(&src_converted,src);
@@ -1653,20 +1916,33 @@ cmsis_arm_mat_qr_f64(PyObject *obj, PyObject *args)
     int tmpALength=arraySizepTmpaIn ;
     int tmpBLength=arraySizepTmpbIn ;
 
-    
-    createf64Matrix(&Q_converted,row,row);
-    createf64Matrix(&R_converted,row,column);
-    float64_t *pTau=PyMem_Malloc(sizeof(float64_t)*column);
+    GETOUTPUTMATRIXFROM(outs[0],f64,R_converted,NPY_DOUBLE,row,column);
+    GETOUTPUTMATRIXFROM(outs[1],f64,Q_converted,NPY_DOUBLE,row,row);
+    GETOUTPUTFROM(outs[2],pTau,float64_t,NPY_DOUBLE,column);
+    if (!R_converted.pData || !Q_converted.pData || !pTau)
+    {
+      FREEOUTPUTMATRIX(R_converted);
+      FREEOUTPUTMATRIX(Q_converted);
+      FREEOUTPUT(pTau);
+      FREEMATRIX(&src_converted);
+      FREEARGUMENT(pTmpaIn_converted);
+      FREEARGUMENT(pTmpbIn_converted);
+      return(NULL);
+    }
+
     float64_t *pTmpa=PyMem_Malloc(sizeof(float64_t)*tmpALength);
     float64_t *pTmpb=PyMem_Malloc(sizeof(float64_t)*tmpBLength);
 
-    arm_status returnValue = arm_mat_qr_f64(&src_converted,threshold,
+    arm_status returnValue;
+    Py_BEGIN_ALLOW_THREADS
+    returnValue = arm_mat_qr_f64(&src_converted,threshold,
         &R_converted,&Q_converted,pTau,pTmpa,pTmpb);
+    Py_END_ALLOW_THREADS
 
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* ROBJ=NumpyArrayFromf64Matrix(&R_converted);
-    PyObject* QOBJ=NumpyArrayFromf64Matrix(&Q_converted);
-    FLOAT64ARRAY1(pTauOBJ,column,pTau);
+    OUTPUTMATRIX(ROBJ,f64,R_converted);
+    OUTPUTMATRIX(QOBJ,f64,Q_converted);
+    OUTPUTARRAY1(pTauOBJ,column,pTau,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("OOOO",theReturnOBJ,ROBJ,QOBJ,pTauOBJ);
 
@@ -1684,11 +1960,11 @@ cmsis_arm_mat_qr_f64(PyObject *obj, PyObject *args)
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_qr_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_qr_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL;
@@ -1704,8 +1980,13 @@ cmsis_arm_mat_qr_f32(PyObject *obj, PyObject *args)
 
   arm_matrix_instance_f32 Q_converted;
   arm_matrix_instance_f32 R_converted;
+  float32_t *pTau=NULL;
+  PyObject *out=NULL;
+  PyObject *outs[3];
 
-  if (PyArg_ParseTuple(args,"OfOO",&src,&threshold,&pTmpaIn,&pTmpbIn))
+  if (PyArg_ParseTuple(args,"OfOO",&src,&threshold,&pTmpaIn,&pTmpbIn) && 
+      parseOutKeyword(args,kwds,&out) && 
+      splitOutTuple(out,3,outs))
   {
 
     f32MatrixFromNumpy(&src_converted,src);
@@ -1717,20 +1998,33 @@ cmsis_arm_mat_qr_f32(PyObject *obj, PyObject *args)
     int tmpALength=arraySizepTmpaIn ;
     int tmpBLength=arraySizepTmpbIn ;
 
-    
-    createf32Matrix(&Q_converted,row,row);
-    createf32Matrix(&R_converted,row,column);
-    float32_t *pTau=PyMem_Malloc(sizeof(float32_t)*column);
+    GETOUTPUTMATRIXFROM(outs[0],f32,R_converted,NPY_FLOAT,row,column);
+    GETOUTPUTMATRIXFROM(outs[1],f32,Q_converted,NPY_FLOAT,row,row);
+    GETOUTPUTFROM(outs[2],pTau,float32_t,NPY_FLOAT,column);
+    if (!R_converted.pData || !Q_converted.pData || !pTau)
+    {
+      FREEOUTPUTMATRIX(R_converted);
+      FREEOUTPUTMATRIX(Q_converted);
+      FREEOUTPUT(pTau);
+      FREEMATRIX(&src_converted);
+      FREEARGUMENT(pTmpaIn_converted);
+      FREEARGUMENT(pTmpbIn_converted);
+      return(NULL);
+    }
+
     float32_t *pTmpa=PyMem_Malloc(sizeof(float32_t)*tmpALength);
     float32_t *pTmpb=PyMem_Malloc(sizeof(float32_t)*tmpBLength);
 
-    arm_status returnValue = arm_mat_qr_f32(&src_converted,threshold,
+    arm_status returnValue;
+    Py_BEGIN_ALLOW_THREADS
+    returnValue = arm_mat_qr_f32(&src_converted,threshold,
         &R_converted,&Q_converted,pTau,pTmpa,pTmpb);
+    Py_END_ALLOW_THREADS
 
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* ROBJ=NumpyArrayFromf32Matrix(&R_converted);
-    PyObject* QOBJ=NumpyArrayFromf32Matrix(&Q_converted);
-    FLOATARRAY1(pTauOBJ,column,pTau);
+    OUTPUTMATRIX(ROBJ,f32,R_converted);
+    OUTPUTMATRIX(QOBJ,f32,Q_converted);
+    OUTPUTARRAY1(pTauOBJ,column,pTau,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("OOOO",theReturnOBJ,ROBJ,QOBJ,pTauOBJ);
 
@@ -1744,16 +2038,15 @@ cmsis_arm_mat_qr_f32(PyObject *obj, PyObject *args)
 
     PyMem_Free(pTmpa);
     PyMem_Free(pTmpb);
-    
-    
+
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_householder_f64(PyObject *obj, PyObject *args)
+cmsis_arm_householder_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
@@ -1761,20 +2054,28 @@ cmsis_arm_householder_f64(PyObject *obj, PyObject *args)
   uint32_t blockSize; // input
   float64_t pResult; // output
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   float64_t threshold;
 
-  if (PyArg_ParseTuple(args,"Od",&pSrc,&threshold))
+  if (PyArg_ParseTuple(args,"Od",&pSrc,&threshold) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
-
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
+    if (pDst == NULL)
+    {
+      FREEARGUMENT(pSrc_converted);
+      return(NULL);
+    }
 
+    Py_BEGIN_ALLOW_THREADS
     pResult=arm_householder_f64(pSrc_converted,threshold,blockSize,pDst);
+    Py_END_ALLOW_THREADS
+
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
-    FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *betaResult = Py_BuildValue("O",pResultOBJ);
     PyObject *vecResult = Py_BuildValue("O",pDstOBJ);
@@ -1783,15 +2084,15 @@ cmsis_arm_householder_f64(PyObject *obj, PyObject *args)
 
     FREEARGUMENT(pSrc_converted);
     Py_DECREF(pResultOBJ);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_householder_f32(PyObject *obj, PyObject *args)
+cmsis_arm_householder_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
@@ -1799,20 +2100,28 @@ cmsis_arm_householder_f32(PyObject *obj, PyObject *args)
   uint32_t blockSize; // input
   float32_t pResult; // output
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   float32_t threshold;
 
-  if (PyArg_ParseTuple(args,"Of",&pSrc,&threshold))
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&threshold) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
+    if (pDst == NULL)
+    {
+      FREEARGUMENT(pSrc_converted);
+      return(NULL);
+    }
 
+    Py_BEGIN_ALLOW_THREADS
     pResult=arm_householder_f32(pSrc_converted,threshold,blockSize,pDst);
+    Py_END_ALLOW_THREADS
+
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
-    FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *betaResult = Py_BuildValue("O",pResultOBJ);
     PyObject *vecResult = Py_BuildValue("O",pDstOBJ);
@@ -1821,172 +2130,219 @@ cmsis_arm_householder_f32(PyObject *obj, PyObject *args)
 
     FREEARGUMENT(pSrc_converted);
     Py_DECREF(pResultOBJ);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_inverse_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_inverse_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f32 src_converted; // input
-  arm_matrix_instance_f32 dst_converted;
+  arm_matrix_instance_f32 dst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && parseOutKeyword(args,kwds,&out))
   {
 
     f32MatrixFromNumpy(&src_converted,src);
     uint32_t row = src_converted.numCols ;
     uint32_t column = src_converted.numRows ;
-    createf32Matrix(&dst_converted,row,column);
 
-    arm_status returnValue = arm_mat_inverse_f32(&src_converted,&dst_converted);
+    GETOUTPUTMATRIX(f32,dst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (dst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_inverse_f32(&src_converted,&dst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* dstOBJ=NumpyArrayFromf32Matrix(&dst_converted);
+    OUTPUTMATRIX(dstOBJ,f32,dst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,dstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEMATRIX(&src_converted);
-    Py_DECREF(dstOBJ);
+    Py_XDECREF(dstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_inverse_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_inverse_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f64 src_converted; // input
-  arm_matrix_instance_f64 dst_converted;
+  arm_matrix_instance_f64 dst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && parseOutKeyword(args,kwds,&out))
   {
 
     f64MatrixFromNumpy(&src_converted,src);
     uint32_t row = src_converted.numCols ;
     uint32_t column = src_converted.numRows ;
-    createf64Matrix(&dst_converted,row,column);
 
-    arm_status returnValue = arm_mat_inverse_f64(&src_converted,&dst_converted);
+    GETOUTPUTMATRIX(f64,dst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (dst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_inverse_f64(&src_converted,&dst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* dstOBJ=NumpyArrayFromf64Matrix(&dst_converted);
+    OUTPUTMATRIX(dstOBJ,f64,dst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,dstOBJ);
 
     Py_DECREF(theReturnOBJ);
     FREEMATRIX(&src_converted);
-    Py_DECREF(dstOBJ);
+    Py_XDECREF(dstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 
 static PyObject *
-cmsis_arm_mat_cholesky_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cholesky_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f32 src_converted; // input
-  arm_matrix_instance_f32 dst_converted;
+  arm_matrix_instance_f32 dst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&src_converted,src);
+    GETMATRIXARGUMENT(f32,src);
     uint32_t column = src_converted.numCols ;
     uint32_t row = src_converted.numRows ;
-    createf32Matrix(&dst_converted,row,column);
 
-    arm_status returnValue = arm_mat_cholesky_f32(&src_converted,&dst_converted);
+    GETOUTPUTMATRIX(f32,dst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (dst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cholesky_f32(&src_converted,&dst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* dstOBJ=NumpyArrayFromf32Matrix(&dst_converted);
+    OUTPUTMATRIX(dstOBJ,f32,dst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,dstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&src_converted);
-    Py_DECREF(dstOBJ);
+    FREEMATRIXARGUMENT(src_converted);
+    Py_XDECREF(dstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_cholesky_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_cholesky_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f64 src_converted; // input
-  arm_matrix_instance_f64 dst_converted;
+  arm_matrix_instance_f64 dst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&src_converted,src);
+    GETMATRIXARGUMENT(f64,src);
     uint32_t column = src_converted.numCols ;
     uint32_t row = src_converted.numRows ;
-    createf64Matrix(&dst_converted,row,column);
 
-    arm_status returnValue = arm_mat_cholesky_f64(&src_converted,&dst_converted);
+    GETOUTPUTMATRIX(f64,dst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (dst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_cholesky_f64(&src_converted,&dst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* dstOBJ=NumpyArrayFromf64Matrix(&dst_converted);
+    OUTPUTMATRIX(dstOBJ,f64,dst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,dstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&src_converted);
-    Py_DECREF(dstOBJ);
+    FREEMATRIXARGUMENT(src_converted);
+    Py_XDECREF(dstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_ldlt_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_ldlt_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f32 src_converted; // input
   arm_matrix_instance_f32 l_converted;
   arm_matrix_instance_f32 d_converted;
+  uint16_t *pPerm=NULL;
+  PyObject *out=NULL;
+  PyObject *outs[3];
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && 
+      parseOutKeyword(args,kwds,&out) && 
+      splitOutTuple(out,3,outs))
   {
 
-    f32MatrixFromNumpy(&src_converted,src);
+    GETMATRIXARGUMENT(f32,src);
     uint32_t column = src_converted.numCols ;
     uint32_t row = src_converted.numRows ;
     
-    createf32Matrix(&l_converted,row,column);
-    createf32Matrix(&d_converted,row,column);
-
-    uint16_t *pPerm=(uint16_t *)PyMem_Malloc(sizeof(uint16_t)*row);
-    INT16ARRAY1(pPermOBJ,row,pPerm);
+    GETOUTPUTMATRIXFROM(outs[0],f32,l_converted,NPY_FLOAT,row,column);
+    GETOUTPUTMATRIXFROM(outs[1],f32,d_converted,NPY_FLOAT,row,column);
+    GETOUTPUTFROM(outs[2],pPerm,uint16_t,NPY_INT16,row);
+    if (!l_converted.pData || !d_converted.pData || !pPerm)
+    {
+      FREEOUTPUTMATRIX(l_converted);
+      FREEOUTPUTMATRIX(d_converted);
+      FREEOUTPUT(pPerm);
+      FREEMATRIXARGUMENT(src_converted);
+      return(NULL);
+    }
 
-    arm_status returnValue = arm_mat_ldlt_f32(&src_converted,&l_converted,&d_converted,pPerm);
+    arm_status returnValue;
+    Py_BEGIN_ALLOW_THREADS
+    returnValue = arm_mat_ldlt_f32(&src_converted,&l_converted,&d_converted,pPerm);
+    Py_END_ALLOW_THREADS
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
     
-    PyObject* lOBJ=NumpyArrayFromf32Matrix(&l_converted);
-    PyObject* dOBJ=NumpyArrayFromf32Matrix(&d_converted);
+    OUTPUTMATRIX(lOBJ,f32,l_converted);
+    OUTPUTMATRIX(dOBJ,f32,d_converted);
+    OUTPUTARRAY1(pPermOBJ,row,pPerm,NPY_INT16);
 
 
     PyObject *pythonResult = Py_BuildValue("OOOO",theReturnOBJ,lOBJ,dOBJ,pPermOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&src_converted);
+    FREEMATRIXARGUMENT(src_converted);
     Py_DECREF(lOBJ);
     Py_DECREF(dOBJ);
     Py_DECREF(pPermOBJ);
@@ -1994,42 +2350,57 @@ cmsis_arm_mat_ldlt_f32(PyObject *obj, PyObject *args)
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_ldlt_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_ldlt_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *src=NULL; // input
   arm_matrix_instance_f64 src_converted; // input
   arm_matrix_instance_f64 l_converted;
   arm_matrix_instance_f64 d_converted;
+  uint16_t *pPerm=NULL;
+  PyObject *out=NULL;
+  PyObject *outs[3];
 
-  if (PyArg_ParseTuple(args,"O",&src))
+  if (PyArg_ParseTuple(args,"O",&src) && 
+      parseOutKeyword(args,kwds,&out) && 
+      splitOutTuple(out,3,outs))
   {
 
-    f64MatrixFromNumpy(&src_converted,src);
+    GETMATRIXARGUMENT(f64,src);
     uint32_t column = src_converted.numCols ;
     uint32_t row = src_converted.numRows ;
     
-    createf64Matrix(&l_converted,row,column);
-    createf64Matrix(&d_converted,row,column);
-
-    uint16_t *pPerm=(uint16_t *)PyMem_Malloc(sizeof(uint16_t)*row);
-    INT16ARRAY1(pPermOBJ,row,pPerm);
+    GETOUTPUTMATRIXFROM(outs[0],f64,l_converted,NPY_DOUBLE,row,column);
+    GETOUTPUTMATRIXFROM(outs[1],f64,d_converted,NPY_DOUBLE,row,column);
+    GETOUTPUTFROM(outs[2],pPerm,uint16_t,NPY_INT16,row);
+    if (!l_converted.pData || !d_converted.pData || !pPerm)
+    {
+      FREEOUTPUTMATRIX(l_converted);
+      FREEOUTPUTMATRIX(d_converted);
+      FREEOUTPUT(pPerm);
+      FREEMATRIXARGUMENT(src_converted);
+      return(NULL);
+    }
 
-    arm_status returnValue = arm_mat_ldlt_f64(&src_converted,&l_converted,&d_converted,pPerm);
+    arm_status returnValue;
+    Py_BEGIN_ALLOW_THREADS
+    returnValue = arm_mat_ldlt_f64(&src_converted,&l_converted,&d_converted,pPerm);
+    Py_END_ALLOW_THREADS
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
     
-    PyObject* lOBJ=NumpyArrayFromf64Matrix(&l_converted);
-    PyObject* dOBJ=NumpyArrayFromf64Matrix(&d_converted);
+    OUTPUTMATRIX(lOBJ,f64,l_converted);
+    OUTPUTMATRIX(dOBJ,f64,d_converted);
+    OUTPUTARRAY1(pPermOBJ,row,pPerm,NPY_INT16);
 
 
     PyObject *pythonResult = Py_BuildValue("OOOO",theReturnOBJ,lOBJ,dOBJ,pPermOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&src_converted);
+    FREEMATRIXARGUMENT(src_converted);
     Py_DECREF(lOBJ);
     Py_DECREF(dOBJ);
     Py_DECREF(pPermOBJ);
@@ -2037,149 +2408,179 @@ cmsis_arm_mat_ldlt_f64(PyObject *obj, PyObject *args)
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_solve_lower_triangular_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_solve_lower_triangular_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f32 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     uint32_t column = pSrcB_converted.numCols ;
     uint32_t row = pSrcA_converted.numRows ;
 
-    createf32Matrix(&pDst_converted,row,column);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
 
-    arm_status returnValue = arm_mat_solve_lower_triangular_f32(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_solve_lower_triangular_f32(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_solve_lower_triangular_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_solve_lower_triangular_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f64 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f64 pSrcB_converted; // input
-  arm_matrix_instance_f64 pDst_converted;
+  arm_matrix_instance_f64 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f64MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f64,pSrcA);
+    GETMATRIXARGUMENT(f64,pSrcB);
     uint32_t column = pSrcB_converted.numCols ;
     uint32_t row = pSrcA_converted.numRows ;
 
-   createf64Matrix(&pDst_converted,row,column);
+   GETOUTPUTMATRIX(f64,pDst_converted,NPY_DOUBLE,row,column);
 
-    arm_status returnValue = arm_mat_solve_lower_triangular_f64(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    arm_status returnValue=ARM_MATH_SUCCESS;
+   if (pDst_converted.pData)
+   {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_solve_lower_triangular_f64(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+   }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf64Matrix(&pDst_converted);
+   OUTPUTMATRIX(pDstOBJ,f64,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_solve_upper_triangular_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mat_solve_upper_triangular_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f32 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f32 pSrcB_converted; // input
-  arm_matrix_instance_f32 pDst_converted;
+  arm_matrix_instance_f32 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f32MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f32MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f32,pSrcA);
+    GETMATRIXARGUMENT(f32,pSrcB);
     uint32_t column = pSrcB_converted.numCols ;
     uint32_t row = pSrcA_converted.numRows ;
-    createf32Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_solve_upper_triangular_f32(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f32,pDst_converted,NPY_FLOAT,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_solve_upper_triangular_f32(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf32Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f32,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
-  Py_RETURN_NONE;
+  return(NULL);
 }
 
 static PyObject *
-cmsis_arm_mat_solve_upper_triangular_f64(PyObject *obj, PyObject *args)
+cmsis_arm_mat_solve_upper_triangular_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
   arm_matrix_instance_f64 pSrcA_converted; // input
   PyObject *pSrcB=NULL; // input
   arm_matrix_instance_f64 pSrcB_converted; // input
-  arm_matrix_instance_f64 pDst_converted;
+  arm_matrix_instance_f64 pDst_converted; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
   {
 
-    f64MatrixFromNumpy(&pSrcA_converted,pSrcA);
-    f64MatrixFromNumpy(&pSrcB_converted,pSrcB);
+    GETMATRIXARGUMENT(f64,pSrcA);
+    GETMATRIXARGUMENT(f64,pSrcB);
     uint32_t column = pSrcB_converted.numCols ;
     uint32_t row = pSrcA_converted.numRows ;
-    createf64Matrix(&pDst_converted,row,column);
 
-    arm_status returnValue = arm_mat_solve_upper_triangular_f64(&pSrcA_converted,
-        &pSrcB_converted,&pDst_converted);
+    GETOUTPUTMATRIX(f64,pDst_converted,NPY_DOUBLE,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_solve_upper_triangular_f64(&pSrcA_converted,
+          &pSrcB_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
-    PyObject* pDstOBJ=NumpyArrayFromf64Matrix(&pDst_converted);
+    OUTPUTMATRIX(pDstOBJ,f64,pDst_converted);
 
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
 
     Py_DECREF(theReturnOBJ);
-    FREEMATRIX(&pSrcA_converted);
-    FREEMATRIX(&pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEMATRIXARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2187,58 +2588,286 @@ cmsis_arm_mat_solve_upper_triangular_f64(PyObject *obj, PyObject *args)
 }
 
 
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+f16 matrix functions : the matrixes are converted to np.float16
+and the results are np.float16 arrays.
+
+*/
+MATRIXFROMNUMPY(f16,float16_t,float16_t,NPY_HALF);
+CREATEMATRIX(f16,float16_t);
+NUMPYARRAYFROMMATRIX(f16,NPY_HALF);
+
+#define F16_MAT_BIN_OP(OP)                                                      \
+static PyObject *                                                               \
+cmsis_arm_mat_##OP##_f16(PyObject *obj, PyObject *args, PyObject *kwds)         \
+{                                                                               \
+                                                                                \
+  PyObject *pSrcA=NULL;                                                         \
+  arm_matrix_instance_f16 pSrcA_converted;                                      \
+  PyObject *pSrcB=NULL;                                                         \
+  arm_matrix_instance_f16 pSrcB_converted;                                      \
+  arm_matrix_instance_f16 pDst_converted;                                       \
+  PyObject *out=NULL;                                                           \
+                                                                                \
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))  \
+  {                                                                             \
+                                                                                \
+    GETMATRIXARGUMENT(f16,pSrcA);                                               \
+    GETMATRIXARGUMENT(f16,pSrcB);                                               \
+    uint32_t row = pSrcA_converted.numRows ;                                    \
+    uint32_t column = pSrcB_converted.numCols ;                                 \
+                                                                                \
+    GETOUTPUTMATRIX(f16,pDst_converted,NPY_HALF,row,column);                    \
+                                                                                \
+    arm_status returnValue=ARM_MATH_SUCCESS;                                    \
+    if (pDst_converted.pData)                                                   \
+    {                                                                           \
+      Py_BEGIN_ALLOW_THREADS                                                    \
+      returnValue = arm_mat_##OP##_f16(&pSrcA_converted,&pSrcB_converted,       \
+         &pDst_converted);                                                      \
+      Py_END_ALLOW_THREADS                                                      \
+    }                                                                           \
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);                      \
+    OUTPUTMATRIX(pDstOBJ,f16,pDst_converted);                                   \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);          \
+                                                                                \
+    Py_DECREF(theReturnOBJ);                                                    \
+    FREEMATRIXARGUMENT(pSrcA_converted);                                        \
+    FREEMATRIXARGUMENT(pSrcB_converted);                                        \
+    Py_XDECREF(pDstOBJ);                                                        \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+F16_MAT_BIN_OP(add);
+F16_MAT_BIN_OP(sub);
+F16_MAT_BIN_OP(mult);
+
+static PyObject *
+cmsis_arm_mat_trans_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *pSrc=NULL; // input
+  arm_matrix_instance_f16 pSrc_converted; // input
+  arm_matrix_instance_f16 pDst_converted; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
+  {
+
+    GETMATRIXARGUMENT(f16,pSrc);
+    uint32_t row = pSrc_converted.numCols ;
+    uint32_t column = pSrc_converted.numRows ;
+
+    GETOUTPUTMATRIX(f16,pDst_converted,NPY_HALF,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_trans_f16(&pSrc_converted,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+    OUTPUTMATRIX(pDstOBJ,f16,pDst_converted);
+
+    PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mat_scale_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *pSrc=NULL; // input
+  arm_matrix_instance_f16 pSrc_converted; // input
+  float32_t scale; // input
+  arm_matrix_instance_f16 pDst_converted; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"Of",&pSrc,&scale) && parseOutKeyword(args,kwds,&out))
+  {
+
+    GETMATRIXARGUMENT(f16,pSrc);
+    uint32_t row = pSrc_converted.numRows ;
+    uint32_t column = pSrc_converted.numCols ;
+
+    GETOUTPUTMATRIX(f16,pDst_converted,NPY_HALF,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (pDst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_scale_f16(&pSrc_converted,(float16_t)scale,&pDst_converted);
+      Py_END_ALLOW_THREADS
+    }
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+    OUTPUTMATRIX(pDstOBJ,f16,pDst_converted);
+
+    PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    FREEMATRIXARGUMENT(pSrc_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mat_vec_mult_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *pSrcA=NULL; // input
+  arm_matrix_instance_f16 pSrcA_converted; // input
+  PyObject *pSrcB=NULL; // input
+  float16_t *pSrcB_converted=NULL; // input
+  float16_t *pDst=NULL; // output
+
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB) && parseOutKeyword(args,kwds,&out))
+  {
+
+    GETMATRIXARGUMENT(f16,pSrcA);
+    GETARGUMENT(pSrcB,NPY_HALF,float16_t,float16_t);
+    uint32_t row = pSrcA_converted.numRows ;
+    GETOUTPUT(pDst,float16_t,NPY_HALF,row);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mat_vec_mult_f16(&pSrcA_converted,pSrcB_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,row,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEMATRIXARGUMENT(pSrcA_converted);
+    FREEARGUMENT(pSrcB_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mat_inverse_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *src=NULL; // input
+  arm_matrix_instance_f16 src_converted; // input
+  arm_matrix_instance_f16 dst_converted; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"O",&src) && parseOutKeyword(args,kwds,&out))
+  {
+
+    f16MatrixFromNumpy(&src_converted,src);
+    uint32_t row = src_converted.numCols ;
+    uint32_t column = src_converted.numRows ;
+
+    GETOUTPUTMATRIX(f16,dst_converted,NPY_HALF,row,column);
+
+    arm_status returnValue=ARM_MATH_SUCCESS;
+    if (dst_converted.pData)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      returnValue = arm_mat_inverse_f16(&src_converted,&dst_converted);
+      Py_END_ALLOW_THREADS
+    }
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+    OUTPUTMATRIX(dstOBJ,f16,dst_converted);
+
+    PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,dstOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    FREEMATRIX(&src_converted);
+    Py_XDECREF(dstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 static PyMethodDef CMSISDSPMethods[] = {
 
-{"arm_mat_add_f32",  cmsis_arm_mat_add_f32, METH_VARARGS,""},
-{"arm_mat_add_q15",  cmsis_arm_mat_add_q15, METH_VARARGS,""},
-{"arm_mat_add_q31",  cmsis_arm_mat_add_q31, METH_VARARGS,""},
-{"arm_mat_cmplx_mult_f32",  cmsis_arm_mat_cmplx_mult_f32, METH_VARARGS,""},
-{"arm_mat_cmplx_mult_q15",  cmsis_arm_mat_cmplx_mult_q15, METH_VARARGS,""},
-{"arm_mat_cmplx_mult_q31",  cmsis_arm_mat_cmplx_mult_q31, METH_VARARGS,""},
-{"arm_mat_trans_f32",  cmsis_arm_mat_trans_f32, METH_VARARGS,""},
-{"arm_mat_trans_f64",  cmsis_arm_mat_trans_f64, METH_VARARGS,""},
-{"arm_mat_trans_q15",  cmsis_arm_mat_trans_q15, METH_VARARGS,""},
-{"arm_mat_trans_q31",  cmsis_arm_mat_trans_q31, METH_VARARGS,""},
-{"arm_mat_trans_q7",  cmsis_arm_mat_trans_q7, METH_VARARGS,""},
-
-
-{"arm_mat_vec_mult_f32",  cmsis_arm_mat_vec_mult_f32, METH_VARARGS,""},
-{"arm_mat_vec_mult_q31",  cmsis_arm_mat_vec_mult_q31, METH_VARARGS,""},
-{"arm_mat_vec_mult_q15",  cmsis_arm_mat_vec_mult_q15, METH_VARARGS,""},
-{"arm_mat_vec_mult_q7",  cmsis_arm_mat_vec_mult_q7, METH_VARARGS,""},
-
-{"arm_mat_mult_f32",  cmsis_arm_mat_mult_f32, METH_VARARGS,""},
-{"arm_mat_mult_f64",  cmsis_arm_mat_mult_f32, METH_VARARGS,""},
-{"arm_mat_mult_q7",  cmsis_arm_mat_mult_q7, METH_VARARGS,""},
-{"arm_mat_mult_q15",  cmsis_arm_mat_mult_q15, METH_VARARGS,""},
-{"arm_mat_mult_fast_q15",  cmsis_arm_mat_mult_fast_q15, METH_VARARGS,""},
-{"arm_mat_mult_q31",  cmsis_arm_mat_mult_q31, METH_VARARGS,""},
-{"arm_mat_mult_opt_q31",  cmsis_arm_mat_mult_opt_q31, METH_VARARGS,""},
-{"arm_mat_mult_fast_q31",  cmsis_arm_mat_mult_fast_q31, METH_VARARGS,""},
-{"arm_mat_sub_f32",  cmsis_arm_mat_sub_f32, METH_VARARGS,""},
-{"arm_mat_sub_f64",  cmsis_arm_mat_sub_f64, METH_VARARGS,""},
-{"arm_mat_sub_q15",  cmsis_arm_mat_sub_q15, METH_VARARGS,""},
-{"arm_mat_sub_q31",  cmsis_arm_mat_sub_q31, METH_VARARGS,""},
-{"arm_mat_scale_f32",  cmsis_arm_mat_scale_f32, METH_VARARGS,""},
-{"arm_mat_scale_q15",  cmsis_arm_mat_scale_q15, METH_VARARGS,""},
-{"arm_mat_scale_q31",  cmsis_arm_mat_scale_q31, METH_VARARGS,""},
-{"arm_mat_inverse_f32",  cmsis_arm_mat_inverse_f32, METH_VARARGS,""},
-{"arm_mat_inverse_f64",  cmsis_arm_mat_inverse_f64, METH_VARARGS,""},
-{"arm_mat_cmplx_trans_f32",  cmsis_arm_mat_cmplx_trans_f32, METH_VARARGS,""},
-{"arm_mat_cmplx_trans_q31",  cmsis_arm_mat_cmplx_trans_q31, METH_VARARGS,""},
-{"arm_mat_cmplx_trans_q15",  cmsis_arm_mat_cmplx_trans_q15, METH_VARARGS,""},
-{"arm_mat_cholesky_f32",  cmsis_arm_mat_cholesky_f32, METH_VARARGS,""},
-{"arm_mat_cholesky_f64",  cmsis_arm_mat_cholesky_f64, METH_VARARGS,""},
-{"arm_mat_ldlt_f32",  cmsis_arm_mat_ldlt_f32, METH_VARARGS,""},
-{"arm_mat_ldlt_f64",  cmsis_arm_mat_ldlt_f64, METH_VARARGS,""},
-{"arm_mat_solve_lower_triangular_f32",  cmsis_arm_mat_solve_lower_triangular_f32, METH_VARARGS,""},
-{"arm_mat_solve_lower_triangular_f64",  cmsis_arm_mat_solve_lower_triangular_f64, METH_VARARGS,""},
-{"arm_mat_solve_upper_triangular_f32",  cmsis_arm_mat_solve_upper_triangular_f32, METH_VARARGS,""},
-{"arm_mat_solve_upper_triangular_f64",  cmsis_arm_mat_solve_upper_triangular_f64, METH_VARARGS,""},
-{"arm_householder_f32",  cmsis_arm_householder_f32, METH_VARARGS,""},
-{"arm_householder_f64",  cmsis_arm_householder_f64, METH_VARARGS,""},
-{"arm_mat_qr_f32",  cmsis_arm_mat_qr_f32, METH_VARARGS,""},
-{"arm_mat_qr_f64",  cmsis_arm_mat_qr_f64, METH_VARARGS,""},
+{"arm_mat_add_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_add_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_add_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_add_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_add_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_add_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_mult_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_mult_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_mult_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_mult_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_mult_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_mult_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_q7",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_q7, METH_VARARGS | METH_KEYWORDS,""},
+
+
+{"arm_mat_vec_mult_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_vec_mult_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_vec_mult_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_vec_mult_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_vec_mult_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_vec_mult_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_vec_mult_q7",  (PyCFunction)(void(*)(void))cmsis_arm_mat_vec_mult_q7, METH_VARARGS | METH_KEYWORDS,""},
+
+{"arm_mat_mult_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_q7",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_fast_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_fast_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_opt_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_opt_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_fast_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_fast_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_sub_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_sub_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_sub_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_sub_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_sub_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_sub_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_sub_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_sub_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_scale_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_scale_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_scale_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_scale_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_scale_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_scale_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_inverse_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_inverse_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_inverse_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_inverse_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_trans_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_trans_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_trans_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_trans_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cmplx_trans_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cmplx_trans_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cholesky_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cholesky_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_cholesky_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_cholesky_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_ldlt_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_ldlt_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_ldlt_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_ldlt_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_solve_lower_triangular_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_solve_lower_triangular_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_solve_lower_triangular_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_solve_lower_triangular_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_solve_upper_triangular_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_solve_upper_triangular_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_solve_upper_triangular_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_solve_upper_triangular_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_householder_f32",  (PyCFunction)(void(*)(void))cmsis_arm_householder_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_householder_f64",  (PyCFunction)(void(*)(void))cmsis_arm_householder_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_qr_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mat_qr_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_qr_f64",  (PyCFunction)(void(*)(void))cmsis_arm_mat_qr_f64, METH_VARARGS | METH_KEYWORDS,""},
+#if defined(ARM_FLOAT16_SUPPORTED)
+{"arm_mat_add_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_add_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_sub_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_sub_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_mult_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_mult_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_trans_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_trans_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_scale_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_scale_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_vec_mult_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_vec_mult_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_mat_inverse_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mat_inverse_f16, METH_VARARGS | METH_KEYWORDS,""},
+#endif
 
 {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
 
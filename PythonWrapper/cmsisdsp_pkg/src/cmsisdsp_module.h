@@ -46,8 +46,14 @@
 #define CAT1(A,B) A##B
 #define CAT(A,B) CAT1(A,B)
 
+/* Name of the module (like cmsisdsp_basic or cmsisdsp_basic_avx2 for
+   the host SIMD variants) */
+#define MODNAME Py_STRINGIFY(MODINITNAME)
+
 
 #include "arm_math.h"
+/* f16 functions are available when the compiler supports _Float16 */
+#include "arm_math_f16.h"
 
 
 #include <numpy/arrayobject.h>
@@ -145,9 +151,76 @@ Method_##NAME##_##FIELD(dsp_##NAME##Object *self, PyObject *ignored)\
        }                                                                      \
     }
 
-#define GETARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT)                          \
-    uint32_t arraySize##FIELD=0;                                               \
-    if (FIELD)                                                                 \
+/*
+
+Zero copy path for the input arguments.
+
+When the Python object is already an aligned, C contiguous ndarray in native
+byte order and with the same layout as the C type used by the kernel, the
+kernel is given a pointer to the array memory. A reference to the array
+is kept until the argument is released.
+
+In all other cases, the object is converted and copied to a new buffer.
+
+*/
+#define ISFLOATTYPE(TYP) (((TYP)0.5) != 0)
+#define ISSIGNEDTYPE(TYP) (((TYP)-1) < 0)
+
+static PyArrayObject *
+borrowNativeArray(PyObject *o,int isFloat,int isSigned,size_t itemSize,int nd)
+{
+    PyArrayObject *a;
+    int typeNum;
+    int sameKind;
+
+    if (!PyArray_Check(o))
+    {
+        return(NULL);
+    }
+
+    a = (PyArrayObject *)o;
+
+    if ((PyArray_NDIM(a) < 1) || ((nd != 0) && (PyArray_NDIM(a) != nd)))
+    {
+        return(NULL);
+    }
+
+    if (!PyArray_IS_C_CONTIGUOUS(a) || 
+        !PyArray_ISALIGNED(a) || 
+        !PyArray_ISNOTSWAPPED(a))
+    {
+        return(NULL);
+    }
+
+    if ((size_t)PyArray_ITEMSIZE(a) != itemSize)
+    {
+        return(NULL);
+    }
+
+    typeNum = PyArray_TYPE(a);
+    if (isFloat)
+    {
+        sameKind = PyTypeNum_ISFLOAT(typeNum);
+    }
+    else if (isSigned)
+    {
+        sameKind = PyTypeNum_ISSIGNED(typeNum);
+    }
+    else
+    {
+        sameKind = PyTypeNum_ISUNSIGNED(typeNum);
+    }
+
+    if (!sameKind)
+    {
+        return(NULL);
+    }
+
+    Py_INCREF(a);
+    return(a);
+}
+
+#define CONVERTARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT)                      \
     {                                                                          \
        PyArray_Descr *desct=PyArray_DescrFromType(FORMAT);                     \
        PyArrayObject *FIELD##c = (PyArrayObject *)PyArray_FromAny(FIELD,desct, \
@@ -164,8 +237,49 @@ Method_##NAME##_##FIELD(dsp_##NAME##Object *self, PyObject *ignored)\
        }                                                                       \
     }
 
-#define FREEARGUMENT(FIELD) \
-    PyMem_Free(FIELD)
+/*
+
+Argument only read by the kernel and released with FREEARGUMENT
+before the wrapper returns. The zero copy path is used when possible.
+
+*/
+#define GETARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT)                          \
+    uint32_t arraySize##FIELD=0;                                               \
+    PyArrayObject *FIELD##_converted_ref=NULL;                                 \
+    if (FIELD)                                                                 \
+    {                                                                          \
+       FIELD##_converted_ref = borrowNativeArray(FIELD,                        \
+          ISFLOATTYPE(DSTFORMAT),ISSIGNEDTYPE(DSTFORMAT),sizeof(DSTFORMAT),0); \
+       if (FIELD##_converted_ref)                                              \
+       {                                                                       \
+           FIELD##_converted = PyArray_DATA(FIELD##_converted_ref);            \
+           arraySize##FIELD = PyArray_SIZE(FIELD##_converted_ref);             \
+       }                                                                       \
+       else                                                                    \
+       CONVERTARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT);                      \
+    }
+
+/*
+
+Argument always copied : the buffer is modified by the kernel,
+or it is kept by an instance, or it is returned to Python.
+
+*/
+#define GETARGUMENTCOPY(FIELD,FORMAT,SRCFORMAT,DSTFORMAT)                      \
+    uint32_t arraySize##FIELD=0;                                               \
+    PyArrayObject *FIELD##_converted_ref=NULL;                                 \
+    if (FIELD)                                                                 \
+    CONVERTARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT);
+
+#define FREEARGUMENT(FIELD)       \
+    if (FIELD##_ref)              \
+    {                             \
+       Py_DECREF(FIELD##_ref);    \
+    }                             \
+    else                          \
+    {                             \
+       PyMem_Free(FIELD);         \
+    }
 
 #ifdef IS_PY3K
 #define ADDTYPE(name)                                               \
@@ -253,6 +367,401 @@ void capsule_cleanup(PyObject *capsule) {
     PyObject *capsule##OBJ = PyCapsule_New(DATA, "cmsisdsp capsule",capsule_cleanup);                       \
     PyArray_SetBaseObject(OBJ, capsule##OBJ);
 
+/*
+
+Frames of the batched functions : one frame per row of a 2D array.
+The zero copy path is used when possible and the frames are released
+with FREEARGUMENT.
+
+*/
+#define GETFRAMESARGUMENT(FIELD,FORMAT,SRCFORMAT,DSTFORMAT)                    \
+    uint32_t nbRows##FIELD=0;                                                  \
+    uint32_t nbCols##FIELD=0;                                                  \
+    PyArrayObject *FIELD##_converted_ref=borrowNativeArray(FIELD,              \
+          ISFLOATTYPE(DSTFORMAT),ISSIGNEDTYPE(DSTFORMAT),sizeof(DSTFORMAT),2); \
+    if (FIELD##_converted_ref)                                                 \
+    {                                                                          \
+       FIELD##_converted = PyArray_DATA(FIELD##_converted_ref);                \
+       nbRows##FIELD = PyArray_DIM(FIELD##_converted_ref,0);                   \
+       nbCols##FIELD = PyArray_DIM(FIELD##_converted_ref,1);                   \
+    }                                                                          \
+    else                                                                       \
+    {                                                                          \
+       PyArray_Descr *desct=PyArray_DescrFromType(FORMAT);                     \
+       PyArrayObject *FIELD##c = (PyArrayObject *)PyArray_FromAny(FIELD,desct, \
+        2,2,NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_ALIGNED | NPY_ARRAY_FORCECAST,  \
+        NULL);                                                                 \
+       if (FIELD##c)                                                           \
+       {                                                                       \
+           uint32_t memCpyIndex;                                               \
+           SRCFORMAT *f=(SRCFORMAT*)PyArray_DATA(FIELD##c);                    \
+           nbRows##FIELD = PyArray_DIM(FIELD##c,0);                            \
+           nbCols##FIELD = PyArray_DIM(FIELD##c,1);                            \
+           FIELD##_converted =PyMem_Malloc(sizeof(DSTFORMAT)*                  \
+              nbRows##FIELD*nbCols##FIELD);                                    \
+           MEMCPY(FIELD##_converted ,f,nbRows##FIELD*nbCols##FIELD,DSTFORMAT); \
+           Py_DECREF(FIELD##c);                                                \
+       }                                                                       \
+    }
+
+/*
+
+Optional out= keyword argument.
+
+The result is written to a preallocated numpy array which is returned
+instead of a new array. The array must be C contiguous, aligned, writeable,
+in native byte order, with the datatype of the result and with the
+same number of elements (and same shape for matrixes).
+
+The array must not overlap one of the numpy arrays of the positional
+arguments : the kernels are not written to work in place and the
+result would be wrong.
+
+*/
+static void
+arrayMemoryExtent(PyArrayObject *a,char **low,char **high)
+{
+    int i;
+    *low = PyArray_BYTES(a);
+    *high = PyArray_BYTES(a) + PyArray_ITEMSIZE(a);
+    for(i=0; i < PyArray_NDIM(a); i++)
+    {
+        npy_intp offset;
+        if (PyArray_DIM(a,i) == 0)
+        {
+            *high = *low;
+            return;
+        }
+        offset = (PyArray_DIM(a,i) - 1) * PyArray_STRIDE(a,i);
+        if (offset < 0)
+        {
+            *low += offset;
+        }
+        else
+        {
+            *high += offset;
+        }
+    }
+}
+
+static int
+arraysOverlap(PyArrayObject *a,PyArrayObject *b)
+{
+    char *lowA,*highA,*lowB,*highB;
+
+    arrayMemoryExtent(a,&lowA,&highA);
+    arrayMemoryExtent(b,&lowB,&highB);
+    return((lowA < highB) && (lowB < highA));
+}
+
+static int
+outOverlapsArguments(PyObject *args,PyArrayObject *out)
+{
+    Py_ssize_t i;
+
+    for(i=0; i < PyTuple_Size(args); i++)
+    {
+        PyObject *o = PyTuple_GET_ITEM(args,i);
+        if (PyArray_Check(o) && arraysOverlap((PyArrayObject*)o,out))
+        {
+            return(1);
+        }
+    }
+    return(0);
+}
+
+/*
+
+Functions with several results are using a tuple of arrays for out=
+(with None for the results which must be allocated). The arrays must
+not overlap the arguments nor each other.
+
+*/
+static int
+outTupleOverlaps(PyObject *args,PyObject *out)
+{
+    Py_ssize_t i,j;
+
+    for(i=0; i < PyTuple_Size(out); i++)
+    {
+        PyObject *o = PyTuple_GET_ITEM(out,i);
+        if (!PyArray_Check(o))
+        {
+            continue;
+        }
+        if (outOverlapsArguments(args,(PyArrayObject*)o))
+        {
+            return(1);
+        }
+        for(j=i+1; j < PyTuple_Size(out); j++)
+        {
+            PyObject *p = PyTuple_GET_ITEM(out,j);
+            if (PyArray_Check(p) && arraysOverlap((PyArrayObject*)o,(PyArrayObject*)p))
+            {
+                return(1);
+            }
+        }
+    }
+    return(0);
+}
+
+static int
+splitOutTuple(PyObject *out,int nb,PyObject **outs)
+{
+    int i;
+
+    for(i=0; i < nb; i++)
+    {
+        outs[i]=NULL;
+    }
+
+    if (out == NULL)
+    {
+        return(1);
+    }
+
+    if (!PyTuple_Check(out) || (PyTuple_Size(out) != nb))
+    {
+        PyErr_Format(PyExc_TypeError,"out must be a tuple of %d arrays",nb);
+        return(0);
+    }
+
+    for(i=0; i < nb; i++)
+    {
+        PyObject *o = PyTuple_GET_ITEM(out,i);
+        outs[i] = (o == Py_None) ? NULL : o;
+    }
+    return(1);
+}
+
+static int
+parseOutKeyword(PyObject *args,PyObject *kwds,PyObject **out)
+{
+    Py_ssize_t nbKeywords=0;
+    PyObject *o=NULL;
+
+    *out=NULL;
+    if (kwds == NULL)
+    {
+        return(1);
+    }
+
+    nbKeywords = PyDict_Size(kwds);
+    o = PyDict_GetItemString(kwds,"out");
+    if (nbKeywords != (o ? 1 : 0))
+    {
+        PyErr_SetString(PyExc_TypeError,"out is the only supported keyword argument");
+        return(0);
+    }
+
+    /* An empty dictionary is given by f(*args,**{}) */
+    if ((o == NULL) || (o == Py_None))
+    {
+       return(1);
+    }
+
+    if ((PyArray_Check(o) && outOverlapsArguments(args,(PyArrayObject*)o)) ||
+        (PyTuple_Check(o) && outTupleOverlaps(args,o)))
+    {
+        PyErr_SetString(PyExc_ValueError,"out must not overlap an input array");
+        return(0);
+    }
+
+    *out = o;
+    return(1);
+}
+
+static PyArrayObject *
+outputArray(PyObject *out,int npyType,int nd,npy_intp *dims)
+{
+    PyArrayObject *a;
+    npy_intp nb=1;
+    int i;
+
+    if (!PyArray_Check(out))
+    {
+        PyErr_SetString(PyExc_TypeError,"out must be a numpy array");
+        return(NULL);
+    }
+
+    a = (PyArrayObject *)out;
+    if (!PyArray_EquivTypenums(PyArray_TYPE(a),npyType) || 
+        !PyArray_ISNOTSWAPPED(a))
+    {
+        PyErr_SetString(PyExc_TypeError,"out has not the datatype of the result");
+        return(NULL);
+    }
+
+    if (!PyArray_IS_C_CONTIGUOUS(a) || 
+        !PyArray_ISALIGNED(a) || 
+        !PyArray_ISWRITEABLE(a))
+    {
+        PyErr_SetString(PyExc_ValueError,"out must be a writeable, aligned and C contiguous array");
+        return(NULL);
+    }
+
+    for(i=0; i < nd; i++)
+    {
+        nb = nb * dims[i];
+    }
+
+    if ((PyArray_SIZE(a) != nb) || 
+        ((nd > 1) && !PyArray_CompareLists(PyArray_DIMS(a),dims,nd) ) || 
+        ((nd > 1) && (PyArray_NDIM(a) != nd)))
+    {
+        PyErr_SetString(PyExc_ValueError,"out has not the dimensions of the result");
+        return(NULL);
+    }
+
+    Py_INCREF(a);
+    return(a);
+}
+
+/*
+
+Length of the frames of a batched function.
+An exception is set if the frames could not be converted.
+
+*/
+static int
+checkFrameLength(void *pData,uint32_t nbCols,uint32_t frameLength)
+{
+    if (pData == NULL)
+    {
+        return(0);
+    }
+
+    if (nbCols != frameLength)
+    {
+        PyErr_Format(PyExc_ValueError,"frames must have %u samples per row",frameLength);
+        return(0);
+    }
+    return(1);
+}
+
+/*
+
+Destination buffer from out= or newly allocated.
+When out= is not valid or the allocation is failing,
+DST is NULL and an exception is set.
+GETOUTPUTFROM is used for one of the arrays of an out= tuple.
+
+*/
+#define GETOUTPUTFROM(OUT,DST,TYP,NPYTYPE,NB)                      \
+    PyArrayObject *DST##_out=NULL;                                 \
+    if (OUT)                                                       \
+    {                                                              \
+       npy_intp dims##DST##_out[1];                                \
+       dims##DST##_out[0]=(NB);                                    \
+       DST##_out=outputArray(OUT,NPYTYPE,1,dims##DST##_out);       \
+       DST = DST##_out ? PyArray_DATA(DST##_out) : NULL;           \
+    }                                                              \
+    else                                                           \
+    {                                                              \
+       DST=PyMem_Malloc(sizeof(TYP)*(NB));                         \
+       if (DST == NULL)                                            \
+       {                                                           \
+          PyErr_NoMemory();                                        \
+       }                                                           \
+    }
+
+#define GETOUTPUT(DST,TYP,NPYTYPE,NB) \
+    GETOUTPUTFROM(out,DST,TYP,NPYTYPE,NB)
+
+/*
+
+Release of a destination buffer when the function is failing
+before the result array is created.
+
+*/
+#define FREEOUTPUT(DST)           \
+    if (DST##_out)                \
+    {                             \
+       Py_DECREF(DST##_out);      \
+    }                             \
+    else                          \
+    {                             \
+       PyMem_Free(DST);           \
+    }
+
+/*
+
+Result of a function using GETOUTPUT.
+OBJ is NULL if DST was not valid.
+
+*/
+#define OUTPUTARRAY1(OBJ,NB,DATA,NPYTYPE)                                          \
+    PyArrayObject *OBJ=NULL;                                                       \
+    if (DATA##_out)                                                                \
+    {                                                                              \
+       OBJ=DATA##_out;                                                             \
+    }                                                                              \
+    else if (DATA)                                                                 \
+    {                                                                              \
+       npy_intp dims##OBJ[1];                                                      \
+       dims##OBJ[0]=NB;                                                            \
+       OBJ=(PyArrayObject*)PyArray_SimpleNewFromData(1, dims##OBJ, NPYTYPE, DATA); \
+       PyObject *capsule##OBJ = PyCapsule_New(DATA, "cmsisdsp capsule",capsule_cleanup);\
+       PyArray_SetBaseObject(OBJ, capsule##OBJ);                                   \
+    }
+
+/*
+
+Input of an in-place function copied to the output buffer.
+The output is padded with zeros if the input is too short.
+
+*/
+#define COPYTOOUTPUT(DST,SRC,TYP,NBSRC,NB)                        \
+    if ((NBSRC) < (NB))                                           \
+    {                                                             \
+       memcpy(DST,SRC,sizeof(TYP)*(NBSRC));                       \
+       memset((DST)+(NBSRC),0,sizeof(TYP)*((NB)-(NBSRC)));        \
+    }                                                             \
+    else                                                          \
+    {                                                             \
+       memcpy(DST,SRC,sizeof(TYP)*(NB));                          \
+    }
+
+/*
+
+2D version of GETOUTPUT and OUTPUTARRAY1 for the batched functions.
+
+*/
+#define GETOUTPUT2D(DST,TYP,NPYTYPE,R,C)                           \
+    PyArrayObject *DST##_out=NULL;                                 \
+    if (out)                                                       \
+    {                                                              \
+       npy_intp dims##DST##_out[2];                                \
+       dims##DST##_out[0]=(R);                                     \
+       dims##DST##_out[1]=(C);                                     \
+       DST##_out=outputArray(out,NPYTYPE,2,dims##DST##_out);       \
+       DST = DST##_out ? PyArray_DATA(DST##_out) : NULL;           \
+    }                                                              \
+    else                                                           \
+    {                                                              \
+       DST=PyMem_Malloc(sizeof(TYP)*(R)*(C));                      \
+       if (DST == NULL)                                            \
+       {                                                           \
+          PyErr_NoMemory();                                        \
+       }                                                           \
+    }
+
+#define OUTPUTARRAY2D(OBJ,R,C,DATA,NPYTYPE)                                        \
+    PyArrayObject *OBJ=NULL;                                                       \
+    if (DATA##_out)                                                                \
+    {                                                                              \
+       OBJ=DATA##_out;                                                             \
+    }                                                                              \
+    else if (DATA)                                                                 \
+    {                                                                              \
+       npy_intp dims##OBJ[2];                                                      \
+       dims##OBJ[0]=R;                                                             \
+       dims##OBJ[1]=C;                                                             \
+       OBJ=(PyArrayObject*)PyArray_SimpleNewFromData(2, dims##OBJ, NPYTYPE, DATA); \
+       PyObject *capsule##OBJ = PyCapsule_New(DATA, "cmsisdsp capsule",capsule_cleanup);\
+       PyArray_SetBaseObject(OBJ, capsule##OBJ);                                   \
+    }
+
 #define MATRIXFROMNUMPY(EXT,TYP,SRCTYPE,NUMPYTYPE)                                   \
 void EXT##MatrixFromNumpy(arm_matrix_instance_##EXT *s,PyObject *o)                   \
 {                                                                            \
@@ -278,9 +787,44 @@ void EXT##MatrixFromNumpy(arm_matrix_instance_##EXT *s,PyObject *o)
                                                                              \
                                                                              \
                                                                              \
+}                                                                            \
+                                                                             \
+PyArrayObject *EXT##MatrixBorrowFromNumpy(arm_matrix_instance_##EXT *s,PyObject *o)\
+{                                                                            \
+    PyArrayObject *ref=borrowNativeArray(o,                                  \
+      ISFLOATTYPE(TYP),ISSIGNEDTYPE(TYP),sizeof(TYP),2);                     \
+    if (ref)                                                                 \
+    {                                                                        \
+       s->pData = PyArray_DATA(ref);                                         \
+       s->numRows=PyArray_DIM(ref,0);                                        \
+       s->numCols=PyArray_DIM(ref,1);                                        \
+    }                                                                        \
+    else                                                                     \
+    {                                                                        \
+       EXT##MatrixFromNumpy(s,o);                                            \
+    }                                                                        \
+    return(ref);                                                             \
 }
 
+/*
 
+Matrix only read by the kernel. The zero copy path is used when possible
+and the matrix must be released with FREEMATRIXARGUMENT.
+
+*/
+#define GETMATRIXARGUMENT(EXT,FIELD)                                         \
+    PyArrayObject *FIELD##_converted_ref =                                   \
+       EXT##MatrixBorrowFromNumpy(&FIELD##_converted,FIELD);
+
+#define FREEMATRIXARGUMENT(FIELD) \
+    if (FIELD##_ref)              \
+    {                             \
+       Py_DECREF(FIELD##_ref);    \
+    }                             \
+    else                          \
+    {                             \
+       FREEMATRIX(&FIELD);        \
+    }
 
 #define CREATEMATRIX(EXT,TYP)                                        \
 void create##EXT##Matrix(arm_matrix_instance_##EXT *s,uint32_t r,uint32_t c)\
@@ -291,6 +835,51 @@ void create##EXT##Matrix(arm_matrix_instance_##EXT *s,uint32_t r,uint32_t c)\
     s->numCols=c;                                                    \
 }
 
+#define GETOUTPUTMATRIXFROM(OUT,EXT,DST,NPYTYPE,R,C)                \
+    PyArrayObject *DST##_out=NULL;                                   \
+    if (OUT)                                                         \
+    {                                                                \
+       npy_intp dims##DST##_out[2];                                  \
+       dims##DST##_out[0]=(R);                                       \
+       dims##DST##_out[1]=(C);                                       \
+       DST##_out=outputArray(OUT,NPYTYPE,2,dims##DST##_out);         \
+       DST.pData = DST##_out ? PyArray_DATA(DST##_out) : NULL;       \
+       DST.numRows=(R);                                              \
+       DST.numCols=(C);                                              \
+    }                                                                \
+    else                                                             \
+    {                                                                \
+       create##EXT##Matrix(&DST,R,C);                                \
+       if (DST.pData == NULL)                                        \
+       {                                                             \
+          PyErr_NoMemory();                                          \
+       }                                                             \
+    }
+
+#define GETOUTPUTMATRIX(EXT,DST,NPYTYPE,R,C) \
+    GETOUTPUTMATRIXFROM(out,EXT,DST,NPYTYPE,R,C)
+
+#define FREEOUTPUTMATRIX(DST)     \
+    if (DST##_out)                \
+    {                             \
+       Py_DECREF(DST##_out);      \
+    }                             \
+    else                          \
+    {                             \
+       FREEMATRIX(&DST);          \
+    }
+
+#define OUTPUTMATRIX(OBJ,EXT,DST)                                    \
+    PyObject *OBJ=NULL;                                              \
+    if (DST##_out)                                                   \
+    {                                                                \
+       OBJ=(PyObject*)DST##_out;                                     \
+    }                                                                \
+    else if (DST.pData)                                              \
+    {                                                                \
+       OBJ=NumpyArrayFrom##EXT##Matrix(&DST);                        \
+    }
+
 #define FREEMATRIX(s) PyMem_Free((s)->pData)
 
 #define NUMPYVECTORFROMBUFFER(EXT,CTYPE,NUMPYTYPE_FROMC)                                          \
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_quaternion"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_quaternion
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -67,7 +69,9 @@ cmsis_arm_quaternion_product_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_product_f32(pSrcA_converted,pSrcB_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -100,7 +104,9 @@ cmsis_arm_quaternion_product_single_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t));
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_product_single_f32(pSrcA_converted,pSrcB_converted,pDst);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -134,7 +140,9 @@ cmsis_arm_quaternion2rotation_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(9*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion2rotation_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,9*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -165,7 +173,9 @@ cmsis_arm_rotation2quaternion_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_rotation2quaternion_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -196,7 +206,9 @@ cmsis_arm_quaternion_normalize_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_normalize_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -227,7 +239,9 @@ cmsis_arm_quaternion_norm_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_norm_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -258,7 +272,9 @@ cmsis_arm_quaternion_conjugate_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_conjugate_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -289,7 +305,9 @@ cmsis_arm_quaternion_inverse_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(4*sizeof(float32_t)*nbQuaternions);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_quaternion_inverse_f32(pSrc_converted,pDst,nbQuaternions);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,4*nbQuaternions,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_statistics"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_statistics
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -60,7 +62,9 @@ cmsis_arm_power_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_power_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("L",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -90,7 +94,9 @@ cmsis_arm_power_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_power_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -119,7 +125,9 @@ cmsis_arm_power_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_power_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -150,7 +158,9 @@ cmsis_arm_power_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_power_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("L",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -180,7 +190,9 @@ cmsis_arm_power_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_power_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -211,7 +223,9 @@ cmsis_arm_mean_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mean_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -242,7 +256,9 @@ cmsis_arm_mean_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mean_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -273,7 +289,9 @@ cmsis_arm_mean_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mean_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -303,7 +321,9 @@ cmsis_arm_mean_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mean_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -332,7 +352,9 @@ cmsis_arm_mean_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mean_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -362,7 +384,9 @@ cmsis_arm_var_f32(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_var_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -392,7 +416,9 @@ cmsis_arm_var_f64(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_var_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -421,7 +447,9 @@ cmsis_arm_var_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_var_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -450,7 +478,9 @@ cmsis_arm_var_q15(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_var_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -481,7 +511,9 @@ cmsis_arm_rms_f32(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_rms_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -510,7 +542,9 @@ cmsis_arm_rms_q31(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_rms_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -540,7 +574,9 @@ cmsis_arm_rms_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_rms_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -571,7 +607,9 @@ cmsis_arm_std_f32(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_std_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -601,7 +639,9 @@ cmsis_arm_std_f64(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_std_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -630,7 +670,9 @@ cmsis_arm_std_q31(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_std_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -659,7 +701,9 @@ cmsis_arm_std_q15(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_std_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -691,7 +735,9 @@ cmsis_arm_min_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_q7(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -722,7 +768,9 @@ cmsis_arm_min_no_idx_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_no_idx_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -749,7 +797,9 @@ cmsis_arm_absmin_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_q7(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -782,7 +832,9 @@ cmsis_arm_absmin_no_idx_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_no_idx_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -811,7 +863,9 @@ cmsis_arm_min_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_q15(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -845,7 +899,9 @@ cmsis_arm_min_no_idx_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_no_idx_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
 
@@ -872,7 +928,9 @@ cmsis_arm_absmin_q15(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_q15(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -906,7 +964,9 @@ cmsis_arm_absmin_no_idx_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_no_idx_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
 
@@ -934,7 +994,9 @@ cmsis_arm_min_q31(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_q31(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -968,7 +1030,9 @@ cmsis_arm_min_no_idx_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_no_idx_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -996,7 +1060,9 @@ cmsis_arm_absmin_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_q31(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1029,7 +1095,9 @@ cmsis_arm_absmin_no_idx_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_no_idx_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -1058,7 +1126,9 @@ cmsis_arm_min_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_f32(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1090,7 +1160,9 @@ cmsis_arm_min_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_f64(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1121,7 +1193,9 @@ cmsis_arm_min_no_idx_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_no_idx_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1150,7 +1224,9 @@ cmsis_arm_min_no_idx_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_min_no_idx_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1180,7 +1256,9 @@ cmsis_arm_absmin_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_f32(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1212,7 +1290,9 @@ cmsis_arm_absmin_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_f64(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1242,7 +1322,9 @@ cmsis_arm_absmin_no_idx_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_no_idx_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1270,7 +1352,9 @@ cmsis_arm_absmin_no_idx_f64(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmin_no_idx_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1301,7 +1385,9 @@ cmsis_arm_max_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_q7(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1335,7 +1421,9 @@ cmsis_arm_max_no_idx_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_no_idx_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -1363,7 +1451,9 @@ cmsis_arm_absmax_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_q7(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1397,7 +1487,9 @@ cmsis_arm_absmax_no_idx_q7(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_no_idx_q7(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -1426,7 +1518,9 @@ cmsis_arm_max_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_q15(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1460,7 +1554,9 @@ cmsis_arm_max_no_idx_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_no_idx_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
 
@@ -1487,7 +1583,9 @@ cmsis_arm_absmax_q15(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_q15(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1520,7 +1618,9 @@ cmsis_arm_absmax_no_idx_q15(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_no_idx_q15(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("h",pResult);
 
 
@@ -1548,7 +1648,9 @@ cmsis_arm_max_q31(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_q31(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1582,7 +1684,9 @@ cmsis_arm_max_no_idx_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_no_idx_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -1609,7 +1713,9 @@ cmsis_arm_absmax_q31(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_q31(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1642,7 +1748,9 @@ cmsis_arm_absmax_no_idx_q31(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_no_idx_q31(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
 
@@ -1671,7 +1779,9 @@ cmsis_arm_max_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_f32(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1703,7 +1813,9 @@ cmsis_arm_max_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_f64(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1734,7 +1846,9 @@ cmsis_arm_max_no_idx_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_no_idx_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1763,7 +1877,9 @@ cmsis_arm_max_no_idx_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrc ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_max_no_idx_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1792,7 +1908,9 @@ cmsis_arm_absmax_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_f32(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1823,7 +1941,9 @@ cmsis_arm_absmax_f64(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_f64(pSrc_converted,blockSize,&pResult,&pIndex);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
     PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);
 
@@ -1853,7 +1973,9 @@ cmsis_arm_absmax_no_idx_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_no_idx_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1881,7 +2003,9 @@ cmsis_arm_absmax_no_idx_f64(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_absmax_no_idx_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1909,7 +2033,9 @@ cmsis_arm_entropy_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     pResult=arm_entropy_f32(pSrc_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1937,7 +2063,9 @@ cmsis_arm_accumulate_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_accumulate_f32(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1965,7 +2093,9 @@ cmsis_arm_entropy_f64(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     pResult=arm_entropy_f64(pSrc_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -1993,7 +2123,9 @@ cmsis_arm_accumulate_f64(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     arm_accumulate_f64(pSrc_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2026,7 +2158,9 @@ cmsis_arm_kullback_leibler_f32(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     result=arm_kullback_leibler_f32(pSrcA_converted,pSrcB_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("f",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -2060,7 +2194,9 @@ cmsis_arm_kullback_leibler_f64(PyObject *obj, PyObject *args)
 
 
 
+    Py_BEGIN_ALLOW_THREADS
     result=arm_kullback_leibler_f64(pSrcA_converted,pSrcB_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* resultOBJ=Py_BuildValue("d",result);
 
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);
@@ -2089,7 +2225,9 @@ cmsis_arm_logsumexp_f32(PyObject *obj, PyObject *args)
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
+    Py_BEGIN_ALLOW_THREADS
     pResult=arm_logsumexp_f32(pSrc_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2122,7 +2260,9 @@ cmsis_arm_logsumexp_dot_prod_f32(PyObject *obj, PyObject *args)
 
     float32_t *tmp=PyMem_Malloc(sizeof(float32_t)*blockSize);
 
+    Py_BEGIN_ALLOW_THREADS
     result=arm_logsumexp_dot_prod_f32(pSrcA_converted,pSrcB_converted,blockSize,tmp);
+    Py_END_ALLOW_THREADS
     PyMem_Free(tmp);
 
     PyObject* resultOBJ=Py_BuildValue("f",result);
@@ -2159,7 +2299,9 @@ cmsis_arm_mse_q7(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mse_q7(pSrcA_converted,pSrcB_converted, blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2195,7 +2337,9 @@ cmsis_arm_mse_q15(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mse_q15(pSrcA_converted,pSrcB_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2231,7 +2375,9 @@ cmsis_arm_mse_q31(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mse_q31(pSrcA_converted,pSrcB_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("i",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2267,7 +2413,9 @@ cmsis_arm_mse_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mse_f32(pSrcA_converted,pSrcB_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("f",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2303,7 +2451,9 @@ cmsis_arm_mse_f64(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_mse_f64(pSrcA_converted,pSrcB_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
     PyObject* pResultOBJ=Py_BuildValue("d",pResult);
 
     PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
@@ -2318,6 +2468,199 @@ cmsis_arm_mse_f64(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+f16 functions : the arguments are converted to np.float16 and
+the results are Python floats.
+
+*/
+#define F16_STAT(OP)                                                            \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args)                             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  float16_t *pSrc_converted=NULL;                                               \
+  uint32_t blockSize;                                                           \
+  float16_t pResult;                                                            \
+                                                                                \
+  if (PyArg_ParseTuple(args,"O",&pSrc))                                         \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);                             \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    Py_BEGIN_ALLOW_THREADS                                                      \
+    arm_##OP##_f16(pSrc_converted,blockSize,&pResult);                          \
+    Py_END_ALLOW_THREADS                                                        \
+    PyObject* pResultOBJ=Py_BuildValue("f",(double)pResult);                    \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);                     \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_DECREF(pResultOBJ);                                                      \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+/* Functions returning the value and its index like arm_max_f16 */
+#define F16_STAT_IDX(OP)                                                        \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args)                             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  float16_t *pSrc_converted=NULL;                                               \
+  uint32_t blockSize;                                                           \
+  float16_t pResult;                                                            \
+  uint32_t pIndex;                                                              \
+                                                                                \
+  if (PyArg_ParseTuple(args,"O",&pSrc))                                         \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);                             \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    Py_BEGIN_ALLOW_THREADS                                                      \
+    arm_##OP##_f16(pSrc_converted,blockSize,&pResult,&pIndex);                  \
+    Py_END_ALLOW_THREADS                                                        \
+    PyObject* pResultOBJ=Py_BuildValue("f",(double)pResult);                    \
+    PyObject* pIndexOBJ=Py_BuildValue("i",pIndex);                              \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("OO",pResultOBJ,pIndexOBJ);          \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_DECREF(pResultOBJ);                                                      \
+    Py_DECREF(pIndexOBJ);                                                       \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+/* Functions returning the result like arm_entropy_f16 */
+#define F16_STAT_RET(OP)                                                        \
+static PyObject *                                                               \
+cmsis_arm_##OP##_f16(PyObject *obj, PyObject *args)                             \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  float16_t *pSrc_converted=NULL;                                               \
+  uint32_t blockSize;                                                           \
+  float16_t pResult;                                                            \
+                                                                                \
+  if (PyArg_ParseTuple(args,"O",&pSrc))                                         \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,NPY_HALF,float16_t,float16_t);                             \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    Py_BEGIN_ALLOW_THREADS                                                      \
+    pResult=arm_##OP##_f16(pSrc_converted,blockSize);                           \
+    Py_END_ALLOW_THREADS                                                        \
+    PyObject* pResultOBJ=Py_BuildValue("f",(double)pResult);                    \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);                     \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_DECREF(pResultOBJ);                                                      \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+F16_STAT(power);
+F16_STAT(mean);
+F16_STAT(var);
+F16_STAT(rms);
+F16_STAT(std);
+F16_STAT(max_no_idx);
+F16_STAT(min_no_idx);
+F16_STAT(absmax_no_idx);
+F16_STAT(absmin_no_idx);
+F16_STAT(accumulate);
+F16_STAT_IDX(max);
+F16_STAT_IDX(min);
+F16_STAT_IDX(absmax);
+F16_STAT_IDX(absmin);
+F16_STAT_RET(entropy);
+F16_STAT_RET(logsumexp);
+
+static PyObject *
+cmsis_arm_kullback_leibler_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *pSrcA=NULL; // input
+  float16_t *pSrcA_converted=NULL; // input
+  PyObject *pSrcB=NULL; // input
+  float16_t *pSrcB_converted=NULL; // input
+  uint32_t blockSize; // input
+  float16_t pResult; // output
+
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  {
+
+    GETARGUMENT(pSrcA,NPY_HALF,float16_t,float16_t);
+    GETARGUMENT(pSrcB,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrcA ;
+
+    Py_BEGIN_ALLOW_THREADS
+    pResult=arm_kullback_leibler_f16(pSrcA_converted,pSrcB_converted,blockSize);
+    Py_END_ALLOW_THREADS
+    PyObject* pResultOBJ=Py_BuildValue("f",(double)pResult);
+
+    PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
+
+    FREEARGUMENT(pSrcA_converted);
+    FREEARGUMENT(pSrcB_converted);
+    Py_DECREF(pResultOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mse_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *pSrcA=NULL; // input
+  float16_t *pSrcA_converted=NULL; // input
+  PyObject *pSrcB=NULL; // input
+  float16_t *pSrcB_converted=NULL; // input
+  uint32_t blockSize; // input
+  float16_t pResult; // output
+
+  if (PyArg_ParseTuple(args,"OO",&pSrcA,&pSrcB))
+  {
+
+    GETARGUMENT(pSrcA,NPY_HALF,float16_t,float16_t);
+    GETARGUMENT(pSrcB,NPY_HALF,float16_t,float16_t);
+    blockSize = arraySizepSrcA ;
+
+    Py_BEGIN_ALLOW_THREADS
+    arm_mse_f16(pSrcA_converted,pSrcB_converted,blockSize,&pResult);
+    Py_END_ALLOW_THREADS
+    PyObject* pResultOBJ=Py_BuildValue("f",(double)pResult);
+
+    PyObject *pythonResult = Py_BuildValue("O",pResultOBJ);
+
+    FREEARGUMENT(pSrcA_converted);
+    FREEARGUMENT(pSrcB_converted);
+    Py_DECREF(pResultOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
@@ -2373,6 +2716,26 @@ static PyMethodDef CMSISDSPMethods[] = {
 {"arm_absmax_q31", cmsis_arm_absmax_q31, METH_VARARGS,""},
 {"arm_max_f32",  cmsis_arm_max_f32, METH_VARARGS,""},
 {"arm_max_f64",  cmsis_arm_max_f64, METH_VARARGS,""},
+#if defined(ARM_FLOAT16_SUPPORTED)
+{"arm_power_f16",  cmsis_arm_power_f16, METH_VARARGS,""},
+{"arm_mean_f16",  cmsis_arm_mean_f16, METH_VARARGS,""},
+{"arm_var_f16",  cmsis_arm_var_f16, METH_VARARGS,""},
+{"arm_rms_f16",  cmsis_arm_rms_f16, METH_VARARGS,""},
+{"arm_std_f16",  cmsis_arm_std_f16, METH_VARARGS,""},
+{"arm_max_no_idx_f16",  cmsis_arm_max_no_idx_f16, METH_VARARGS,""},
+{"arm_min_no_idx_f16",  cmsis_arm_min_no_idx_f16, METH_VARARGS,""},
+{"arm_absmax_no_idx_f16",  cmsis_arm_absmax_no_idx_f16, METH_VARARGS,""},
+{"arm_absmin_no_idx_f16",  cmsis_arm_absmin_no_idx_f16, METH_VARARGS,""},
+{"arm_accumulate_f16",  cmsis_arm_accumulate_f16, METH_VARARGS,""},
+{"arm_max_f16",  cmsis_arm_max_f16, METH_VARARGS,""},
+{"arm_min_f16",  cmsis_arm_min_f16, METH_VARARGS,""},
+{"arm_absmax_f16",  cmsis_arm_absmax_f16, METH_VARARGS,""},
+{"arm_absmin_f16",  cmsis_arm_absmin_f16, METH_VARARGS,""},
+{"arm_entropy_f16",  cmsis_arm_entropy_f16, METH_VARARGS,""},
+{"arm_logsumexp_f16",  cmsis_arm_logsumexp_f16, METH_VARARGS,""},
+{"arm_kullback_leibler_f16",  cmsis_arm_kullback_leibler_f16, METH_VARARGS,""},
+{"arm_mse_f16",  cmsis_arm_mse_f16, METH_VARARGS,""},
+#endif
 
 {"arm_max_no_idx_f32",  cmsis_arm_max_no_idx_f32, METH_VARARGS,""},
 {"arm_max_no_idx_f64",  cmsis_arm_max_no_idx_f64, METH_VARARGS,""},
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_support"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_support
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -140,32 +142,37 @@ cmsis_arm_sort_init_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_sort_f32(PyObject *obj, PyObject *args)
+cmsis_arm_sort_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_sort_instance_f32Object *selfS = (dsp_arm_sort_instance_f32Object *)S;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_sort_f32(selfS->instance,pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_sort_f32(selfS->instance,pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -174,25 +181,30 @@ cmsis_arm_sort_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_fill_f32(PyObject *obj, PyObject *args)
+cmsis_arm_fill_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   float32_t value; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"fi",&value,&blockSize))
+  if (PyArg_ParseTuple(args,"fi",&value,&blockSize) && parseOutKeyword(args,kwds,&out))
   {
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_fill_f32(value,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fill_f32(value,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -200,25 +212,30 @@ cmsis_arm_fill_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_fill_f64(PyObject *obj, PyObject *args)
+cmsis_arm_fill_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   float64_t value; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"di",&value,&blockSize))
+  if (PyArg_ParseTuple(args,"di",&value,&blockSize) && parseOutKeyword(args,kwds,&out))
   {
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_fill_f64(value,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fill_f64(value,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -226,25 +243,30 @@ cmsis_arm_fill_f64(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_fill_q31(PyObject *obj, PyObject *args)
+cmsis_arm_fill_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   q31_t value; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"ii",&value,&blockSize))
+  if (PyArg_ParseTuple(args,"ii",&value,&blockSize) && parseOutKeyword(args,kwds,&out))
   {
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_fill_q31(value,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fill_q31(value,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -252,25 +274,30 @@ cmsis_arm_fill_q31(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_fill_q15(PyObject *obj, PyObject *args)
+cmsis_arm_fill_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   q15_t value; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"hi",&value,&blockSize))
+  if (PyArg_ParseTuple(args,"hi",&value,&blockSize) && parseOutKeyword(args,kwds,&out))
   {
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_fill_q15(value,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fill_q15(value,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -278,25 +305,30 @@ cmsis_arm_fill_q15(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_fill_q7(PyObject *obj, PyObject *args)
+cmsis_arm_fill_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   q31_t value; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"ii",&value,&blockSize))
+  if (PyArg_ParseTuple(args,"ii",&value,&blockSize) && parseOutKeyword(args,kwds,&out))
   {
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_fill_q7((q7_t)value,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_fill_q7((q7_t)value,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -306,30 +338,35 @@ cmsis_arm_fill_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_copy_f32(PyObject *obj, PyObject *args)
+cmsis_arm_copy_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_copy_f32(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_copy_f32(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -337,30 +374,35 @@ cmsis_arm_copy_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_copy_f64(PyObject *obj, PyObject *args)
+cmsis_arm_copy_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float64_t *pSrc_converted=NULL; // input
   float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float64_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float64_t)*blockSize);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,blockSize);
 
-
-    arm_copy_f64(pSrc_converted,pDst,blockSize);
- FLOAT64ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_copy_f64(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -369,30 +411,35 @@ cmsis_arm_copy_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_copy_q7(PyObject *obj, PyObject *args)
+cmsis_arm_copy_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_copy_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_copy_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -401,30 +448,35 @@ cmsis_arm_copy_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_copy_q15(PyObject *obj, PyObject *args)
+cmsis_arm_copy_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-
-    arm_copy_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_copy_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -433,30 +485,35 @@ cmsis_arm_copy_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_copy_q31(PyObject *obj, PyObject *args)
+cmsis_arm_copy_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_copy_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_copy_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -472,30 +529,35 @@ cmsis_arm_copy_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q7_to_q31(PyObject *obj, PyObject *args)
+cmsis_arm_q7_to_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_q7_to_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q7_to_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -506,30 +568,35 @@ cmsis_arm_q7_to_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q7_to_q15(PyObject *obj, PyObject *args)
+cmsis_arm_q7_to_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_q7_to_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q7_to_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -540,30 +607,35 @@ cmsis_arm_q7_to_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q7_to_float(PyObject *obj, PyObject *args)
+cmsis_arm_q7_to_float(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q7_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_BYTE,int8_t,q7_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_q7_to_float(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q7_to_float(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -576,30 +648,35 @@ cmsis_arm_q7_to_float(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q31_to_float(PyObject *obj, PyObject *args)
+cmsis_arm_q31_to_float(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-
-    arm_q31_to_float(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q31_to_float(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -612,30 +689,35 @@ cmsis_arm_q31_to_float(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_float_to_q31(PyObject *obj, PyObject *args)
+cmsis_arm_float_to_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_float_to_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_float_to_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -644,30 +726,35 @@ cmsis_arm_float_to_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_float_to_q15(PyObject *obj, PyObject *args)
+cmsis_arm_float_to_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_float_to_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_float_to_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -676,30 +763,35 @@ cmsis_arm_float_to_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_float_to_q7(PyObject *obj, PyObject *args)
+cmsis_arm_float_to_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_float_to_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_float_to_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -708,30 +800,35 @@ cmsis_arm_float_to_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q31_to_q15(PyObject *obj, PyObject *args)
+cmsis_arm_q31_to_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q15_t)*blockSize);
-
+    GETOUTPUT(pDst,q15_t,NPY_INT16,blockSize);
 
-    arm_q31_to_q15(pSrc_converted,pDst,blockSize);
- INT16ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q31_to_q15(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -740,30 +837,35 @@ cmsis_arm_q31_to_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q31_to_q7(PyObject *obj, PyObject *args)
+cmsis_arm_q31_to_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-
-    arm_q31_to_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q31_to_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -772,30 +874,35 @@ cmsis_arm_q31_to_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q15_to_float(PyObject *obj, PyObject *args)
+cmsis_arm_q15_to_float(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*blockSize);
-
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,blockSize);
 
-    arm_q15_to_float(pSrc_converted,pDst,blockSize);
- FLOATARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q15_to_float(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -804,30 +911,35 @@ cmsis_arm_q15_to_float(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q15_to_q31(PyObject *obj, PyObject *args)
+cmsis_arm_q15_to_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*blockSize);
-
+    GETOUTPUT(pDst,q31_t,NPY_INT32,blockSize);
 
-    arm_q15_to_q31(pSrc_converted,pDst,blockSize);
- INT32ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q15_to_q31(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -836,30 +948,35 @@ cmsis_arm_q15_to_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_q15_to_q7(PyObject *obj, PyObject *args)
+cmsis_arm_q15_to_q7(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q7_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t blockSize; // input
 
-  if (PyArg_ParseTuple(args,"O",&pSrc))
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
     blockSize = arraySizepSrc ;
 
-    pDst=PyMem_Malloc(sizeof(q7_t)*blockSize);
-
+    GETOUTPUT(pDst,q7_t,NPY_BYTE,blockSize);
 
-    arm_q15_to_q7(pSrc_converted,pDst,blockSize);
- INT8ARRAY1(pDstOBJ,blockSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_q15_to_q7(pSrc_converted,pDst,blockSize);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,NPY_BYTE);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -868,7 +985,7 @@ cmsis_arm_q15_to_q7(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_barycenter_f32(PyObject *obj, PyObject *args)
+cmsis_arm_barycenter_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *pSrcA=NULL; // input
@@ -876,24 +993,29 @@ cmsis_arm_barycenter_f32(PyObject *obj, PyObject *args)
   PyObject *pSrcB=NULL; // input
   float32_t *pSrcB_converted=NULL; // input
   float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t nbVectors,vecDim;
 
-  if (PyArg_ParseTuple(args,"OOII",&pSrcA,&pSrcB,&nbVectors,&vecDim))
+  if (PyArg_ParseTuple(args,"OOII",&pSrcA,&pSrcB,&nbVectors,&vecDim) && parseOutKeyword(args,kwds,&out))
   {
     GETARGUMENT(pSrcA,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pSrcB,NPY_DOUBLE,double,float32_t);
 
-    pDst=PyMem_Malloc(sizeof(float32_t)*vecDim);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,vecDim);
 
-
-    arm_barycenter_f32(pSrcA_converted,pSrcB_converted,pDst,nbVectors,vecDim);
- FLOATARRAY1(pDstOBJ,vecDim,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_barycenter_f32(pSrcA_converted,pSrcB_converted,pDst,nbVectors,vecDim);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,vecDim,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrcA_converted);
     FREEARGUMENT(pSrcB_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -919,7 +1041,9 @@ cmsis_arm_weighted_sum_f32(PyObject *obj, PyObject *args)
     blockSize = arraySizepSrcA ;
 
 
+    Py_BEGIN_ALLOW_THREADS
     dst=arm_weighted_sum_f32(pSrcA_converted,pSrcB_converted,blockSize);
+    Py_END_ALLOW_THREADS
     PyObject* pDstOBJ=Py_BuildValue("f",dst);
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
@@ -959,40 +1083,101 @@ cmsis_arm_div_int64_to_int32(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+Conversions to and from f16 (np.float16 arrays)
+
+*/
+#define F16_CONVERT(NAME,SRCNPY,SRCFORMAT,SRCTYP,DSTTYP,DSTNPY)                \
+static PyObject *                                                               \
+cmsis_arm_##NAME(PyObject *obj, PyObject *args, PyObject *kwds)                 \
+{                                                                               \
+                                                                                \
+  PyObject *pSrc=NULL;                                                          \
+  SRCTYP *pSrc_converted=NULL;                                                  \
+  DSTTYP *pDst=NULL;                                                            \
+  PyObject *out=NULL;                                                           \
+  uint32_t blockSize;                                                           \
+                                                                                \
+  if (PyArg_ParseTuple(args,"O",&pSrc) && parseOutKeyword(args,kwds,&out))           \
+  {                                                                             \
+                                                                                \
+    GETARGUMENT(pSrc,SRCNPY,SRCFORMAT,SRCTYP);                                  \
+    blockSize = arraySizepSrc ;                                                 \
+                                                                                \
+    GETOUTPUT(pDst,DSTTYP,DSTNPY,blockSize);                                    \
+                                                                                \
+    if (pDst)                                                                   \
+    {                                                                           \
+      Py_BEGIN_ALLOW_THREADS                                                    \
+      arm_##NAME(pSrc_converted,pDst,blockSize);                                \
+      Py_END_ALLOW_THREADS                                                      \
+    }                                                                           \
+    OUTPUTARRAY1(pDstOBJ,blockSize,pDst,DSTNPY);                                \
+                                                                                \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                        \
+                                                                                \
+    FREEARGUMENT(pSrc_converted);                                               \
+    Py_XDECREF(pDstOBJ);                                                        \
+    return(pythonResult);                                                       \
+                                                                                \
+  }                                                                             \
+  return(NULL);                                                                 \
+}
+
+F16_CONVERT(float_to_f16,NPY_DOUBLE,double,float32_t,float16_t,NPY_HALF);
+F16_CONVERT(f64_to_f16,NPY_DOUBLE,double,float64_t,float16_t,NPY_HALF);
+F16_CONVERT(q15_to_f16,NPY_INT16,int16_t,q15_t,float16_t,NPY_HALF);
+F16_CONVERT(f16_to_float,NPY_HALF,float16_t,float16_t,float32_t,NPY_FLOAT);
+F16_CONVERT(f16_to_f64,NPY_HALF,float16_t,float16_t,float64_t,NPY_DOUBLE);
+F16_CONVERT(f16_to_q15,NPY_HALF,float16_t,float16_t,q15_t,NPY_INT16);
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 {"arm_div_int64_to_int32",  cmsis_arm_div_int64_to_int32, METH_VARARGS,""},
-{"arm_copy_f64",  cmsis_arm_copy_f64, METH_VARARGS,""},
-{"arm_copy_f32",  cmsis_arm_copy_f32, METH_VARARGS,""},
-{"arm_copy_q7",  cmsis_arm_copy_q7, METH_VARARGS,""},
-{"arm_copy_q15",  cmsis_arm_copy_q15, METH_VARARGS,""},
-{"arm_copy_q31",  cmsis_arm_copy_q31, METH_VARARGS,""},
-
-
-{"arm_q7_to_q31",  cmsis_arm_q7_to_q31, METH_VARARGS,""},
-{"arm_q7_to_q15",  cmsis_arm_q7_to_q15, METH_VARARGS,""},
-{"arm_q7_to_float",  cmsis_arm_q7_to_float, METH_VARARGS,""},
-{"arm_q31_to_float",  cmsis_arm_q31_to_float, METH_VARARGS,""},
-
-
-
-{"arm_float_to_q31",  cmsis_arm_float_to_q31, METH_VARARGS,""},
-{"arm_float_to_q15",  cmsis_arm_float_to_q15, METH_VARARGS,""},
-{"arm_float_to_q7",  cmsis_arm_float_to_q7, METH_VARARGS,""},
-{"arm_q31_to_q15",  cmsis_arm_q31_to_q15, METH_VARARGS,""},
-{"arm_q31_to_q7",  cmsis_arm_q31_to_q7, METH_VARARGS,""},
-{"arm_q15_to_float",  cmsis_arm_q15_to_float, METH_VARARGS,""},
-{"arm_q15_to_q31",  cmsis_arm_q15_to_q31, METH_VARARGS,""},
-{"arm_q15_to_q7",  cmsis_arm_q15_to_q7, METH_VARARGS,""},
-
-{"arm_fill_f64",  cmsis_arm_fill_f64, METH_VARARGS,""},
-{"arm_fill_f32",  cmsis_arm_fill_f32, METH_VARARGS,""},
-{"arm_fill_q31",  cmsis_arm_fill_q31, METH_VARARGS,""},
-{"arm_fill_q15",  cmsis_arm_fill_q15, METH_VARARGS,""},
-{"arm_fill_q7",  cmsis_arm_fill_q7, METH_VARARGS,""},
-{"arm_sort_f32",  cmsis_arm_sort_f32, METH_VARARGS,""},
+{"arm_copy_f64",  (PyCFunction)(void(*)(void))cmsis_arm_copy_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_copy_f32",  (PyCFunction)(void(*)(void))cmsis_arm_copy_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_copy_q7",  (PyCFunction)(void(*)(void))cmsis_arm_copy_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_copy_q15",  (PyCFunction)(void(*)(void))cmsis_arm_copy_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_copy_q31",  (PyCFunction)(void(*)(void))cmsis_arm_copy_q31, METH_VARARGS | METH_KEYWORDS,""},
+
+
+{"arm_q7_to_q31",  (PyCFunction)(void(*)(void))cmsis_arm_q7_to_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q7_to_q15",  (PyCFunction)(void(*)(void))cmsis_arm_q7_to_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q7_to_float",  (PyCFunction)(void(*)(void))cmsis_arm_q7_to_float, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q31_to_float",  (PyCFunction)(void(*)(void))cmsis_arm_q31_to_float, METH_VARARGS | METH_KEYWORDS,""},
+
+
+
+{"arm_float_to_q31",  (PyCFunction)(void(*)(void))cmsis_arm_float_to_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_float_to_q15",  (PyCFunction)(void(*)(void))cmsis_arm_float_to_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_float_to_q7",  (PyCFunction)(void(*)(void))cmsis_arm_float_to_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q31_to_q15",  (PyCFunction)(void(*)(void))cmsis_arm_q31_to_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q31_to_q7",  (PyCFunction)(void(*)(void))cmsis_arm_q31_to_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q15_to_float",  (PyCFunction)(void(*)(void))cmsis_arm_q15_to_float, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q15_to_q31",  (PyCFunction)(void(*)(void))cmsis_arm_q15_to_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q15_to_q7",  (PyCFunction)(void(*)(void))cmsis_arm_q15_to_q7, METH_VARARGS | METH_KEYWORDS,""},
+#if defined(ARM_FLOAT16_SUPPORTED)
+{"arm_float_to_f16",  (PyCFunction)(void(*)(void))cmsis_arm_float_to_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_f64_to_f16",  (PyCFunction)(void(*)(void))cmsis_arm_f64_to_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_q15_to_f16",  (PyCFunction)(void(*)(void))cmsis_arm_q15_to_f16, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_f16_to_float",  (PyCFunction)(void(*)(void))cmsis_arm_f16_to_float, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_f16_to_f64",  (PyCFunction)(void(*)(void))cmsis_arm_f16_to_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_f16_to_q15",  (PyCFunction)(void(*)(void))cmsis_arm_f16_to_q15, METH_VARARGS | METH_KEYWORDS,""},
+#endif
+
+{"arm_fill_f64",  (PyCFunction)(void(*)(void))cmsis_arm_fill_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fill_f32",  (PyCFunction)(void(*)(void))cmsis_arm_fill_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fill_q31",  (PyCFunction)(void(*)(void))cmsis_arm_fill_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fill_q15",  (PyCFunction)(void(*)(void))cmsis_arm_fill_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_fill_q7",  (PyCFunction)(void(*)(void))cmsis_arm_fill_q7, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_sort_f32",  (PyCFunction)(void(*)(void))cmsis_arm_sort_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_sort_init_f32",  cmsis_arm_sort_init_f32, METH_VARARGS,""},
-{"arm_barycenter_f32",  cmsis_arm_barycenter_f32, METH_VARARGS,""},
+{"arm_barycenter_f32",  (PyCFunction)(void(*)(void))cmsis_arm_barycenter_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_weighted_sum_f32",  cmsis_arm_weighted_sum_f32, METH_VARARGS,""},
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
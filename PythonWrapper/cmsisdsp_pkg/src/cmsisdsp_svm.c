@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_svm"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_svm
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -400,9 +402,9 @@ cmsis_arm_svm_linear_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_svm_linear_instance_f32Object *selfS = (dsp_arm_svm_linear_instance_f32Object *)S;
-    GETARGUMENT(pdualCoefficients,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(psupportVectors,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pclasses,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pdualCoefficients,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(psupportVectors,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pclasses,NPY_INT32,int32_t,int32_t);
 
     arm_svm_linear_init_f32(selfS->instance,
       nbOfSupportVectors,
@@ -452,9 +454,9 @@ cmsis_arm_svm_polynomial_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_svm_polynomial_instance_f32Object *selfS = (dsp_arm_svm_polynomial_instance_f32Object *)S;
-    GETARGUMENT(pdualCoefficients,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(psupportVectors,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pclasses,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pdualCoefficients,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(psupportVectors,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pclasses,NPY_INT32,int32_t,int32_t);
 
     arm_svm_polynomial_init_f32(selfS->instance,
       nbOfSupportVectors,
@@ -504,9 +506,9 @@ cmsis_arm_svm_rbf_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_svm_rbf_instance_f32Object *selfS = (dsp_arm_svm_rbf_instance_f32Object *)S;
-    GETARGUMENT(pdualCoefficients,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(psupportVectors,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pclasses,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pdualCoefficients,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(psupportVectors,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pclasses,NPY_INT32,int32_t,int32_t);
 
     arm_svm_rbf_init_f32(selfS->instance,
       nbOfSupportVectors,
@@ -556,9 +558,9 @@ cmsis_arm_svm_sigmoid_init_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_svm_sigmoid_instance_f32Object *selfS = (dsp_arm_svm_sigmoid_instance_f32Object *)S;
-    GETARGUMENT(pdualCoefficients,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(psupportVectors,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pclasses,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pdualCoefficients,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(psupportVectors,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pclasses,NPY_INT32,int32_t,int32_t);
 
     arm_svm_sigmoid_init_f32(selfS->instance,
       nbOfSupportVectors,
@@ -596,7 +598,9 @@ cmsis_arm_svm_##NAME##_predict_f32(PyObject *obj, PyObject *args)
                                                                                                   \
                                                                                                   \
                                                                                                   \
+    Py_BEGIN_ALLOW_THREADS                                                                        \
     arm_svm_##NAME##_predict_f32(selfS->instance,pSrc_converted,&dst);                            \
+    Py_END_ALLOW_THREADS                                                                          \
     PyObject* resultOBJ=Py_BuildValue("i",dst);                                                   \
     PyObject *pythonResult = Py_BuildValue("O",resultOBJ);                                        \
                                                                                                   \
@@ -613,20 +617,86 @@ SVMPREDICT(polynomial);
 SVMPREDICT(rbf);
 SVMPREDICT(sigmoid);
 
+/*
+
+Prediction of all the rows of a 2D array (one feature vector per row).
+The labels are written in an int32 array.
+
+*/
+#define SVMPREDICTBATCH(NAME)                                                                     \
+static PyObject *                                                                                 \
+cmsis_arm_svm_##NAME##_predict_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)           \
+{                                                                                                 \
+                                                                                                  \
+  PyObject *S=NULL;                                                                               \
+  PyObject *frames=NULL;                                                                          \
+  float32_t *frames_converted=NULL;                                                               \
+  int32_t *pDst=NULL;                                                                             \
+  PyObject *out=NULL;                                                                             \
+                                                                                                  \
+  if (PyArg_ParseTuple(args,"OO",&S,&frames) && parseOutKeyword(args,kwds,&out))                       \
+  {                                                                                               \
+                                                                                                  \
+    dsp_arm_svm_##NAME##_instance_f32Object *selfS = (dsp_arm_svm_##NAME##_instance_f32Object *)S;\
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);                                        \
+    uint32_t nbFrames = nbRowsframes;                                                             \
+    uint32_t vectorDimension = selfS->instance->vectorDimension;                                  \
+                                                                                                  \
+    if (!checkFrameLength(frames_converted,nbColsframes,vectorDimension))                         \
+    {                                                                                             \
+       FREEARGUMENT(frames_converted);                                                            \
+       return(NULL);                                                                              \
+    }                                                                                             \
+                                                                                                  \
+    GETOUTPUT(pDst,int32_t,NPY_INT32,nbFrames);                                                   \
+                                                                                                  \
+    if (pDst)                                                                                     \
+    {                                                                                             \
+      float32_t *pIn = frames_converted;                                                          \
+                                                                                                  \
+      Py_BEGIN_ALLOW_THREADS                                                                      \
+      for(uint32_t i=0; i < nbFrames; i++)                                                        \
+      {                                                                                           \
+        arm_svm_##NAME##_predict_f32(selfS->instance,pIn,&pDst[i]);                               \
+        pIn += vectorDimension;                                                                   \
+      }                                                                                           \
+      Py_END_ALLOW_THREADS                                                                        \
+    }                                                                                             \
+    OUTPUTARRAY1(pDstOBJ,nbFrames,pDst,NPY_INT32);                                                \
+                                                                                                  \
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);                                          \
+                                                                                                  \
+    FREEARGUMENT(frames_converted);                                                               \
+    Py_XDECREF(pDstOBJ);                                                                          \
+    return(pythonResult);                                                                         \
+                                                                                                  \
+  }                                                                                               \
+  return(NULL);                                                                                   \
+}
+
+SVMPREDICTBATCH(linear);
+SVMPREDICTBATCH(polynomial);
+SVMPREDICTBATCH(rbf);
+SVMPREDICTBATCH(sigmoid);
+
 static PyMethodDef CMSISDSPMethods[] = {
 
 
 {"arm_svm_linear_init_f32",  cmsis_arm_svm_linear_init_f32, METH_VARARGS,""},
 {"arm_svm_linear_predict_f32",  cmsis_arm_svm_linear_predict_f32, METH_VARARGS,""},
+{"arm_svm_linear_predict_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_svm_linear_predict_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 
 {"arm_svm_polynomial_init_f32",  cmsis_arm_svm_polynomial_init_f32, METH_VARARGS,""},
 {"arm_svm_polynomial_predict_f32",  cmsis_arm_svm_polynomial_predict_f32, METH_VARARGS,""},
+{"arm_svm_polynomial_predict_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_svm_polynomial_predict_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 
 {"arm_svm_rbf_init_f32",  cmsis_arm_svm_rbf_init_f32, METH_VARARGS,""},
 {"arm_svm_rbf_predict_f32",  cmsis_arm_svm_rbf_predict_f32, METH_VARARGS,""},
+{"arm_svm_rbf_predict_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_svm_rbf_predict_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 
 {"arm_svm_sigmoid_init_f32",  cmsis_arm_svm_sigmoid_init_f32, METH_VARARGS,""},
 {"arm_svm_sigmoid_predict_f32",  cmsis_arm_svm_sigmoid_predict_f32, METH_VARARGS,""},
+{"arm_svm_sigmoid_predict_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_svm_sigmoid_predict_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_transform"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_transform
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -1304,9 +1306,18 @@ static PyMethodDef arm_rfft_fast_instance_f32_methods[] = {
 DSPType(arm_rfft_fast_instance_f32,arm_rfft_fast_instance_f32_new,arm_rfft_fast_instance_f32_dealloc,arm_rfft_fast_instance_f32_init,arm_rfft_fast_instance_f32_methods);
 
 
+/*
+
+The dct4 instance is using the rfft and cfft instances given to
+the init function : references to them are kept until the dct4
+instance is released or initialized again.
+
+*/
 typedef struct {
     PyObject_HEAD
     arm_dct4_instance_f32 *instance;
+    PyObject *rfft;
+    PyObject *cfft;
 } dsp_arm_dct4_instance_f32Object;
 
 
@@ -1314,6 +1325,8 @@ static void
 arm_dct4_instance_f32_dealloc(dsp_arm_dct4_instance_f32Object* self)
 {
     //printf("Dealloc called\n");
+    Py_XDECREF(self->rfft);
+    Py_XDECREF(self->cfft);
     if (self->instance)
     {
 
@@ -1337,6 +1350,8 @@ arm_dct4_instance_f32_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (self != NULL) {
 
         self->instance = PyMem_Malloc(sizeof(arm_dct4_instance_f32));
+        self->rfft = NULL;
+        self->cfft = NULL;
 
         self->instance->pTwiddle = NULL;
         self->instance->pCosFactor = NULL;
@@ -1393,6 +1408,8 @@ DSPType(arm_dct4_instance_f32,arm_dct4_instance_f32_new,arm_dct4_instance_f32_de
 typedef struct {
     PyObject_HEAD
     arm_dct4_instance_q31 *instance;
+    PyObject *rfft;
+    PyObject *cfft;
 } dsp_arm_dct4_instance_q31Object;
 
 
@@ -1400,6 +1417,8 @@ static void
 arm_dct4_instance_q31_dealloc(dsp_arm_dct4_instance_q31Object* self)
 {
     //printf("Dealloc called\n");
+    Py_XDECREF(self->rfft);
+    Py_XDECREF(self->cfft);
     if (self->instance)
     {
 
@@ -1423,6 +1442,8 @@ arm_dct4_instance_q31_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (self != NULL) {
 
         self->instance = PyMem_Malloc(sizeof(arm_dct4_instance_q31));
+        self->rfft = NULL;
+        self->cfft = NULL;
 
         self->instance->pTwiddle = NULL;
         self->instance->pCosFactor = NULL;
@@ -1479,6 +1500,8 @@ DSPType(arm_dct4_instance_q31,arm_dct4_instance_q31_new,arm_dct4_instance_q31_de
 typedef struct {
     PyObject_HEAD
     arm_dct4_instance_q15 *instance;
+    PyObject *rfft;
+    PyObject *cfft;
 } dsp_arm_dct4_instance_q15Object;
 
 
@@ -1486,6 +1509,8 @@ static void
 arm_dct4_instance_q15_dealloc(dsp_arm_dct4_instance_q15Object* self)
 {
     //printf("Dealloc called\n");
+    Py_XDECREF(self->rfft);
+    Py_XDECREF(self->cfft);
     if (self->instance)
     {
 
@@ -1509,6 +1534,8 @@ arm_dct4_instance_q15_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     if (self != NULL) {
 
         self->instance = PyMem_Malloc(sizeof(arm_dct4_instance_q15));
+        self->rfft = NULL;
+        self->cfft = NULL;
 
         self->instance->pTwiddle = NULL;
         self->instance->pCosFactor = NULL;
@@ -1801,6 +1828,320 @@ DSPType(arm_mfcc_instance_q31,arm_mfcc_instance_q31_new,arm_mfcc_instance_q31_de
 DSPType(arm_mfcc_instance_q15,arm_mfcc_instance_q15_new,arm_mfcc_instance_q15_dealloc,arm_mfcc_instance_q15_init,arm_mfcc_instance_q15_methods);
 
 
+/*
+
+Streaming MFCC : audio chunks of any length are split into frames
+of fftLen samples with a hop of hop samples.
+
+The stream is keeping a reference to the MFCC instance. The samples
+which are not yet used by a frame are kept in pBuffer (less than
+fftLen samples). pFrame is a copy of the frame since the input
+of arm_mfcc is modified by the kernel.
+
+*/
+#define MFCCSTREAMTYPE(EXT,TYP,TMPTYP)                                         \
+typedef struct {                                                               \
+    PyObject_HEAD                                                              \
+    PyObject *mfcc;                                                            \
+    uint32_t fftLen;                                                           \
+    uint32_t hop;                                                              \
+    uint32_t nbSamples;                                                        \
+    TYP *pBuffer;                                                              \
+    TYP *pFrame;                                                               \
+    TMPTYP *pTmp;                                                              \
+} dsp_arm_mfcc_stream_instance_##EXT##Object;                                  \
+                                                                               \
+                                                                               \
+static void                                                                    \
+arm_mfcc_stream_instance_##EXT##_dealloc(dsp_arm_mfcc_stream_instance_##EXT##Object* self)\
+{                                                                              \
+    Py_XDECREF(self->mfcc);                                                    \
+    PyMem_Free(self->pBuffer);                                                 \
+    PyMem_Free(self->pFrame);                                                  \
+    PyMem_Free(self->pTmp);                                                    \
+                                                                               \
+    Py_TYPE(self)->tp_free((PyObject*)self);                                   \
+}                                                                              \
+                                                                               \
+                                                                               \
+static PyObject *                                                              \
+arm_mfcc_stream_instance_##EXT##_new(PyTypeObject *type, PyObject *args, PyObject *kwds)\
+{                                                                              \
+    dsp_arm_mfcc_stream_instance_##EXT##Object *self;                          \
+                                                                               \
+    self = (dsp_arm_mfcc_stream_instance_##EXT##Object *)type->tp_alloc(type, 0);\
+                                                                               \
+    if (self != NULL) {                                                        \
+        self->mfcc = NULL;                                                     \
+        self->fftLen = 0;                                                      \
+        self->hop = 0;                                                         \
+        self->nbSamples = 0;                                                   \
+        self->pBuffer = NULL;                                                  \
+        self->pFrame = NULL;                                                   \
+        self->pTmp = NULL;                                                     \
+    }                                                                          \
+                                                                               \
+    return (PyObject *)self;                                                   \
+}                                                                              \
+                                                                               \
+static int                                                                     \
+arm_mfcc_stream_instance_##EXT##_init(dsp_arm_mfcc_stream_instance_##EXT##Object *self, PyObject *args, PyObject *kwds)\
+{                                                                              \
+    return 0;                                                                  \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_arm_mfcc_stream_instance_##EXT##_fftLen(dsp_arm_mfcc_stream_instance_##EXT##Object *self, PyObject *ignored)\
+{                                                                              \
+    return(Py_BuildValue("k",self->fftLen));                                   \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_arm_mfcc_stream_instance_##EXT##_hop(dsp_arm_mfcc_stream_instance_##EXT##Object *self, PyObject *ignored)\
+{                                                                              \
+    return(Py_BuildValue("k",self->hop));                                      \
+}                                                                              \
+                                                                               \
+static PyObject *                                                              \
+Method_arm_mfcc_stream_instance_##EXT##_nbSamples(dsp_arm_mfcc_stream_instance_##EXT##Object *self, PyObject *ignored)\
+{                                                                              \
+    return(Py_BuildValue("k",self->nbSamples));                                \
+}                                                                              \
+                                                                               \
+static PyMethodDef arm_mfcc_stream_instance_##EXT##_methods[] = {              \
+                                                                               \
+    {"fftLen", (PyCFunction) Method_arm_mfcc_stream_instance_##EXT##_fftLen,METH_NOARGS,"fftLen"},\
+    {"hop", (PyCFunction) Method_arm_mfcc_stream_instance_##EXT##_hop,METH_NOARGS,"hop"},\
+    {"nbSamples", (PyCFunction) Method_arm_mfcc_stream_instance_##EXT##_nbSamples,METH_NOARGS,"nbSamples"},\
+                                                                               \
+    {NULL}  /* Sentinel */                                                     \
+};                                                                             \
+                                                                               \
+DSPType(arm_mfcc_stream_instance_##EXT,arm_mfcc_stream_instance_##EXT##_new,arm_mfcc_stream_instance_##EXT##_dealloc,arm_mfcc_stream_instance_##EXT##_init,arm_mfcc_stream_instance_##EXT##_methods);
+
+MFCCSTREAMTYPE(f32,float32_t,float32_t);
+MFCCSTREAMTYPE(q31,q31_t,q31_t);
+MFCCSTREAMTYPE(q15,q15_t,q31_t);
+
+
+
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+typedef struct {
+    PyObject_HEAD
+    arm_cfft_instance_f16 *instance;
+} dsp_arm_cfft_instance_f16Object;
+
+
+static void
+arm_cfft_instance_f16_dealloc(dsp_arm_cfft_instance_f16Object* self)
+{
+    if (self->instance)
+    {
+       PyMem_Free(self->instance);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+
+static PyObject *
+arm_cfft_instance_f16_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    dsp_arm_cfft_instance_f16Object *self;
+
+    self = (dsp_arm_cfft_instance_f16Object *)type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+
+        self->instance = PyMem_Malloc(sizeof(arm_cfft_instance_f16));
+
+        self->instance->pTwiddle = NULL;
+        self->instance->pBitRevTable = NULL;
+
+    }
+
+
+    return (PyObject *)self;
+}
+
+static int
+arm_cfft_instance_f16_init(dsp_arm_cfft_instance_f16Object *self, PyObject *args, PyObject *kwds)
+{
+
+char *kwlist[] = {
+"fftLen","bitRevLength",NULL
+};
+
+if (PyArg_ParseTupleAndKeywords(args, kwds, "|hh", kwlist,&self->instance->fftLen
+,&self->instance->bitRevLength
+))
+    {
+
+
+    }
+    return 0;
+}
+
+GETFIELD(arm_cfft_instance_f16,fftLen,"h");
+GETFIELD(arm_cfft_instance_f16,bitRevLength,"h");
+
+
+static PyMethodDef arm_cfft_instance_f16_methods[] = {
+
+    {"fftLen", (PyCFunction) Method_arm_cfft_instance_f16_fftLen,METH_NOARGS,"fftLen"},
+    {"bitRevLength", (PyCFunction) Method_arm_cfft_instance_f16_bitRevLength,METH_NOARGS,"bitRevLength"},
+
+    {NULL}  /* Sentinel */
+};
+
+
+DSPType(arm_cfft_instance_f16,arm_cfft_instance_f16_new,arm_cfft_instance_f16_dealloc,arm_cfft_instance_f16_init,arm_cfft_instance_f16_methods);
+
+
+typedef struct {
+    PyObject_HEAD
+    arm_rfft_fast_instance_f16 *instance;
+} dsp_arm_rfft_fast_instance_f16Object;
+
+
+static void
+arm_rfft_fast_instance_f16_dealloc(dsp_arm_rfft_fast_instance_f16Object* self)
+{
+    if (self->instance)
+    {
+       PyMem_Free(self->instance);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+
+static PyObject *
+arm_rfft_fast_instance_f16_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    dsp_arm_rfft_fast_instance_f16Object *self;
+
+    self = (dsp_arm_rfft_fast_instance_f16Object *)type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+
+        self->instance = PyMem_Malloc(sizeof(arm_rfft_fast_instance_f16));
+
+        self->instance->pTwiddleRFFT = NULL;
+
+    }
+
+
+    return (PyObject *)self;
+}
+
+static int
+arm_rfft_fast_instance_f16_init(dsp_arm_rfft_fast_instance_f16Object *self, PyObject *args, PyObject *kwds)
+{
+
+char *kwlist[] = {
+"fftLenRFFT",NULL
+};
+
+if (PyArg_ParseTupleAndKeywords(args, kwds, "|h", kwlist,&self->instance->fftLenRFFT
+))
+    {
+
+
+    }
+    return 0;
+}
+
+GETFIELD(arm_rfft_fast_instance_f16,fftLenRFFT,"h");
+
+
+static PyMethodDef arm_rfft_fast_instance_f16_methods[] = {
+
+    {"fftLenRFFT", (PyCFunction) Method_arm_rfft_fast_instance_f16_fftLenRFFT,METH_NOARGS,"fftLenRFFT"},
+
+    {NULL}  /* Sentinel */
+};
+
+
+DSPType(arm_rfft_fast_instance_f16,arm_rfft_fast_instance_f16_new,arm_rfft_fast_instance_f16_dealloc,arm_rfft_fast_instance_f16_init,arm_rfft_fast_instance_f16_methods);
+
+
+typedef struct {
+    PyObject_HEAD
+    arm_mfcc_instance_f16 *instance;
+} dsp_arm_mfcc_instance_f16Object;
+
+static void
+arm_mfcc_instance_f16_dealloc(dsp_arm_mfcc_instance_f16Object* self)
+{
+    if (self->instance)
+    {
+       PyMem_Free(self->instance);
+    }
+
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyObject *
+arm_mfcc_instance_f16_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    dsp_arm_mfcc_instance_f16Object *self;
+
+    self = (dsp_arm_mfcc_instance_f16Object *)type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+
+        self->instance = PyMem_Malloc(sizeof(arm_mfcc_instance_f16));
+
+        self->instance->dctCoefs = NULL;
+        self->instance->filterCoefs = NULL;
+        self->instance->windowCoefs = NULL;
+        self->instance->filterPos = NULL;
+        self->instance->filterLengths = NULL;
+
+    }
+
+
+    return (PyObject *)self;
+}
+
+static int
+arm_mfcc_instance_f16_init(dsp_arm_mfcc_instance_f16Object *self, PyObject *args, PyObject *kwds)
+{
+
+char *kwlist[] = {
+"fftLen","nbMelFilters","nbDctOutputs",NULL
+};
+
+if (PyArg_ParseTupleAndKeywords(args, kwds, "|iii", kwlist,&self->instance->fftLen
+,&self->instance->nbMelFilters,&self->instance->nbDctOutputs
+))
+    {
+
+
+    }
+    return 0;
+}
+
+GETFIELD(arm_mfcc_instance_f16,fftLen,"i");
+GETFIELD(arm_mfcc_instance_f16,nbMelFilters,"i");
+GETFIELD(arm_mfcc_instance_f16,nbDctOutputs,"i");
+
+
+static PyMethodDef arm_mfcc_instance_f16_methods[] = {
+
+    {"fftLen", (PyCFunction) Method_arm_mfcc_instance_f16_fftLen,METH_NOARGS,"fftLen"},
+    {"nbMelFilters", (PyCFunction) Method_arm_mfcc_instance_f16_nbMelFilters,METH_NOARGS,"nbMelFilters"},
+    {"nbDctOutputs", (PyCFunction) Method_arm_mfcc_instance_f16_nbDctOutputs,METH_NOARGS,"nbDctOutputs"},
+
+    {NULL}  /* Sentinel */
+};
+
+
+DSPType(arm_mfcc_instance_f16,arm_mfcc_instance_f16_new,arm_mfcc_instance_f16_dealloc,arm_mfcc_instance_f16_init,arm_mfcc_instance_f16_methods);
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
 
 void typeRegistration(PyObject *module) {
 
@@ -1817,6 +2158,7 @@ void typeRegistration(PyObject *module) {
   ADDTYPE(arm_cfft_instance_f32);
   ADDTYPE(arm_rfft_instance_q15);
   ADDTYPE(arm_rfft_instance_q31);
+  ADDTYPE(arm_rfft_instance_f32);
   ADDTYPE(arm_rfft_fast_instance_f32);
   ADDTYPE(arm_rfft_fast_instance_f64);
   ADDTYPE(arm_dct4_instance_f32);
@@ -1827,6 +2169,14 @@ void typeRegistration(PyObject *module) {
   ADDTYPE(arm_mfcc_instance_f32);
   ADDTYPE(arm_mfcc_instance_q31);
   ADDTYPE(arm_mfcc_instance_q15);
+  ADDTYPE(arm_mfcc_stream_instance_f32);
+  ADDTYPE(arm_mfcc_stream_instance_q31);
+  ADDTYPE(arm_mfcc_stream_instance_q15);
+#if defined(ARM_FLOAT16_SUPPORTED)
+  ADDTYPE(arm_cfft_instance_f16);
+  ADDTYPE(arm_rfft_fast_instance_f16);
+  ADDTYPE(arm_mfcc_instance_f16);
+#endif
 }
 
 
@@ -1860,22 +2210,39 @@ cmsis_arm_cfft_radix2_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix2_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix2_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
+  q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix2_instance_q15Object *selfS = (dsp_arm_cfft_radix2_instance_q15Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
 
-    arm_cfft_radix2_q15(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,q15_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix2_q15(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -1910,22 +2277,39 @@ cmsis_arm_cfft_radix4_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix4_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix4_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
+  q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix4_instance_q15Object *selfS = (dsp_arm_cfft_radix4_instance_q15Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
 
-    arm_cfft_radix4_q15(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,q15_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix4_q15(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -1960,22 +2344,39 @@ cmsis_arm_cfft_radix2_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix2_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix2_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
+  q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix2_instance_q31Object *selfS = (dsp_arm_cfft_radix2_instance_q31Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
 
-    arm_cfft_radix2_q31(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,q31_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix2_q31(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -1983,22 +2384,39 @@ cmsis_arm_cfft_radix2_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix4_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix4_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q31_t *pSrc_converted=NULL; // input
+  q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix4_instance_q31Object *selfS = (dsp_arm_cfft_radix4_instance_q31Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
 
-    arm_cfft_radix4_q31(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,q31_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix4_q31(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -2060,22 +2478,39 @@ cmsis_arm_cfft_radix2_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix2_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix2_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix2_instance_f32Object *selfS = (dsp_arm_cfft_radix2_instance_f32Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
 
-    arm_cfft_radix2_f32(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,float32_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix2_f32(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -2110,22 +2545,39 @@ cmsis_arm_cfft_radix4_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_radix4_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_radix4_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   float32_t *pSrc_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_radix4_instance_f32Object *selfS = (dsp_arm_cfft_radix4_instance_f32Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
 
-    arm_cfft_radix4_f32(selfS->instance,pSrc_converted);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pSrc_converted,float32_t,arraySizepSrc,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_radix4_f32(selfS->instance,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
     FREEARGUMENT(pSrc_converted);
-    Py_RETURN_NONE;
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
 
   }
   return(NULL);
@@ -2133,26 +2585,40 @@ cmsis_arm_cfft_radix4_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_q15(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p1=NULL; // input
   q15_t *p1_converted=NULL; // input
+  q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
   uint32_t bitReverseFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag))
+  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_instance_q15Object *selfS = (dsp_arm_cfft_instance_q15Object *)S;
-    GETARGUMENT(p1,NPY_INT16,int16_t,int16_t);
+    uint32_t outputLength = 2*selfS->instance->fftLen;
+    GETARGUMENT(p1,NPY_INT16,int16_t,q15_t);
+
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
 
-    arm_cfft_q15(selfS->instance,p1_converted,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
- INT16ARRAY1(p1OBJ,2*selfS->instance->fftLen,p1_converted);
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,p1_converted,q15_t,arraySizep1,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_q15(selfS->instance,pDst,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
-    PyObject *pythonResult = Py_BuildValue("O",p1OBJ);
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
+    FREEARGUMENT(p1_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2161,26 +2627,40 @@ cmsis_arm_cfft_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_q31(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p1=NULL; // input
   q31_t *p1_converted=NULL; // input
+  q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
   uint32_t bitReverseFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag))
+  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_instance_q31Object *selfS = (dsp_arm_cfft_instance_q31Object *)S;
-    GETARGUMENT(p1,NPY_INT32,int32_t,int32_t);
+    uint32_t outputLength = 2*selfS->instance->fftLen;
+    GETARGUMENT(p1,NPY_INT32,int32_t,q31_t);
+
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
 
-    arm_cfft_q31(selfS->instance,p1_converted,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
- INT32ARRAY1(p1OBJ,2*selfS->instance->fftLen,p1_converted);
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,p1_converted,q31_t,arraySizep1,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_q31(selfS->instance,pDst,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
-    PyObject *pythonResult = Py_BuildValue("O",p1OBJ);
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
+    FREEARGUMENT(p1_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2190,26 +2670,40 @@ cmsis_arm_cfft_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_f64(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p1=NULL; // input
   float64_t *p1_converted=NULL; // input
+  float64_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
   uint32_t bitReverseFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag))
+  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_instance_f64Object *selfS = (dsp_arm_cfft_instance_f64Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(p1,NPY_DOUBLE,double,float64_t);
 
-    arm_cfft_f64(selfS->instance,p1_converted,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
-    FLOAT64ARRAY1(p1OBJ,2*selfS->instance->fftLen,p1_converted);
+    GETOUTPUT(pDst,float64_t,NPY_DOUBLE,outputLength);
 
-    PyObject *pythonResult = Py_BuildValue("O",p1OBJ);
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,p1_converted,float64_t,arraySizep1,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_f64(selfS->instance,pDst,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_DOUBLE);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
+    FREEARGUMENT(p1_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2218,26 +2712,97 @@ cmsis_arm_cfft_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_cfft_f32(PyObject *obj, PyObject *args)
+cmsis_arm_cfft_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p1=NULL; // input
   float32_t *p1_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
   uint32_t bitReverseFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag))
+  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_cfft_instance_f32Object *selfS = (dsp_arm_cfft_instance_f32Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
     GETARGUMENT(p1,NPY_DOUBLE,double,float32_t);
 
-    arm_cfft_f32(selfS->instance,p1_converted,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
- FLOATARRAY1(p1OBJ,2*selfS->instance->fftLen,p1_converted);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
 
-    PyObject *pythonResult = Py_BuildValue("O",p1OBJ);
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,p1_converted,float32_t,arraySizep1,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_f32(selfS->instance,pDst,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
 
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(p1_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_cfft_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *frames=NULL; // input
+  float32_t *frames_converted=NULL; // input
+  uint32_t ifftFlag; // input
+  uint32_t bitReverseFlag; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"OOii",&S,&frames,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_cfft_instance_f32Object *selfS = (dsp_arm_cfft_instance_f32Object *)S;
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);
+    uint32_t nbFrames = nbRowsframes ;
+    uint32_t inputLength = 2*selfS->instance->fftLen ;
+    uint32_t outputLength = inputLength ;
+
+    if (!checkFrameLength(frames_converted,nbColsframes,inputLength))
+    {
+       FREEARGUMENT(frames_converted);
+       return(NULL);
+    }
+
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbFrames,outputLength);
+
+    if (pDst)
+    {
+      float32_t *pIn = frames_converted;
+      float32_t *pOut = pDst;
+
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < nbFrames; i++)
+      {
+        /* The transform is in-place : it is computed in the output */
+        memcpy(pOut,pIn,sizeof(float32_t)*inputLength);
+        arm_cfft_f32(selfS->instance,pOut,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+        pIn += inputLength;
+        pOut += outputLength;
+      }
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(frames_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2273,15 +2838,15 @@ cmsis_arm_rfft_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_rfft_q15(PyObject *obj, PyObject *args)
+cmsis_arm_rfft_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *pSrc=NULL; // input
   q15_t *pSrc_converted=NULL; // input
   q15_t *pDst=NULL; // output
-
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
      int inputSize;
      int outputSize;
@@ -2298,18 +2863,22 @@ cmsis_arm_rfft_q15(PyObject *obj, PyObject *args)
         outputSize = 2*inputSize+2;
      }
 
-    GETARGUMENT(pSrc,NPY_INT16,int16_t,int16_t);
-
-    pDst=PyMem_Malloc(sizeof(q15_t)*outputSize);
+    GETARGUMENTCOPY(pSrc,NPY_INT16,int16_t,int16_t);
 
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputSize);
 
-    arm_rfft_q15(selfS->instance,pSrc_converted,pDst);
- INT16ARRAY1(pDstOBJ,outputSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_rfft_q15(selfS->instance,pSrc_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputSize,pDst,NPY_INT16);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2345,7 +2914,7 @@ cmsis_arm_rfft_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_rfft_q31(PyObject *obj, PyObject *args)
+cmsis_arm_rfft_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -2355,7 +2924,8 @@ cmsis_arm_rfft_q31(PyObject *obj, PyObject *args)
 
 
 
-  if (PyArg_ParseTuple(args,"OO",&S,&pSrc))
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))
   {
      int inputSize;
      int outputSize;
@@ -2372,18 +2942,22 @@ cmsis_arm_rfft_q31(PyObject *obj, PyObject *args)
         outputSize = 2*inputSize+2;
      }
   
-    GETARGUMENT(pSrc,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pSrc,NPY_INT32,int32_t,int32_t);
 
-    pDst=PyMem_Malloc(sizeof(q31_t)*outputSize);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputSize);
 
-
-    arm_rfft_q31(selfS->instance,pSrc_converted,pDst);
- INT32ARRAY1(pDstOBJ,outputSize,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_rfft_q31(selfS->instance,pSrc_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputSize,pDst,NPY_INT32);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pSrc_converted);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2433,12 +3007,14 @@ cmsis_arm_rfft_f32(PyObject *obj, PyObject *args)
   {
 
     dsp_arm_rfft_instance_f32Object *selfS = (dsp_arm_rfft_instance_f32Object *)S;
-    GETARGUMENT(pSrc,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pSrc,NPY_DOUBLE,double,float32_t);
 
     pDst=PyMem_Malloc(sizeof(float32_t)*2*selfS->instance->fftLenReal);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_rfft_f32(selfS->instance,pSrc_converted,pDst);
+    Py_END_ALLOW_THREADS
  FLOATARRAY1(pDstOBJ,selfS->instance->fftLenReal+1,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -2478,31 +3054,36 @@ cmsis_arm_rfft_fast_init_f64(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_rfft_fast_f64(PyObject *obj, PyObject *args)
+cmsis_arm_rfft_fast_f64(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p=NULL; // input
   float64_t *p_converted=NULL; // input
   float64_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOi",&S,&p,&ifftFlag))
+  if (PyArg_ParseTuple(args,"OOi",&S,&p,&ifftFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_rfft_fast_instance_f64Object *selfS = (dsp_arm_rfft_fast_instance_f64Object *)S;
-    GETARGUMENT(p,NPY_DOUBLE,double,float64_t);
+    GETARGUMENTCOPY(p,NPY_DOUBLE,double,float64_t);
 
-    pOut=PyMem_Malloc(sizeof(float64_t)*selfS->instance->fftLenRFFT);
+    GETOUTPUT(pOut,float64_t,NPY_DOUBLE,selfS->instance->fftLenRFFT);
 
-
-    arm_rfft_fast_f64(selfS->instance,p_converted,pOut,(uint8_t)ifftFlag);
- FLOAT64ARRAY1(pOutOBJ,selfS->instance->fftLenRFFT,pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_rfft_fast_f64(selfS->instance,p_converted,pOut,(uint8_t)ifftFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,selfS->instance->fftLenRFFT,pOut,NPY_DOUBLE);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(p_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
     return(pythonResult);
 
   }
@@ -2538,31 +3119,102 @@ cmsis_arm_rfft_fast_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_rfft_fast_f32(PyObject *obj, PyObject *args)
+cmsis_arm_rfft_fast_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
   PyObject *p=NULL; // input
   float32_t *p_converted=NULL; // input
   float32_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
   uint32_t ifftFlag; // input
 
-  if (PyArg_ParseTuple(args,"OOi",&S,&p,&ifftFlag))
+  if (PyArg_ParseTuple(args,"OOi",&S,&p,&ifftFlag) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_rfft_fast_instance_f32Object *selfS = (dsp_arm_rfft_fast_instance_f32Object *)S;
-    GETARGUMENT(p,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(p,NPY_DOUBLE,double,float32_t);
 
-    pOut=PyMem_Malloc(sizeof(float32_t)*(selfS->instance->fftLenRFFT));
+    GETOUTPUT(pOut,float32_t,NPY_FLOAT,(selfS->instance->fftLenRFFT));
 
-
-    arm_rfft_fast_f32(selfS->instance,p_converted,pOut,(uint8_t)ifftFlag);
- FLOATARRAY1(pOutOBJ,(selfS->instance->fftLenRFFT),pOut);
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_rfft_fast_f32(selfS->instance,p_converted,pOut,(uint8_t)ifftFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,(selfS->instance->fftLenRFFT),pOut,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
 
     FREEARGUMENT(p_converted);
-    Py_DECREF(pOutOBJ);
+    Py_XDECREF(pOutOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_rfft_fast_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *frames=NULL; // input
+  float32_t *frames_converted=NULL; // input
+  uint32_t ifftFlag; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"OOi",&S,&frames,&ifftFlag) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_rfft_fast_instance_f32Object *selfS = (dsp_arm_rfft_fast_instance_f32Object *)S;
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);
+    uint32_t nbFrames = nbRowsframes ;
+    uint32_t inputLength = selfS->instance->fftLenRFFT ;
+    uint32_t outputLength = inputLength ;
+
+    if (!checkFrameLength(frames_converted,nbColsframes,inputLength))
+    {
+       FREEARGUMENT(frames_converted);
+       return(NULL);
+    }
+
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbFrames,outputLength);
+
+    if (pDst)
+    {
+      float32_t *pIn = frames_converted;
+      float32_t *pOut = pDst;
+      /* The input of the rfft is modified by the kernel */
+      float32_t *pTmp = PyMem_Malloc(sizeof(float32_t)*inputLength);
+
+      if (pTmp == NULL)
+      {
+        FREEOUTPUT(pDst);
+        FREEARGUMENT(frames_converted);
+        return(PyErr_NoMemory());
+      }
+
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < nbFrames; i++)
+      {
+        memcpy(pTmp,pIn,sizeof(float32_t)*inputLength);
+        arm_rfft_fast_f32(selfS->instance,pTmp,pOut,(uint8_t)ifftFlag);
+        pIn += inputLength;
+        pOut += outputLength;
+      }
+      Py_END_ALLOW_THREADS
+
+      PyMem_Free(pTmp);
+    }
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(frames_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2590,6 +3242,12 @@ cmsis_arm_dct4_init_f32(PyObject *obj, PyObject *args)
     uint32_t outputLength = selfS->instance->N ;
 
     arm_status returnValue = arm_dct4_init_f32(selfS->instance,selfS_RFFT->instance,selfS_CFFT->instance,N,Nby2,normalize);
+    Py_INCREF(S_RFFT);
+    Py_INCREF(S_CFFT);
+    Py_XDECREF(selfS->rfft);
+    Py_XDECREF(selfS->cfft);
+    selfS->rfft = S_RFFT;
+    selfS->cfft = S_CFFT;
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
 
     PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
@@ -2603,7 +3261,7 @@ cmsis_arm_dct4_init_f32(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_dct4_f32(PyObject *obj, PyObject *args)
+cmsis_arm_dct4_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -2611,21 +3269,99 @@ cmsis_arm_dct4_f32(PyObject *obj, PyObject *args)
   float32_t *pState_converted=NULL; // input
   PyObject *pInlineBuffer=NULL; // input
   float32_t *pInlineBuffer_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer))
+  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_dct4_instance_f32Object *selfS = (dsp_arm_dct4_instance_f32Object *)S;
-    GETARGUMENT(pState,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pState,NPY_DOUBLE,double,float32_t);
     GETARGUMENT(pInlineBuffer,NPY_DOUBLE,double,float32_t);
     uint32_t outputLength = selfS->instance->N ;
 
-    arm_dct4_f32(selfS->instance,pState_converted,pInlineBuffer_converted);
- FLOATARRAY1(pInlineBufferOBJ,outputLength,pInlineBuffer_converted);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,outputLength);
 
-    PyObject *pythonResult = Py_BuildValue("O",pInlineBufferOBJ);
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pInlineBuffer_converted,float32_t,arraySizepInlineBuffer,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_dct4_f32(selfS->instance,pState_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pState_converted);
+    FREEARGUMENT(pInlineBuffer_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_dct4_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *frames=NULL; // input
+  float32_t *frames_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"OO",&S,&frames) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_dct4_instance_f32Object *selfS = (dsp_arm_dct4_instance_f32Object *)S;
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);
+    uint32_t nbFrames = nbRowsframes ;
+    uint32_t inputLength = selfS->instance->N ;
+    uint32_t outputLength = inputLength ;
+
+    if (!checkFrameLength(frames_converted,nbColsframes,inputLength))
+    {
+       FREEARGUMENT(frames_converted);
+       return(NULL);
+    }
+
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbFrames,outputLength);
+
+    if (pDst)
+    {
+      float32_t *pIn = frames_converted;
+      float32_t *pOut = pDst;
+      float32_t *pState = PyMem_Malloc(sizeof(float32_t)*2*inputLength);
+
+      if (pState == NULL)
+      {
+        FREEOUTPUT(pDst);
+        FREEARGUMENT(frames_converted);
+        return(PyErr_NoMemory());
+      }
+
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < nbFrames; i++)
+      {
+        /* The transform is in-place : it is computed in the output */
+        memcpy(pOut,pIn,sizeof(float32_t)*inputLength);
+        arm_dct4_f32(selfS->instance,pState,pOut);
+        pIn += inputLength;
+        pOut += outputLength;
+      }
+      Py_END_ALLOW_THREADS
+
+      PyMem_Free(pState);
+    }
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(frames_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2653,6 +3389,12 @@ cmsis_arm_dct4_init_q31(PyObject *obj, PyObject *args)
     uint32_t outputLength = selfS->instance->N ;
 
     arm_status returnValue = arm_dct4_init_q31(selfS->instance,selfS_RFFT->instance,selfS_CFFT->instance,N,Nby2,normalize);
+    Py_INCREF(S_RFFT);
+    Py_INCREF(S_CFFT);
+    Py_XDECREF(selfS->rfft);
+    Py_XDECREF(selfS->cfft);
+    selfS->rfft = S_RFFT;
+    selfS->cfft = S_CFFT;
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
 
     PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
@@ -2666,7 +3408,7 @@ cmsis_arm_dct4_init_q31(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_dct4_q31(PyObject *obj, PyObject *args)
+cmsis_arm_dct4_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -2674,21 +3416,34 @@ cmsis_arm_dct4_q31(PyObject *obj, PyObject *args)
   q31_t *pState_converted=NULL; // input
   PyObject *pInlineBuffer=NULL; // input
   q31_t *pInlineBuffer_converted=NULL; // input
+  q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer))
+  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_dct4_instance_q31Object *selfS = (dsp_arm_dct4_instance_q31Object *)S;
-    GETARGUMENT(pState,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pInlineBuffer,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pState,NPY_INT32,int32_t,q31_t);
+    GETARGUMENT(pInlineBuffer,NPY_INT32,int32_t,q31_t);
     uint32_t outputLength = selfS->instance->N ;
 
-    arm_dct4_q31(selfS->instance,pState_converted,pInlineBuffer_converted);
- INT32ARRAY1(pInlineBufferOBJ,outputLength,pInlineBuffer_converted);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pInlineBuffer_converted,q31_t,arraySizepInlineBuffer,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_dct4_q31(selfS->instance,pState_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT32);
 
-    PyObject *pythonResult = Py_BuildValue("O",pInlineBufferOBJ);
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pState_converted);
+    FREEARGUMENT(pInlineBuffer_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2716,6 +3471,12 @@ cmsis_arm_dct4_init_q15(PyObject *obj, PyObject *args)
     uint32_t outputLength = selfS->instance->N ;
 
     arm_status returnValue = arm_dct4_init_q15(selfS->instance,selfS_RFFT->instance,selfS_CFFT->instance,N,Nby2,normalize);
+    Py_INCREF(S_RFFT);
+    Py_INCREF(S_CFFT);
+    Py_XDECREF(selfS->rfft);
+    Py_XDECREF(selfS->cfft);
+    selfS->rfft = S_RFFT;
+    selfS->cfft = S_CFFT;
     PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
 
     PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
@@ -2729,7 +3490,7 @@ cmsis_arm_dct4_init_q15(PyObject *obj, PyObject *args)
 
 
 static PyObject *
-cmsis_arm_dct4_q15(PyObject *obj, PyObject *args)
+cmsis_arm_dct4_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -2737,21 +3498,34 @@ cmsis_arm_dct4_q15(PyObject *obj, PyObject *args)
   q15_t *pState_converted=NULL; // input
   PyObject *pInlineBuffer=NULL; // input
   q15_t *pInlineBuffer_converted=NULL; // input
+  q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
 
-  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer))
+  if (PyArg_ParseTuple(args,"OOO",&S,&pState,&pInlineBuffer) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_dct4_instance_q15Object *selfS = (dsp_arm_dct4_instance_q15Object *)S;
-    GETARGUMENT(pState,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pInlineBuffer,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pState,NPY_INT16,int16_t,q15_t);
+    GETARGUMENT(pInlineBuffer,NPY_INT16,int16_t,q15_t);
     uint32_t outputLength = selfS->instance->N ;
 
-    arm_dct4_q15(selfS->instance,pState_converted,pInlineBuffer_converted);
- INT16ARRAY1(pInlineBufferOBJ,outputLength,pInlineBuffer_converted);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,pInlineBuffer_converted,q15_t,arraySizepInlineBuffer,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_dct4_q15(selfS->instance,pState_converted,pDst);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_INT16);
 
-    PyObject *pythonResult = Py_BuildValue("O",pInlineBufferOBJ);
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
 
     FREEARGUMENT(pState_converted);
+    FREEARGUMENT(pInlineBuffer_converted);
+    Py_XDECREF(pDstOBJ);
     return(pythonResult);
 
   }
@@ -2894,11 +3668,11 @@ cmsis_arm_mfcc_init_f32(PyObject *obj, PyObject *args)
 
     dsp_arm_mfcc_instance_f32Object *selfS = (dsp_arm_mfcc_instance_f32Object *)S;
 
-    GETARGUMENT(pdctCoefs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterCoefs,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(pwindowCoefs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pdctCoefs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterCoefs,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(pwindowCoefs,NPY_DOUBLE,double,float32_t);
 
 
     arm_status returnValue = arm_mfcc_init_f32(selfS->instance,
@@ -2918,7 +3692,7 @@ cmsis_arm_mfcc_init_f32(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_mfcc_f32(PyObject *obj, PyObject *args)
+cmsis_arm_mfcc_f32(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -2928,22 +3702,27 @@ cmsis_arm_mfcc_f32(PyObject *obj, PyObject *args)
   PyObject *tmp=NULL; // input
   float32_t *tmp_converted=NULL; // input
 
-  float32_t *pDst;
-  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp))
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_mfcc_instance_f32Object *selfS = (dsp_arm_mfcc_instance_f32Object *)S;
-    GETARGUMENT(p1,NPY_DOUBLE,double,float32_t);
-    GETARGUMENT(tmp,NPY_DOUBLE,double,float32_t);
-
-    pDst=PyMem_Malloc(sizeof(float32_t)*selfS->instance->nbDctOutputs);
+    GETARGUMENTCOPY(p1,NPY_DOUBLE,double,float32_t);
+    GETARGUMENTCOPY(tmp,NPY_DOUBLE,double,float32_t);
 
-    arm_mfcc_f32(selfS->instance,p1_converted,pDst,tmp_converted);
+    GETOUTPUT(pDst,float32_t,NPY_FLOAT,selfS->instance->nbDctOutputs);
 
-    FLOATARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst);
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mfcc_f32(selfS->instance,p1_converted,pDst,tmp_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst,NPY_FLOAT);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
 
     FREEARGUMENT(p1_converted);
     FREEARGUMENT(tmp_converted);
@@ -2957,6 +3736,75 @@ cmsis_arm_mfcc_f32(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+static PyObject *
+cmsis_arm_mfcc_batch_f32(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *frames=NULL; // input
+  float32_t *frames_converted=NULL; // input
+  float32_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+
+  if (PyArg_ParseTuple(args,"OO",&S,&frames) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_mfcc_instance_f32Object *selfS = (dsp_arm_mfcc_instance_f32Object *)S;
+    GETFRAMESARGUMENT(frames,NPY_DOUBLE,double,float32_t);
+    uint32_t nbFrames = nbRowsframes ;
+    uint32_t inputLength = selfS->instance->fftLen ;
+    uint32_t outputLength = selfS->instance->nbDctOutputs ;
+
+    if (!checkFrameLength(frames_converted,nbColsframes,inputLength))
+    {
+       FREEARGUMENT(frames_converted);
+       return(NULL);
+    }
+
+    GETOUTPUT2D(pDst,float32_t,NPY_FLOAT,nbFrames,outputLength);
+
+    if (pDst)
+    {
+      float32_t *pIn = frames_converted;
+      float32_t *pOut = pDst;
+      /* The input of the mfcc is modified by the kernel */
+      float32_t *pSrc = PyMem_Malloc(sizeof(float32_t)*inputLength);
+      float32_t *pTmp = PyMem_Malloc(sizeof(float32_t)*(2*inputLength+2));
+
+      if ((pSrc == NULL) || (pTmp == NULL))
+      {
+        PyMem_Free(pSrc);
+        PyMem_Free(pTmp);
+        FREEOUTPUT(pDst);
+        FREEARGUMENT(frames_converted);
+        return(PyErr_NoMemory());
+      }
+
+      Py_BEGIN_ALLOW_THREADS
+      for(uint32_t i=0; i < nbFrames; i++)
+      {
+        memcpy(pSrc,pIn,sizeof(float32_t)*inputLength);
+        arm_mfcc_f32(selfS->instance,pSrc,pOut,pTmp);
+        pIn += inputLength;
+        pOut += outputLength;
+      }
+      Py_END_ALLOW_THREADS
+
+      PyMem_Free(pSrc);
+      PyMem_Free(pTmp);
+    }
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,outputLength,pDst,NPY_FLOAT);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(frames_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
 static PyObject *
 cmsis_arm_mfcc_init_q15(PyObject *obj, PyObject *args)
 {
@@ -2985,11 +3833,11 @@ cmsis_arm_mfcc_init_q15(PyObject *obj, PyObject *args)
 
     dsp_arm_mfcc_instance_q15Object *selfS = (dsp_arm_mfcc_instance_q15Object *)S;
 
-    GETARGUMENT(pdctCoefs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterCoefs,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(pwindowCoefs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pdctCoefs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterCoefs,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(pwindowCoefs,NPY_INT16,int16_t,int16_t);
 
 
     arm_status returnValue = arm_mfcc_init_q15(selfS->instance,
@@ -3009,7 +3857,7 @@ cmsis_arm_mfcc_init_q15(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_mfcc_q15(PyObject *obj, PyObject *args)
+cmsis_arm_mfcc_q15(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -3019,23 +3867,29 @@ cmsis_arm_mfcc_q15(PyObject *obj, PyObject *args)
   PyObject *tmp=NULL; // input
   q31_t *tmp_converted=NULL; // input
 
-  q15_t *pDst;
-  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp))
+  q15_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_mfcc_instance_q15Object *selfS = (dsp_arm_mfcc_instance_q15Object *)S;
-    GETARGUMENT(p1,NPY_INT16,int16_t,int16_t);
-    GETARGUMENT(tmp,NPY_INT32,int32_t,int32_t);
-
-    pDst=PyMem_Malloc(sizeof(q15_t)*selfS->instance->nbDctOutputs);
+    GETARGUMENTCOPY(p1,NPY_INT16,int16_t,int16_t);
+    GETARGUMENTCOPY(tmp,NPY_INT32,int32_t,int32_t);
 
-    arm_status status = arm_mfcc_q15(selfS->instance,p1_converted,pDst,tmp_converted);
+    GETOUTPUT(pDst,q15_t,NPY_INT16,selfS->instance->nbDctOutputs);
 
-    INT16ARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst);
+    arm_status status=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      status = arm_mfcc_q15(selfS->instance,p1_converted,pDst,tmp_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst,NPY_INT16);
 
     PyObject* theReturnOBJ=Py_BuildValue("i",status);
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     Py_DECREF(theReturnOBJ);
 
     FREEARGUMENT(p1_converted);
@@ -3077,11 +3931,11 @@ cmsis_arm_mfcc_init_q31(PyObject *obj, PyObject *args)
 
     dsp_arm_mfcc_instance_q31Object *selfS = (dsp_arm_mfcc_instance_q31Object *)S;
 
-    GETARGUMENT(pdctCoefs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
-    GETARGUMENT(pfilterCoefs,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(pwindowCoefs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pdctCoefs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterCoefs,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(pwindowCoefs,NPY_INT32,int32_t,int32_t);
 
 
     arm_status returnValue = arm_mfcc_init_q31(selfS->instance,
@@ -3101,7 +3955,7 @@ cmsis_arm_mfcc_init_q31(PyObject *obj, PyObject *args)
 }
 
 static PyObject *
-cmsis_arm_mfcc_q31(PyObject *obj, PyObject *args)
+cmsis_arm_mfcc_q31(PyObject *obj, PyObject *args, PyObject *kwds)
 {
 
   PyObject *S=NULL; // input
@@ -3111,23 +3965,29 @@ cmsis_arm_mfcc_q31(PyObject *obj, PyObject *args)
   PyObject *tmp=NULL; // input
   q31_t *tmp_converted=NULL; // input
 
-  q31_t *pDst;
-  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp))
+  q31_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp) && parseOutKeyword(args,kwds,&out))
   {
 
     dsp_arm_mfcc_instance_q31Object *selfS = (dsp_arm_mfcc_instance_q31Object *)S;
-    GETARGUMENT(p1,NPY_INT32,int32_t,int32_t);
-    GETARGUMENT(tmp,NPY_INT32,int32_t,int32_t);
-
-    pDst=PyMem_Malloc(sizeof(q31_t)*selfS->instance->nbDctOutputs);
+    GETARGUMENTCOPY(p1,NPY_INT32,int32_t,int32_t);
+    GETARGUMENTCOPY(tmp,NPY_INT32,int32_t,int32_t);
 
-    arm_status status = arm_mfcc_q31(selfS->instance,p1_converted,pDst,tmp_converted);
+    GETOUTPUT(pDst,q31_t,NPY_INT32,selfS->instance->nbDctOutputs);
 
-    INT32ARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst);
+    arm_status status=ARM_MATH_SUCCESS;
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      status = arm_mfcc_q31(selfS->instance,p1_converted,pDst,tmp_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst,NPY_INT32);
 
     PyObject* theReturnOBJ=Py_BuildValue("i",status);
     PyObject *pythonResult = Py_BuildValue("OO",theReturnOBJ,pDstOBJ);
-    Py_DECREF(pDstOBJ);
+    Py_XDECREF(pDstOBJ);
     Py_DECREF(theReturnOBJ);
 
     FREEARGUMENT(p1_converted);
@@ -3141,6 +4001,470 @@ cmsis_arm_mfcc_q31(PyObject *obj, PyObject *args)
   return(NULL);
 }
 
+/*
+
+Number of frames for nbNew new samples
+
+*/
+static npy_intp
+mfccStreamNbFrames(uint32_t nbSamples,npy_intp nbNew,uint32_t fftLen,uint32_t hop)
+{
+    npy_intp total = nbSamples + nbNew;
+    return(total >= fftLen ? (total - fftLen) / hop + 1 : 0);
+}
+
+/*
+
+The stream is initialized with an initialized MFCC instance and the hop
+between two frames (between 1 and fftLen). The buffered samples are
+cleared. The old buffers are released if the stream is initialized again.
+
+*/
+#define MFCCSTREAMINIT(EXT,TYP,TMPTYP)                                                        \
+static PyObject *                                                                             \
+cmsis_arm_mfcc_stream_init_##EXT(PyObject *obj, PyObject *args)                               \
+{                                                                                             \
+                                                                                              \
+  PyObject *S=NULL; /* input */                                                               \
+  PyObject *mfcc=NULL; /* input */                                                            \
+  uint32_t hop; /* input */                                                                   \
+                                                                                              \
+  if (PyArg_ParseTuple(args,"OO!I",&S,&dsp_arm_mfcc_instance_##EXT##Type,&mfcc,&hop))         \
+  {                                                                                           \
+                                                                                              \
+    dsp_arm_mfcc_stream_instance_##EXT##Object *selfS = (dsp_arm_mfcc_stream_instance_##EXT##Object *)S;\
+    arm_mfcc_instance_##EXT *instance = ((dsp_arm_mfcc_instance_##EXT##Object *)mfcc)->instance;\
+    uint32_t fftLen = instance->fftLen;                                                       \
+                                                                                              \
+    if ((instance->dctCoefs == NULL) || (fftLen == 0))                                        \
+    {                                                                                         \
+       PyErr_SetString(PyExc_ValueError,"the MFCC instance is not initialized");              \
+       return(NULL);                                                                          \
+    }                                                                                         \
+                                                                                              \
+    if ((hop == 0) || (hop > fftLen))                                                         \
+    {                                                                                         \
+       PyErr_Format(PyExc_ValueError,"the hop must be between 1 and %u",fftLen);              \
+       return(NULL);                                                                          \
+    }                                                                                         \
+                                                                                              \
+    Py_INCREF(mfcc);                                                                          \
+    Py_XDECREF(selfS->mfcc);                                                                  \
+    selfS->mfcc = mfcc;                                                                       \
+                                                                                              \
+    PyMem_Free(selfS->pBuffer);                                                               \
+    PyMem_Free(selfS->pFrame);                                                                \
+    PyMem_Free(selfS->pTmp);                                                                  \
+    selfS->fftLen = fftLen;                                                                   \
+    selfS->hop = hop;                                                                         \
+    selfS->nbSamples = 0;                                                                     \
+    selfS->pBuffer = PyMem_Malloc(sizeof(TYP)*fftLen);                                        \
+    selfS->pFrame = PyMem_Malloc(sizeof(TYP)*fftLen);                                         \
+    /* Same size as the temporary buffer of arm_mfcc_batch_f32 */                             \
+    selfS->pTmp = PyMem_Malloc(sizeof(TMPTYP)*(2*fftLen+2));                                  \
+                                                                                              \
+    if ((selfS->pBuffer == NULL) || (selfS->pFrame == NULL) || (selfS->pTmp == NULL))         \
+    {                                                                                         \
+       PyMem_Free(selfS->pBuffer);                                                            \
+       PyMem_Free(selfS->pFrame);                                                             \
+       PyMem_Free(selfS->pTmp);                                                               \
+       selfS->pBuffer = NULL;                                                                 \
+       selfS->pFrame = NULL;                                                                  \
+       selfS->pTmp = NULL;                                                                    \
+       selfS->fftLen = 0;                                                                     \
+       Py_CLEAR(selfS->mfcc);                                                                 \
+       return(PyErr_NoMemory());                                                              \
+    }                                                                                         \
+                                                                                              \
+    Py_RETURN_NONE;                                                                           \
+                                                                                              \
+  }                                                                                           \
+  return(NULL);                                                                               \
+}                                                                                             \
+                                                                                              \
+static PyObject *                                                                             \
+cmsis_arm_mfcc_stream_reset_##EXT(PyObject *obj, PyObject *args)                              \
+{                                                                                             \
+  PyObject *S=NULL; /* input */                                                               \
+                                                                                              \
+  if (PyArg_ParseTuple(args,"O",&S))                                                          \
+  {                                                                                           \
+    dsp_arm_mfcc_stream_instance_##EXT##Object *selfS = (dsp_arm_mfcc_stream_instance_##EXT##Object *)S;\
+    selfS->nbSamples = 0;                                                                     \
+    Py_RETURN_NONE;                                                                           \
+  }                                                                                           \
+  return(NULL);                                                                               \
+}
+
+MFCCSTREAMINIT(f32,float32_t,float32_t);
+MFCCSTREAMINIT(q31,q31_t,q31_t);
+MFCCSTREAMINIT(q15,q15_t,q31_t);
+
+/*
+
+MFCC of all the frames completed by a chunk of samples.
+The result has one row of nbDctOutputs values per frame.
+
+Frame f is starting at f*hop in the stream made of the buffered
+samples followed by the chunk. The samples after the last frame
+are buffered for the next chunk.
+
+*/
+#define MFCCSTREAMFRAMES(EXT,TYP,MFCC)                                                        \
+static arm_status                                                                             \
+mfccStreamFrames_##EXT(dsp_arm_mfcc_stream_instance_##EXT##Object *selfS,                     \
+   const TYP *pSrc,npy_intp nbNew,npy_intp nbFrames,uint32_t nbDct,TYP *pDst)                 \
+{                                                                                             \
+    arm_status status = ARM_MATH_SUCCESS;                                                     \
+    arm_mfcc_instance_##EXT *instance = ((dsp_arm_mfcc_instance_##EXT##Object *)selfS->mfcc)->instance;\
+    const uint32_t fftLen = selfS->fftLen;                                                    \
+    const npy_intp nb = selfS->nbSamples;                                                     \
+    const npy_intp total = nb + nbNew;                                                        \
+    npy_intp pos = 0;                                                                         \
+                                                                                              \
+    for(npy_intp f=0; f < nbFrames; f++)                                                      \
+    {                                                                                         \
+        if (pos < nb)                                                                         \
+        {                                                                                     \
+           npy_intp nbOld = nb - pos;                                                         \
+           memcpy(selfS->pFrame,selfS->pBuffer + pos,sizeof(TYP)*nbOld);                      \
+           memcpy(selfS->pFrame + nbOld,pSrc,sizeof(TYP)*(fftLen - nbOld));                   \
+        }                                                                                     \
+        else                                                                                  \
+        {                                                                                     \
+           memcpy(selfS->pFrame,pSrc + (pos - nb),sizeof(TYP)*fftLen);                        \
+        }                                                                                     \
+        arm_status frameStatus = MFCC(instance,selfS->pFrame,pDst + f*nbDct,selfS->pTmp);     \
+        if (frameStatus != ARM_MATH_SUCCESS)                                                  \
+        {                                                                                     \
+           status = frameStatus;                                                              \
+        }                                                                                     \
+        pos += selfS->hop;                                                                    \
+    }                                                                                         \
+                                                                                              \
+    /* Samples kept for the next frames */                                                    \
+    if (pos < nb)                                                                             \
+    {                                                                                         \
+        memmove(selfS->pBuffer,selfS->pBuffer + pos,sizeof(TYP)*(nb - pos));                  \
+        memcpy(selfS->pBuffer + (nb - pos),pSrc,sizeof(TYP)*nbNew);                           \
+    }                                                                                         \
+    else                                                                                      \
+    {                                                                                         \
+        memcpy(selfS->pBuffer,pSrc + (pos - nb),sizeof(TYP)*(total - pos));                   \
+    }                                                                                         \
+    selfS->nbSamples = (uint32_t)(total - pos);                                               \
+    return(status);                                                                           \
+}
+
+/* arm_mfcc_f32 has no status */
+static arm_status mfcc_stream_f32(const arm_mfcc_instance_f32 *S,float32_t *pSrc,
+  float32_t *pDst,float32_t *pTmp)
+{
+   arm_mfcc_f32(S,pSrc,pDst,pTmp);
+   return(ARM_MATH_SUCCESS);
+}
+
+MFCCSTREAMFRAMES(f32,float32_t,mfcc_stream_f32);
+MFCCSTREAMFRAMES(q31,q31_t,arm_mfcc_q31);
+MFCCSTREAMFRAMES(q15,q15_t,arm_mfcc_q15);
+
+/*
+
+f32 returns the MFCC array and the fixed point versions
+return (status, MFCC array) like arm_mfcc_q31 and arm_mfcc_q15.
+
+*/
+#define MFCCSTREAM(EXT,TYP,NPYTYPE,SRCTYPE,NPYTYPE_FROMC,RESULT)                              \
+static PyObject *                                                                             \
+cmsis_arm_mfcc_stream_##EXT(PyObject *obj, PyObject *args, PyObject *kwds)                    \
+{                                                                                             \
+                                                                                              \
+  PyObject *S=NULL; /* input */                                                               \
+  PyObject *pSrc=NULL; /* input */                                                            \
+  TYP *pSrc_converted=NULL; /* input */                                                       \
+  TYP *pDst=NULL; /* output */                                                                \
+  PyObject *out=NULL; /* output */                                                            \
+                                                                                              \
+  if (PyArg_ParseTuple(args,"OO",&S,&pSrc) && parseOutKeyword(args,kwds,&out))                     \
+  {                                                                                           \
+                                                                                              \
+    dsp_arm_mfcc_stream_instance_##EXT##Object *selfS = (dsp_arm_mfcc_stream_instance_##EXT##Object *)S;\
+    if (selfS->mfcc == NULL)                                                                  \
+    {                                                                                         \
+       PyErr_SetString(PyExc_ValueError,"the MFCC stream is not initialized");                \
+       return(NULL);                                                                          \
+    }                                                                                         \
+    arm_mfcc_instance_##EXT *instance = ((dsp_arm_mfcc_instance_##EXT##Object *)selfS->mfcc)->instance;\
+    if (instance->fftLen != selfS->fftLen)                                                    \
+    {                                                                                         \
+       PyErr_SetString(PyExc_ValueError,"the FFT length of the MFCC instance has changed");   \
+       return(NULL);                                                                          \
+    }                                                                                         \
+                                                                                              \
+    GETARGUMENT(pSrc,NPYTYPE,SRCTYPE,TYP);                                                    \
+    if (pSrc_converted == NULL)                                                               \
+    {                                                                                         \
+       return(NULL);                                                                          \
+    }                                                                                         \
+    npy_intp nbNew = arraySizepSrc;                                                           \
+    npy_intp nbFrames = mfccStreamNbFrames(selfS->nbSamples,nbNew,selfS->fftLen,selfS->hop);  \
+    uint32_t nbDct = instance->nbDctOutputs;                                                  \
+                                                                                              \
+    GETOUTPUT2D(pDst,TYP,NPYTYPE_FROMC,nbFrames,nbDct);                                       \
+                                                                                              \
+    arm_status status = ARM_MATH_SUCCESS;                                                     \
+    if (pDst)                                                                                 \
+    {                                                                                         \
+      Py_BEGIN_ALLOW_THREADS                                                                  \
+      status = mfccStreamFrames_##EXT(selfS,pSrc_converted,nbNew,nbFrames,nbDct,pDst);        \
+      Py_END_ALLOW_THREADS                                                                    \
+    }                                                                                         \
+    OUTPUTARRAY2D(pDstOBJ,nbFrames,nbDct,pDst,NPYTYPE_FROMC);                                 \
+                                                                                              \
+    PyObject *pythonResult = RESULT;                                                          \
+                                                                                              \
+    FREEARGUMENT(pSrc_converted);                                                             \
+    Py_XDECREF(pDstOBJ);                                                                      \
+    return(pythonResult);                                                                     \
+                                                                                              \
+  }                                                                                           \
+  return(NULL);                                                                               \
+}
+
+/* arm_mfcc_f32 has no status : it is always ARM_MATH_SUCCESS */
+MFCCSTREAM(f32,float32_t,NPY_DOUBLE,double,NPY_FLOAT,((void)status,Py_BuildValue("O",pDstOBJ)));
+MFCCSTREAM(q31,q31_t,NPY_INT32,int32_t,NPY_INT32,(pDstOBJ ? Py_BuildValue("iO",status,pDstOBJ) : NULL));
+MFCCSTREAM(q15,q15_t,NPY_INT16,int16_t,NPY_INT16,(pDstOBJ ? Py_BuildValue("iO",status,pDstOBJ) : NULL));
+
+
+#if defined(ARM_FLOAT16_SUPPORTED)
+
+/*
+
+f16 transforms : the arguments are converted to np.float16 and
+the results are np.float16 arrays.
+
+*/
+static PyObject *
+cmsis_arm_cfft_init_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint16_t fftLen; // input
+
+  if (PyArg_ParseTuple(args,"Oh",&S,&fftLen))
+  {
+
+    dsp_arm_cfft_instance_f16Object *selfS = (dsp_arm_cfft_instance_f16Object *)S;
+
+    arm_status returnValue = arm_cfft_init_f16(selfS->instance,fftLen);
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+
+    PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_cfft_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *p1=NULL; // input
+  float16_t *p1_converted=NULL; // input
+  float16_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t ifftFlag; // input
+  uint32_t bitReverseFlag; // input
+
+  if (PyArg_ParseTuple(args,"OOii",&S,&p1,&ifftFlag,&bitReverseFlag) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_cfft_instance_f16Object *selfS = (dsp_arm_cfft_instance_f16Object *)S;
+    uint32_t outputLength = 2*selfS->instance->fftLen;
+    GETARGUMENT(p1,NPY_HALF,float16_t,float16_t);
+
+    GETOUTPUT(pDst,float16_t,NPY_HALF,outputLength);
+
+    if (pDst)
+    {
+      /* The transform is in-place : it is computed in the output */
+      COPYTOOUTPUT(pDst,p1_converted,float16_t,arraySizep1,outputLength);
+      Py_BEGIN_ALLOW_THREADS
+      arm_cfft_f16(selfS->instance,pDst,(uint8_t)ifftFlag,(uint8_t)bitReverseFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,outputLength,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+
+    FREEARGUMENT(p1_converted);
+    Py_XDECREF(pDstOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_rfft_fast_init_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint16_t fftLen; // input
+
+  if (PyArg_ParseTuple(args,"Oh",&S,&fftLen))
+  {
+
+    dsp_arm_rfft_fast_instance_f16Object *selfS = (dsp_arm_rfft_fast_instance_f16Object *)S;
+
+    arm_status returnValue = arm_rfft_fast_init_f16(selfS->instance,fftLen);
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+
+    PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_rfft_fast_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *p=NULL; // input
+  float16_t *p_converted=NULL; // input
+  float16_t *pOut=NULL; // output
+  PyObject *out=NULL; // output
+  uint32_t ifftFlag; // input
+
+  if (PyArg_ParseTuple(args,"OOi",&S,&p,&ifftFlag) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_rfft_fast_instance_f16Object *selfS = (dsp_arm_rfft_fast_instance_f16Object *)S;
+    GETARGUMENTCOPY(p,NPY_HALF,float16_t,float16_t);
+
+    GETOUTPUT(pOut,float16_t,NPY_HALF,(selfS->instance->fftLenRFFT));
+
+    if (pOut)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_rfft_fast_f16(selfS->instance,p_converted,pOut,(uint8_t)ifftFlag);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pOutOBJ,(selfS->instance->fftLenRFFT),pOut,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pOutOBJ);
+
+    FREEARGUMENT(p_converted);
+    Py_XDECREF(pOutOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mfcc_init_f16(PyObject *obj, PyObject *args)
+{
+
+  PyObject *S=NULL; // input
+  uint32_t fftLen,nbMelFilters,nbDctOutputs; // input
+
+  PyObject *pdctCoefs=NULL; // input
+  float16_t *pdctCoefs_converted=NULL; // input
+
+  PyObject *pfilterCoefs=NULL; // input
+  float16_t *pfilterCoefs_converted=NULL; // input
+
+  PyObject *pwindowCoefs=NULL; // input
+  float16_t *pwindowCoefs_converted=NULL; // input
+
+  PyObject *pfilterPos=NULL; // input
+  uint32_t *pfilterPos_converted=NULL; // input
+
+  PyObject *pfilterLengths=NULL; // input
+  uint32_t *pfilterLengths_converted=NULL; // input
+
+  if (PyArg_ParseTuple(args,"OiiiOOOOO",&S,&fftLen,&nbMelFilters,&nbDctOutputs,
+    &pdctCoefs,&pfilterPos,&pfilterLengths,&pfilterCoefs,&pwindowCoefs))
+  {
+
+    dsp_arm_mfcc_instance_f16Object *selfS = (dsp_arm_mfcc_instance_f16Object *)S;
+
+    GETARGUMENTCOPY(pdctCoefs,NPY_HALF,float16_t,float16_t);
+    GETARGUMENTCOPY(pfilterPos,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterLengths,NPY_UINT32,uint32_t,uint32_t);
+    GETARGUMENTCOPY(pfilterCoefs,NPY_HALF,float16_t,float16_t);
+    GETARGUMENTCOPY(pwindowCoefs,NPY_HALF,float16_t,float16_t);
+
+
+    arm_status returnValue = arm_mfcc_init_f16(selfS->instance,
+        fftLen,nbMelFilters,nbDctOutputs,
+        pdctCoefs_converted,
+        pfilterPos_converted,pfilterLengths_converted,pfilterCoefs_converted,
+        pwindowCoefs_converted);
+    PyObject* theReturnOBJ=Py_BuildValue("i",returnValue);
+
+    PyObject *pythonResult = Py_BuildValue("O",theReturnOBJ);
+
+    Py_DECREF(theReturnOBJ);
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+static PyObject *
+cmsis_arm_mfcc_f16(PyObject *obj, PyObject *args, PyObject *kwds)
+{
+
+  PyObject *S=NULL; // input
+  PyObject *p1=NULL; // input
+  float16_t *p1_converted=NULL; // input
+
+  PyObject *tmp=NULL; // input
+  float16_t *tmp_converted=NULL; // input
+
+  float16_t *pDst=NULL; // output
+  PyObject *out=NULL; // output
+  if (PyArg_ParseTuple(args,"OOO",&S,&p1,&tmp) && parseOutKeyword(args,kwds,&out))
+  {
+
+    dsp_arm_mfcc_instance_f16Object *selfS = (dsp_arm_mfcc_instance_f16Object *)S;
+    GETARGUMENTCOPY(p1,NPY_HALF,float16_t,float16_t);
+    GETARGUMENTCOPY(tmp,NPY_HALF,float16_t,float16_t);
+
+    GETOUTPUT(pDst,float16_t,NPY_HALF,selfS->instance->nbDctOutputs);
+
+    if (pDst)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      arm_mfcc_f16(selfS->instance,p1_converted,pDst,tmp_converted);
+      Py_END_ALLOW_THREADS
+    }
+    OUTPUTARRAY1(pDstOBJ,selfS->instance->nbDctOutputs,pDst,NPY_HALF);
+
+    PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
+    Py_XDECREF(pDstOBJ);
+
+    FREEARGUMENT(p1_converted);
+    FREEARGUMENT(tmp_converted);
+
+    return(pythonResult);
+
+  }
+  return(NULL);
+}
+
+#endif /* defined(ARM_FLOAT16_SUPPORTED) */
 
 static PyMethodDef CMSISDSPMethods[] = {
 
@@ -3148,36 +4472,39 @@ static PyMethodDef CMSISDSPMethods[] = {
 
 
 {"arm_cfft_radix2_init_q15",  cmsis_arm_cfft_radix2_init_q15, METH_VARARGS,""},
-{"arm_cfft_radix2_q15",  cmsis_arm_cfft_radix2_q15, METH_VARARGS,""},
+{"arm_cfft_radix2_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix2_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_cfft_radix4_init_q15",  cmsis_arm_cfft_radix4_init_q15, METH_VARARGS,""},
-{"arm_cfft_radix4_q15",  cmsis_arm_cfft_radix4_q15, METH_VARARGS,""},
+{"arm_cfft_radix4_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix4_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_cfft_radix2_init_q31",  cmsis_arm_cfft_radix2_init_q31, METH_VARARGS,""},
-{"arm_cfft_radix2_q31",  cmsis_arm_cfft_radix2_q31, METH_VARARGS,""},
-{"arm_cfft_radix4_q31",  cmsis_arm_cfft_radix4_q31, METH_VARARGS,""},
+{"arm_cfft_radix2_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix2_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_radix4_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix4_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_cfft_radix4_init_q31",  cmsis_arm_cfft_radix4_init_q31, METH_VARARGS,""},
 {"arm_cfft_radix2_init_f32",  cmsis_arm_cfft_radix2_init_f32, METH_VARARGS,""},
-{"arm_cfft_radix2_f32",  cmsis_arm_cfft_radix2_f32, METH_VARARGS,""},
+{"arm_cfft_radix2_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix2_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_cfft_radix4_init_f32",  cmsis_arm_cfft_radix4_init_f32, METH_VARARGS,""},
-{"arm_cfft_radix4_f32",  cmsis_arm_cfft_radix4_f32, METH_VARARGS,""},
-{"arm_cfft_q15",  cmsis_arm_cfft_q15, METH_VARARGS,""},
-{"arm_cfft_q31",  cmsis_arm_cfft_q31, METH_VARARGS,""},
-{"arm_cfft_f64",  cmsis_arm_cfft_f64, METH_VARARGS,""},
-{"arm_cfft_f32",  cmsis_arm_cfft_f32, METH_VARARGS,""},
+{"arm_cfft_radix4_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_radix4_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_q15",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_q15, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_q31",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_q31, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_f64",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_cfft_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_rfft_init_q15",  cmsis_arm_rfft_init_q15, METH_VARARGS,""},
-{"arm_rfft_q15",  cmsis_arm_rfft_q15, METH_VARARGS,""},
+{"arm_rfft_q15",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_q15, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_rfft_init_q31",  cmsis_arm_rfft_init_q31, METH_VARARGS,""},
-{"arm_rfft_q31",  cmsis_arm_rfft_q31, METH_VARARGS,""},
+{"arm_rfft_q31",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_rfft_fast_init_f64",  cmsis_arm_rfft_fast_init_f64, METH_VARARGS,""},
-{"arm_rfft_fast_f64",  cmsis_arm_rfft_fast_f64, METH_VARARGS,""},
-{"arm_rfft_fast_f32",  cmsis_arm_rfft_fast_f32, METH_VARARGS,""},
+{"arm_rfft_fast_f64",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_fast_f64, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_rfft_fast_f32",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_fast_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_rfft_fast_init_f32",  cmsis_arm_rfft_fast_init_f32, METH_VARARGS,""},
-{"arm_rfft_fast_f32",  cmsis_arm_rfft_fast_f32, METH_VARARGS,""},
+{"arm_rfft_fast_f32",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_fast_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_rfft_fast_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_fast_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_dct4_init_f32",  cmsis_arm_dct4_init_f32, METH_VARARGS,""},
-{"arm_dct4_f32",  cmsis_arm_dct4_f32, METH_VARARGS,""},
+{"arm_dct4_f32",  (PyCFunction)(void(*)(void))cmsis_arm_dct4_f32, METH_VARARGS | METH_KEYWORDS,""},
+{"arm_dct4_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_dct4_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_dct4_init_q31",  cmsis_arm_dct4_init_q31, METH_VARARGS,""},
-{"arm_dct4_q31",  cmsis_arm_dct4_q31, METH_VARARGS,""},
+{"arm_dct4_q31",  (PyCFunction)(void(*)(void))cmsis_arm_dct4_q31, METH_VARARGS | METH_KEYWORDS,""},
 {"arm_dct4_init_q15",  cmsis_arm_dct4_init_q15, METH_VARARGS,""},
-{"arm_dct4_q15",  cmsis_arm_dct4_q15, METH_VARARGS,""},
+{"arm_dct4_q15",  (PyCFunction)(void(*)(void))cmsis_arm_dct4_q15, METH_VARARGS | METH_KEYWORDS,""},
 
 
 {"arm_cfft_init_f32",  cmsis_arm_cfft_init_f32, METH_VARARGS,""},
@@ -3187,11 +4514,29 @@ static PyMethodDef CMSISDSPMethods[] = {
 
 
     {"arm_mfcc_init_f32",  cmsis_arm_mfcc_init_f32, METH_VARARGS,""},
-    {"arm_mfcc_f32",  cmsis_arm_mfcc_f32, METH_VARARGS,""},
+    {"arm_mfcc_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_f32, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_batch_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_batch_f32, METH_VARARGS | METH_KEYWORDS,""},
     {"arm_mfcc_init_q15",  cmsis_arm_mfcc_init_q15, METH_VARARGS,""},
-    {"arm_mfcc_q15",  cmsis_arm_mfcc_q15, METH_VARARGS,""},
+    {"arm_mfcc_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_q15, METH_VARARGS | METH_KEYWORDS,""},
     {"arm_mfcc_init_q31",  cmsis_arm_mfcc_init_q31, METH_VARARGS,""},
-    {"arm_mfcc_q31",  cmsis_arm_mfcc_q31, METH_VARARGS,""},
+    {"arm_mfcc_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_q31, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_stream_init_f32",  cmsis_arm_mfcc_stream_init_f32, METH_VARARGS,""},
+    {"arm_mfcc_stream_f32",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_stream_f32, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_stream_reset_f32",  cmsis_arm_mfcc_stream_reset_f32, METH_VARARGS,""},
+    {"arm_mfcc_stream_init_q31",  cmsis_arm_mfcc_stream_init_q31, METH_VARARGS,""},
+    {"arm_mfcc_stream_q31",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_stream_q31, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_stream_reset_q31",  cmsis_arm_mfcc_stream_reset_q31, METH_VARARGS,""},
+    {"arm_mfcc_stream_init_q15",  cmsis_arm_mfcc_stream_init_q15, METH_VARARGS,""},
+    {"arm_mfcc_stream_q15",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_stream_q15, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_stream_reset_q15",  cmsis_arm_mfcc_stream_reset_q15, METH_VARARGS,""},
+#if defined(ARM_FLOAT16_SUPPORTED)
+    {"arm_cfft_init_f16",  cmsis_arm_cfft_init_f16, METH_VARARGS,""},
+    {"arm_cfft_f16",  (PyCFunction)(void(*)(void))cmsis_arm_cfft_f16, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_rfft_fast_init_f16",  cmsis_arm_rfft_fast_init_f16, METH_VARARGS,""},
+    {"arm_rfft_fast_f16",  (PyCFunction)(void(*)(void))cmsis_arm_rfft_fast_f16, METH_VARARGS | METH_KEYWORDS,""},
+    {"arm_mfcc_init_f16",  cmsis_arm_mfcc_init_f16, METH_VARARGS,""},
+    {"arm_mfcc_f16",  (PyCFunction)(void(*)(void))cmsis_arm_mfcc_f16, METH_VARARGS | METH_KEYWORDS,""},
+#endif
    
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL}        /* Sentinel */
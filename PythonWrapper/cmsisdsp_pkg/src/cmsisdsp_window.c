@@ -26,8 +26,10 @@
  * limitations under the License.
  */
 
-#define MODNAME "cmsisdsp_window"
+/* Changed by setup.py for the host SIMD variants of the module */
+#ifndef MODINITNAME
 #define MODINITNAME cmsisdsp_window
+#endif
 
 #include "cmsisdsp_module.h"
 
@@ -55,7 +57,9 @@ cmsis_arm_welch_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_welch_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -81,7 +85,9 @@ cmsis_arm_welch_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_welch_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -108,7 +114,9 @@ cmsis_arm_bartlett_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_bartlett_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -134,7 +142,9 @@ cmsis_arm_bartlett_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_bartlett_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -161,7 +171,9 @@ cmsis_arm_hamming_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hamming_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -187,7 +199,9 @@ cmsis_arm_hamming_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hamming_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -214,7 +228,9 @@ cmsis_arm_hanning_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hanning_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -240,7 +256,9 @@ cmsis_arm_hanning_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hanning_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -267,7 +285,9 @@ cmsis_arm_nuttall3_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -293,7 +313,9 @@ cmsis_arm_nuttall3_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -320,7 +342,9 @@ cmsis_arm_nuttall4_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -346,7 +370,9 @@ cmsis_arm_nuttall4_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -373,7 +399,9 @@ cmsis_arm_nuttall3a_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3a_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -399,7 +427,9 @@ cmsis_arm_nuttall3a_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3a_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -426,7 +456,9 @@ cmsis_arm_nuttall3b_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3b_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -452,7 +484,9 @@ cmsis_arm_nuttall3b_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall3b_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -479,7 +513,9 @@ cmsis_arm_nuttall4a_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4a_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -505,7 +541,9 @@ cmsis_arm_nuttall4a_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4a_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -532,7 +570,9 @@ cmsis_arm_blackman_harris_92db_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_blackman_harris_92db_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -558,7 +598,9 @@ cmsis_arm_blackman_harris_92db_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_blackman_harris_92db_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -585,7 +627,9 @@ cmsis_arm_nuttall4b_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4b_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -611,7 +655,9 @@ cmsis_arm_nuttall4b_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4b_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -638,7 +684,9 @@ cmsis_arm_nuttall4c_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4c_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -664,7 +712,9 @@ cmsis_arm_nuttall4c_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_nuttall4c_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -691,7 +741,9 @@ cmsis_arm_hft90d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft90d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -717,7 +769,9 @@ cmsis_arm_hft90d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft90d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -744,7 +798,9 @@ cmsis_arm_hft95_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft95_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -770,7 +826,9 @@ cmsis_arm_hft95_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft95_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -797,7 +855,9 @@ cmsis_arm_hft116d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft116d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -823,7 +883,9 @@ cmsis_arm_hft116d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft116d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -850,7 +912,9 @@ cmsis_arm_hft144d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft144d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -876,7 +940,9 @@ cmsis_arm_hft144d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft144d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -903,7 +969,9 @@ cmsis_arm_hft169d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft169d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -929,7 +997,9 @@ cmsis_arm_hft169d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft169d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -956,7 +1026,9 @@ cmsis_arm_hft196d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft196d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -982,7 +1054,9 @@ cmsis_arm_hft196d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft196d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -1009,7 +1083,9 @@ cmsis_arm_hft223d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft223d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -1035,7 +1111,9 @@ cmsis_arm_hft223d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft223d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -1062,7 +1140,9 @@ cmsis_arm_hft248d_f32(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float32_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft248d_f32(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOATARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -1088,7 +1168,9 @@ cmsis_arm_hft248d_f64(PyObject *obj, PyObject *args)
     pDst=PyMem_Malloc(sizeof(float64_t)*nb);
 
 
+    Py_BEGIN_ALLOW_THREADS
     arm_hft248d_f64(pDst,nb);
+    Py_END_ALLOW_THREADS
     FLOAT64ARRAY1(pDstOBJ,nb,pDst);
 
     PyObject *pythonResult = Py_BuildValue("O",pDstOBJ);
@@ -0,0 +1,87 @@
+# Benchmark of the block versions of the controller functions.
+#
+# The current loop of a field oriented control running at 20 kHz
+# is simulated from recorded phase currents and angles:
+# - with a Python loop calling the scalar functions for each sample
+#   (on a subset of the samples since it is very slow)
+# - with the block functions (sin_cos, clarke, park, pid, inv_park
+#   and inv_clarke)
+# - with the fused arm_foc_block_f32
+#
+# The speed is given as a multiple of real time.
+#
+# python benchcontroller.py 60
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+
+duration = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+
+SAMPLERATE = 20000
+NBLOOP = 20000
+KP, KI, KD = 0.8, 0.05, 0.0
+
+nb = int(duration*SAMPLERATE)
+t = np.arange(nb) / SAMPLERATE
+rng = np.random.default_rng(0)
+# Electrical angle in degrees (as expected by arm_sin_cos_f32)
+theta = (((360.0*50*t) + 180.0) % 360.0 - 180.0).astype(np.float32)
+Ia = (np.cos(np.radians(theta)) + 0.01*rng.standard_normal(nb)).astype(np.float32)
+Ib = (np.cos(np.radians(theta) - 2*np.pi/3) + 0.01*rng.standard_normal(nb)).astype(np.float32)
+IqRef = np.where(t < duration/2,0.5,0.8).astype(np.float32)
+
+def newPid():
+    S = dsp.arm_pid_instance_f32(Kp=KP,Ki=KI,Kd=KD)
+    dsp.arm_pid_init_f32(S,1)
+    return(S)
+
+def pythonLoop(n):
+    Sd, Sq = newPid(), newPid()
+    Va = np.zeros(n,dtype=np.float32)
+    Vb = np.zeros(n,dtype=np.float32)
+    for i in range(n):
+        s,c = dsp.arm_sin_cos_f32(theta[i])
+        alpha = Ia[i]
+        beta = (Ia[i] + 2*Ib[i]) / np.sqrt(3)
+        d = alpha*c + beta*s
+        q = -alpha*s + beta*c
+        vd = dsp.arm_pid_f32(Sd,0.0 - d)
+        vq = dsp.arm_pid_f32(Sq,IqRef[i] - q)
+        valpha = vd*c - vq*s
+        vbeta = vd*s + vq*c
+        Va[i] = valpha
+        Vb[i] = -0.5*valpha + (np.sqrt(3)/2)*vbeta
+    return(Va,Vb)
+
+def blocks():
+    Sd, Sq = newPid(), newPid()
+    s,c = dsp.arm_sin_cos_block_f32(theta)
+    alpha,beta = dsp.arm_clarke_block_f32(Ia,Ib)
+    d,q = dsp.arm_park_block_f32(alpha,beta,s,c)
+    vd = dsp.arm_pid_block_f32(Sd,-d)
+    vq = dsp.arm_pid_block_f32(Sq,IqRef - q)
+    valpha,vbeta = dsp.arm_inv_park_block_f32(vd,vq,s,c)
+    return(dsp.arm_inv_clarke_block_f32(valpha,vbeta))
+
+def fused():
+    Sd, Sq = newPid(), newPid()
+    return(dsp.arm_foc_block_f32(Sd,Sq,Ia,Ib,theta,[0.0],IqRef))
+
+def measure(f,n):
+    start = time.perf_counter()
+    res = f()
+    return(res,(n/SAMPLERATE)/(time.perf_counter() - start))
+
+(refA,refB),rtLoop = measure(lambda : pythonLoop(NBLOOP),NBLOOP)
+(blkA,blkB),rtBlocks = measure(blocks,nb)
+(focA,focB),rtFused = measure(fused,nb)
+
+print("%.0f s at %d Hz (%d samples)" % (duration,SAMPLERATE,nb))
+print("%-22s %12s" % ("","x real time"))
+print("%-22s %12.1f" % ("Python loop",rtLoop))
+print("%-22s %12.0f" % ("block functions",rtBlocks))
+print("%-22s %12.0f" % ("arm_foc_block_f32",rtFused))
+print("Same voltages (blocks and fused) : %s" % (np.array_equal(blkA,focA) and np.array_equal(blkB,focB)))
+print("Max difference with the Python loop : %g" % max(np.max(np.abs(refA - focA[:NBLOOP])),np.max(np.abs(refB - focB[:NBLOOP]))))
@@ -0,0 +1,96 @@
+# Benchmark of the FFT convolution and correlation (cmsisdsp.fastconv).
+#
+# - Reverberation : a recording at 48 kHz is convolved with a room
+#   impulse response. The direct kernel is computed on the first
+#   second only since it is very slow (its time per sample is growing
+#   with the length of the signal so the full signal would be
+#   even slower). The FFT convolution is computed on the full
+#   recording in one call and by chunks of 10 ms with overlap-save
+#   and overlap-add.
+# - Time delay estimation : lag between two microphones with
+#   fastconv.lagPeak.
+# - Error of the fixed point FFT convolutions versus the direct
+#   kernels (on the first second).
+#
+# The times are given in ns per output sample.
+#
+# python benchconv.py 60 8192
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+import cmsisdsp.fastconv as fastconv
+from cmsisdsp.fixedpoint import toQ31, toQ15
+
+duration = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+nbTaps = int(sys.argv[2]) if len(sys.argv) > 2 else 8192
+
+FS = 48000
+CHUNK = FS // 100
+NBDIRECT = FS
+
+rng = np.random.default_rng(0)
+
+x = (0.3*rng.standard_normal(duration*FS)).clip(-1,1)
+# Exponentially decaying room impulse response
+rir = rng.standard_normal(nbTaps)*np.exp(-6.9*np.arange(nbTaps)/nbTaps)
+rir = 0.9*rir/np.sum(np.abs(rir))
+
+x32 = x.astype(np.float32)
+rir32 = rir.astype(np.float32)
+
+def perSample(f,n):
+    start = time.perf_counter()
+    res = f()
+    return(res,1e9*(time.perf_counter() - start)/n)
+
+def stream(c,samples):
+    y = [c.process(samples[i:i+CHUNK]) for i in range(0,len(samples),CHUNK)]
+    return(np.concatenate(y + [c.flush()]))
+
+nbOutputs = len(x) + nbTaps - 1
+print("%d s at %d Hz, %d taps, ns per output sample" % (duration,FS,nbTaps))
+print("%-14s %12s %12s %12s %12s" % ("","direct","fft","overlap-save","overlap-add"))
+
+ref,tDirect = perSample(lambda : dsp.arm_conv_f32(x32[:NBDIRECT],NBDIRECT,rir32,nbTaps),NBDIRECT+nbTaps-1)
+y,tFFT = perSample(lambda : fastconv.convolve(x32,rir32,method="fft"),nbOutputs)
+yOLS,tOLS = perSample(lambda : stream(fastconv.OverlapSave(rir32),x32),nbOutputs)
+yOLA,tOLA = perSample(lambda : stream(fastconv.OverlapAdd(rir32),x32),nbOutputs)
+print("%-14s %12.1f %12.1f %12.1f %12.1f" % ("f32",tDirect,tFFT,tOLS,tOLA))
+errF32 = np.max(np.abs(y[:NBDIRECT] - ref[:NBDIRECT]))
+sameStream = np.allclose(y,yOLS,atol=1e-5) and np.allclose(y,yOLA,atol=1e-5)
+
+errors = []
+for dtype,conv,to in [(dt.Q31,dsp.arm_conv_q31,toQ31),(dt.Q15,dsp.arm_conv_q15,toQ15)]:
+    xq = to(x)
+    rirq = to(rir)
+    ref,tDirect = perSample(lambda : conv(xq[:NBDIRECT],NBDIRECT,rirq,nbTaps),NBDIRECT+nbTaps-1)
+    y,tFFT = perSample(lambda : fastconv.convolve(xq,rirq,dtype,method="fft"),nbOutputs)
+    yOLS,tOLS = perSample(lambda : stream(fastconv.OverlapSave(rirq,dtype),xq),nbOutputs)
+    yOLA,tOLA = perSample(lambda : stream(fastconv.OverlapAdd(rirq,dtype),xq),nbOutputs)
+    print("%-14s %12.1f %12.1f %12.1f %12.1f" % ("q%d" % dtype,tDirect,tFFT,tOLS,tOLA))
+    errors.append(np.max(np.abs(y[:NBDIRECT].astype(np.int64) - ref[:NBDIRECT])))
+
+print("Max error versus the direct kernels : f32 %.2e, q31 %d LSB, q15 %d LSB" % (errF32,errors[0],errors[1]))
+print("Same results for the streams : %s" % sameStream)
+
+# Second microphone : delayed and noisy version of the first one
+DELAY = 37
+MAXLAG = FS // 100
+mic1 = x[FS:2*FS]
+mic2 = x[FS-DELAY:2*FS-DELAY] + 0.3*rng.standard_normal(FS)
+mic2 = mic2.clip(-1,1)
+
+print("")
+print("Time delay estimation (1 s, delay %d samples), ns per sample" % DELAY)
+print("%-14s %12s %12s %12s" % ("","direct","fft","lag"))
+for name,dtype,to in [("f32",dt.F32,lambda s : s.astype(np.float32)),
+                      ("q31",dt.Q31,toQ31),
+                      ("q15",dt.Q15,toQ15)]:
+    a = to(mic2)
+    b = to(mic1)
+    (lagDirect,_),tDirect = perSample(lambda : fastconv.lagPeak(a,b,dtype,maxLag=MAXLAG,method="direct"),FS)
+    (lag,_),tFFT = perSample(lambda : fastconv.lagPeak(a,b,dtype,maxLag=MAXLAG,method="fft"),FS)
+    print("%-14s %12.1f %12.1f %12d %s" % (name,tDirect,tFFT,lag,"" if lag == lagDirect else "(direct %d)" % lagDirect))
@@ -0,0 +1,58 @@
+# Benchmark of the pairwise distance functions.
+#
+# The distances between queries and templates are computed:
+# - with one call of arm_euclidean_distance_f32 per pair
+#   (measured on a subset of the queries)
+# - with arm_cdist_f32
+# - with arm_cdist_f32 and several threads
+# - with arm_cdist_topk_f32 which is only keeping the k nearest
+#   templates of each query
+#
+# python benchdistance.py 2000 500 64 4
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.batch
+
+nbQueries = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+nbTemplates = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+dim = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+nbThreads = int(sys.argv[4]) if len(sys.argv) > 4 else 4
+K = 5
+
+rng = np.random.default_rng(0)
+queries = rng.uniform(-1,1,(nbQueries,dim)).astype(np.float32)
+templates = rng.uniform(-1,1,(nbTemplates,dim)).astype(np.float32)
+
+def measure(f):
+    start = time.perf_counter()
+    res = f()
+    return(res,time.perf_counter() - start)
+
+# Python loop on a subset of the queries
+subset = max(1,min(nbQueries,20))
+loop,t = measure(lambda : np.array([[dsp.arm_euclidean_distance_f32(q,x) for x in templates]
+                                    for q in queries[:subset]]))
+tLoop = t * nbQueries / subset
+
+full,tFull = measure(lambda : dsp.arm_cdist_f32(queries,templates,"euclidean"))
+threaded,tThreaded = measure(lambda : cmsisdsp.batch.runCdist(dsp.arm_cdist_f32,
+                             queries,templates,"euclidean",nbThreads=nbThreads))
+(idx,dist),tTopk = measure(lambda : dsp.arm_cdist_topk_f32(queries,templates,"euclidean",K))
+
+ref = np.argsort(full,axis=1,kind="stable")[:,:K]
+
+print("%d queries, %d templates, dimension %d" % (nbQueries,nbTemplates,dim))
+print("%-28s %10s %10s" % ("","time (ms)","speedup"))
+print("%-28s %10.1f %10.1f" % ("loop (extrapolated)",1e3*tLoop,1.0))
+print("%-28s %10.1f %10.1f" % ("arm_cdist_f32",1e3*tFull,tLoop/tFull))
+print("%-28s %10.1f %10.1f" % ("arm_cdist_f32 (%d threads)" % nbThreads,1e3*tThreaded,tLoop/tThreaded))
+print("%-28s %10.1f %10.1f" % ("arm_cdist_topk_f32 (k=%d)" % K,1e3*tTopk,tLoop/tTopk))
+print("")
+print("Same distances as the loop : %s" % np.array_equal(loop,full[:subset]))
+print("Same distances with threads : %s" % np.array_equal(full,threaded))
+print("Same nearest templates : %s" % np.array_equal(idx,ref))
+print("Memory of the distance matrix : %d bytes" % full.nbytes)
+print("Memory of the top %d : %d bytes" % (K,idx.nbytes + dist.nbytes))
@@ -0,0 +1,61 @@
+# Benchmark of the nearest template search with the DTW distance.
+#
+# The templates are noisy and shifted versions of a few patterns.
+# The nearest template of a query is searched:
+# - with arm_dtw_distance_f32 for each template (the distance matrix
+#   is computed with numpy and the cost matrix is returned)
+# - with arm_dtw_distance_only_f32 for each template
+# - with arm_dtw_topk_f32 (lower bound pruning and early abandoning)
+#
+# python benchdtw.py 2000 128 10
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+
+nbTemplates = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+length = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+winSize = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+NBPATTERNS = 8
+
+rng = np.random.default_rng(0)
+t = np.linspace(0,1,length)
+patterns = [np.sin(2*np.pi*(f*t + rng.uniform())) for f in rng.uniform(1,4,NBPATTERNS)]
+
+def sequence(p):
+    shift = rng.integers(-winSize//2,winSize//2+1)
+    return(np.roll(patterns[p],shift) + 0.1*rng.standard_normal(length))
+
+templates = np.array([sequence(p % NBPATTERNS) for p in range(nbTemplates)],dtype=np.float32)
+query = sequence(3).astype(np.float32)
+
+window = np.zeros((length,length),dtype=np.int8)
+_,window = dsp.arm_dtw_init_window_q7(dsp.ARM_DTW_SAKOE_CHIBA_WINDOW,winSize,window)
+
+def measure(f):
+    start = time.perf_counter()
+    res = f()
+    return(res,time.perf_counter() - start)
+
+def full(x):
+    status,d,_ = dsp.arm_dtw_distance_f32(np.abs(query[:,None] - x[None,:]),window)
+    return(d)
+
+def distanceOnly(x):
+    status,d = dsp.arm_dtw_distance_only_f32(np.abs(query[:,None] - x[None,:]),window)
+    return(d)
+
+ref,tFull = measure(lambda : np.array([full(x) for x in templates]))
+only,tOnly = measure(lambda : np.array([distanceOnly(x) for x in templates]))
+(idx,dist,nbComputed),tTopk = measure(lambda : dsp.arm_dtw_topk_f32(query,templates,window,1))
+
+print("%d templates of length %d, window %d" % (nbTemplates,length,winSize))
+print("%-28s %10s %10s" % ("","time (ms)","speedup"))
+print("%-28s %10.1f %10.1f" % ("arm_dtw_distance_f32",1e3*tFull,1.0))
+print("%-28s %10.1f %10.1f" % ("arm_dtw_distance_only_f32",1e3*tOnly,tFull/tOnly))
+print("%-28s %10.1f %10.1f" % ("arm_dtw_topk_f32 (k=1)",1e3*tTopk,tFull/tTopk))
+print("")
+print("Same distances : %s" % np.array_equal(ref,only))
+print("Same nearest template : %s" % (idx[0] == np.argmin(ref) and dist[0] == np.min(ref)))
+print("DTW computed for %d templates (%.1f %%)" % (nbComputed,100.0*nbComputed/nbTemplates))
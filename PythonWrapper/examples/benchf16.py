@@ -0,0 +1,98 @@
+# Accuracy and memory of the f16 functions compared to the
+# f32 functions.
+#
+# The reference is computed with numpy in double precision.
+# For each kernel, the maximum absolute error of the f16 and f32
+# versions, the size of the input and output arrays and the
+# execution time are displayed.
+#
+# python benchf16.py 20
+import sys
+import timeit
+
+import numpy as np
+import cmsisdsp as dsp
+
+NBSAMPLES = 4096
+NBTAPS = 32
+FFTSIZE = 256
+MATSIZE = 16
+
+def kernels():
+    """
+     Kernels of the benchmark.
+
+     :return: Dictionary of (reference, {ext : (function,inputs)}).
+     :rtype: dict
+
+    """
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5,0.5,NBSAMPLES)
+    coefs = rng.uniform(-0.5,0.5,NBTAPS) / NBTAPS
+    signal = rng.uniform(-0.5,0.5,2*FFTSIZE) / FFTSIZE
+    a = rng.uniform(-0.5,0.5,(MATSIZE,MATSIZE))
+    b = rng.uniform(-0.5,0.5,(MATSIZE,MATSIZE))
+
+    res = {}
+    res["add"] = (samples + samples,
+      {ext : (getattr(dsp,"arm_add_%s" % ext),
+              [samples.astype(fmt),samples.astype(fmt)])
+       for ext,fmt in [("f16",np.float16),("f32",np.float32)]})
+
+    res["dot_prod"] = (np.dot(samples,samples),
+      {ext : (getattr(dsp,"arm_dot_prod_%s" % ext),
+              [samples.astype(fmt),samples.astype(fmt)])
+       for ext,fmt in [("f16",np.float16),("f32",np.float32)]})
+
+    res["mean"] = (np.mean(samples),
+      {ext : (getattr(dsp,"arm_mean_%s" % ext),[samples.astype(fmt)])
+       for ext,fmt in [("f16",np.float16),("f32",np.float32)]})
+
+    res["mat_mult"] = (a @ b,
+      {ext : ((lambda x,y,f=getattr(dsp,"arm_mat_mult_%s" % ext): f(x,y)[1]),
+              [a.astype(fmt),b.astype(fmt)])
+       for ext,fmt in [("f16",np.float16),("f32",np.float32)]})
+
+    firs = {}
+    for ext,fmt in [("f16",np.float16),("f32",np.float32)]:
+        S = getattr(dsp,"arm_fir_instance_%s" % ext)()
+        state = np.zeros(NBTAPS+NBSAMPLES-1,dtype=fmt)
+        f = getattr(dsp,"arm_fir_%s" % ext)
+        init = getattr(dsp,"arm_fir_init_%s" % ext)
+        c = coefs.astype(fmt)
+        # The filter is initialized before each run so that
+        # all the runs are starting from the same state
+        def fir(x,f=f,init=init,S=S,c=c,state=state):
+            init(S,NBTAPS,c,state)
+            return(f(S,x))
+        firs[ext] = (fir,[samples.astype(fmt)])
+    res["fir"] = (np.convolve(samples,coefs)[:NBSAMPLES],firs)
+
+    cffts = {}
+    for ext,fmt in [("f16",np.float16),("f32",np.float32)]:
+        S = getattr(dsp,"arm_cfft_instance_%s" % ext)()
+        getattr(dsp,"arm_cfft_init_%s" % ext)(S,FFTSIZE)
+        f = getattr(dsp,"arm_cfft_%s" % ext)
+        cffts[ext] = ((lambda x,f=f,S=S: f(S,x,0,1)),[signal.astype(fmt)])
+    ref = np.fft.fft(signal[0::2] + 1j*signal[1::2])
+    res["cfft"] = (np.stack([ref.real,ref.imag],axis=1).reshape(-1),cffts)
+
+    return(res)
+
+nbRuns = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+print("%-10s %12s %12s %10s %10s %10s %10s" % ("kernel","error f16","error f32",
+      "bytes f16","bytes f32","f16 (us)","f32 (us)"))
+for name,(ref,versions) in kernels().items():
+    errors = {}
+    sizes = {}
+    times = {}
+    for ext,(f,inputs) in versions.items():
+        result = np.asarray(f(*inputs),dtype=np.float64)
+        errors[ext] = np.max(np.abs(result - ref))
+        sizes[ext] = sum(x.nbytes for x in inputs) + np.asarray(f(*inputs)).nbytes
+        times[ext] = min(timeit.repeat(lambda : f(*inputs),number=1,repeat=nbRuns))
+    print("%-10s %12.3g %12.3g %10d %10d %10.1f %10.1f" % (name,
+          errors["f16"],errors["f32"],
+          sizes["f16"],sizes["f32"],
+          1e6*times["f16"],1e6*times["f32"]))
@@ -0,0 +1,67 @@
+# Benchmark of the array versions of the fast math functions.
+#
+# The functions are evaluated on a phase vector:
+# - with a Python loop calling the scalar function (on a subset
+#   of the vector since it is very slow)
+# - with the array function (arm_vsin_f32 ...)
+# - with the array function and a preallocated out= buffer
+# - with NumPy (which is not computing the same approximations)
+#
+# The times are given in ns per sample.
+#
+# python benchfastmath.py 1000000
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.fixedpoint as fix
+
+nb = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+NBLOOP = min(nb,20000)
+
+rng = np.random.default_rng(0)
+phase = rng.uniform(-np.pi,np.pi,nb).astype(np.float32)
+positive = rng.uniform(0,1,nb).astype(np.float32)
+# The angles of the q31 and q15 sin and cos are in [0,1) for [0,2 pi)
+phase_q31 = fix.toQ31(np.abs(phase) / (2*np.pi))
+phase_q15 = fix.toQ15(np.abs(phase) / (2*np.pi))
+positive_q31 = fix.toQ31(positive)
+positive_q15 = fix.toQ15(positive)
+
+def perSample(f,n):
+    start = time.perf_counter()
+    f()
+    return(1e9*(time.perf_counter() - start)/n)
+
+def scalar(f,*args):
+    return(perSample(lambda : [f(*v) for v in zip(*[a[:NBLOOP] for a in args])],NBLOOP))
+
+def vector(f,*args):
+    return(perSample(lambda : f(*args),nb))
+
+def vectorOut(f,*args):
+    out = np.empty_like(args[0])
+    f(*args,out=out)
+    return(perSample(lambda : f(*args,out=out),nb))
+
+BENCHS = [("sin_f32",dsp.arm_sin_f32,dsp.arm_vsin_f32,np.sin,(phase,)),
+          ("cos_f32",dsp.arm_cos_f32,dsp.arm_vcos_f32,np.cos,(phase,)),
+          ("sqrt_f32",dsp.arm_sqrt_f32,dsp.arm_vsqrt_f32,np.sqrt,(positive,)),
+          ("atan2_f32",dsp.arm_atan2_f32,dsp.arm_vatan2_f32,np.arctan2,(phase,positive)),
+          ("sin_q31",dsp.arm_sin_q31,dsp.arm_vsin_q31,None,(phase_q31,)),
+          ("cos_q15",dsp.arm_cos_q15,dsp.arm_vcos_q15,None,(phase_q15,)),
+          ("sqrt_q31",dsp.arm_sqrt_q31,dsp.arm_vsqrt_q31,None,(positive_q31,)),
+          ("sqrt_q15",dsp.arm_sqrt_q15,dsp.arm_vsqrt_q15,None,(positive_q15,)),
+         ]
+
+print("%d samples, ns per sample" % nb)
+print("%-10s %12s %12s %12s %12s" % ("","scalar loop","array","array out=","numpy"))
+for name,s,v,n,args in BENCHS:
+    tNumpy = "%12.2f" % vector(n,*args) if n else "%12s" % "-"
+    print("%-10s %12.1f %12.2f %12.2f %s" % (name,scalar(s,*args),vector(v,*args),vectorOut(v,*args),tNumpy))
+
+# The array functions are computing the same values as the scalar functions
+ref = np.array([dsp.arm_sin_f32(x) for x in phase[:NBLOOP]],dtype=np.float32)
+print("arm_vsin_f32 same as arm_sin_f32 : %s" % np.array_equal(ref,dsp.arm_vsin_f32(phase[:NBLOOP])))
+print("Max error of arm_vsin_f32 : %g" % np.max(np.abs(dsp.arm_vsin_f32(phase) - np.sin(phase.astype(np.float64)))))
@@ -0,0 +1,55 @@
+# Benchmark of the import time of the cmsisdsp package.
+#
+# Each measurement is done in a new Python process. The time
+# is measured for the import of the package and for the first
+# use of a function (which is loading its extension module).
+# The lazy loading of the extension modules is compared with
+# the loading of all the modules (CMSISDSP_EAGER_IMPORT=1).
+#
+# python benchimport.py 20
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+CODE = """
+import time
+start = time.perf_counter()
+import cmsisdsp as dsp
+imported = time.perf_counter()
+dsp.arm_add_f32([1.0,2.0],[3.0,4.0])
+used = time.perf_counter()
+print(imported - start, used - imported)
+"""
+
+def measure(nbRuns,eager):
+    """
+     Import time and first use time in seconds (median of the runs).
+
+     :param nbRuns: Number of Python processes.
+     :type nbRuns: int
+     :param eager: True to load all the extension modules at import.
+     :type eager: bool
+     :return: Import time and time of the first use of a function.
+     :rtype: tuple
+
+    """
+    env = dict(os.environ)
+    if eager:
+       env["CMSISDSP_EAGER_IMPORT"] = "1"
+    else:
+       env.pop("CMSISDSP_EAGER_IMPORT",None)
+    times = []
+    for i in range(nbRuns):
+        res = subprocess.run([sys.executable,"-c",CODE],env=env,
+                             check=True,stdout=subprocess.PIPE,text=True)
+        times.append([float(x) for x in res.stdout.split()])
+    return(tuple(np.median(np.array(times),axis=0)))
+
+nbRuns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+print("%-6s %12s %12s" % ("mode","import (ms)","first (ms)"))
+for eager in [False,True]:
+    imp,first = measure(nbRuns,eager)
+    print("%-6s %12.2f %12.2f" % ("eager" if eager else "lazy",1000*imp,1000*first))
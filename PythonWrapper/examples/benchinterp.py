@@ -0,0 +1,67 @@
+# Benchmark of the block versions of the interpolations.
+#
+# - Linear interpolation : lookup table calibration of a signal
+# - Bilinear interpolation : rotation of an image (one query point
+#   per pixel)
+#
+# Each one is computed with a Python loop calling the scalar function
+# (on a subset of the points since it is very slow), with the block
+# function and with the block function on several threads
+# (batch.runInterp). The linear interpolation is also computed with
+# np.interp.
+#
+# The times are given in ns per point.
+#
+# python benchinterp.py 1024 4
+import os
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.batch as batch
+
+width = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+nbThreads = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+height = 3*width//4
+NBLOOP = 20000
+
+rng = np.random.default_rng(0)
+
+# Calibration table of a sensor
+TABLESIZE = 256
+table = np.cumsum(rng.uniform(0.5,1.5,TABLESIZE)).astype(np.float32)
+linear = dsp.arm_linear_interp_instance_f32(nValues=TABLESIZE,x1=0.0,xSpacing=1.0,pYData=table)
+x = rng.uniform(0,TABLESIZE-1,width*height).astype(np.float32)
+
+# Image rotated by 10 degrees around its center
+image = rng.uniform(0,1,(height,width)).astype(np.float32)
+bilinear = dsp.arm_bilinear_interp_instance_f32(numRows=height,numCols=width,pData=image.reshape(-1))
+rows,cols = np.mgrid[0:height,0:width]
+a = np.radians(10)
+X = ((cols - width/2)*np.cos(a) - (rows - height/2)*np.sin(a) + width/2).astype(np.float32).reshape(-1)
+Y = ((cols - width/2)*np.sin(a) + (rows - height/2)*np.cos(a) + height/2).astype(np.float32).reshape(-1)
+
+def perPoint(f,n):
+    start = time.perf_counter()
+    res = f()
+    return(res,1e9*(time.perf_counter() - start)/n)
+
+nb = width*height
+print("%d points, %d threads, ns per point" % (nb,nbThreads))
+print("%-10s %12s %12s %12s %12s" % ("","scalar loop","block","threads","numpy"))
+
+ref,tLoop = perPoint(lambda : [dsp.arm_linear_interp_f32(linear,v) for v in x[:NBLOOP]],NBLOOP)
+res,tBlock = perPoint(lambda : dsp.arm_linear_interp_block_f32(linear,x),nb)
+resT,tThreads = perPoint(lambda : batch.runInterp(dsp.arm_linear_interp_block_f32,linear,x,nbThreads=nbThreads),nb)
+_,tNumpy = perPoint(lambda : np.interp(x,np.arange(TABLESIZE),table),nb)
+print("%-10s %12.1f %12.2f %12.2f %12.2f" % ("linear",tLoop,tBlock,tThreads,tNumpy))
+sameLinear = np.array_equal(np.array(ref,dtype=np.float32),res[:NBLOOP]) and np.array_equal(res,resT)
+
+ref,tLoop = perPoint(lambda : [dsp.arm_bilinear_interp_f32(bilinear,u,v) for u,v in zip(X[:NBLOOP],Y[:NBLOOP])],NBLOOP)
+res,tBlock = perPoint(lambda : dsp.arm_bilinear_interp_block_f32(bilinear,X,Y),nb)
+resT,tThreads = perPoint(lambda : batch.runInterp(dsp.arm_bilinear_interp_block_f32,bilinear,X,Y,nbThreads=nbThreads),nb)
+print("%-10s %12.1f %12.2f %12.2f %12s" % ("bilinear",tLoop,tBlock,tThreads,"-"))
+sameBilinear = np.array_equal(np.array(ref,dtype=np.float32),res[:NBLOOP]) and np.array_equal(res,resT)
+
+print("Same results as the scalar functions : %s" % (sameLinear and sameBilinear))
@@ -0,0 +1,70 @@
+# Benchmark of the streaming MFCC.
+#
+# An audio signal is received by chunks. The MFCC of the frames
+# are computed:
+# - with a Python loop slicing the frames and calling arm_mfcc_f32
+# - with arm_mfcc_stream_f32
+#
+# The speed is given as a multiple of real time.
+#
+# python benchmfccstream.py 60 512
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.mfcc as mfcc
+from cmsisdsp.datatype import F32
+
+duration = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+chunkSize = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+
+SAMPLERATE = 16000
+FFTSIZE = 512
+HOP = 160
+NBMELFILTERS = 40
+NBDCTOUTPUTS = 13
+
+filtLen,filtPos,packedFilters = mfcc.melFilterMatrix(F32,64,SAMPLERATE/2,NBMELFILTERS,SAMPLERATE,FFTSIZE)
+dctMatrixFilters = mfcc.dctMatrix(F32,NBDCTOUTPUTS,NBMELFILTERS)
+window = np.hamming(FFTSIZE)
+
+mfccf32 = dsp.arm_mfcc_instance_f32()
+dsp.arm_mfcc_init_f32(mfccf32,FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,dctMatrixFilters,
+    filtPos,filtLen,packedFilters,window)
+
+rng = np.random.default_rng(0)
+audio = rng.uniform(-0.5,0.5,int(duration*SAMPLERATE)).astype(np.float32)
+chunks = [audio[i:i+chunkSize] for i in range(0,len(audio),chunkSize)]
+
+def loop():
+    tmp = np.zeros(2*FFTSIZE+2,dtype=np.float32)
+    buffer = np.zeros(0,dtype=np.float32)
+    res = []
+    for c in chunks:
+        buffer = np.concatenate([buffer,c])
+        pos = 0
+        while pos + FFTSIZE <= len(buffer):
+            res.append(dsp.arm_mfcc_f32(mfccf32,buffer[pos:pos+FFTSIZE],tmp))
+            pos += HOP
+        buffer = buffer[pos:]
+    return(np.array(res))
+
+def stream():
+    s = dsp.arm_mfcc_stream_instance_f32()
+    dsp.arm_mfcc_stream_init_f32(s,mfccf32,HOP)
+    return(np.concatenate([dsp.arm_mfcc_stream_f32(s,c) for c in chunks]))
+
+def measure(f):
+    start = time.perf_counter()
+    res = f()
+    return(res,time.perf_counter() - start)
+
+ref,tLoop = measure(loop)
+res,tStream = measure(stream)
+
+print("%.0f s of audio, chunks of %d samples, %d frames" % (duration,chunkSize,res.shape[0]))
+print("%-22s %10s %12s" % ("","time (ms)","x real time"))
+print("%-22s %10.1f %12.0f" % ("Python loop",1e3*tLoop,duration/tLoop))
+print("%-22s %10.1f %12.0f" % ("arm_mfcc_stream_f32",1e3*tStream,duration/tStream))
+print("Same MFCC : %s" % np.array_equal(ref,res,equal_nan=True))
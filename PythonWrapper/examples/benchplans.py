@@ -0,0 +1,71 @@
+# Benchmark of the plan registry (cmsisdsp.plans).
+#
+# A graph with many transform nodes of the same length is simulated
+# by creating the same instances several times:
+# - with a new instance and a call to the init function for each node
+# - with the shared instance of the registry
+#
+# The time is given in us per node and the memory is the memory
+# allocated by the instances (measured with tracemalloc).
+#
+# python benchplans.py 1000
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+import cmsisdsp.mfcc as mfcc
+import cmsisdsp.plans as plans
+
+nbNodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+FFTSIZE = 1024
+NBMELFILTERS = 40
+NBDCTOUTPUTS = 13
+
+filtLen,filtPos,packedFilters = mfcc.melFilterMatrix(dt.F32,20,8000,NBMELFILTERS,16000,FFTSIZE)
+dctMatrixFilters = mfcc.dctMatrix(dt.F32,NBDCTOUTPUTS,NBMELFILTERS)
+window = np.hamming(FFTSIZE).astype(np.float32)
+mfccTables = (dctMatrixFilters,filtPos,filtLen,packedFilters,window)
+
+def newCfft():
+    S = dsp.arm_cfft_instance_f32()
+    dsp.arm_cfft_init_f32(S,FFTSIZE)
+    return(S)
+
+def newRfft():
+    S = dsp.arm_rfft_fast_instance_f32()
+    dsp.arm_rfft_fast_init_f32(S,FFTSIZE)
+    return(S)
+
+def newMfcc():
+    S = dsp.arm_mfcc_instance_f32()
+    dsp.arm_mfcc_init_f32(S,FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,*mfccTables)
+    return(S)
+
+def measure(f):
+    start = time.perf_counter()
+    nodes = [f() for i in range(nbNodes)]
+    t = 1e6*(time.perf_counter() - start)/nbNodes
+    del nodes
+    tracemalloc.start()
+    nodes = [f() for i in range(nbNodes)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return(t,memory)
+
+BENCHS = [("cfft_f32",newCfft,lambda : plans.cfft(FFTSIZE)),
+          ("rfft_fast_f32",newRfft,lambda : plans.rfftFast(FFTSIZE)),
+          ("mfcc_f32",newMfcc,lambda : plans.mfcc(FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,*mfccTables))
+         ]
+
+print("%d nodes, FFT length %d" % (nbNodes,FFTSIZE))
+print("%-14s %12s %12s %14s %14s" % ("","init us","plans us","init memory","plans memory"))
+for name,new,shared in BENCHS:
+    tInit,mInit = measure(new)
+    tPlans,mPlans = measure(shared)
+    print("%-14s %12.2f %12.2f %14d %14d" % (name,tInit,tPlans,mInit,mPlans))
+
+print(plans.stats())
@@ -0,0 +1,64 @@
+# Benchmark of the batched predictions of the classifiers.
+#
+# The classifiers are built from random parameters (no training).
+# The samples are classified:
+# - with one call of the predict function per sample
+# - with the predict_batch function
+# - with the predict_batch function and several threads
+#
+# python benchpredict.py 20000 16 4
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.batch
+
+nbSamples = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+dim = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+nbThreads = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+NBCLASSES = 5
+NBSUPPORTVECTORS = 64
+
+rng = np.random.default_rng(0)
+samples = rng.uniform(-1,1,(nbSamples,dim)).astype(np.float32)
+
+bayes = dsp.arm_gaussian_naive_bayes_instance_f32(
+    vectorDimension=dim,numberOfClasses=NBCLASSES,
+    theta=rng.uniform(-1,1,NBCLASSES*dim),
+    sigma=rng.uniform(0.5,1.5,NBCLASSES*dim),
+    classPriors=np.ones(NBCLASSES)/NBCLASSES,
+    epsilon=1e-9)
+
+svm = dsp.arm_svm_rbf_instance_f32()
+dsp.arm_svm_rbf_init_f32(svm,NBSUPPORTVECTORS,dim,
+    0.1,rng.uniform(-1,1,NBSUPPORTVECTORS),
+    rng.uniform(-1,1,NBSUPPORTVECTORS*dim),
+    [0,1],1.0/dim)
+
+def measure(f):
+    start = time.perf_counter()
+    res = f()
+    return(res,time.perf_counter() - start)
+
+def bench(name,single,batch,S,labels):
+    loop,tLoop = measure(lambda : np.array([single(S,x) for x in samples]))
+    full,tFull = measure(lambda : batch(S,samples))
+    threaded,tThreaded = measure(lambda : cmsisdsp.batch.runPredict(batch,S,
+                                 samples,nbThreads=nbThreads))
+    print("%-34s %10.1f %10.1f" % (name + " loop",1e3*tLoop,1.0))
+    print("%-34s %10.1f %10.1f" % (name + " batch",1e3*tFull,tLoop/tFull))
+    print("%-34s %10.1f %10.1f" % (name + " batch (%d threads)" % nbThreads,1e3*tThreaded,tLoop/tThreaded))
+    print("%-34s %10s" % ("Same labels as the loop",
+          np.array_equal(loop,labels(full)) and np.array_equal(loop,labels(threaded))))
+
+print("%d samples, dimension %d" % (nbSamples,dim))
+print("%-34s %10s %10s" % ("","time (ms)","speedup"))
+bench("bayes",
+      lambda S,x : dsp.arm_gaussian_naive_bayes_predict_f32(S,x)[1],
+      dsp.arm_gaussian_naive_bayes_predict_batch_f32,bayes,
+      lambda r : r[1])
+bench("svm rbf",
+      dsp.arm_svm_rbf_predict_f32,
+      dsp.arm_svm_rbf_predict_batch_f32,svm,
+      lambda r : r)
@@ -0,0 +1,80 @@
+# Benchmark of the reset of a filter instance and of the continuous
+# processing of a signal by blocks.
+#
+# Each block of a signal is filtered from a zero state:
+# - by calling arm_fir_init_q15 before each block
+# - by calling reset() on the instance before each block
+#
+# The signal is filtered continuously (the state is kept from one block
+# to the next one, like the FIR node of the kws example):
+# - by initializing the instance once and filtering the blocks
+# - by filtering the whole signal in one call
+#
+# python benchreset.py 10000 256
+import sys
+import time
+
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.fixedpoint as fix
+
+nbBlocks = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+blockSize = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+NUMTAPS = 10
+
+rng = np.random.default_rng(0)
+blocks = fix.toQ15(rng.uniform(-0.5,0.5,(nbBlocks,blockSize)))
+coefs = np.ones(NUMTAPS)/NUMTAPS
+
+def measure(f):
+    start = time.perf_counter()
+    res = f()
+    return(res,time.perf_counter() - start)
+
+def newFilter():
+    S = dsp.arm_fir_instance_q15()
+    dsp.arm_fir_init_q15(S,NUMTAPS,fix.toQ15(coefs),
+        np.zeros(NUMTAPS+blockSize-1,dtype=np.int16))
+    return(S)
+
+def init():
+    S = dsp.arm_fir_instance_q15()
+    res = []
+    for b in blocks:
+        dsp.arm_fir_init_q15(S,NUMTAPS,fix.toQ15(coefs),
+            np.zeros(NUMTAPS+blockSize-1,dtype=np.int16))
+        res.append(dsp.arm_fir_q15(S,b))
+    return(np.array(res))
+
+def reset():
+    S = newFilter()
+    res = []
+    for b in blocks:
+        S.reset()
+        res.append(dsp.arm_fir_q15(S,b))
+    return(np.array(res))
+
+def continuous():
+    S = newFilter()
+    res = np.zeros_like(blocks)
+    for i,b in enumerate(blocks):
+        dsp.arm_fir_q15(S,b,out=res[i])
+    return(res)
+
+def whole():
+    S = newFilter()
+    return(dsp.arm_fir_q15(S,blocks.reshape(-1)).reshape(nbBlocks,blockSize))
+
+ref,tInit = measure(init)
+res,tReset = measure(reset)
+refc,tWhole = measure(whole)
+resc,tContinuous = measure(continuous)
+
+print("%d blocks of %d samples" % (nbBlocks,blockSize))
+print("%-22s %10s %10s" % ("","time (ms)","speedup"))
+print("%-22s %10.1f %10.1f" % ("init for each block",1e3*tInit,1.0))
+print("%-22s %10.1f %10.1f" % ("reset for each block",1e3*tReset,tInit/tReset))
+print("%-22s %10.1f %10.1f" % ("continuous by blocks",1e3*tContinuous,tInit/tContinuous))
+print("%-22s %10.1f %10.1f" % ("continuous one call",1e3*tWhole,tInit/tWhole))
+print("Same output with reset : %s" % np.array_equal(ref,res))
+print("Same output by blocks and in one call : %s" % np.array_equal(refc,resc))
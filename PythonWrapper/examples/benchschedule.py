@@ -0,0 +1,69 @@
+# Benchmark of the compute graph scheduler on big random graphs.
+#
+# The graphs are random synchronous dataflow graphs : each node
+# is connected to one or two previous nodes with random rates
+# chosen so that the graph is consistent.
+#
+# python benchschedule.py 100 200 500
+import sys
+import time
+import math
+import random
+
+from cmsisdsp.cg.scheduler import *
+
+class BenchNode(GenericNode):
+    def __init__(self,name):
+        GenericNode.__init__(self,name)
+
+    @property
+    def typeName(self):
+        return "BenchNode"
+
+def randomGraph(nbNodes,seed=0,maxInputs=2,maxRepetition=4):
+    """
+     Random consistent graph with nbNodes nodes.
+
+     :param nbNodes: Number of nodes.
+     :type nbNodes: int
+     :param seed: Seed of the random generator.
+     :type seed: int
+     :param maxInputs: Maximum number of inputs of a node.
+     :type maxInputs: int
+     :param maxRepetition: Maximum number of executions of a node in a schedule.
+     :type maxRepetition: int
+     :return: The graph.
+     :rtype: Graph
+
+    """
+    rng = random.Random(seed)
+    floatType = CType(F32)
+    nodes = []
+    repetitions = []
+    g = Graph()
+    for i in range(nbNodes):
+        node = BenchNode("node%d" % i)
+        repetition = rng.randint(1,maxRepetition)
+        if i > 0:
+           nbInputs = rng.randint(1,min(maxInputs,i))
+           for j,src in enumerate(rng.sample(range(i),nbInputs)):
+               # Rates are chosen such that
+               # produced * repetition[src] == consumed * repetition[node]
+               total = math.lcm(repetitions[src],repetition) * rng.randint(1,3)
+               o = "o%d" % len(nodes[src]._outputs)
+               nodes[src].addOutput(o,floatType,total // repetitions[src])
+               node.addInput("i%d" % j,floatType,total // repetition)
+               g.connect(nodes[src][o],node["i%d" % j])
+        nodes.append(node)
+        repetitions.append(repetition)
+    return(g)
+
+if __name__ == "__main__":
+   sizes = [int(x) for x in sys.argv[1:]] or [50,100,200]
+   conf = Configuration()
+   for nb in sizes:
+       g = randomGraph(nb)
+       start = time.perf_counter()
+       sched = g.computeSchedule(config=conf)
+       duration = time.perf_counter() - start
+       print("%5d nodes, schedule length %6d : %8.3f s" % (nb,len(sched.schedule),duration))
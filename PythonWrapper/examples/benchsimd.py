@@ -0,0 +1,126 @@
+# Benchmark of the host SIMD variants of the extension modules.
+#
+# The package must be built with the variants:
+# CMSISDSP_HOST_SIMD=1 pip install .
+#
+# Each kernel is run with the default modules (CMSISDSP_SIMD=none)
+# and with the variant selected for the CPU, in two Python processes.
+# The outputs are compared : the fixed point results must be
+# bit exact.
+#
+# python benchsimd.py 20
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+NBSAMPLES = 65536
+NBTAPS = 64
+FFTSIZE = 1024
+MATSIZE = 64
+
+def q(x,fmt):
+    # Conversion of the random inputs to fixed point
+    scale = {np.int16 : 1<<15, np.int32 : 1<<31}[fmt]
+    return(np.clip(np.round(x*scale),np.iinfo(fmt).min,np.iinfo(fmt).max).astype(fmt))
+
+def kernels(dsp):
+    """
+     Kernels of the benchmark.
+
+     :param dsp: The cmsisdsp package.
+     :type dsp: module
+     :return: Dictionary of functions without arguments.
+     :rtype: dict
+
+    """
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5,0.5,NBSAMPLES)
+    coefs = rng.uniform(-0.5,0.5,NBTAPS) / NBTAPS
+    signal = rng.uniform(-0.5,0.5,2*FFTSIZE) / FFTSIZE
+    a = rng.uniform(-0.5,0.5,(MATSIZE,MATSIZE)) / MATSIZE
+    b = rng.uniform(-0.5,0.5,(MATSIZE,MATSIZE))
+
+    res = {}
+    state = np.zeros(NBTAPS+NBSAMPLES-1)
+    for ext,fmt in [("f32",np.float32),("q31",np.int32),("q15",np.int16)]:
+        c = coefs.astype(fmt) if fmt == np.float32 else q(coefs,fmt)
+        x = samples.astype(fmt) if fmt == np.float32 else q(samples,fmt)
+        S = getattr(dsp,"arm_fir_instance_%s" % ext)()
+        getattr(dsp,"arm_fir_init_%s" % ext)(S,NBTAPS,c,state.astype(fmt))
+        f = getattr(dsp,"arm_fir_%s" % ext)
+        res["fir_%s" % ext] = (lambda f=f,S=S,x=x: f(S,x))
+
+    for ext,fmt in [("f32",np.float32),("q31",np.int32),("q15",np.int16)]:
+        x = signal.astype(fmt) if fmt == np.float32 else q(signal,fmt)
+        S = getattr(dsp,"arm_cfft_instance_%s" % ext)()
+        getattr(dsp,"arm_cfft_init_%s" % ext)(S,FFTSIZE)
+        f = getattr(dsp,"arm_cfft_%s" % ext)
+        res["cfft_%s" % ext] = (lambda f=f,S=S,x=x: f(S,x,0,1))
+
+    af,bf = a.astype(np.float32),b.astype(np.float32)
+    res["mat_mult_f32"] = lambda : dsp.arm_mat_mult_f32(af,bf)[1]
+    a31,b31 = q(a,np.int32),q(b,np.int32)
+    res["mat_mult_q31"] = lambda : dsp.arm_mat_mult_q31(a31,b31)[1]
+    a15,b15 = q(a,np.int16),q(b,np.int16)
+    tmp = np.zeros(MATSIZE*MATSIZE,dtype=np.int16)
+    res["mat_mult_q15"] = lambda : dsp.arm_mat_mult_q15(a15,b15,tmp)[1]
+
+    # Basic kernels which are auto-vectorized
+    for ext,fmt in [("f32",np.float32),("q31",np.int32),("q15",np.int16)]:
+        x = samples.astype(fmt) if fmt == np.float32 else q(samples,fmt)
+        f = getattr(dsp,"arm_add_%s" % ext)
+        res["add_%s" % ext] = (lambda f=f,x=x: f(x,x))
+    x15 = q(samples,np.int16)
+    res["dot_prod_q15"] = lambda : dsp.arm_dot_prod_q15(x15,x15)
+    return(res)
+
+def child(outputFile,nbRuns):
+    # Run in the process with the modules selected by CMSISDSP_SIMD
+    import cmsisdsp as dsp
+    outputs = {}
+    times = {}
+    for name,f in kernels(dsp).items():
+        # First run from the initial state of the filters
+        outputs[name] = np.asarray(f())
+        times[name] = min(timeit.repeat(f,number=1,repeat=nbRuns))
+    np.savez(outputFile,**outputs)
+    print(json.dumps({"variant" : dsp.simdVariant(), "times" : times}))
+
+def run(simd,outputFile,nbRuns):
+    env = dict(os.environ)
+    if simd is None:
+       env.pop("CMSISDSP_SIMD",None)
+    else:
+       env["CMSISDSP_SIMD"] = simd
+    res = subprocess.run([sys.executable,__file__,"--child",outputFile,str(nbRuns)],
+                         env=env,check=True,stdout=subprocess.PIPE,text=True)
+    return(json.loads(res.stdout))
+
+if len(sys.argv) > 1 and sys.argv[1] == "--child":
+   child(sys.argv[2],int(sys.argv[3]))
+   sys.exit(0)
+
+nbRuns = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+with tempfile.TemporaryDirectory() as d:
+     refFile = os.path.join(d,"ref.npz")
+     simdFile = os.path.join(d,"simd.npz")
+     ref = run("none",refFile,nbRuns)
+     simd = run(None,simdFile,nbRuns)
+     refOutputs = np.load(refFile)
+     simdOutputs = np.load(simdFile)
+
+     print("Variant : %s" % simd["variant"])
+     print("%-14s %12s %12s %8s %6s" % ("kernel","default (us)","simd (us)","speedup","exact"))
+     for name in ref["times"]:
+         t0 = ref["times"][name]
+         t1 = simd["times"][name]
+         exact = np.array_equal(refOutputs[name],simdOutputs[name])
+         print("%-14s %12.1f %12.1f %8.2f %6s" % (name,1e6*t0,1e6*t1,t0/t1,exact))
+         if not exact and not name.endswith("f32"):
+            print("Error : fixed point results are different for %s" % name)
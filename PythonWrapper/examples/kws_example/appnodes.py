@@ -94,19 +94,20 @@ class FIR(GenericNode):
         GenericNode.__init__(self,inputSize,outSize,fifoin,fifoout)
         self._firq15=dsp.arm_fir_instance_q15()
 
-        
-        
+        # The instance is initialized once : it owns a copy of the
+        # coefficients and of the state which is kept from one
+        # block to the next one
+        blockSize=self._inputSize
+        numTaps=10
+        stateLength = numTaps + blockSize - 1
+        dsp.arm_fir_init_q15(self._firq15,numTaps,fix.toQ15(np.ones(numTaps)/numTaps),np.zeros(stateLength,dtype=np.int16))
+
 
     def run(self):
         a=self.getReadBuffer()
         b=self.getWriteBuffer()
         errorStatus = 0
 
-        blockSize=self._inputSize
-        numTaps=10
-        stateLength = numTaps + blockSize - 1
-        dsp.arm_fir_init_q15(self._firq15,10,fix.toQ15(np.ones(10)/10.0),np.zeros(stateLength,dtype=np.int16))
-
         b[:] = dsp.arm_fir_q15(self._firq15,a)
         
         return(errorStatus)
@@ -145,22 +145,41 @@ class FIR<q15_t,inputSize,q15_t,inputSize>: public GenericNode<q15_t,inputSize,q
 public:
     FIR(FIFOBase<q15_t> &src,FIFOBase<q15_t> &dst):GenericNode<q15_t,inputSize,q15_t,inputSize>(src,dst){
         int blockSize=inputSize;
-        int numTaps=10;
-        int stateLength = numTaps + blockSize - 1;
+        // arm_fir_init_q15 is clearing NUMTAPS + blockSize samples
+        // (the q15 FIR with ARM_MATH_DSP needs one more sample)
+        int stateLength = NUMTAPS + blockSize;
+
+        // The filter is initialized once so that the state is kept
+        // from one block to the next one.
+        // An initialization error is returned by run and stops
+        // the scheduler.
+        state=(q15_t*)malloc(stateLength * sizeof(q15_t));
+        if (state == NULL)
+        {
+            initStatus = ARM_MATH_ARGUMENT_ERROR;
+        }
+        else
+        {
+            initStatus = arm_fir_init_q15(&(this->firq15),NUMTAPS,fir_coefs,state,blockSize);
+        }
+    };
 
-        state=(q15_t*)malloc(stateLength * sizeof(q15_t*));
+    ~FIR()
+    {
+        free(state);
     };
 
     int run(){
         #if defined(DEBUG)
         Serial.println("==== FIR");
         #endif
+        if (initStatus != ARM_MATH_SUCCESS)
+        {
+            return(initStatus);
+        }
         q15_t *a=this->getReadBuffer();
         q15_t *b=this->getWriteBuffer();
         int blockSize=inputSize;
-        int stateLength = NUMTAPS + blockSize - 1;
-
-        arm_status status=arm_fir_init_q15(&(this->firq15),NUMTAPS,fir_coefs,state,blockSize);
 
         arm_fir_q15(&(this->firq15),a,b,blockSize);
         return(0);
@@ -168,6 +187,7 @@ public:
 
 arm_fir_instance_q15 firq15;
 q15_t *state;
+arm_status initStatus;
 
 };
 
@@ -0,0 +1,120 @@
+# Pairwise distances (cdist, pdist and top-k) compared with the
+# distance functions called for each pair of rows
+import cmsisdsp as dsp
+import cmsisdsp.batch
+import numpy as np
+
+rng = np.random.default_rng(0)
+
+METRICS = ["braycurtis","canberra","chebyshev","cityblock","correlation",
+           "cosine","euclidean","jensenshannon","minkowski"]
+BOOLMETRICS = ["dice","hamming","jaccard","kulsinski","rogerstanimoto",
+               "russellrao","sokalmichener","sokalsneath","yule"]
+
+NBCOLS = 19
+NBBITS = 32*3 - 5
+
+def pairDistance(metric,a,b,p=2):
+    if metric == "minkowski":
+       return(dsp.arm_minkowski_distance_f32(a,b,p))
+    return(getattr(dsp,"arm_%s_distance_f32" % metric)(a,b))
+
+def pairBoolDistance(metric,a,b):
+    return(getattr(dsp,"arm_%s_distance" % metric)(a,b,NBBITS))
+
+def cdistRef(f,XA,XB):
+    return(np.array([[f(a,b) for b in XB] for a in XA],dtype=np.float32))
+
+def pdistRef(f,X):
+    return(np.array([f(X[i],X[j]) for i in range(len(X)) for j in range(i+1,len(X))],dtype=np.float32))
+
+# Indexes of the k smallest distances of each row (ties sorted by index)
+def topkRef(d,k):
+    idx = np.argsort(d,axis=1,kind="stable")[:,:k]
+    return(idx,np.take_along_axis(d,idx,axis=1))
+
+# Positive samples for braycurtis and jensenshannon
+XA = rng.uniform(0.1,1,(7,NBCOLS))
+XB = rng.uniform(0.1,1,(40,NBCOLS))
+# Duplicate rows are giving ties
+XB[30:35] = XB[3]
+
+for metric in METRICS:
+    for p in ([2,1,3] if metric == "minkowski" else [2]):
+        f = lambda a,b : pairDistance(metric,a,b,p)
+        args = (metric,p) if p != 2 else (metric,)
+        ref = cdistRef(f,XA,XB)
+        res = dsp.arm_cdist_f32(XA,XB,*args)
+        assert res.shape == (len(XA),len(XB))
+        assert np.array_equal(res,ref)
+
+        ref = pdistRef(f,XB)
+        res = dsp.arm_pdist_f32(XB,*args)
+        assert np.array_equal(res,ref)
+
+        # Ranges of rows like runPdist
+        out = np.zeros(len(ref),dtype=np.float32)
+        for first,last in [(0,3),(3,17),(17,39),(39,40)]:
+            dsp.arm_pdist_f32(XB,metric,p,first,last,out=out)
+        assert np.array_equal(out,ref)
+        # Without out=, the distances of the other rows are zero
+        for first,last in [(0,2),(5,17),(39,40)]:
+            res = dsp.arm_pdist_f32(XB,metric,p,first,last)
+            start = first*len(XB) - first*(first+1)//2
+            end = last*len(XB) - last*(last+1)//2
+            assert np.array_equal(res[start:end],ref[start:end])
+            assert not np.any(res[:start]) and not np.any(res[end:])
+        for nbThreads in [2,3,8]:
+            res = cmsisdsp.batch.runPdist(dsp.arm_pdist_f32,XB,metric,p,nbThreads=nbThreads)
+            assert np.array_equal(res,ref)
+
+        d = cdistRef(f,XA,XB)
+        for k in [1,5,len(XB)]:
+            refIdx,refDist = topkRef(d,k)
+            idx,dist = dsp.arm_cdist_topk_f32(XA,XB,metric,k,*args[1:])
+            assert np.array_equal(idx,refIdx)
+            assert np.array_equal(dist,refDist)
+        print("%-14s p=%d : OK" % (metric,p))
+
+# Order of the minkowski distance : 2 by default, must be positive
+assert np.array_equal(dsp.arm_cdist_f32(XA,XB,"minkowski"),
+                      dsp.arm_cdist_f32(XA,XB,"minkowski",2))
+assert not np.array_equal(dsp.arm_pdist_f32(XB,"minkowski",3),
+                          dsp.arm_pdist_f32(XB,"minkowski"))
+for f,args in [(dsp.arm_cdist_f32,(XA,XB,"minkowski",0)),
+               (dsp.arm_pdist_f32,(XB,"minkowski",0)),
+               (dsp.arm_cdist_topk_f32,(XA,XB,"minkowski",1,-1)),
+               (dsp.arm_cdist_f32,(XA,XB,"unknown"))]:
+    try:
+       f(*args)
+       assert False
+    except ValueError:
+       pass
+
+# Boolean distances : the rows are packed bits
+BA = rng.integers(0,1<<32,(7,3),dtype=np.uint32)
+BB = rng.integers(0,1<<32,(40,3),dtype=np.uint32)
+BB[30:35] = BB[3]
+
+for metric in BOOLMETRICS:
+    f = lambda a,b : pairBoolDistance(metric,a,b)
+    ref = cdistRef(f,BA,BB)
+    res = dsp.arm_cdist_bool(BA,BB,metric,NBBITS)
+    assert np.array_equal(res,ref)
+
+    ref = pdistRef(f,BB)
+    res = dsp.arm_pdist_bool(BB,metric,NBBITS)
+    assert np.array_equal(res,ref)
+    for nbThreads in [2,3]:
+        res = cmsisdsp.batch.runPdist(dsp.arm_pdist_bool,BB,metric,NBBITS,nbThreads=nbThreads)
+        assert np.array_equal(res,ref)
+
+    d = cdistRef(f,BA,BB)
+    for k in [1,5]:
+        refIdx,refDist = topkRef(d,k)
+        idx,dist = dsp.arm_cdist_topk_bool(BA,BB,metric,k,NBBITS)
+        assert np.array_equal(idx,refIdx)
+        assert np.array_equal(dist,refDist)
+    print("%-14s : OK" % metric)
+
+print("OK")
@@ -0,0 +1,70 @@
+# DTW distance without the cost matrix and nearest templates search
+# compared with arm_dtw_distance_f32
+import cmsisdsp as dsp
+import numpy as np
+
+rng = np.random.default_rng(0)
+
+def window(queryLength,templateLength,winSize):
+    if winSize is None:
+       return(None)
+    w = np.zeros((queryLength,templateLength),dtype=np.int8)
+    status,w = dsp.arm_dtw_init_window_q7(dsp.ARM_DTW_SAKOE_CHIBA_WINDOW,winSize,w)
+    assert status == 0
+    return(w)
+
+def distances(query,template):
+    return(np.abs(query[:,None] - template[None,:]).astype(np.float32))
+
+def fullDistance(query,template,w):
+    status,d,_ = dsp.arm_dtw_distance_f32(distances(query,template),w)
+    return(status,d)
+
+# arm_dtw_distance_only_f32 is arm_dtw_distance_f32 without the
+# cost matrix (the rows are along the longest dimension)
+for queryLength,templateLength in [(1,1),(1,20),(20,1),(30,30),(40,25),(25,40)]:
+    for winSize in [None,1,5,50]:
+        w = window(queryLength,templateLength,winSize)
+        for trial in range(5):
+            query = rng.standard_normal(queryLength).astype(np.float32)
+            template = rng.standard_normal(templateLength).astype(np.float32)
+            refStatus,ref = fullDistance(query,template,w)
+            status,d = dsp.arm_dtw_distance_only_f32(distances(query,template),w)
+            assert status == refStatus
+            if status == 0:
+               assert d == ref
+        print("distance only %2d x %2d, window %s : OK" % (queryLength,templateLength,winSize))
+
+# arm_dtw_topk_f32 is giving the k nearest templates of a brute force
+# search with arm_dtw_distance_f32 (ties sorted by index). The index
+# is -1 when there is no path in the window.
+def bruteForce(query,templates,w,k):
+    dist = []
+    for t in templates:
+        status,d = fullDistance(query,t,w)
+        dist.append(d if status == 0 else np.inf)
+    dist = np.array(dist,dtype=np.float32)
+    idx = np.lexsort((np.arange(len(dist)),dist))[:k]
+    return(np.where(np.isinf(dist[idx]),-1,idx),dist[idx])
+
+for queryLength,templateLength in [(32,32),(40,32),(32,40)]:
+    for winSize in [None,3,10]:
+        w = window(queryLength,templateLength,winSize)
+        t = np.linspace(0,1,templateLength)
+        patterns = [np.sin(2*np.pi*(f*t + rng.uniform())) for f in rng.uniform(1,4,4)]
+        templates = np.array([patterns[p % 4] + 0.2*rng.standard_normal(templateLength) 
+                              for p in range(200)],dtype=np.float32)
+        # Duplicate templates are giving ties
+        templates[150:160] = templates[10]
+        query = np.interp(np.linspace(0,1,queryLength),t,templates[10])
+        query = (query + 0.1*rng.standard_normal(queryLength)).astype(np.float32)
+        for k in [1,5,20]:
+            refIdx,refDist = bruteForce(query,templates,w,k)
+            idx,dist,nbComputed = dsp.arm_dtw_topk_f32(query,templates,w,k)
+            assert np.array_equal(idx,refIdx)
+            assert np.array_equal(dist,refDist)
+            assert k <= nbComputed <= len(templates)
+            print("topk %2d x %2d, window %s, k=%2d : DTW computed for %3d templates" % 
+                (queryLength,templateLength,winSize,k,nbComputed))
+
+print("OK")
@@ -0,0 +1,100 @@
+# FFT convolution and correlation (fastconv) compared with the
+# direct kernels of CMSIS-DSP
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+import cmsisdsp.fastconv as fastconv
+import cmsisdsp.fixedpoint as fix
+import numpy as np
+from numpy.testing import assert_allclose
+
+rng = np.random.default_rng(0)
+
+NAMES = {dt.F32:"f32",dt.Q31:"q31",dt.Q15:"q15"}
+
+# Lengths of the signal and of the impulse response
+LENGTHS = [(1000,31),(5000,400),(3000,3000),(20000,2500)]
+
+# The signal is using the full range and the impulse response is
+# scaled so that the output is not saturated
+def signals(dtype,nbA,nbB):
+    a = rng.uniform(-1,1,nbA)
+    b = rng.uniform(-1,1,nbB)/nbB
+    if dtype == dt.Q31:
+       return(fix.toQ31(a),fix.toQ31(b))
+    if dtype == dt.Q15:
+       return(fix.toQ15(a),fix.toQ15(b))
+    return(a.astype(np.float32),b.astype(np.float32))
+
+# The outputs of overlap-add are the sum of two inverse
+# transforms : the q31 error can be twice bigger
+def checkError(dtype,res,ref,q31Bound=2**-20):
+    res = res.astype(np.float64)
+    ref = ref.astype(np.float64)
+    err = np.max(np.abs(res - ref))
+    if dtype == dt.Q15:
+       print("  max error %d LSB" % err)
+       assert err <= 1
+    elif dtype == dt.Q31:
+       rel = err/np.max(np.abs(ref))
+       print("  relative error %g (2**%.1f)" % (rel,np.log2(rel) if rel > 0 else -np.inf))
+       assert rel <= q31Bound
+    else:
+       print("  max error %g" % err)
+       assert_allclose(res,ref,rtol=0,atol=1e-5*np.max(np.abs(ref)))
+
+for dtype in [dt.F32,dt.Q31,dt.Q15]:
+    for nbA,nbB in LENGTHS:
+        a,b = signals(dtype,nbA,nbB)
+        print("%s : %d x %d" % (NAMES[dtype],nbA,nbB))
+
+        # Convolution
+        conv = fastconv.convolve(a,b,dtype,method="direct")
+        res = fastconv.convolve(a,b,dtype,method="fft")
+        assert len(res) == len(conv)
+        checkError(dtype,res,conv)
+
+        # Correlation
+        ref = fastconv.correlate(a,b,dtype,method="direct")
+        res = fastconv.correlate(a,b,dtype,method="fft")
+        assert len(res) == len(ref)
+        checkError(dtype,res,ref)
+
+        # Streaming by chunks of random lengths : process followed by
+        # flush is the FFT convolution (overlap-save) or is as close
+        # to the direct convolution (overlap-add)
+        fft = fastconv.convolve(a,b,dtype,method="fft")
+        B = fastconv.defaultBlockSize(len(b),len(a))
+        for streaming in [fastconv.OverlapSave,fastconv.OverlapAdd]:
+            c = streaming(b,dtype,B)
+            res = []
+            start = 0
+            while start < len(a):
+                nb = int(rng.integers(1,3*B))
+                res.append(c.process(a[start:start+nb]))
+                start += nb
+            res.append(c.flush())
+            res = np.concatenate(res)
+            assert res.dtype == fft.dtype
+            assert len(res) == len(fft)
+            if streaming == fastconv.OverlapSave:
+               assert np.array_equal(res,fft)
+            else:
+               checkError(dtype,res,conv,q31Bound=2**-19)
+
+# The method is checked for all the datatypes
+for dtype in [dt.F64,dt.F32,dt.Q31,dt.Q15]:
+    a,b = np.zeros(10,dtype=np.int16),np.zeros(5,dtype=np.int16)
+    for f in [fastconv.convolve,fastconv.correlate]:
+        try:
+           f(a,b,dtype,method="unknown")
+           assert False
+        except ValueError:
+           pass
+
+try:
+   fastconv.convolve(np.ones(10),np.ones(5),dt.F64,method="direct")
+   assert False
+except ValueError:
+   pass
+
+print("OK")
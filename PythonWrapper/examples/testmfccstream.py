@@ -0,0 +1,90 @@
+# Streaming MFCC compared with arm_mfcc_f32 (q31, q15) called on
+# each frame : the features must be the same (bit exact)
+import cmsisdsp as dsp
+import cmsisdsp.fixedpoint as f
+import cmsisdsp.mfcc as mfcc
+import numpy as np
+from cmsisdsp.datatype import F32,Q31,Q15
+import cmsisdsp.datatype as dt
+
+SAMPLERATE = 16000
+FFTSIZE = 256
+NBMELFILTERS = 20
+NBDCTOUTPUTS = 13
+
+rng = np.random.default_rng(0)
+audio = rng.uniform(-0.5,0.5,8000)
+
+def mfccInstance(dtype):
+    filtLen,filtPos,packedFilters = mfcc.melFilterMatrix(dtype,64,SAMPLERATE/2,NBMELFILTERS,SAMPLERATE,FFTSIZE)
+    dctMatrixFilters = mfcc.dctMatrix(dtype,NBDCTOUTPUTS,NBMELFILTERS)
+    window = dt.convert(np.hamming(FFTSIZE),dtype)
+    if dtype == F32:
+       S = dsp.arm_mfcc_instance_f32()
+       dsp.arm_mfcc_init_f32(S,FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,dctMatrixFilters,
+          filtPos,filtLen,packedFilters,window)
+    elif dtype == Q31:
+       S = dsp.arm_mfcc_instance_q31()
+       dsp.arm_mfcc_init_q31(S,FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,dctMatrixFilters,
+          filtPos,filtLen,packedFilters,window)
+    else:
+       S = dsp.arm_mfcc_instance_q15()
+       dsp.arm_mfcc_init_q15(S,FFTSIZE,NBMELFILTERS,NBDCTOUTPUTS,dctMatrixFilters,
+          filtPos,filtLen,packedFilters,window)
+    return(S)
+
+# MFCC of each frame with arm_mfcc_f32 (q31, q15)
+def reference(dtype,S,samples,hop):
+    res = []
+    for pos in range(0,len(samples)-FFTSIZE+1,hop):
+        frame = samples[pos:pos+FFTSIZE]
+        if dtype == F32:
+           res.append(dsp.arm_mfcc_f32(S,frame,np.zeros(2*FFTSIZE+2,dtype=np.float32)))
+        elif dtype == Q31:
+           status,m = dsp.arm_mfcc_q31(S,frame,np.zeros(2*FFTSIZE,dtype=np.int32))
+           assert status == 0
+           res.append(m)
+        else:
+           status,m = dsp.arm_mfcc_q15(S,frame,np.zeros(2*FFTSIZE,dtype=np.int32))
+           assert status == 0
+           res.append(m)
+    return(np.array(res))
+
+def stream(dtype,s,chunks):
+    res = []
+    for c in chunks:
+        if dtype == F32:
+           m = dsp.arm_mfcc_stream_f32(s,c)
+        else:
+           if dtype == Q31:
+              status,m = dsp.arm_mfcc_stream_q31(s,c)
+           else:
+              status,m = dsp.arm_mfcc_stream_q15(s,c)
+           assert status == 0
+        assert m.shape[1] == NBDCTOUTPUTS
+        res.append(m)
+    return(np.concatenate(res))
+
+for dtype,name in [(F32,"f32"),(Q31,"q31"),(Q15,"q15")]:
+    S = mfccInstance(dtype)
+    samples = dt.convert(audio,dtype)
+    if dtype == F32:
+       samples = samples.astype(np.float32)
+    for hop in [1,100,160,FFTSIZE]:
+        ref = reference(dtype,S,samples,hop)
+
+        s = getattr(dsp,"arm_mfcc_stream_instance_%s" % name)()
+        getattr(dsp,"arm_mfcc_stream_init_%s" % name)(s,S,hop)
+
+        # Chunks of random lengths (some are empty or longer than a frame)
+        for trial in range(3):
+            bounds = np.sort(rng.integers(0,len(samples),20))
+            chunks = np.split(samples,bounds)
+            res = stream(dtype,s,chunks)
+            print("%s hop %3d : %d frames" % (name,hop,res.shape[0]))
+            assert res.shape == ref.shape
+            assert np.array_equal(res,ref,equal_nan=True)
+            # The next signal is starting from a new stream
+            getattr(dsp,"arm_mfcc_stream_reset_%s" % name)(s)
+
+print("OK")
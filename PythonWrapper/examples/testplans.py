@@ -0,0 +1,81 @@
+# Registry of the shared transform instances (cmsisdsp.plans) :
+# hits, misses and evictions and results of the evicted plans
+import gc
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+import cmsisdsp.plans as plans
+
+N = 128
+NORMALIZE = np.sqrt(2.0/N)
+
+rng = np.random.default_rng(0)
+signal = rng.uniform(-1,1,N).astype(np.float32)
+
+# DCT-IV computed with numpy
+n = np.arange(N)
+ref = NORMALIZE*np.cos(np.pi/N*np.outer(n+0.5,n+0.5)).dot(signal)
+
+def dct4(S):
+    scratch = plans.dct4Scratch(N)
+    return(dsp.arm_dct4_f32(S,scratch.buffer,signal.copy()))
+
+def checkStats(hits,misses,evictions,size):
+    s = plans.stats()
+    print(s)
+    assert s["hits"] == hits
+    assert s["misses"] == misses
+    assert s["evictions"] == evictions
+    assert s["size"] == size
+
+plans.clear()
+plans.setMaxSize(2)
+checkStats(0,0,0,0)
+
+cfft = plans.cfft(64)
+checkStats(0,1,0,1)
+assert plans.cfft(64) is cfft
+checkStats(1,1,0,1)
+
+# Different datatype : different plan
+cfftq31 = plans.cfft(64,dtype=dt.Q31)
+assert cfftq31 is not cfft
+checkStats(1,2,0,2)
+
+# The least recently used plan (cfft q31) is evicted
+assert plans.cfft(64) is cfft
+S = plans.dct4(N,NORMALIZE)
+checkStats(2,3,1,2)
+assert np.allclose(dct4(S),ref,atol=1e-5)
+
+# The dct4 plan is evicted : the registry is no more
+# referencing its rfft and cfft instances
+plans.rfftFast(64)
+plans.rfft(64)
+checkStats(2,5,3,2)
+assert plans.dct4(N,NORMALIZE) is not S
+checkStats(2,6,4,2)
+
+# The evicted plan is still valid after the memory of the
+# registry has been released and reused
+gc.collect()
+other = [plans.cfft(1024,dtype=t) for t in [dt.F32,dt.Q31,dt.Q15]]
+assert np.allclose(dct4(S),ref,atol=1e-5)
+
+# Same with the instances given to the init function
+# only referenced by the dct4 instance
+S = dsp.arm_dct4_instance_f32()
+status = dsp.arm_dct4_init_f32(S,dsp.arm_rfft_instance_f32(),
+                               dsp.arm_cfft_radix4_instance_f32(),
+                               N,N>>1,NORMALIZE)
+assert status == 0
+gc.collect()
+other = [dsp.arm_rfft_instance_f32() for i in range(10)]
+assert np.allclose(dct4(S),ref,atol=1e-5)
+
+# The statistics are reset
+plans.clear()
+checkStats(0,0,0,0)
+plans.setMaxSize(plans.DEFAULT_MAXSIZE)
+
+print("OK")
@@ -1,34 +1,51 @@
-import BasicMaths
-import Bayes
-import BIQUAD
-import ComplexMaths
-import Controller
-import Convolutions
-import Decimate
-import Distance
-import FastMath
-import FIR
-import Matrix
-import Softmax 
-import Stats
-import Support
-import SVM 
-import Transform
+import argparse
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import Tools
 
-BasicMaths.generatePatterns()
-Bayes.generatePatterns()
-BIQUAD.generatePatterns()
-ComplexMaths.generatePatterns()
-Controller.generatePatterns()
-Convolutions.generatePatterns()
-Decimate.generatePatterns()
-Distance.generatePatterns()
-FastMath.generatePatterns()
-FIR.generatePatterns()
-Interpolate.generatePatterns()
-Matrix.generatePatterns()
-Softmax.generatePatterns()
-Stats.generatePatterns()
-Support.generatePatterns()
-SVM.generatePatterns() 
-Transform.generatePatterns()
+# Each module is generating its patterns and parameters in its own
+# directories so the modules can be run in parallel.
+MODULES = ["BasicMaths",
+           "Bayes",
+           "BIQUAD",
+           "ComplexMaths",
+           "Controller",
+           "Convolutions",
+           "Decimate",
+           "Distance",
+           "FastMath",
+           "FIR",
+           "Interpolate",
+           "Matrix",
+           "Softmax",
+           "Stats",
+           "Support",
+           "SVM",
+           "Transform"]
+
+def setBinary(binary):
+    Tools.BINARY = binary
+
+def generate(name):
+    importlib.import_module(name).generatePatterns()
+    return(name)
+
+parser = argparse.ArgumentParser(description='Generate the test patterns')
+parser.add_argument('-j', type=int, default=os.cpu_count(), help="Number of processes (1 to run the modules one after the other)")
+parser.add_argument('-b', action='store_true', help="Write the patterns in binary containers")
+parser.add_argument('modules', nargs='*', default=MODULES, help="Modules to run (all by default)")
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    if args.j is None or args.j <= 1:
+        setBinary(args.b)
+        for name in args.modules:
+            generate(name)
+            print(name)
+    else:
+        with ProcessPoolExecutor(max_workers=args.j,initializer=setBinary,initargs=(args.b,)) as executor:
+            futures = [executor.submit(generate,name) for name in args.modules]
+            for f in as_completed(futures):
+                print(f.result())
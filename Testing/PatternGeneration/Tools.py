@@ -1,7 +1,12 @@
 import os.path
 import struct
+import sys
 import numpy as np
 
+# The binary pattern format is shared with the test scripts
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import TestScripts.PatternFile as PatternFile
+
 def normalize(a):
   return(a/np.max(np.abs(a)))
 
@@ -61,20 +66,10 @@ def createMissingDir(destPath):
 def packset(a):
     b = np.packbits(a)
     newSize = int(np.ceil(b.shape[0] / 4.0)) * 4
-    c = np.copy(b)
-    c.resize(newSize)
-    #print(c)
-    vecSize = round(newSize/4)
-    c=c.reshape(vecSize,4)
-    #print(c)
-    r = np.zeros(vecSize)
-    result = []
-    for i in range(0,vecSize):
-        #print(c[i,:])
-        #print("%X %X %X %X" % (c[i,0],c[i,1],c[i,2],c[i,3]))
-        d = (c[i,0] << 24) | (c[i,1] << 16) | (c[i,2] << 8) | c[i,3] 
-        result.append(np.uint32(d))
-    return(result) 
+    c = np.zeros(newSize,dtype=np.uint8)
+    c[:b.shape[0]] = b
+    # Big endian words : the first byte is the most significant one
+    return(list(c.view(">u4").astype(np.uint32)))
 
 def float_to_hex(f):
     """ Convert and x86 float to an ARM unsigned long int.
@@ -171,12 +166,159 @@ def u32(r):
 def u64(r):
   return ("0x%s" % format(struct.unpack('<Q', struct.pack('<Q', r))[0],'016X'))
 
+# Vectorized versions of the conversions above used to write
+# the pattern files. A whole array is converted at once and the
+# result is the same as calling the scalar functions on each sample.
+
+def floats_to_bits(data,dt,udt):
+    """ Vectorized float_to_hex, float16_to_hex and float64_to_hex.
+  
+    Args:
+      data (array): values to be converted
+      dt (dtype): float type of the samples
+      udt (dtype): unsigned type of same size
+    Raises:
+      OverflowError if a value is too big for the float type
+    Returns:
+      array : bit representation of the samples
+    """
+    d = np.asarray(data).reshape(-1)
+    with np.errstate(over="ignore"):
+      r = d.astype(dt)
+    if np.any(np.isinf(r) & ~np.isinf(d)):
+      raise OverflowError("float too large to pack")
+    return(r.view(udt))
+
+def to_fixed_bits(data,nbBits):
+    """ Vectorized to_q63, to_q31, to_q15 and to_q7.
+  
+    Args:
+      data (array): values to be converted
+      nbBits (int): word size (64, 32, 16 or 8)
+    Raises:
+      ValueError or OverflowError for NaN and infinite values
+    Returns:
+      array : two's complement representation of the saturated samples
+    """
+    r = np.round(np.asarray(data,dtype=np.float64).reshape(-1) * 2.0**(nbBits-1))
+    if np.any(np.isnan(r)):
+      raise ValueError("cannot convert float NaN to integer")
+    if np.any(np.isinf(r)):
+      raise OverflowError("cannot convert float infinity to integer")
+    # 2**63-1 is not a float64 so the saturation to the maximum
+    # is done after the conversion to integers
+    sat = r >= 2.0**(nbBits-1)
+    r = np.where(sat,0.0,np.maximum(r,-2.0**(nbBits-1))).astype(np.int64)
+    r[sat] = 2**(nbBits-1) - 1
+    return(r.astype(np.uint64) & np.uint64(2**nbBits - 1))
+
+def ints_to_bits(data,nbBits,signed):
+    """ Vectorized s8, u8, s16, u16, s32, u32, s64 and u64.
+  
+    Args:
+      data (array): integers to be converted
+      nbBits (int): word size (64, 32, 16 or 8)
+      signed (bool): True for signed integers
+    Raises:
+      struct.error if a value is out of range
+    Returns:
+      array : two's complement representation of the samples
+    """
+    d = np.asarray(data).reshape(-1)
+    if signed:
+      lo,hi = -2**(nbBits-1),2**(nbBits-1)-1
+    else:
+      lo,hi = 0,2**nbBits-1
+    if d.size > 0 and (int(d.min()) < lo or int(d.max()) > hi):
+      raise struct.error("argument out of range")
+    if d.dtype.kind == "u":
+      r = d.astype(np.uint64)
+    else:
+      r = d.astype(np.int64).astype(np.uint64)
+    return(r & np.uint64(2**nbBits - 1))
+
+# For each kind of pattern file : sample width, format of the comment,
+# format of the sample, scalar conversion and vectorized conversion.
+# Vectorized conversions are only used for arrays of numbers
+# (the kinds of numpy arrays given in the last column).
+PATTERNFORMATS = {
+ "f64" : ("D","%f","%#x",float64_to_hex,lambda d:floats_to_bits(d,np.float64,np.uint64),"biuf"),
+ "f32" : ("W","%f","%#x",float_to_hex,lambda d:floats_to_bits(d,np.float32,np.uint32),"biuf"),
+ "f16" : ("H","%f","%#x",float16_to_hex,lambda d:floats_to_bits(d,np.float16,np.uint16),"biuf"),
+ "q63" : ("D","%f","0x%016X",to_q63,lambda d:to_fixed_bits(d,64),"biuf"),
+ "q31" : ("W","%f","0x%08X",to_q31,lambda d:to_fixed_bits(d,32),"biuf"),
+ "q15" : ("H","%f","0x%04X",to_q15,lambda d:to_fixed_bits(d,16),"biuf"),
+ "q7"  : ("B","%f","0x%02X",to_q7,lambda d:to_fixed_bits(d,8),"biuf"),
+ "s64" : ("D","%d","0x%016X",s64,lambda d:ints_to_bits(d,64,True),"biu"),
+ "u64" : ("D","%d","0x%016X",u64,lambda d:ints_to_bits(d,64,False),"biu"),
+ "s32" : ("W","%d","0x%08X",s32,lambda d:ints_to_bits(d,32,True),"biu"),
+ "u32" : ("W","%s","0x%08X",u32,lambda d:ints_to_bits(d,32,False),"biu"),
+ "s16" : ("H","%d","0x%04X",s16,lambda d:ints_to_bits(d,16,True),"biu"),
+ "u16" : ("H","%d","0x%04X",u16,lambda d:ints_to_bits(d,16,False),"biu"),
+ "s8"  : ("B","%d","0x%02X",s8,lambda d:ints_to_bits(d,8,True),"biu"),
+ "u8"  : ("B","%d","0x%02X",u8,lambda d:ints_to_bits(d,8,False),"biu"),
+}
+
+def formatPattern(kind,data):
+    """ Content of a pattern file
+    
+    The samples are converted and formatted with one operation
+    for the whole array.
+  
+    Args:
+      kind (str): kind of pattern (key of PATTERNFORMATS)
+      data (array): samples
+    Raises:
+      Nothing 
+    Returns:
+      str : content of the pattern file
+    """
+    width,comment,sample,scalar,vectorized,kinds = PATTERNFORMATS[kind]
+    header = "%s\n%d\n" % (width,len(data))
+    lineFormat = "// %s\n%s\n" % (comment,sample)
+    d = np.asarray(data)
+    if d.dtype.kind in kinds:
+      # Comments and samples are interleaved and formatted
+      # with one format string
+      values = [None] * (2*d.size)
+      values[0::2] = d.reshape(-1).tolist()
+      values[1::2] = vectorized(d).tolist()
+      return(header + (lineFormat * d.size) % tuple(values))
+    else:
+      lineFormat = "// %s\n%%s\n" % comment
+      return(header + "".join([lineFormat % (v,scalar(v)) for v in data]))
+
+def patternSamples(kind,data):
+    """ Samples of a pattern as written in a binary container
+  
+    Args:
+      kind (str): kind of pattern (key of PATTERNFORMATS)
+      data (array): samples
+    Raises:
+      Nothing 
+    Returns:
+      (str,array) : sample width and samples as unsigned integers
+    """
+    width,comment,sample,scalar,vectorized,kinds = PATTERNFORMATS[kind]
+    d = np.asarray(data)
+    if d.dtype.kind in kinds:
+      return(width,vectorized(d))
+    else:
+      return(width,np.array([int(scalar(v),16) for v in data],dtype=np.uint64))
+
+# Default for the binary mode of the configurations.
+# When True, the patterns are written in the binary container
+# of the pattern directory (TestScripts/PatternFile.py) instead
+# of text files.
+BINARY = False
+
 class Config:
     def __init__(self,patternDir,paramDir,ext):
       self._patternDir = "%s%s" % (patternDir,ext.upper())
       self._paramDir = "%s%s" % (paramDir,ext.upper())
       self._ext = ext 
       self._overwrite=True
+      self._binary=BINARY
 
       createMissingDir(self._patternDir)
       createMissingDir(self._paramDir)
@@ -184,9 +326,36 @@ class Config:
     def setOverwrite(self,v):
         self._overwrite=v
 
+    def setBinary(self,v):
+        self._binary=v
+
     def canOverwrite(self,path):
         return(self._overwrite or not os.path.exists(path))
 
+    def _writePattern(self,i,kind,data):
+        """ Write pattern data in a text file or in the binary container
+        of the pattern directory
+        
+          Args:
+            i (str): path of the text pattern file
+            kind (str): kind of pattern (key of PATTERNFORMATS)
+            data (array): Vector containing the data
+          Raises:
+            Nothing 
+          Returns:
+            Nothing
+        """
+        if self._binary:
+          name = os.path.basename(i)
+          if self._overwrite or not PatternFile.hasPattern(self._patternDir,name):
+            width,samples = patternSamples(kind,data)
+            PatternFile.addPattern(self._patternDir,name,width,samples)
+        elif self.canOverwrite(i):
+          with open(i,"w") as f:
+              f.write(formatPattern(kind,data))
+          # The text file is replacing the pattern of the container
+          PatternFile.removePattern(self._patternDir,os.path.basename(i))
+
     def inputP(self,i,name=None):
         """ Path to a reference pattern from the ID
       
@@ -667,14 +836,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("D\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % float64_to_hex(v))
+        self._writePattern(i,"f64",data)
 
     def _writeVectorF32(self,i,data):
         """ Write pattern data
@@ -693,14 +855,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("W\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % float_to_hex(v))
+        self._writePattern(i,"f32",data)
 
     def _writeVectorF16(self,i,data):
         """ Write pattern data
@@ -719,14 +874,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("H\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % float16_to_hex(v))
+        self._writePattern(i,"f16",data)
 
     def _writeVectorQ63(self,i,data):
         """ Write pattern data
@@ -745,14 +893,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("D\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % to_q63(v))
+        self._writePattern(i,"q63",data)
 
     def _writeVectorQ31(self,i,data):
         """ Write pattern data
@@ -771,14 +912,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("W\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % to_q31(v))
+        self._writePattern(i,"q31",data)
 
     def _writeVectorQ15(self,i,data):
         """ Write pattern data
@@ -797,14 +931,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("H\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % to_q15(v))
+        self._writePattern(i,"q15",data)
 
     def _writeVectorS16(self,i,data):
         """ Write pattern data
@@ -823,14 +950,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("H\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % s16(v))
+        self._writePattern(i,"s16",data)
 
     def _writeVectorU16(self,i,data):
         """ Write pattern data
@@ -849,14 +969,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("H\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % u16(v))
+        self._writePattern(i,"u16",data)
 
     def _writeVectorS64(self,i,data):
         """ Write pattern data
@@ -875,14 +988,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("D\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % s64(v))
+        self._writePattern(i,"s64",data)
 
 
     def _writeVectorU64(self,i,data):
@@ -902,14 +1008,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("D\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % u64(v))
+        self._writePattern(i,"u64",data)
 
     def _writeVectorS32(self,i,data):
         """ Write pattern data
@@ -928,14 +1027,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("W\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % s32(v))
+        self._writePattern(i,"s32",data)
 
     def _writeVectorU32(self,i,data):
         """ Write pattern data
@@ -954,14 +1046,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("W\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %s\n" % v)
-                  f.write("%s\n" % u32(v))
+        self._writePattern(i,"u32",data)
 
     def _writeVectorQ7(self,i,data):
         """ Write pattern data
@@ -980,14 +1065,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("B\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %f\n" % v)
-                  f.write("%s\n" % to_q7(v))
+        self._writePattern(i,"q7",data)
 
     def _writeVectorS8(self,i,data):
         """ Write pattern data
@@ -1006,14 +1084,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("B\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % s8(v))
+        self._writePattern(i,"s8",data)
 
     def _writeVectorU8(self,i,data):
         """ Write pattern data
@@ -1032,14 +1103,7 @@ class Config:
           Returns:
             Nothing
         """
-        if self.canOverwrite(i):
-          with open(i,"w") as f:
-              # Write sample dimension nb sample header
-              #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
-              f.write("B\n%d\n" % len(data))
-              for v in data:
-                  f.write("// %d\n" % v)
-                  f.write("%s\n" % u8(v))
+        self._writePattern(i,"u8",data)
 
     def writeReference(self,j,data,name=None):
         if (self._ext == "f64"):
@@ -1205,8 +1269,9 @@ class Config:
               # Write sample dimension nb sample header
               #np.savetxt(i, data, newline="\n", header="W\n%d" % len(data),comments ="" )
               f.write("%d\n" % len(data))
-              for v in data:
-                  f.write("%d\n" % v)
+              if isinstance(data,np.ndarray):
+                 data = data.reshape(-1).tolist()
+              f.write("".join(map("%d\n".__mod__,data)))
 
 
 
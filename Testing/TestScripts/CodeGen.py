@@ -1,4 +1,5 @@
 import TestScripts.Parser
+import TestScripts.PatternFile as PatternFile
 import sys
 import os.path
 import math
@@ -60,6 +61,8 @@ class CodeGen:
         self._currentPaths = [self._patternDir]
         self._currentParamPaths = [self._paramDir]
         self._alignment=8
+        # Binary pattern containers already opened (by directory)
+        self._containers = {}
    
     def _genGroup(self,root,fi):
         """ Generate header definition for a group of tests
@@ -558,6 +561,50 @@ class CodeGen:
         v = decodeHex(s,8,0x0FF)
       return(v)
 
+    def _container(self,directory):
+        """ Memory mapped pattern container of a directory
+
+        Args:
+          directory (str) : Directory of the patterns
+        Raises:
+          Nothing 
+        Returns:
+          (dict,memmap) : The container or None if the directory has no container
+        """
+        if not directory in self._containers:
+           self._containers[directory] = PatternFile.openContainer(directory)
+        return(self._containers[directory])
+
+    def _addContainerPattern(self,includeFile,container,name):
+        """ Add a pattern from a binary container to the include file
+
+        The generated array is the same as the one generated from
+        the text pattern file.
+
+        Args:
+          includeFile (file) : Opened include file
+          container ((dict,memmap)) : Memory mapped container
+          name (str) : Name of the text pattern file
+        Raises:
+          Nothing 
+        Returns:
+          int : The number of samples
+        """
+        k,samples = PatternFile.getPattern(container,name)
+        nbSamples = len(samples)
+        sampleSize = samples.itemsize
+        newOffset = self._offset + sampleSize * nbSamples
+        pad = self._alignment*math.ceil(newOffset / self._alignment) - newOffset
+        self._offset=newOffset + pad
+
+        # The samples are little endian so the bytes are in the
+        # order used by _write64, _write32, _write16 and _write8
+        sampleFormat = "%d," * sampleSize + "\n"
+        includeFile.write((sampleFormat * nbSamples) % tuple(samples.view("u1").tolist()))
+        for i in range(pad):
+             includeFile.write("0,\n")
+        return(nbSamples)
+
     def addPattern(self,includeFile,path):
         """ Add a pattern to the include file
         
@@ -581,6 +628,17 @@ class CodeGen:
         # pattern being added to this array
         returnOffset = self._offset
 
+        # When the directory has a binary container with this pattern,
+        # the samples are read from the memory mapped container.
+        # A text file modified after the container is used instead
+        # (the container would have stale samples).
+        directory,name = os.path.split(path)
+        container = self._container(directory)
+        if container is not None and name in container[0] and \
+           not PatternFile.textIsNewer(directory,name):
+          nbSamples = self._addContainerPattern(includeFile,container,name)
+          return(returnOffset,nbSamples)
+
         # Read the pattern for the pattern file
         with open(path,"r") as pat:
           # Read pattern word size (B,H or W for 8, 16 or 32 bits)
@@ -0,0 +1,352 @@
+""" Binary container for the test patterns
+
+All the patterns of a directory (the patterns of a suite) can be
+stored in one binary file named patterns.bin instead of one text
+file per pattern.
+
+Format of the container (all numbers are little endian):
+
+- Header (24 bytes):
+  magic "CMSISPAT", version (uint32), number of patterns (uint32)
+  and offset of the index (uint64)
+- Payloads:
+  the samples of each pattern as unsigned integers of the sample
+  width. Each payload is aligned on 8 bytes
+- Index (one entry of 88 bytes per pattern):
+  name of the text pattern file (64 bytes), sample width (D, W, H or B
+  padded to 8 bytes), number of samples (uint64) and offset of
+  the payload (uint64)
+
+The index is at the end of the file so that a pattern can be added
+without moving the payloads of the other patterns. The content of a
+pattern is the same as the hexadecimal lines of the text format.
+
+"""
+import os.path
+import numpy as np
+
+CONTAINER = "patterns.bin"
+MAGIC = b"CMSISPAT"
+VERSION = 1
+ALIGNMENT = 8
+
+HEADER = np.dtype([("magic","S8"),
+                   ("version","<u4"),
+                   ("nbPatterns","<u4"),
+                   ("indexOffset","<u8")])
+
+ENTRY = np.dtype([("name","S64"),
+                  ("kind","S8"),
+                  ("nbSamples","<u8"),
+                  ("offset","<u8")])
+
+# Sample type for each sample width of the text format
+SAMPLETYPES = {"D":np.dtype("<u8"),
+               "W":np.dtype("<u4"),
+               "H":np.dtype("<u2"),
+               "B":np.dtype("u1")}
+
+def containerPath(directory):
+    return(os.path.join(directory,CONTAINER))
+
+def _align(offset):
+    return(ALIGNMENT*((offset + ALIGNMENT - 1) // ALIGNMENT))
+
+def readIndex(directory):
+    """ Index of a container
+
+    Args:
+      directory (str) : directory of the patterns
+    Raises:
+      ValueError if the file is not a pattern container
+    Returns:
+      dict : name -> (sample width, number of samples, offset)
+        The dictionary is empty if there is no container
+    """
+    path = containerPath(directory)
+    if not os.path.exists(path):
+       return({})
+    with open(path,"rb") as f:
+       header = np.fromfile(f,dtype=HEADER,count=1)
+       if len(header) != 1 or header[0]["magic"] != MAGIC:
+          raise ValueError("%s is not a pattern container" % path)
+       if header[0]["version"] != VERSION:
+          raise ValueError("%s : unsupported version %d" % (path,header[0]["version"]))
+       f.seek(int(header[0]["indexOffset"]))
+       entries = np.fromfile(f,dtype=ENTRY,count=int(header[0]["nbPatterns"]))
+    return({e["name"].decode("utf-8"):(e["kind"].decode("ascii"),int(e["nbSamples"]),int(e["offset"]))
+            for e in entries})
+
+def _writeIndex(f,index,indexOffset):
+    entries = np.zeros(len(index),dtype=ENTRY)
+    for i,(name,(kind,nbSamples,offset)) in enumerate(index.items()):
+        entries[i] = (name.encode("utf-8"),kind.encode("ascii"),nbSamples,offset)
+    f.seek(indexOffset)
+    entries.tofile(f)
+    f.truncate()
+    f.seek(0)
+    header = np.array([(MAGIC,VERSION,len(index),indexOffset)],dtype=HEADER)
+    header.tofile(f)
+
+def hasPattern(directory,name):
+    return(name in readIndex(directory))
+
+def addPattern(directory,name,kind,samples):
+    """ Add a pattern to the container of a directory
+
+    The container is created if needed. A pattern with the same name
+    is replaced. Its payload is reused when the new pattern has the
+    same size (otherwise the old payload is unused until the
+    container is compacted).
+
+    Args:
+      directory (str) : directory of the patterns
+      name (str) : name of the text pattern file
+      kind (str) : sample width (D, W, H or B)
+      samples (array) : samples as unsigned integers
+    Raises:
+      ValueError if the name is too long
+    Returns:
+      Nothing
+    """
+    if len(name.encode("utf-8")) > ENTRY["name"].itemsize:
+       raise ValueError("Pattern name %s is too long" % name)
+    payload = np.asarray(samples).astype(SAMPLETYPES[kind])
+    index = readIndex(directory)
+    path = containerPath(directory)
+    if not index:
+       indexOffset = _align(HEADER.itemsize)
+       with open(path,"wb") as f:
+          np.zeros(1,dtype=HEADER).tofile(f)
+    else:
+       with open(path,"rb") as f:
+          indexOffset = int(np.fromfile(f,dtype=HEADER,count=1)[0]["indexOffset"])
+
+    with open(path,"r+b") as f:
+       if name in index and index[name][0] == kind and index[name][1] == payload.size:
+          offset = index[name][2]
+          f.seek(offset)
+          payload.tofile(f)
+          # The index is rewritten to keep the file valid
+          # when the pattern was not at the end
+       else:
+          offset = indexOffset
+          f.seek(offset)
+          payload.tofile(f)
+          indexOffset = _align(offset + payload.nbytes)
+          f.write(b"\0" * (indexOffset - offset - payload.nbytes))
+       index[name] = (kind,payload.size,offset)
+       _writeIndex(f,index,indexOffset)
+
+def removePattern(directory,name):
+    """ Remove a pattern from the container of a directory
+
+    It is used when the pattern is written again as a text file so
+    that the old samples of the container are not used any more.
+    The payload is unused until the container is compacted. The
+    container is removed when it has no more patterns.
+
+    Args:
+      directory (str) : directory of the patterns
+      name (str) : name of the text pattern file
+    Raises:
+      Nothing
+    Returns:
+      bool : True if the pattern was in the container
+    """
+    index = readIndex(directory)
+    if not name in index:
+       return(False)
+    del index[name]
+    path = containerPath(directory)
+    if not index:
+       os.remove(path)
+       return(True)
+    with open(path,"rb") as f:
+       indexOffset = int(np.fromfile(f,dtype=HEADER,count=1)[0]["indexOffset"])
+    with open(path,"r+b") as f:
+       _writeIndex(f,index,indexOffset)
+    return(True)
+
+def textIsNewer(directory,name):
+    """ True if the text pattern file has been modified after the container
+
+    Args:
+      directory (str) : directory of the patterns
+      name (str) : name of the text pattern file
+    Raises:
+      Nothing
+    Returns:
+      bool : True if the text file is more recent than the container
+    """
+    text = os.path.join(directory,name)
+    path = containerPath(directory)
+    if not os.path.exists(text) or not os.path.exists(path):
+       return(False)
+    return(os.path.getmtime(text) > os.path.getmtime(path))
+
+def openContainer(directory):
+    """ Memory mapped container
+
+    Args:
+      directory (str) : directory of the patterns
+    Raises:
+      Nothing
+    Returns:
+      (dict,memmap) : index and content of the container
+        or None if there is no container
+    """
+    index = readIndex(directory)
+    if not index:
+       return(None)
+    return((index,np.memmap(containerPath(directory),dtype=np.uint8,mode="r")))
+
+def getPattern(container,name):
+    """ Pattern from a memory mapped container
+
+    Args:
+      container ((dict,memmap)) : container returned by openContainer
+      name (str) : name of the text pattern file
+    Raises:
+      KeyError if the pattern is not in the container
+    Returns:
+      (str,array) : sample width and samples (no copy)
+    """
+    index,data = container
+    kind,nbSamples,offset = index[name]
+    dt = SAMPLETYPES[kind]
+    return(kind,data[offset:offset + nbSamples * dt.itemsize].view(dt))
+
+def readTextPattern(path):
+    """ Read a pattern in the text format
+
+    Args:
+      path (str) : path to the text pattern file
+    Raises:
+      ValueError if the file is not a pattern file
+    Returns:
+      (str,array) : sample width and samples as unsigned integers
+    """
+    with open(path,"r") as f:
+       lines = f.read().splitlines()
+    kind = lines[0].strip() if lines else ""
+    if kind not in SAMPLETYPES:
+       raise ValueError("%s is not a pattern file" % path)
+    nbSamples = int(lines[1].strip())
+    # A comment line and a sample line for each sample
+    values = lines[3:3+2*nbSamples:2]
+    if len(values) != nbSamples:
+       raise ValueError("%s : %d samples expected" % (path,nbSamples))
+    mask = (1 << (8*SAMPLETYPES[kind].itemsize)) - 1
+    samples = np.array([int(v,16) & mask for v in values],dtype=np.uint64)
+    return(kind,samples.astype(SAMPLETYPES[kind]))
+
+def _lineFormat(name,samples):
+    """ Format of the lines of a text pattern file and values
+    displayed in the comments. The datatype is given by the suffix
+    of the file name (the samples are displayed as integers if
+    it is unknown). The formats are the ones used by the pattern
+    generation scripts.
+    """
+    ext = os.path.splitext(name)[0].split("_")[-1]
+    hexFormat = "0x%%0%dX" % (2*samples.itemsize)
+    if ext in ["f64","f32","f16"]:
+       return("// %f\n%#x\n",samples.view("<f%d" % samples.itemsize).astype(np.float64))
+    if ext in ["q63","q31","q15","q7"]:
+       signed = samples.view("<i%d" % samples.itemsize).astype(np.float64)
+       return("// %%f\n%s\n" % hexFormat,signed / 2.0**(8*samples.itemsize - 1))
+    if ext in ["s64","s32","s16","s8"]:
+       return("// %%d\n%s\n" % hexFormat,samples.view("<i%d" % samples.itemsize))
+    return("// %%d\n%s\n" % hexFormat,samples)
+
+def writeTextPattern(path,kind,samples):
+    """ Write a pattern in the text format
+
+    The comments are computed from the samples so they may differ
+    in the last digit from the comments written by the pattern
+    generation scripts (which are using the original values).
+
+    Args:
+      path (str) : path to the text pattern file
+      kind (str) : sample width (D, W, H or B)
+      samples (array) : samples as unsigned integers
+    Raises:
+      Nothing
+    Returns:
+      Nothing
+    """
+    samples = np.asarray(samples).astype(SAMPLETYPES[kind])
+    lineFormat,comments = _lineFormat(os.path.basename(path),samples)
+    values = [None] * (2*samples.size)
+    values[0::2] = comments.tolist()
+    values[1::2] = samples.tolist()
+    with open(path,"w") as f:
+       f.write("%s\n%d\n" % (kind,samples.size))
+       f.write((lineFormat * samples.size) % tuple(values))
+
+def textToContainer(directory):
+    """ Create the container of a directory from its text patterns
+
+    An existing container is replaced. The text files which are
+    not valid patterns are not added to the container.
+
+    Args:
+      directory (str) : directory of the patterns
+    Raises:
+      Nothing
+    Returns:
+      int : number of patterns in the container
+    """
+    names = sorted(n for n in os.listdir(directory) if n.endswith(".txt"))
+    patterns = []
+    for name in names:
+        try:
+           patterns.append((name,) + readTextPattern(os.path.join(directory,name)))
+        except ValueError as e:
+           # Not a pattern file : it is kept as a text file
+           print("Skipped %s" % e)
+    path = containerPath(directory)
+    if os.path.exists(path):
+       os.remove(path)
+    for name,kind,samples in patterns:
+        addPattern(directory,name,kind,samples)
+    return(len(patterns))
+
+def containerToText(directory):
+    """ Write the text patterns of a directory from its container
+
+    Args:
+      directory (str) : directory of the patterns
+    Raises:
+      Nothing
+    Returns:
+      int : number of text patterns written
+    """
+    container = openContainer(directory)
+    if container is None:
+       return(0)
+    for name in container[0]:
+        kind,samples = getPattern(container,name)
+        writeTextPattern(os.path.join(directory,name),kind,samples)
+    return(len(container[0]))
+
+def compact(directory):
+    """ Remove the unused payloads of a container
+
+    Args:
+      directory (str) : directory of the patterns
+    Raises:
+      Nothing
+    Returns:
+      int : number of patterns in the container
+    """
+    container = openContainer(directory)
+    if container is None:
+       return(0)
+    patterns = [(name,) + getPattern(container,name) for name in container[0]]
+    patterns = [(name,kind,np.array(samples)) for (name,kind,samples) in patterns]
+    del container
+    os.remove(containerPath(directory))
+    for name,kind,samples in patterns:
+        addPattern(directory,name,kind,samples)
+    return(len(patterns))
@@ -0,0 +1,43 @@
+# Conversion between the text pattern files and the binary
+# pattern containers (TestScripts/PatternFile.py).
+#
+# Each directory of the tree containing patterns is converted.
+#
+# python convertPatterns.py -b Patterns   (text files to containers)
+# python convertPatterns.py -t Patterns   (containers to text files)
+# python convertPatterns.py -c Patterns   (compaction of the containers)
+
+import argparse
+import os
+import TestScripts.PatternFile as PatternFile
+
+parser = argparse.ArgumentParser(description='Convert the test patterns')
+parser.add_argument('-b', action='store_true', help="Text patterns to binary containers")
+parser.add_argument('-t', action='store_true', help="Binary containers to text patterns")
+parser.add_argument('-c', action='store_true', help="Compaction of the binary containers")
+parser.add_argument('-r', action='store_true', help="Remove the source files after the conversion")
+parser.add_argument('root', nargs='?', type=str, default="Patterns", help="Pattern folder")
+
+args = parser.parse_args()
+
+nbDirs = 0
+nbPatterns = 0
+for directory,dirs,files in os.walk(args.root):
+    if args.b and any(f.endswith(".txt") for f in files):
+       nb = PatternFile.textToContainer(directory)
+       if nb > 0:
+          nbDirs += 1
+          nbPatterns += nb
+          if args.r:
+             for name in PatternFile.readIndex(directory):
+                 os.remove(os.path.join(directory,name))
+    if args.t and PatternFile.CONTAINER in files:
+       nbDirs += 1
+       nbPatterns += PatternFile.containerToText(directory)
+       if args.r:
+          os.remove(PatternFile.containerPath(directory))
+    if args.c and PatternFile.CONTAINER in files:
+       nbDirs += 1
+       nbPatterns += PatternFile.compact(directory)
+
+print("%d patterns in %d folders" % (nbPatterns,nbDirs))
@@ -1,21 +1,65 @@
+import os as _os
+import importlib as _importlib
 import cmsisdsp.version
 
-from cmsisdsp_filtering import *
-from cmsisdsp_matrix import *
-from cmsisdsp_support import *
-from cmsisdsp_statistics import *
-from cmsisdsp_complexf import *
-from cmsisdsp_basic import *
-from cmsisdsp_controller import *
-from cmsisdsp_transform import *
-from cmsisdsp_interpolation import *
-from cmsisdsp_quaternion import *
-from cmsisdsp_fastmath import *
-from cmsisdsp_distance import *
-from cmsisdsp_bayes import *
-from cmsisdsp_svm import *
-from cmsisdsp_window import *
+from cmsisdsp._index import MODULES as _MODULES, INDEX as _INDEX
+from cmsisdsp import _cpu
 
+# The extension modules are loaded when one of their names
+# is used for the first time (PEP 562). The index gives the
+# module defining each name.
+# If the environment variable CMSISDSP_EAGER_IMPORT is set,
+# all the modules are loaded when importing cmsisdsp.
+
+def _loadModule(name):
+    module = _importlib.import_module(_cpu.moduleName(name))
+    # Names defined by several modules are taken from the
+    # module given by the index
+    g = globals()
+    for k in dir(module):
+        if not k.startswith("_") and _INDEX.get(k,name) == name:
+           g[k] = getattr(module,k)
+    return(module)
+
+def loadAll():
+    """Load all the extension modules of the package.
+
+    It is done by default the first time a function or type
+    is used. Loading all of them can be useful before forking
+    worker processes or when measuring timings.
+    """
+    for m in _MODULES:
+        _loadModule(m)
+
+def simdVariant():
+    """Host SIMD variant of the extension modules (like avx2)
+    or None when the default modules are used.
+    """
+    return(_cpu.variant())
+
+def __getattr__(name):
+    if name in _INDEX:
+       return(getattr(_loadModule(_INDEX[name]),name))
+    if name in __all__ or name == "cg":
+       return(_importlib.import_module("%s.%s" % (__name__,name)))
+    if not name.startswith("_"):
+       # Name not in the index (index not up to date with the
+       # wrappers): the modules are searched
+       for m in _MODULES:
+           try:
+              module = _importlib.import_module(_cpu.moduleName(m))
+           except ImportError:
+              continue
+           if hasattr(module,name):
+              _loadModule(m)
+              return(getattr(module,name))
+    raise AttributeError("module %r has no attribute %r" % (__name__,name))
+
+def __dir__():
+    return(sorted(set(globals()) | set(_INDEX)))
+
+if _os.environ.get("CMSISDSP_EAGER_IMPORT"):
+   loadAll()
 
 __version__ = cmsisdsp.version.__version__
 
@@ -30,7 +74,7 @@ commit_hash=" 31d9d2ef4ace9d3e3ca014d25525af3b99e86a66"
 # (So several CMSIS-DSP versions may have same version number hence the commit hash)
 developmentVersion=False
 
-__all__ = ["datatype", "fixedpoint", "mfcc"]
+__all__ = ["datatype", "fixedpoint", "mfcc", "batch", "plans", "fastconv"]
 
 # Default values
 DEFAULT_HOUSEHOLDER_THRESHOLD_F64=1.0e-16
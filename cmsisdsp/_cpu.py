@@ -0,0 +1,103 @@
+"""Selection of the host SIMD variant of the extension modules.
+
+The variants are built by setup.py when CMSISDSP_HOST_SIMD is set.
+The module cmsisdsp_basic_avx2 is the avx2 variant of cmsisdsp_basic.
+The environment variable CMSISDSP_SIMD can be used to force a variant
+or to disable them (CMSISDSP_SIMD=none).
+"""
+import importlib.util
+import os
+import platform
+import subprocess
+import sys
+
+# Variants of each architecture from the best to the worst
+_VARIANTS = {"x86_64" : ["avx512","avx2"],
+             "amd64" : ["avx512","avx2"],
+             "aarch64" : ["neon"],
+             "arm64" : ["neon"]}
+
+# CPU features needed by each variant (Neon is always available on
+# aarch64)
+_FEATURES = {"avx2" : ["avx2"],
+             "avx512" : ["avx512f","avx512bw","avx512dq","avx512vl"],
+             "neon" : []}
+
+# Windows IsProcessorFeaturePresent
+_WINFEATURES = {"avx2" : 40, "avx512f" : 41}
+
+_variant = None
+_selected = False
+
+def _linuxFeatures():
+    features = set()
+    try:
+       with open("/proc/cpuinfo") as f:
+            for l in f:
+                key,_,value = l.partition(":")
+                if key.strip() in ["flags","Features"]:
+                   features.update(value.split())
+    except OSError:
+       pass
+    return(features)
+
+def _darwinFeatures():
+    try:
+       res = subprocess.run(["sysctl","-n","machdep.cpu.features","machdep.cpu.leaf7_features"],
+                            stdout=subprocess.PIPE,stderr=subprocess.DEVNULL,text=True)
+       return(set(res.stdout.lower().split()))
+    except OSError:
+       return(set())
+
+def _windowsFeatures():
+    import ctypes
+    features = set()
+    for name,pf in _WINFEATURES.items():
+        if ctypes.windll.kernel32.IsProcessorFeaturePresent(pf):
+           features.add(name)
+    return(features)
+
+def cpuFeatures():
+    """SIMD features of the CPU (like avx2) supported by the OS"""
+    if sys.platform.startswith("linux"):
+       return(_linuxFeatures())
+    if sys.platform == "darwin":
+       return(_darwinFeatures())
+    if sys.platform == "win32":
+       return(_windowsFeatures())
+    return(set())
+
+def _built(variant):
+    return(importlib.util.find_spec("cmsisdsp_basic_%s" % variant) is not None)
+
+def selectVariant():
+    """Variant used for the extension modules or None"""
+    forced = os.environ.get("CMSISDSP_SIMD","").strip().lower()
+    if forced in ["none","0","no"]:
+       return(None)
+    if forced:
+       return(forced if _built(forced) else None)
+    candidates = [v for v in _VARIANTS.get(platform.machine().lower(),[]) if _built(v)]
+    if not candidates:
+       return(None)
+    features = cpuFeatures()
+    for v in candidates:
+        if all(f in features for f in _FEATURES[v]):
+           return(v)
+    return(None)
+
+def variant():
+    global _variant,_selected
+    if not _selected:
+       _variant = selectVariant()
+       _selected = True
+    return(_variant)
+
+def moduleName(name):
+    """Name of the module to load for the extension module name"""
+    v = variant()
+    if v is not None:
+       variantName = "%s_%s" % (name,v)
+       if importlib.util.find_spec(variantName) is not None:
+          return(variantName)
+    return(name)
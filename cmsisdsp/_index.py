@@ -0,0 +1,735 @@
+# Generated by setup.py. Do not edit.
+# Extension module defining each name of the cmsisdsp package.
+
+MODULES = ["cmsisdsp_filtering",
+           "cmsisdsp_matrix",
+           "cmsisdsp_support",
+           "cmsisdsp_statistics",
+           "cmsisdsp_complexf",
+           "cmsisdsp_basic",
+           "cmsisdsp_controller",
+           "cmsisdsp_transform",
+           "cmsisdsp_interpolation",
+           "cmsisdsp_quaternion",
+           "cmsisdsp_fastmath",
+           "cmsisdsp_distance",
+           "cmsisdsp_bayes",
+           "cmsisdsp_svm",
+           "cmsisdsp_window"]
+
+INDEX = {
+  "arm_abs_f16" : "cmsisdsp_basic",
+  "arm_abs_f32" : "cmsisdsp_basic",
+  "arm_abs_f64" : "cmsisdsp_basic",
+  "arm_abs_q15" : "cmsisdsp_basic",
+  "arm_abs_q31" : "cmsisdsp_basic",
+  "arm_abs_q7" : "cmsisdsp_basic",
+  "arm_absmax_f16" : "cmsisdsp_statistics",
+  "arm_absmax_f32" : "cmsisdsp_statistics",
+  "arm_absmax_f64" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_f16" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_f32" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_f64" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_q15" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_q31" : "cmsisdsp_statistics",
+  "arm_absmax_no_idx_q7" : "cmsisdsp_statistics",
+  "arm_absmax_q15" : "cmsisdsp_statistics",
+  "arm_absmax_q31" : "cmsisdsp_statistics",
+  "arm_absmax_q7" : "cmsisdsp_statistics",
+  "arm_absmin_f16" : "cmsisdsp_statistics",
+  "arm_absmin_f32" : "cmsisdsp_statistics",
+  "arm_absmin_f64" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_f16" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_f32" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_f64" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_q15" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_q31" : "cmsisdsp_statistics",
+  "arm_absmin_no_idx_q7" : "cmsisdsp_statistics",
+  "arm_absmin_q15" : "cmsisdsp_statistics",
+  "arm_absmin_q31" : "cmsisdsp_statistics",
+  "arm_absmin_q7" : "cmsisdsp_statistics",
+  "arm_accumulate_f16" : "cmsisdsp_statistics",
+  "arm_accumulate_f32" : "cmsisdsp_statistics",
+  "arm_accumulate_f64" : "cmsisdsp_statistics",
+  "arm_add_f16" : "cmsisdsp_basic",
+  "arm_add_f32" : "cmsisdsp_basic",
+  "arm_add_f64" : "cmsisdsp_basic",
+  "arm_add_q15" : "cmsisdsp_basic",
+  "arm_add_q31" : "cmsisdsp_basic",
+  "arm_add_q7" : "cmsisdsp_basic",
+  "arm_and_u16" : "cmsisdsp_basic",
+  "arm_and_u32" : "cmsisdsp_basic",
+  "arm_and_u8" : "cmsisdsp_basic",
+  "arm_atan2_f32" : "cmsisdsp_fastmath",
+  "arm_atan2_q15" : "cmsisdsp_fastmath",
+  "arm_atan2_q31" : "cmsisdsp_fastmath",
+  "arm_bartlett_f32" : "cmsisdsp_window",
+  "arm_bartlett_f64" : "cmsisdsp_window",
+  "arm_barycenter_f32" : "cmsisdsp_support",
+  "arm_bilinear_interp_block_f32" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_block_q15" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_block_q31" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_block_q7" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_f32" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_instance_f32" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_instance_q15" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_instance_q31" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_instance_q7" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_q15" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_q31" : "cmsisdsp_interpolation",
+  "arm_bilinear_interp_q7" : "cmsisdsp_interpolation",
+  "arm_biquad_cas_df1_32x64_init_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cas_df1_32x64_ins_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cas_df1_32x64_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_bank_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_bank_init_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_f16" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_fast_q15" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_fast_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_init_f16" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_init_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_init_q15" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_init_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_q15" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df1_q31" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_f64" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_init_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_init_f64" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_instance_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_df2T_instance_f64" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_stereo_df2T_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_stereo_df2T_init_f32" : "cmsisdsp_filtering",
+  "arm_biquad_cascade_stereo_df2T_instance_f32" : "cmsisdsp_filtering",
+  "arm_biquad_casd_df1_bank_inst_f32" : "cmsisdsp_filtering",
+  "arm_biquad_casd_df1_inst_f16" : "cmsisdsp_filtering",
+  "arm_biquad_casd_df1_inst_f32" : "cmsisdsp_filtering",
+  "arm_biquad_casd_df1_inst_q15" : "cmsisdsp_filtering",
+  "arm_biquad_casd_df1_inst_q31" : "cmsisdsp_filtering",
+  "arm_blackman_harris_92db_f32" : "cmsisdsp_window",
+  "arm_blackman_harris_92db_f64" : "cmsisdsp_window",
+  "arm_braycurtis_distance_f32" : "cmsisdsp_distance",
+  "arm_canberra_distance_f32" : "cmsisdsp_distance",
+  "arm_cdist_bool" : "cmsisdsp_distance",
+  "arm_cdist_f32" : "cmsisdsp_distance",
+  "arm_cdist_topk_bool" : "cmsisdsp_distance",
+  "arm_cdist_topk_f32" : "cmsisdsp_distance",
+  "arm_cfft_batch_f32" : "cmsisdsp_transform",
+  "arm_cfft_f16" : "cmsisdsp_transform",
+  "arm_cfft_f32" : "cmsisdsp_transform",
+  "arm_cfft_f64" : "cmsisdsp_transform",
+  "arm_cfft_init_f16" : "cmsisdsp_transform",
+  "arm_cfft_init_f32" : "cmsisdsp_transform",
+  "arm_cfft_init_f64" : "cmsisdsp_transform",
+  "arm_cfft_init_q15" : "cmsisdsp_transform",
+  "arm_cfft_init_q31" : "cmsisdsp_transform",
+  "arm_cfft_instance_f16" : "cmsisdsp_transform",
+  "arm_cfft_instance_f32" : "cmsisdsp_transform",
+  "arm_cfft_instance_q15" : "cmsisdsp_transform",
+  "arm_cfft_instance_q31" : "cmsisdsp_transform",
+  "arm_cfft_q15" : "cmsisdsp_transform",
+  "arm_cfft_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix2_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix2_init_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix2_init_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix2_init_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix2_instance_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix2_instance_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix2_instance_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix2_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix2_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix4_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix4_init_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix4_init_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix4_init_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix4_instance_f32" : "cmsisdsp_transform",
+  "arm_cfft_radix4_instance_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix4_instance_q31" : "cmsisdsp_transform",
+  "arm_cfft_radix4_q15" : "cmsisdsp_transform",
+  "arm_cfft_radix4_q31" : "cmsisdsp_transform",
+  "arm_chebyshev_distance_f32" : "cmsisdsp_distance",
+  "arm_chebyshev_distance_f64" : "cmsisdsp_distance",
+  "arm_circularWrite_f32" : "cmsisdsp_filtering",
+  "arm_circularWrite_q15" : "cmsisdsp_filtering",
+  "arm_circularWrite_q7" : "cmsisdsp_filtering",
+  "arm_cityblock_distance_f32" : "cmsisdsp_distance",
+  "arm_cityblock_distance_f64" : "cmsisdsp_distance",
+  "arm_clarke_block_f32" : "cmsisdsp_controller",
+  "arm_clarke_block_q31" : "cmsisdsp_controller",
+  "arm_clarke_f32" : "cmsisdsp_controller",
+  "arm_clarke_q31" : "cmsisdsp_controller",
+  "arm_clip_f16" : "cmsisdsp_basic",
+  "arm_clip_f32" : "cmsisdsp_basic",
+  "arm_clip_q15" : "cmsisdsp_basic",
+  "arm_clip_q31" : "cmsisdsp_basic",
+  "arm_clip_q7" : "cmsisdsp_basic",
+  "arm_cmplx_conj_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_conj_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_conj_q31" : "cmsisdsp_complexf",
+  "arm_cmplx_dot_prod_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_dot_prod_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_dot_prod_q31" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_f64" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_fast_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_q31" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_squared_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_squared_f64" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_squared_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_mag_squared_q31" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_cmplx_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_cmplx_f64" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_cmplx_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_cmplx_q31" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_real_f32" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_real_q15" : "cmsisdsp_complexf",
+  "arm_cmplx_mult_real_q31" : "cmsisdsp_complexf",
+  "arm_conv_f32" : "cmsisdsp_filtering",
+  "arm_conv_fast_opt_q15" : "cmsisdsp_filtering",
+  "arm_conv_fast_q15" : "cmsisdsp_filtering",
+  "arm_conv_fast_q31" : "cmsisdsp_filtering",
+  "arm_conv_opt_q15" : "cmsisdsp_filtering",
+  "arm_conv_opt_q7" : "cmsisdsp_filtering",
+  "arm_conv_partial_f32" : "cmsisdsp_filtering",
+  "arm_conv_partial_fast_opt_q15" : "cmsisdsp_filtering",
+  "arm_conv_partial_fast_q15" : "cmsisdsp_filtering",
+  "arm_conv_partial_fast_q31" : "cmsisdsp_filtering",
+  "arm_conv_partial_opt_q15" : "cmsisdsp_filtering",
+  "arm_conv_partial_opt_q7" : "cmsisdsp_filtering",
+  "arm_conv_partial_q15" : "cmsisdsp_filtering",
+  "arm_conv_partial_q31" : "cmsisdsp_filtering",
+  "arm_conv_partial_q7" : "cmsisdsp_filtering",
+  "arm_conv_q15" : "cmsisdsp_filtering",
+  "arm_conv_q31" : "cmsisdsp_filtering",
+  "arm_conv_q7" : "cmsisdsp_filtering",
+  "arm_copy_f32" : "cmsisdsp_support",
+  "arm_copy_f64" : "cmsisdsp_support",
+  "arm_copy_q15" : "cmsisdsp_support",
+  "arm_copy_q31" : "cmsisdsp_support",
+  "arm_copy_q7" : "cmsisdsp_support",
+  "arm_correlate_f32" : "cmsisdsp_filtering",
+  "arm_correlate_f64" : "cmsisdsp_filtering",
+  "arm_correlate_fast_opt_q15" : "cmsisdsp_filtering",
+  "arm_correlate_fast_q15" : "cmsisdsp_filtering",
+  "arm_correlate_fast_q31" : "cmsisdsp_filtering",
+  "arm_correlate_opt_q15" : "cmsisdsp_filtering",
+  "arm_correlate_opt_q7" : "cmsisdsp_filtering",
+  "arm_correlate_q15" : "cmsisdsp_filtering",
+  "arm_correlate_q31" : "cmsisdsp_filtering",
+  "arm_correlate_q7" : "cmsisdsp_filtering",
+  "arm_correlation_distance_f32" : "cmsisdsp_distance",
+  "arm_cos_f32" : "cmsisdsp_fastmath",
+  "arm_cos_q15" : "cmsisdsp_fastmath",
+  "arm_cos_q31" : "cmsisdsp_fastmath",
+  "arm_cosine_distance_f32" : "cmsisdsp_distance",
+  "arm_cosine_distance_f64" : "cmsisdsp_distance",
+  "arm_dct4_batch_f32" : "cmsisdsp_transform",
+  "arm_dct4_f32" : "cmsisdsp_transform",
+  "arm_dct4_init_f32" : "cmsisdsp_transform",
+  "arm_dct4_init_q15" : "cmsisdsp_transform",
+  "arm_dct4_init_q31" : "cmsisdsp_transform",
+  "arm_dct4_instance_f32" : "cmsisdsp_transform",
+  "arm_dct4_instance_q15" : "cmsisdsp_transform",
+  "arm_dct4_instance_q31" : "cmsisdsp_transform",
+  "arm_dct4_q15" : "cmsisdsp_transform",
+  "arm_dct4_q31" : "cmsisdsp_transform",
+  "arm_dice_distance" : "cmsisdsp_distance",
+  "arm_div_int64_to_int32" : "cmsisdsp_support",
+  "arm_divide_q15" : "cmsisdsp_fastmath",
+  "arm_divide_q31" : "cmsisdsp_fastmath",
+  "arm_dot_prod_f16" : "cmsisdsp_basic",
+  "arm_dot_prod_f32" : "cmsisdsp_basic",
+  "arm_dot_prod_f64" : "cmsisdsp_basic",
+  "arm_dot_prod_q15" : "cmsisdsp_basic",
+  "arm_dot_prod_q31" : "cmsisdsp_basic",
+  "arm_dot_prod_q7" : "cmsisdsp_basic",
+  "arm_dtw_distance_f32" : "cmsisdsp_distance",
+  "arm_dtw_distance_only_f32" : "cmsisdsp_distance",
+  "arm_dtw_init_window_q7" : "cmsisdsp_distance",
+  "arm_dtw_path_f32" : "cmsisdsp_distance",
+  "arm_dtw_topk_f32" : "cmsisdsp_distance",
+  "arm_entropy_f16" : "cmsisdsp_statistics",
+  "arm_entropy_f32" : "cmsisdsp_statistics",
+  "arm_entropy_f64" : "cmsisdsp_statistics",
+  "arm_euclidean_distance_f32" : "cmsisdsp_distance",
+  "arm_euclidean_distance_f64" : "cmsisdsp_distance",
+  "arm_f16_to_f64" : "cmsisdsp_support",
+  "arm_f16_to_float" : "cmsisdsp_support",
+  "arm_f16_to_q15" : "cmsisdsp_support",
+  "arm_f64_to_f16" : "cmsisdsp_support",
+  "arm_fill_f32" : "cmsisdsp_support",
+  "arm_fill_f64" : "cmsisdsp_support",
+  "arm_fill_q15" : "cmsisdsp_support",
+  "arm_fill_q31" : "cmsisdsp_support",
+  "arm_fill_q7" : "cmsisdsp_support",
+  "arm_fir_bank_f32" : "cmsisdsp_filtering",
+  "arm_fir_bank_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_bank_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_bank_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_bank_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_bank_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_bank_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_bank_q15" : "cmsisdsp_filtering",
+  "arm_fir_bank_q31" : "cmsisdsp_filtering",
+  "arm_fir_decimate_f32" : "cmsisdsp_filtering",
+  "arm_fir_decimate_fast_q15" : "cmsisdsp_filtering",
+  "arm_fir_decimate_fast_q31" : "cmsisdsp_filtering",
+  "arm_fir_decimate_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_decimate_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_decimate_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_decimate_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_decimate_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_decimate_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_decimate_q15" : "cmsisdsp_filtering",
+  "arm_fir_decimate_q31" : "cmsisdsp_filtering",
+  "arm_fir_f16" : "cmsisdsp_filtering",
+  "arm_fir_f32" : "cmsisdsp_filtering",
+  "arm_fir_f64" : "cmsisdsp_filtering",
+  "arm_fir_fast_q15" : "cmsisdsp_filtering",
+  "arm_fir_fast_q31" : "cmsisdsp_filtering",
+  "arm_fir_init_f16" : "cmsisdsp_filtering",
+  "arm_fir_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_init_f64" : "cmsisdsp_filtering",
+  "arm_fir_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_init_q7" : "cmsisdsp_filtering",
+  "arm_fir_instance_f16" : "cmsisdsp_filtering",
+  "arm_fir_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_instance_f64" : "cmsisdsp_filtering",
+  "arm_fir_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_instance_q7" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_f32" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_q15" : "cmsisdsp_filtering",
+  "arm_fir_interpolate_q31" : "cmsisdsp_filtering",
+  "arm_fir_lattice_f32" : "cmsisdsp_filtering",
+  "arm_fir_lattice_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_lattice_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_lattice_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_lattice_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_lattice_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_lattice_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_lattice_q15" : "cmsisdsp_filtering",
+  "arm_fir_lattice_q31" : "cmsisdsp_filtering",
+  "arm_fir_q15" : "cmsisdsp_filtering",
+  "arm_fir_q31" : "cmsisdsp_filtering",
+  "arm_fir_q7" : "cmsisdsp_filtering",
+  "arm_fir_sparse_f32" : "cmsisdsp_filtering",
+  "arm_fir_sparse_init_f32" : "cmsisdsp_filtering",
+  "arm_fir_sparse_init_q15" : "cmsisdsp_filtering",
+  "arm_fir_sparse_init_q31" : "cmsisdsp_filtering",
+  "arm_fir_sparse_init_q7" : "cmsisdsp_filtering",
+  "arm_fir_sparse_instance_f32" : "cmsisdsp_filtering",
+  "arm_fir_sparse_instance_q15" : "cmsisdsp_filtering",
+  "arm_fir_sparse_instance_q31" : "cmsisdsp_filtering",
+  "arm_fir_sparse_instance_q7" : "cmsisdsp_filtering",
+  "arm_float_to_f16" : "cmsisdsp_support",
+  "arm_float_to_q15" : "cmsisdsp_support",
+  "arm_float_to_q31" : "cmsisdsp_support",
+  "arm_float_to_q7" : "cmsisdsp_support",
+  "arm_foc_block_f32" : "cmsisdsp_controller",
+  "arm_foc_block_q31" : "cmsisdsp_controller",
+  "arm_gaussian_naive_bayes_instance_f32" : "cmsisdsp_bayes",
+  "arm_gaussian_naive_bayes_predict_batch_f32" : "cmsisdsp_bayes",
+  "arm_gaussian_naive_bayes_predict_f32" : "cmsisdsp_bayes",
+  "arm_hamming_distance" : "cmsisdsp_distance",
+  "arm_hamming_f32" : "cmsisdsp_window",
+  "arm_hamming_f64" : "cmsisdsp_window",
+  "arm_hanning_f32" : "cmsisdsp_window",
+  "arm_hanning_f64" : "cmsisdsp_window",
+  "arm_hft116d_f32" : "cmsisdsp_window",
+  "arm_hft116d_f64" : "cmsisdsp_window",
+  "arm_hft144d_f32" : "cmsisdsp_window",
+  "arm_hft144d_f64" : "cmsisdsp_window",
+  "arm_hft169d_f32" : "cmsisdsp_window",
+  "arm_hft169d_f64" : "cmsisdsp_window",
+  "arm_hft196d_f32" : "cmsisdsp_window",
+  "arm_hft196d_f64" : "cmsisdsp_window",
+  "arm_hft223d_f32" : "cmsisdsp_window",
+  "arm_hft223d_f64" : "cmsisdsp_window",
+  "arm_hft248d_f32" : "cmsisdsp_window",
+  "arm_hft248d_f64" : "cmsisdsp_window",
+  "arm_hft90d_f32" : "cmsisdsp_window",
+  "arm_hft90d_f64" : "cmsisdsp_window",
+  "arm_hft95_f32" : "cmsisdsp_window",
+  "arm_hft95_f64" : "cmsisdsp_window",
+  "arm_householder_f32" : "cmsisdsp_matrix",
+  "arm_householder_f64" : "cmsisdsp_matrix",
+  "arm_iir_lattice_f32" : "cmsisdsp_filtering",
+  "arm_iir_lattice_init_f32" : "cmsisdsp_filtering",
+  "arm_iir_lattice_init_q15" : "cmsisdsp_filtering",
+  "arm_iir_lattice_init_q31" : "cmsisdsp_filtering",
+  "arm_iir_lattice_instance_f32" : "cmsisdsp_filtering",
+  "arm_iir_lattice_instance_q15" : "cmsisdsp_filtering",
+  "arm_iir_lattice_instance_q31" : "cmsisdsp_filtering",
+  "arm_iir_lattice_q15" : "cmsisdsp_filtering",
+  "arm_iir_lattice_q31" : "cmsisdsp_filtering",
+  "arm_inv_clarke_block_f32" : "cmsisdsp_controller",
+  "arm_inv_clarke_block_q31" : "cmsisdsp_controller",
+  "arm_inv_clarke_f32" : "cmsisdsp_controller",
+  "arm_inv_clarke_q31" : "cmsisdsp_controller",
+  "arm_inv_park_block_f32" : "cmsisdsp_controller",
+  "arm_inv_park_block_q31" : "cmsisdsp_controller",
+  "arm_inv_park_f32" : "cmsisdsp_controller",
+  "arm_inv_park_q31" : "cmsisdsp_controller",
+  "arm_jaccard_distance" : "cmsisdsp_distance",
+  "arm_jensenshannon_distance_f32" : "cmsisdsp_distance",
+  "arm_kullback_leibler_f16" : "cmsisdsp_statistics",
+  "arm_kullback_leibler_f32" : "cmsisdsp_statistics",
+  "arm_kullback_leibler_f64" : "cmsisdsp_statistics",
+  "arm_kulsinski_distance" : "cmsisdsp_distance",
+  "arm_levinson_durbin_f32" : "cmsisdsp_filtering",
+  "arm_levinson_durbin_q31" : "cmsisdsp_filtering",
+  "arm_linear_interp_block_f32" : "cmsisdsp_interpolation",
+  "arm_linear_interp_block_q15" : "cmsisdsp_interpolation",
+  "arm_linear_interp_block_q31" : "cmsisdsp_interpolation",
+  "arm_linear_interp_block_q7" : "cmsisdsp_interpolation",
+  "arm_linear_interp_f32" : "cmsisdsp_interpolation",
+  "arm_linear_interp_instance_f32" : "cmsisdsp_interpolation",
+  "arm_linear_interp_q15" : "cmsisdsp_interpolation",
+  "arm_linear_interp_q31" : "cmsisdsp_interpolation",
+  "arm_linear_interp_q7" : "cmsisdsp_interpolation",
+  "arm_lms_f32" : "cmsisdsp_filtering",
+  "arm_lms_init_f32" : "cmsisdsp_filtering",
+  "arm_lms_init_q15" : "cmsisdsp_filtering",
+  "arm_lms_init_q31" : "cmsisdsp_filtering",
+  "arm_lms_instance_f32" : "cmsisdsp_filtering",
+  "arm_lms_instance_q15" : "cmsisdsp_filtering",
+  "arm_lms_instance_q31" : "cmsisdsp_filtering",
+  "arm_lms_norm_f32" : "cmsisdsp_filtering",
+  "arm_lms_norm_init_f32" : "cmsisdsp_filtering",
+  "arm_lms_norm_init_q15" : "cmsisdsp_filtering",
+  "arm_lms_norm_init_q31" : "cmsisdsp_filtering",
+  "arm_lms_norm_instance_f32" : "cmsisdsp_filtering",
+  "arm_lms_norm_instance_q15" : "cmsisdsp_filtering",
+  "arm_lms_norm_instance_q31" : "cmsisdsp_filtering",
+  "arm_lms_norm_q15" : "cmsisdsp_filtering",
+  "arm_lms_norm_q31" : "cmsisdsp_filtering",
+  "arm_lms_q15" : "cmsisdsp_filtering",
+  "arm_lms_q31" : "cmsisdsp_filtering",
+  "arm_logsumexp_dot_prod_f32" : "cmsisdsp_statistics",
+  "arm_logsumexp_f16" : "cmsisdsp_statistics",
+  "arm_logsumexp_f32" : "cmsisdsp_statistics",
+  "arm_mat_add_f16" : "cmsisdsp_matrix",
+  "arm_mat_add_f32" : "cmsisdsp_matrix",
+  "arm_mat_add_q15" : "cmsisdsp_matrix",
+  "arm_mat_add_q31" : "cmsisdsp_matrix",
+  "arm_mat_cholesky_f32" : "cmsisdsp_matrix",
+  "arm_mat_cholesky_f64" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_mult_f32" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_mult_q15" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_mult_q31" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_trans_f32" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_trans_q15" : "cmsisdsp_matrix",
+  "arm_mat_cmplx_trans_q31" : "cmsisdsp_matrix",
+  "arm_mat_inverse_f16" : "cmsisdsp_matrix",
+  "arm_mat_inverse_f32" : "cmsisdsp_matrix",
+  "arm_mat_inverse_f64" : "cmsisdsp_matrix",
+  "arm_mat_ldlt_f32" : "cmsisdsp_matrix",
+  "arm_mat_ldlt_f64" : "cmsisdsp_matrix",
+  "arm_mat_mult_f16" : "cmsisdsp_matrix",
+  "arm_mat_mult_f32" : "cmsisdsp_matrix",
+  "arm_mat_mult_f64" : "cmsisdsp_matrix",
+  "arm_mat_mult_fast_q15" : "cmsisdsp_matrix",
+  "arm_mat_mult_fast_q31" : "cmsisdsp_matrix",
+  "arm_mat_mult_opt_q31" : "cmsisdsp_matrix",
+  "arm_mat_mult_q15" : "cmsisdsp_matrix",
+  "arm_mat_mult_q31" : "cmsisdsp_matrix",
+  "arm_mat_mult_q7" : "cmsisdsp_matrix",
+  "arm_mat_qr_f32" : "cmsisdsp_matrix",
+  "arm_mat_qr_f64" : "cmsisdsp_matrix",
+  "arm_mat_scale_f16" : "cmsisdsp_matrix",
+  "arm_mat_scale_f32" : "cmsisdsp_matrix",
+  "arm_mat_scale_q15" : "cmsisdsp_matrix",
+  "arm_mat_scale_q31" : "cmsisdsp_matrix",
+  "arm_mat_solve_lower_triangular_f32" : "cmsisdsp_matrix",
+  "arm_mat_solve_lower_triangular_f64" : "cmsisdsp_matrix",
+  "arm_mat_solve_upper_triangular_f32" : "cmsisdsp_matrix",
+  "arm_mat_solve_upper_triangular_f64" : "cmsisdsp_matrix",
+  "arm_mat_sub_f16" : "cmsisdsp_matrix",
+  "arm_mat_sub_f32" : "cmsisdsp_matrix",
+  "arm_mat_sub_f64" : "cmsisdsp_matrix",
+  "arm_mat_sub_q15" : "cmsisdsp_matrix",
+  "arm_mat_sub_q31" : "cmsisdsp_matrix",
+  "arm_mat_trans_f16" : "cmsisdsp_matrix",
+  "arm_mat_trans_f32" : "cmsisdsp_matrix",
+  "arm_mat_trans_f64" : "cmsisdsp_matrix",
+  "arm_mat_trans_q15" : "cmsisdsp_matrix",
+  "arm_mat_trans_q31" : "cmsisdsp_matrix",
+  "arm_mat_trans_q7" : "cmsisdsp_matrix",
+  "arm_mat_vec_mult_f16" : "cmsisdsp_matrix",
+  "arm_mat_vec_mult_f32" : "cmsisdsp_matrix",
+  "arm_mat_vec_mult_q15" : "cmsisdsp_matrix",
+  "arm_mat_vec_mult_q31" : "cmsisdsp_matrix",
+  "arm_mat_vec_mult_q7" : "cmsisdsp_matrix",
+  "arm_matrix_instance_f32" : "cmsisdsp_matrix",
+  "arm_matrix_instance_f64" : "cmsisdsp_matrix",
+  "arm_matrix_instance_q15" : "cmsisdsp_matrix",
+  "arm_matrix_instance_q31" : "cmsisdsp_matrix",
+  "arm_max_f16" : "cmsisdsp_statistics",
+  "arm_max_f32" : "cmsisdsp_statistics",
+  "arm_max_f64" : "cmsisdsp_statistics",
+  "arm_max_no_idx_f16" : "cmsisdsp_statistics",
+  "arm_max_no_idx_f32" : "cmsisdsp_statistics",
+  "arm_max_no_idx_f64" : "cmsisdsp_statistics",
+  "arm_max_no_idx_q15" : "cmsisdsp_statistics",
+  "arm_max_no_idx_q31" : "cmsisdsp_statistics",
+  "arm_max_no_idx_q7" : "cmsisdsp_statistics",
+  "arm_max_q15" : "cmsisdsp_statistics",
+  "arm_max_q31" : "cmsisdsp_statistics",
+  "arm_max_q7" : "cmsisdsp_statistics",
+  "arm_mean_f16" : "cmsisdsp_statistics",
+  "arm_mean_f32" : "cmsisdsp_statistics",
+  "arm_mean_f64" : "cmsisdsp_statistics",
+  "arm_mean_q15" : "cmsisdsp_statistics",
+  "arm_mean_q31" : "cmsisdsp_statistics",
+  "arm_mean_q7" : "cmsisdsp_statistics",
+  "arm_mfcc_batch_f32" : "cmsisdsp_transform",
+  "arm_mfcc_f16" : "cmsisdsp_transform",
+  "arm_mfcc_f32" : "cmsisdsp_transform",
+  "arm_mfcc_init_f16" : "cmsisdsp_transform",
+  "arm_mfcc_init_f32" : "cmsisdsp_transform",
+  "arm_mfcc_init_q15" : "cmsisdsp_transform",
+  "arm_mfcc_init_q31" : "cmsisdsp_transform",
+  "arm_mfcc_instance_f16" : "cmsisdsp_transform",
+  "arm_mfcc_instance_f32" : "cmsisdsp_transform",
+  "arm_mfcc_instance_q15" : "cmsisdsp_transform",
+  "arm_mfcc_instance_q31" : "cmsisdsp_transform",
+  "arm_mfcc_q15" : "cmsisdsp_transform",
+  "arm_mfcc_q31" : "cmsisdsp_transform",
+  "arm_mfcc_stream_f32" : "cmsisdsp_transform",
+  "arm_mfcc_stream_init_f32" : "cmsisdsp_transform",
+  "arm_mfcc_stream_init_q15" : "cmsisdsp_transform",
+  "arm_mfcc_stream_init_q31" : "cmsisdsp_transform",
+  "arm_mfcc_stream_instance_f32" : "cmsisdsp_transform",
+  "arm_mfcc_stream_instance_q15" : "cmsisdsp_transform",
+  "arm_mfcc_stream_instance_q31" : "cmsisdsp_transform",
+  "arm_mfcc_stream_q15" : "cmsisdsp_transform",
+  "arm_mfcc_stream_q31" : "cmsisdsp_transform",
+  "arm_mfcc_stream_reset_f32" : "cmsisdsp_transform",
+  "arm_mfcc_stream_reset_q15" : "cmsisdsp_transform",
+  "arm_mfcc_stream_reset_q31" : "cmsisdsp_transform",
+  "arm_min_f16" : "cmsisdsp_statistics",
+  "arm_min_f32" : "cmsisdsp_statistics",
+  "arm_min_f64" : "cmsisdsp_statistics",
+  "arm_min_no_idx_f16" : "cmsisdsp_statistics",
+  "arm_min_no_idx_f32" : "cmsisdsp_statistics",
+  "arm_min_no_idx_f64" : "cmsisdsp_statistics",
+  "arm_min_no_idx_q15" : "cmsisdsp_statistics",
+  "arm_min_no_idx_q31" : "cmsisdsp_statistics",
+  "arm_min_no_idx_q7" : "cmsisdsp_statistics",
+  "arm_min_q15" : "cmsisdsp_statistics",
+  "arm_min_q31" : "cmsisdsp_statistics",
+  "arm_min_q7" : "cmsisdsp_statistics",
+  "arm_minkowski_distance_f32" : "cmsisdsp_distance",
+  "arm_mse_f16" : "cmsisdsp_statistics",
+  "arm_mse_f32" : "cmsisdsp_statistics",
+  "arm_mse_f64" : "cmsisdsp_statistics",
+  "arm_mse_q15" : "cmsisdsp_statistics",
+  "arm_mse_q31" : "cmsisdsp_statistics",
+  "arm_mse_q7" : "cmsisdsp_statistics",
+  "arm_mult_f16" : "cmsisdsp_basic",
+  "arm_mult_f32" : "cmsisdsp_basic",
+  "arm_mult_f64" : "cmsisdsp_basic",
+  "arm_mult_q15" : "cmsisdsp_basic",
+  "arm_mult_q31" : "cmsisdsp_basic",
+  "arm_mult_q7" : "cmsisdsp_basic",
+  "arm_negate_f16" : "cmsisdsp_basic",
+  "arm_negate_f32" : "cmsisdsp_basic",
+  "arm_negate_f64" : "cmsisdsp_basic",
+  "arm_negate_q15" : "cmsisdsp_basic",
+  "arm_negate_q31" : "cmsisdsp_basic",
+  "arm_negate_q7" : "cmsisdsp_basic",
+  "arm_not_u16" : "cmsisdsp_basic",
+  "arm_not_u32" : "cmsisdsp_basic",
+  "arm_not_u8" : "cmsisdsp_basic",
+  "arm_nuttall3_f32" : "cmsisdsp_window",
+  "arm_nuttall3_f64" : "cmsisdsp_window",
+  "arm_nuttall3a_f32" : "cmsisdsp_window",
+  "arm_nuttall3a_f64" : "cmsisdsp_window",
+  "arm_nuttall3b_f32" : "cmsisdsp_window",
+  "arm_nuttall3b_f64" : "cmsisdsp_window",
+  "arm_nuttall4_f32" : "cmsisdsp_window",
+  "arm_nuttall4_f64" : "cmsisdsp_window",
+  "arm_nuttall4a_f32" : "cmsisdsp_window",
+  "arm_nuttall4a_f64" : "cmsisdsp_window",
+  "arm_nuttall4b_f32" : "cmsisdsp_window",
+  "arm_nuttall4b_f64" : "cmsisdsp_window",
+  "arm_nuttall4c_f32" : "cmsisdsp_window",
+  "arm_nuttall4c_f64" : "cmsisdsp_window",
+  "arm_offset_f16" : "cmsisdsp_basic",
+  "arm_offset_f32" : "cmsisdsp_basic",
+  "arm_offset_f64" : "cmsisdsp_basic",
+  "arm_offset_q15" : "cmsisdsp_basic",
+  "arm_offset_q31" : "cmsisdsp_basic",
+  "arm_offset_q7" : "cmsisdsp_basic",
+  "arm_or_u16" : "cmsisdsp_basic",
+  "arm_or_u32" : "cmsisdsp_basic",
+  "arm_or_u8" : "cmsisdsp_basic",
+  "arm_park_block_f32" : "cmsisdsp_controller",
+  "arm_park_block_q31" : "cmsisdsp_controller",
+  "arm_park_f32" : "cmsisdsp_controller",
+  "arm_park_q31" : "cmsisdsp_controller",
+  "arm_pdist_bool" : "cmsisdsp_distance",
+  "arm_pdist_f32" : "cmsisdsp_distance",
+  "arm_pid_block_f32" : "cmsisdsp_controller",
+  "arm_pid_block_q15" : "cmsisdsp_controller",
+  "arm_pid_block_q31" : "cmsisdsp_controller",
+  "arm_pid_f32" : "cmsisdsp_controller",
+  "arm_pid_init_f32" : "cmsisdsp_controller",
+  "arm_pid_init_q15" : "cmsisdsp_controller",
+  "arm_pid_init_q31" : "cmsisdsp_controller",
+  "arm_pid_instance_f32" : "cmsisdsp_controller",
+  "arm_pid_instance_q15" : "cmsisdsp_controller",
+  "arm_pid_instance_q31" : "cmsisdsp_controller",
+  "arm_pid_q15" : "cmsisdsp_controller",
+  "arm_pid_q31" : "cmsisdsp_controller",
+  "arm_pid_reset_f32" : "cmsisdsp_controller",
+  "arm_pid_reset_q15" : "cmsisdsp_controller",
+  "arm_pid_reset_q31" : "cmsisdsp_controller",
+  "arm_power_f16" : "cmsisdsp_statistics",
+  "arm_power_f32" : "cmsisdsp_statistics",
+  "arm_power_f64" : "cmsisdsp_statistics",
+  "arm_power_q15" : "cmsisdsp_statistics",
+  "arm_power_q31" : "cmsisdsp_statistics",
+  "arm_power_q7" : "cmsisdsp_statistics",
+  "arm_q15_to_f16" : "cmsisdsp_support",
+  "arm_q15_to_float" : "cmsisdsp_support",
+  "arm_q15_to_q31" : "cmsisdsp_support",
+  "arm_q15_to_q7" : "cmsisdsp_support",
+  "arm_q31_to_float" : "cmsisdsp_support",
+  "arm_q31_to_q15" : "cmsisdsp_support",
+  "arm_q31_to_q7" : "cmsisdsp_support",
+  "arm_q7_to_float" : "cmsisdsp_support",
+  "arm_q7_to_q15" : "cmsisdsp_support",
+  "arm_q7_to_q31" : "cmsisdsp_support",
+  "arm_quaternion2rotation_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_conjugate_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_inverse_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_norm_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_normalize_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_product_f32" : "cmsisdsp_quaternion",
+  "arm_quaternion_product_single_f32" : "cmsisdsp_quaternion",
+  "arm_recip_q15" : "cmsisdsp_basic",
+  "arm_recip_q31" : "cmsisdsp_basic",
+  "arm_rfft_fast_batch_f32" : "cmsisdsp_transform",
+  "arm_rfft_fast_f16" : "cmsisdsp_transform",
+  "arm_rfft_fast_f32" : "cmsisdsp_transform",
+  "arm_rfft_fast_f64" : "cmsisdsp_transform",
+  "arm_rfft_fast_init_f16" : "cmsisdsp_transform",
+  "arm_rfft_fast_init_f32" : "cmsisdsp_transform",
+  "arm_rfft_fast_init_f64" : "cmsisdsp_transform",
+  "arm_rfft_fast_instance_f16" : "cmsisdsp_transform",
+  "arm_rfft_fast_instance_f32" : "cmsisdsp_transform",
+  "arm_rfft_fast_instance_f64" : "cmsisdsp_transform",
+  "arm_rfft_init_q15" : "cmsisdsp_transform",
+  "arm_rfft_init_q31" : "cmsisdsp_transform",
+  "arm_rfft_instance_f32" : "cmsisdsp_transform",
+  "arm_rfft_instance_q15" : "cmsisdsp_transform",
+  "arm_rfft_instance_q31" : "cmsisdsp_transform",
+  "arm_rfft_q15" : "cmsisdsp_transform",
+  "arm_rfft_q31" : "cmsisdsp_transform",
+  "arm_rms_f16" : "cmsisdsp_statistics",
+  "arm_rms_f32" : "cmsisdsp_statistics",
+  "arm_rms_q15" : "cmsisdsp_statistics",
+  "arm_rms_q31" : "cmsisdsp_statistics",
+  "arm_rogerstanimoto_distance" : "cmsisdsp_distance",
+  "arm_rotation2quaternion_f32" : "cmsisdsp_quaternion",
+  "arm_russellrao_distance" : "cmsisdsp_distance",
+  "arm_scale_f16" : "cmsisdsp_basic",
+  "arm_scale_f32" : "cmsisdsp_basic",
+  "arm_scale_f64" : "cmsisdsp_basic",
+  "arm_scale_q15" : "cmsisdsp_basic",
+  "arm_scale_q31" : "cmsisdsp_basic",
+  "arm_scale_q7" : "cmsisdsp_basic",
+  "arm_shift_q15" : "cmsisdsp_basic",
+  "arm_shift_q31" : "cmsisdsp_basic",
+  "arm_shift_q7" : "cmsisdsp_basic",
+  "arm_sin_cos_block_f32" : "cmsisdsp_controller",
+  "arm_sin_cos_block_q31" : "cmsisdsp_controller",
+  "arm_sin_cos_f32" : "cmsisdsp_controller",
+  "arm_sin_cos_q31" : "cmsisdsp_controller",
+  "arm_sin_f32" : "cmsisdsp_fastmath",
+  "arm_sin_q15" : "cmsisdsp_fastmath",
+  "arm_sin_q31" : "cmsisdsp_fastmath",
+  "arm_sokalmichener_distance" : "cmsisdsp_distance",
+  "arm_sokalsneath_distance" : "cmsisdsp_distance",
+  "arm_sort_f32" : "cmsisdsp_support",
+  "arm_sort_init_f32" : "cmsisdsp_support",
+  "arm_sort_instance_f32" : "cmsisdsp_support",
+  "arm_spline_f32" : "cmsisdsp_interpolation",
+  "arm_spline_init_f32" : "cmsisdsp_interpolation",
+  "arm_spline_instance_f32" : "cmsisdsp_interpolation",
+  "arm_sqrt_f32" : "cmsisdsp_fastmath",
+  "arm_sqrt_q15" : "cmsisdsp_fastmath",
+  "arm_sqrt_q31" : "cmsisdsp_fastmath",
+  "arm_std_f16" : "cmsisdsp_statistics",
+  "arm_std_f32" : "cmsisdsp_statistics",
+  "arm_std_f64" : "cmsisdsp_statistics",
+  "arm_std_q15" : "cmsisdsp_statistics",
+  "arm_std_q31" : "cmsisdsp_statistics",
+  "arm_sub_f16" : "cmsisdsp_basic",
+  "arm_sub_f32" : "cmsisdsp_basic",
+  "arm_sub_f64" : "cmsisdsp_basic",
+  "arm_sub_q15" : "cmsisdsp_basic",
+  "arm_sub_q31" : "cmsisdsp_basic",
+  "arm_sub_q7" : "cmsisdsp_basic",
+  "arm_svm_linear_init_f32" : "cmsisdsp_svm",
+  "arm_svm_linear_instance_f32" : "cmsisdsp_svm",
+  "arm_svm_linear_predict_batch_f32" : "cmsisdsp_svm",
+  "arm_svm_linear_predict_f32" : "cmsisdsp_svm",
+  "arm_svm_polynomial_init_f32" : "cmsisdsp_svm",
+  "arm_svm_polynomial_instance_f32" : "cmsisdsp_svm",
+  "arm_svm_polynomial_predict_batch_f32" : "cmsisdsp_svm",
+  "arm_svm_polynomial_predict_f32" : "cmsisdsp_svm",
+  "arm_svm_rbf_init_f32" : "cmsisdsp_svm",
+  "arm_svm_rbf_instance_f32" : "cmsisdsp_svm",
+  "arm_svm_rbf_predict_batch_f32" : "cmsisdsp_svm",
+  "arm_svm_rbf_predict_f32" : "cmsisdsp_svm",
+  "arm_svm_sigmoid_init_f32" : "cmsisdsp_svm",
+  "arm_svm_sigmoid_instance_f32" : "cmsisdsp_svm",
+  "arm_svm_sigmoid_predict_batch_f32" : "cmsisdsp_svm",
+  "arm_svm_sigmoid_predict_f32" : "cmsisdsp_svm",
+  "arm_var_f16" : "cmsisdsp_statistics",
+  "arm_var_f32" : "cmsisdsp_statistics",
+  "arm_var_f64" : "cmsisdsp_statistics",
+  "arm_var_q15" : "cmsisdsp_statistics",
+  "arm_var_q31" : "cmsisdsp_statistics",
+  "arm_vatan2_f32" : "cmsisdsp_fastmath",
+  "arm_vatan2_q15" : "cmsisdsp_fastmath",
+  "arm_vatan2_q31" : "cmsisdsp_fastmath",
+  "arm_vcos_f32" : "cmsisdsp_fastmath",
+  "arm_vcos_q15" : "cmsisdsp_fastmath",
+  "arm_vcos_q31" : "cmsisdsp_fastmath",
+  "arm_vexp_f32" : "cmsisdsp_fastmath",
+  "arm_vexp_f64" : "cmsisdsp_fastmath",
+  "arm_vlog_f32" : "cmsisdsp_fastmath",
+  "arm_vlog_f64" : "cmsisdsp_fastmath",
+  "arm_vlog_q15" : "cmsisdsp_fastmath",
+  "arm_vlog_q31" : "cmsisdsp_fastmath",
+  "arm_vsin_f32" : "cmsisdsp_fastmath",
+  "arm_vsin_q15" : "cmsisdsp_fastmath",
+  "arm_vsin_q31" : "cmsisdsp_fastmath",
+  "arm_vsqrt_f32" : "cmsisdsp_fastmath",
+  "arm_vsqrt_q15" : "cmsisdsp_fastmath",
+  "arm_vsqrt_q31" : "cmsisdsp_fastmath",
+  "arm_weighted_sum_f32" : "cmsisdsp_support",
+  "arm_welch_f32" : "cmsisdsp_window",
+  "arm_welch_f64" : "cmsisdsp_window",
+  "arm_xor_u16" : "cmsisdsp_basic",
+  "arm_xor_u32" : "cmsisdsp_basic",
+  "arm_xor_u8" : "cmsisdsp_basic",
+  "arm_yule_distance" : "cmsisdsp_distance",
+  "clz" : "cmsisdsp_basic",
+  "error_out" : "cmsisdsp_window",
+  "ssat" : "cmsisdsp_basic",
+  "usat" : "cmsisdsp_basic",
+}
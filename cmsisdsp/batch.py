@@ -0,0 +1,311 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+def runBatch(f,S,frames,*args,nbThreads=None,out=None):
+    """
+     Run a batched function (like arm_rfft_fast_batch_f32) with the frames
+     distributed on several threads.
+
+     Each thread is processing a contiguous block of frames and writes
+     directly in its rows of the output. The GIL is released by the
+     C functions so the threads are running in parallel.
+
+     The instance is only read by the batched functions and can
+     be shared between the threads.
+
+     :param f: Batched function.
+     :type f: function
+     :param S: Instance used by the batched function.
+     :type S: CMSIS-DSP instance
+     :param frames: Frames (one frame per row).
+     :type frames: 2D array
+     :param args: Other arguments of the batched function.
+     :type args: list
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :param out: Optional output array.
+     :type out: 2D array
+     :return: Output frames (one frame per row).
+     :rtype: 2D array
+
+    """
+    frames = np.ascontiguousarray(frames,dtype=np.float32)
+    nbFrames = frames.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbFrames < 2:
+       return(f(S,frames,*args,out=out))
+
+    nbThreads = min(nbThreads,nbFrames)
+
+    if out is None:
+       # Dimensions of the output are given by the processing of one frame
+       first = f(S,frames[:1],*args)
+       out = np.empty((nbFrames,first.shape[1]),dtype=first.dtype)
+
+    bounds = np.linspace(0,nbFrames,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,S,frames[start:end],*args,out=out[start:end])
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        for j in jobs:
+            j.result()
+
+    return(out)
+
+def runChannels(f,S,samples,nbThreads=None,out=None):
+    """
+     Run a filter bank function (like arm_fir_bank_f32) with the channels
+     distributed on several threads.
+
+     Each thread is processing a contiguous block of channels. The
+     channels have their own instance and state in the bank so
+     the threads are not sharing any state.
+
+     :param f: Filter bank function.
+     :type f: function
+     :param S: Filter bank.
+     :type S: CMSIS-DSP filter bank instance
+     :param samples: Samples (one channel per row).
+     :type samples: 2D array
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :param out: Optional output array.
+     :type out: 2D array
+     :return: Filtered samples (one channel per row).
+     :rtype: 2D array
+
+    """
+    nbChannels = samples.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbChannels < 2:
+       return(f(S,samples,out=out))
+
+    nbThreads = min(nbThreads,nbChannels)
+
+    if out is None:
+       # Datatype of the output is given by the processing of no channel
+       # (the filters are not stateless and no sample can be processed)
+       empty = f(S,samples[:0],0)
+       out = np.empty(samples.shape,dtype=empty.dtype)
+
+    bounds = np.linspace(0,nbChannels,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,S,samples[start:end],start,out=out[start:end])
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        for j in jobs:
+            j.result()
+
+    return(out)
+
+def runCdist(f,XA,XB,*args,nbThreads=None,out=None):
+    """
+     Run a pairwise distance function (arm_cdist_f32 or arm_cdist_bool)
+     with the rows of XA distributed on several threads.
+
+     Each thread is computing the distances of a contiguous block of
+     rows of XA and writes directly in its rows of the output.
+
+     :param f: Pairwise distance function.
+     :type f: function
+     :param XA: First array (one vector per row).
+     :type XA: 2D array
+     :param XB: Second array (one vector per row).
+     :type XB: 2D array
+     :param args: Other arguments of the function (metric ...).
+     :type args: list
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :param out: Optional output array.
+     :type out: 2D array
+     :return: Distances between the rows of XA and XB.
+     :rtype: 2D array
+
+    """
+    nbRows = XA.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbRows < 2:
+       return(f(XA,XB,*args,out=out))
+
+    nbThreads = min(nbThreads,nbRows)
+
+    if out is None:
+       out = np.empty((nbRows,XB.shape[0]),dtype=np.float32)
+
+    bounds = np.linspace(0,nbRows,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,XA[start:end],XB,*args,out=out[start:end])
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        for j in jobs:
+            j.result()
+
+    return(out)
+
+def runCdistTopk(f,XA,XB,*args,nbThreads=None):
+    """
+     Run a k nearest function (arm_cdist_topk_f32 or arm_cdist_topk_bool)
+     with the rows of XA distributed on several threads.
+
+     :param f: k nearest function.
+     :type f: function
+     :param XA: Queries (one vector per row).
+     :type XA: 2D array
+     :param XB: Vectors searched (one vector per row).
+     :type XB: 2D array
+     :param args: Other arguments of the function (metric, k ...).
+     :type args: list
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :return: Indexes and distances of the k nearest rows of XB.
+     :rtype: tuple of 2D arrays
+
+    """
+    nbRows = XA.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbRows < 2:
+       return(f(XA,XB,*args))
+
+    nbThreads = min(nbThreads,nbRows)
+
+    bounds = np.linspace(0,nbRows,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,XA[start:end],XB,*args)
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        results = [j.result() for j in jobs]
+
+    return(np.concatenate([r[0] for r in results]),
+           np.concatenate([r[1] for r in results]))
+
+def runPdist(f,X,*args,nbThreads=None,out=None):
+    """
+     Run a condensed distance function (arm_pdist_f32 or arm_pdist_bool)
+     with the rows distributed on several threads.
+
+     Row i of the condensed matrix has n-1-i distances so the
+     ranges of rows are chosen to give the same number of
+     distances to each thread.
+
+     The ranges of rows are given after the arguments so
+     the optional arguments must be given
+     (the order of the minkowski distance for arm_pdist_f32).
+
+     :param f: Condensed distance function.
+     :type f: function
+     :param X: Vectors (one vector per row).
+     :type X: 2D array
+     :param args: Other arguments of the function (metric and p or nbBits).
+     :type args: list
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :param out: Optional output array.
+     :type out: 1D array
+     :return: Condensed distance matrix.
+     :rtype: 1D array
+
+    """
+    nbRows = X.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbRows < 3:
+       return(f(X,*args,out=out))
+
+    rows = np.arange(nbRows+1)
+    offsets = rows*nbRows - rows*(rows+1)//2
+    nbDist = offsets[-1]
+
+    if out is None:
+       out = np.empty(nbDist,dtype=np.float32)
+
+    bounds = np.searchsorted(offsets,np.linspace(0,nbDist,nbThreads+1))
+    bounds[0] = 0
+    bounds[-1] = nbRows
+    bounds = np.unique(bounds)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,X,*args,int(start),int(end),out=out)
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        for j in jobs:
+            j.result()
+
+    return(out)
+
+def runPredict(f,S,samples,nbThreads=None):
+    """
+     Run a batched prediction function (like arm_svm_rbf_predict_batch_f32
+     or arm_gaussian_naive_bayes_predict_batch_f32) with the samples
+     distributed on several threads.
+
+     The classifier is only read by the prediction functions and can
+     be shared between the threads. Each thread has its own temporary
+     buffers.
+
+     :param f: Batched prediction function.
+     :type f: function
+     :param S: Classifier instance.
+     :type S: CMSIS-DSP instance
+     :param samples: Feature vectors (one vector per row).
+     :type samples: 2D array
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :return: Labels or tuple (probabilities, labels) for naive bayes.
+     :rtype: 1D array or tuple of arrays
+
+    """
+    samples = np.ascontiguousarray(samples,dtype=np.float32)
+    nbSamples = samples.shape[0]
+
+    if nbThreads is None or nbThreads <= 1 or nbSamples < 2:
+       return(f(S,samples))
+
+    nbThreads = min(nbThreads,nbSamples)
+
+    bounds = np.linspace(0,nbSamples,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,S,samples[start:end])
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        results = [j.result() for j in jobs]
+
+    if isinstance(results[0],tuple):
+       return(tuple(np.concatenate([r[i] for r in results]) for i in range(len(results[0]))))
+    return(np.concatenate(results))
+
+def runInterp(f,S,*queries,nbThreads=None,out=None):
+    """
+     Run a block interpolation function (like arm_linear_interp_block_f32
+     or arm_bilinear_interp_block_f32) with the query points
+     distributed on several threads.
+
+     Each thread is processing a contiguous block of query points and
+     writes directly in its part of the output. The table is only read
+     by the interpolation functions and is shared between the threads.
+
+     :param f: Block interpolation function.
+     :type f: function
+     :param S: Instance (or table for the q31, q15 and q7 linear interpolations).
+     :type S: CMSIS-DSP instance or array
+     :param queries: Query points (x or X and Y).
+     :type queries: 1D arrays
+     :param nbThreads: Number of threads (no thread by default).
+     :type nbThreads: int
+     :param out: Optional output array.
+     :type out: 1D array
+     :return: Interpolated values.
+     :rtype: 1D array
+
+    """
+    nbQueries = len(queries[0])
+
+    if nbThreads is None or nbThreads <= 1 or nbQueries < 2:
+       return(f(S,*queries,out=out))
+
+    nbThreads = min(nbThreads,nbQueries)
+
+    if out is None:
+       # Datatype of the output is given by the interpolation of no point
+       empty = f(S,*[q[:0] for q in queries])
+       out = np.empty(nbQueries,dtype=empty.dtype)
+
+    bounds = np.linspace(0,nbQueries,nbThreads+1).astype(int)
+    with ThreadPoolExecutor(max_workers=nbThreads) as executor:
+        jobs = [executor.submit(f,S,*[q[start:end] for q in queries],out=out[start:end])
+                for start,end in zip(bounds[:-1],bounds[1:])]
+        for j in jobs:
+            j.result()
+
+    return(out)
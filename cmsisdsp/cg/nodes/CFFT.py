@@ -27,6 +27,8 @@
 ############################################
 from .simu import *
 import cmsisdsp as dsp 
+import cmsisdsp.datatype as dt
+import cmsisdsp.plans as plans
 
 
 
@@ -34,20 +36,18 @@ import cmsisdsp as dsp
 class CFFT(GenericNode):
     def __init__(self,inputSize,outSize,fifoin,fifoout):
         GenericNode.__init__(self,inputSize,outSize,fifoin,fifoout)
+        # The instance is shared with the other nodes of same length
         if fifoin.type == np.dtype(np.float32):
-           self._cfft=dsp.arm_cfft_instance_f32()
-           status=dsp.arm_cfft_init_f32(self._cfft,inputSize>>1)
+           self._cfft=plans.cfft(inputSize>>1,dt.F32)
         if fifoin.type == np.dtype(np.int16):
-           self._cfft=dsp.arm_cfft_instance_q15()
-           status=dsp.arm_cfft_init_q15(self._cfft,inputSize>>1)
+           self._cfft=plans.cfft(inputSize>>1,dt.Q15)
 
     def run(self):
         a=self.getReadBuffer()
         b=self.getWriteBuffer()
-        # Copy arrays (not just assign references)
-        b[:]=a[:]
+        # The transform is computed directly in the output FIFO
         if self._src.type == np.dtype(np.float32):
-           dsp.arm_cfft_f32(self._cfft,b,0,1)
+           dsp.arm_cfft_f32(self._cfft,a,0,1,out=b)
         if self._src.type == np.dtype(np.int16):
-           dsp.arm_cfft_q15(self._cfft,b,0,1)
+           dsp.arm_cfft_q15(self._cfft,a,0,1,out=b)
         return(0)
\ No newline at end of file
@@ -27,25 +27,25 @@
 ############################################
 from .simu import *
 import cmsisdsp as dsp 
+import cmsisdsp.datatype as dt
+import cmsisdsp.plans as plans
 
 # CMSIS-DSP ICFFT
 class ICFFT(GenericNode):
     def __init__(self,inputSize,outSize,fifoin,fifoout):
         GenericNode.__init__(self,inputSize,outSize,fifoin,fifoout)
+        # The instance is shared with the other nodes of same length
         if fifoin.type == np.dtype(np.float32):
-           self._icfft=dsp.arm_cfft_instance_f32()
-           status=dsp.arm_cfft_init_f32(self._icfft,inputSize>>1)
+           self._icfft=plans.cfft(inputSize>>1,dt.F32)
         if fifoin.type == np.dtype(np.int16):
-           self._icfft=dsp.arm_cfft_instance_q15()
-           status=dsp.arm_cfft_init_q15(self._icfft,inputSize>>1)
+           self._icfft=plans.cfft(inputSize>>1,dt.Q15)
 
     def run(self):
         a=self.getReadBuffer()
         b=self.getWriteBuffer()
-        # Copy arrays (not just assign references)
-        b[:]=a[:]
+        # The transform is computed directly in the output FIFO
         if self._src.type == np.dtype(np.float32):
-           dsp.arm_cfft_f32(self._icfft,b,1,1)
+           dsp.arm_cfft_f32(self._icfft,a,1,1,out=b)
         if self._src.type == np.dtype(np.int16):
-           dsp.arm_cfft_q15(self._icfft,b,1,1)
+           dsp.arm_cfft_q15(self._icfft,a,1,1,out=b)
         return(0)
\ No newline at end of file
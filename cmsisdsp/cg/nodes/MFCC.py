@@ -27,6 +27,8 @@
 ############################################
 from .simu import *
 import cmsisdsp as dsp 
+import cmsisdsp.datatype as dt
+import cmsisdsp.plans as plans
 
 
 
@@ -35,21 +37,22 @@ class MFCC(GenericNode):
     def __init__(self,inputSize,outSize,fifoin,fifoout,mfccConfig):
         GenericNode.__init__(self,inputSize,outSize,fifoin,fifoout)
         self._config=mfccConfig
+        # The temporary buffer is allocated by the first run
         if self._src.type == np.dtype(np.float32):
-           self._tmp=np.zeros(2*inputSize,dtype=np.float32)
+           self._tmp=plans.mfccScratch(inputSize,dt.F32)
         else:
-           self._tmp=np.zeros(2*inputSize,dtype=np.int32)
+           self._tmp=plans.mfccScratch(inputSize,dt.Q31)
 
 
     def run(self):
         a=self.getReadBuffer()
         b=self.getWriteBuffer()
+        # The MFCC is computed directly in the output FIFO
         if self._src.type == np.dtype(np.float32):
-           res=dsp.arm_mfcc_f32(self._config,a,self._tmp)
+           dsp.arm_mfcc_f32(self._config,a,self._tmp.buffer,out=b)
            errorStatus = 0
         if self._src.type == np.dtype(np.int32):
-           errorStatus,res=dsp.arm_mfcc_q31(self._config,a,self._tmp)
+           errorStatus,_=dsp.arm_mfcc_q31(self._config,a,self._tmp.buffer,out=b)
         if self._src.type == np.dtype(np.int16):
-           errorStatus,res=dsp.arm_mfcc_q15(self._config,a,self._tmp)
-        b[:] = res[:]
+           errorStatus,_=dsp.arm_mfcc_q15(self._config,a,self._tmp.buffer,out=b)
         return(errorStatus)
\ No newline at end of file
@@ -74,6 +74,72 @@ class FIFO(FIFOBase):
     def dump(self):
         print(self._buffer)
 
+class MirrorFIFO(FIFOBase):
+    """ Circular FIFO with a buffer of twice the FIFO length.
+
+    The second half of the buffer is a mirror of the first half
+    so that a window of up to fifoSize samples starting anywhere in
+    the first half is always a contiguous view. Contrary to FIFO, there is
+    no compaction of the buffer and no allocation when reading or
+    writing.
+
+    The samples written in a window are mirrored in the other
+    half before the next access to the FIFO.
+
+    The FIFO is using its own buffer. fifoBuf is only used for the
+    initial values.
+
+    It can be selected for an edge of the graph with
+    g.connect(src.o,dst.i,fifoClass="MirrorFIFO")
+    """
+    def __init__(self,fifoSize,fifoBuf,delay=0):
+        self._length = fifoSize
+        self._buffer = np.empty(2*fifoSize,dtype=fifoBuf.dtype)
+        self._buffer[:fifoSize] = fifoBuf[:fifoSize]
+        self._buffer[fifoSize:] = fifoBuf[:fifoSize]
+        self._readPos = 0
+        self._writePos = delay % fifoSize if fifoSize > 0 else 0
+        # Window written by the last getWriteBuffer and
+        # not yet mirrored
+        self._mirrorPos = 0
+        self._mirrorNb = 0
+
+    def _mirror(self):
+        if self._mirrorNb > 0:
+           start = self._mirrorPos
+           end = start + self._mirrorNb
+           # Part of the window in the first half
+           if start < self._length:
+              firstEnd = min(end,self._length)
+              self._buffer[start+self._length:firstEnd+self._length] = self._buffer[start:firstEnd]
+           # Part of the window in the second half
+           if end > self._length:
+              secondStart = max(start,self._length)
+              self._buffer[secondStart-self._length:end-self._length] = self._buffer[secondStart:end]
+           self._mirrorNb = 0
+
+    def getWriteBuffer(self,nb):
+        self._mirror()
+        ret = self._buffer[self._writePos:self._writePos+nb]
+        self._mirrorPos = self._writePos
+        self._mirrorNb = nb
+        self._writePos = (self._writePos + nb) % self._length
+        return(ret)
+
+    def getReadBuffer(self,nb):
+        self._mirror()
+        ret = self._buffer[self._readPos:self._readPos+nb]
+        self._readPos = (self._readPos + nb) % self._length
+        return(ret)
+
+    @property
+    def type(self):
+        return(self._buffer.dtype)
+
+    def dump(self):
+        self._mirror()
+        print(self._buffer[:self._length])
+
 class GenericNode:
     def __init__(self,inputSize, outputSize,fifoin,fifoout):
         self._src = fifoin
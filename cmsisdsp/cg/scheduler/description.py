@@ -30,6 +30,7 @@
 import networkx as nx
 import numpy as np 
 import math 
+from fractions import Fraction
 
 from sympy import Matrix
 from sympy.core.numbers import ilcm,igcd
@@ -37,6 +38,7 @@ from sympy.core.numbers import ilcm,igcd
 import cmsisdsp.cg.scheduler.graphviz
 import cmsisdsp.cg.scheduler.ccode
 import cmsisdsp.cg.scheduler.pythoncode
+import cmsisdsp.cg.scheduler.nativecode
 
 from .node import *
 from .config import *
@@ -160,6 +162,14 @@ def analyzeStep(vec,allFIFOs,theTime):
             allFIFOs[fifoID].recordRead(theTime) 
         fifoID = fifoID + 1
 
+def analyzeSparseStep(changes,allFIFOs,theTime):
+    """Analyze an evolution step given as a dictionary position -> change"""
+    for fifoID,change in changes.items():
+        if change > 0:
+            allFIFOs[fifoID].recordWrite(theTime) 
+        elif change < 0:
+            allFIFOs[fifoID].recordRead(theTime) 
+
 class Graph():
 
     def __init__(self):
@@ -585,7 +595,14 @@ class Graph():
         if not nx.is_connected(self._g):
             raise GraphIsNotConnected
 
-    def topologyMatrix(self):
+    def sparseTopologyMatrix(self):
+        """Topology matrix as a list of rows.
+           There is one row per edge and a row is
+           a list of (node position, value) for the non zero values.
+
+           It also initializes the maps from nodes and edges to their
+           positions used during scheduling.
+        """
         self.checkGraph()
         # For cyclo static scheduling : compute the node periods
         for n in self.nodes:
@@ -607,26 +624,129 @@ class Graph():
             node.nbOutputsForTopologicalSort = node.nbOutputs
             nID = nID + 1
 
+        # Position of an edge in the FIFO vectors
+        self._edgePosition = {}
+        for pos,edge in enumerate(self._sortedEdges):
+            self._edgePosition[edge] = pos
+
         for edge in self._sortedEdges: 
             na,nb = edge
-            currentRow=[0] * len(self._sortedNodes) 
 
-            ia=self._sortedNodes.index(na.owner)
-            ib=self._sortedNodes.index(nb.owner)
+            ia=na.owner.sortedNodeID
+            ib=nb.owner.sortedNodeID
 
             # Produced by na on the edge
             # for execution of one cycle of the na.owner node
-            totalProduced = na.cycleTotal * na.owner.cyclePeriod // na.cyclePeriod
-            currentRow[ia] = totalProduced
+            totalProduced = int(na.cycleTotal * na.owner.cyclePeriod // na.cyclePeriod)
 
             # Consumed by nb on the edge
             # for execution of a full cycle of the node
-            totalProduced = nb.cycleTotal * nb.owner.cyclePeriod // nb.cyclePeriod
-            currentRow[ib] = -totalProduced
+            totalConsumed = int(nb.cycleTotal * nb.owner.cyclePeriod // nb.cyclePeriod)
+
+            if ia == ib:
+               # Same behavior as the dense matrix where
+               # the consumed value is written last
+               rows.append([(ib,-totalConsumed)])
+            else:
+               rows.append([(ia,totalProduced),(ib,-totalConsumed)])
+
+        # IOs of each node connected to a FIFO with the position
+        # of the FIFO.
+        # If the fifo is empty, it is a connection to a constant
+        # node so there is no FIFO
+        self._nodeIOs = []
+        for node in self._sortedNodes:
+            ios = []
+            for i in node._inputs:
+                io = node._inputs[i]
+                if len(io._fifo)>0:
+                   ios.append((self._edgePosition[io._fifo],io,-1))
+            for o in node._outputs:
+                io = node._outputs[o]
+                if len(io._fifo)>0:
+                   ios.append((self._edgePosition[io._fifo],io,1))
+            self._nodeIOs.append(ios)
+
+        # Nodes connected to each FIFO
+        self._fifoNodes = []
+        for na,nb in self._sortedEdges:
+            self._fifoNodes.append(set([na.owner.sortedNodeID,nb.owner.sortedNodeID]))
+
+        # Nodes sharing a FIFO with each node (including the node)
+        self._connectedNodes = []
+        for nodeID,ios in enumerate(self._nodeIOs):
+            connected = set([nodeID])
+            for pos,io,direction in ios:
+                connected.update(self._fifoNodes[pos])
+            self._connectedNodes.append(connected)
+
+        return(rows)
+
+    def topologyMatrix(self):
+        rows = self.sparseTopologyMatrix()
+        m = np.zeros((len(rows),len(self._sortedNodes)),dtype=int)
+        for r,row in enumerate(rows):
+            for col,value in row:
+                m[r,col] = value
+        return(m)
+
+    def sparseNullVector(self,rows,nbNodes):
+        """Null vector of a sparse topology matrix.
+
+           Each row of a topology matrix is giving the ratio
+           between the repetitions of the producer and consumer
+           of an edge. The repetitions are propagated
+           through the graph as exact fractions and checked on
+           all the edges. It is linear in the size of the graph.
+        """
+        neighbors = [[] for x in range(nbNodes)]
+        for row in rows:
+            if len(row) != 2 or (row[0][1] > 0) == (row[1][1] > 0):
+               # Not a topology matrix of a graph
+               return(self.nullVector(self.denseMatrix(rows,nbNodes)))
+            (ia,produced),(ib,consumed) = row
+            # repetition[ia] * produced == repetition[ib] * (-consumed)
+            neighbors[ia].append((ib,Fraction(produced,-consumed)))
+            neighbors[ib].append((ia,Fraction(-consumed,produced)))
+
+        if nbNodes == 0:
+           raise NotSchedulableError
+
+        repetitions = [None] * nbNodes
+        repetitions[0] = Fraction(1)
+        toVisit = [0]
+        while toVisit:
+            current = toVisit.pop()
+            for other,ratio in neighbors[current]:
+                if repetitions[other] is None:
+                   repetitions[other] = repetitions[current] * ratio
+                   toVisit.append(other)
+
+        # If the graph is not connected, the null space has more
+        # than one dimension
+        if any(x is None for x in repetitions):
+           raise NotSchedulableError
 
-            rows.append(currentRow)
+        # The propagation is using a spanning tree. The other
+        # edges must also be balanced
+        for row in rows:
+            (ia,produced),(ib,consumed) = row
+            if repetitions[ia] * produced + repetitions[ib] * consumed != 0:
+               raise NotSchedulableError
 
-        return(np.array(rows))
+        # Remove denominators
+        ppcm = ilcm(*[x.denominator for x in repetitions]) if nbNodes > 1 else repetitions[0].denominator
+        intValues = [int(x * ppcm) for x in repetitions]
+        # Convert intValues to the smallest possible values
+        gcd = igcd(*intValues) if nbNodes > 1 else intValues[0]
+        return([x // gcd for x in intValues])
+
+    def denseMatrix(self,rows,nbNodes):
+        m = np.zeros((len(rows),nbNodes),dtype=int)
+        for r,row in enumerate(rows):
+            for col,value in row:
+                m[r,col] = value
+        return(m)
 
     def nullVector(self,m):
         #print("Null vector")
@@ -643,13 +763,28 @@ class Graph():
         intValues = [x * ppcm for x in result]
         # Convert intValues to the smallest possible values
         gcd = igcd(*intValues)
-        return([x // gcd for x in intValues])
+        return([int(x // gcd) for x in intValues])
 
     @property
     def initEvolutionVector(self):
         """Initial FIFO state taking into account delays"""
         return(np.array([self.getDelay(x) for x in self.edges]))
 
+    def sparseEvolutionForNode(self,nodeID,test=True):
+        """FIFO changes for one execution of a node as
+           a dictionary position -> change. Only the FIFOs
+           connected to the node are changed"""
+        # In test mode we are testing several nodes
+        # to find the best one to schedule.
+        # So we should not advance the cycle
+        # of the IOs
+        changes = {}
+        for pos,io,direction in self._nodeIOs[nodeID]:
+            changes[pos] = direction * io.cycleValue
+            if not test:
+               io.advanceCycle()
+        return(changes)
+
     def evolutionVectorForNode(self,nodeID,test=True):
         """Return the evolution vector corresponding to a selected node"""
         # For a simple static scheduling, the topology matrix T
@@ -676,90 +811,141 @@ class Graph():
         # v = np.zeros(len(self._sortedNodes))
         # v[nodeID] = 1 
         # for cyclo static scheduling
-        n = self._sortedNodes[nodeID]
-        #print(n)
         v = np.zeros(len(self._sortedEdges))
-
-        # In test mode we are testing several nodes
-        # to find the best one to schedule.
-        # So we should not advance the cycle
-        # of the IOs
-        for i in n._inputs:
-            io = n._inputs[i]
-            edge = io._fifo
-            # If 0, it is a connection to a constant node
-            # so there is no FIFO
-            if len(edge)>0:
-               pos = self._sortedEdges.index(edge)
-               v[pos] = -io.cycleValue
-               if not test:
-                  io.advanceCycle()
-            
-
-        for o in n._outputs:
-            io = n._outputs[o]
-            edge = io._fifo
-            # If 0 it is a connection to a constant edge
-            # so there is no FIFO
-            if len(edge)>0:
-               pos = self._sortedEdges.index(edge)
-               v[pos] = io.cycleValue
-               if not test:
-                  io.advanceCycle()
-            
-
+        for pos,change in self.sparseEvolutionForNode(nodeID,test).items():
+            v[pos] = change
         #print(v)
         return(v)
 
+    def _maxOccupancies(self,occupancy):
+        """Positions of the biggest occupancies in decreasing order.
+           A node is connected to at most maxNodeIOs FIFOs so
+           the biggest occupancy of the FIFOs not changed by a node
+           is in this list"""
+        nb = self._maxNodeIOs + 1
+        if len(occupancy) <= nb:
+           top = np.arange(len(occupancy))
+        else:
+           top = np.argpartition(occupancy,-nb)[-nb:]
+        return(top[np.argsort(-occupancy[top],kind="stable")])
+
+    def _localOccupancy(self,nodeID,n,b,normV):
+        """Maximum occupancy of the FIFOs changed by a node
+           if it is executed"""
+        if n[nodeID] <= 0:
+           return(np.inf)
+        theMin = -np.inf
+        for pos,change in self.sparseEvolutionForNode(nodeID).items():
+            newB = b[pos] + change
+            # FIFO underflow
+            if newB < 0:
+               return(np.inf)
+            theMin = max(theMin,newB / normV[pos])
+        return(theMin)
+
+    def _otherOccupancy(self,nodeID,occupancy,top):
+        """Maximum occupancy of the FIFOs not changed by a node"""
+        changed = [x[0] for x in self._nodeIOs[nodeID]]
+        for pos in top:
+            if not pos in changed:
+               return(occupancy[pos])
+        return(-np.inf)
+
+    def _candidateOccupancy(self,changes,b,normV,occupancy,top,bMax=None):
+        """Maximum occupancy of the FIFOs if a node is executed
+           or None if a FIFO would underflow (or overflow when bMax is
+           used)"""
+        theMin = None
+        for pos,change in changes.items():
+            newB = b[pos] + change
+            if newB < 0:
+               return(None)
+            if bMax is not None and newB > bMax[pos]:
+               return(None)
+            value = newB / normV[pos]
+            if theMin is None or value > theMin:
+               theMin = value
+        # Biggest occupancy of the FIFOs not changed by the node
+        for pos in top:
+            if not pos in changes:
+               if theMin is None or occupancy[pos] > theMin:
+                  theMin = occupancy[pos]
+               break
+        return(theMin)
+
+    def _executeNode(self,selected,b,normV,occupancy,allFIFOs,evolutionTime,analyze=True,bMax=None):
+        """Execute a node and update the FIFO state in place"""
+        fifoChange = self.sparseEvolutionForNode(selected,test=False)
+        for pos,change in fifoChange.items():
+            b[pos] = b[pos] + change
+            occupancy[pos] = b[pos] / normV[pos]
+            if bMax is not None and b[pos] > bMax[pos]:
+               bMax[pos] = b[pos]
+        # Analyze FIFOs to know if a FIFOs write is
+        # followed immediately by a FIFO read of same size
+        if analyze:
+           analyzeSparseStep(fifoChange,allFIFOs,evolutionTime)
+
+    def _canExecute(self,nodeID,n,b,bMax):
+        """True if a node can be executed without FIFO underflow
+           or overflow"""
+        if n[nodeID] <= 0:
+           return(False)
+        for pos,change in self.sparseEvolutionForNode(nodeID).items():
+            newB = b[pos] + change
+            if newB < 0 or newB > bMax[pos]:
+               return(False)
+        return(True)
+
     def computeTopologicalOrderSchedule(self,normV,allFIFOs,initB,bMax,initN,config):
-        b = np.array(initB)
-        n = np.array(initN)
+        b = 1.0*np.array(initB)
+        n = list(initN)
+        occupancy = b / normV
+        nbNodes = len(self._sortedNodes)
+
+        # Nodes which can be executed and number of them in each
+        # layer. They are only updated for the nodes connected to the
+        # FIFOs changed by the executed node.
+        layerOfNode = [0] * nbNodes
+        for l,layer in enumerate(self._topologicalSort):
+            for node in layer:
+                layerOfNode[node.sortedNodeID] = l
+        canExecute = [self._canExecute(k,n,b,bMax) for k in range(nbNodes)]
+        nbInLayer = [0] * len(self._topologicalSort)
+        for k in range(nbNodes):
+            if canExecute[k]:
+               nbInLayer[layerOfNode[k]] += 1
 
 
         schedule=[]
 
-        zeroVec = np.zeros(len(self._sortedNodes))
+        remaining = sum([1 for x in n if x != 0])
         evolutionTime = 0
         #print(self._sortedNodes)
         # While there are remaining node periods to schedule
-        while (n != zeroVec).any():
+        while remaining > 0:
             #print("")
             #print(n)
-            # Look for the best node to schedule
-            # which is the one giving the minimum FIFO increase
+            # The first node which can be executed in the first
+            # possible layer is selected
             
             # None selected
             selected = -1
 
-            # Min FIFO size found
+            top = self._maxOccupancies(occupancy)
 
-            for layer in self._topologicalSort:
-                minVal = 10000000
-                selected = -1
+            for l,layer in enumerate(self._topologicalSort):
+                if nbInLayer[l] == 0:
+                   continue
                 for node in layer:
                     # If the node can be scheduled
-                    if n[node.sortedNodeID] > 0:
-                       # Evolution vector for static scheduling
-                       # v = self.evolutionVectorForNode(nodeID)
-                       # for cyclo static we need the new fifo state
-                       newB = self.evolutionVectorForNode(node.sortedNodeID) + b
-                       # New fifos size after this evolution
-                       # For static scheduling, fifo update would have been
-                       # newB = np.dot(t,v) + b
-                       #print(newB)
-                
-                       # Check that there is no FIFO underflow or overfflow:
-                       if np.all(newB >= 0) and np.all(newB <= bMax):
-                          # Total FIFO size for this possible execution
-                          # We normalize to get the occupancy number as explained above
-                          theMin = (1.0*np.array(newB) / normV).max()
-                          # If this possible evolution is giving smaller FIFO size
-                          # (measured in occupancy number) then it is selected
-                          if theMin < minVal:
-                             minVal = theMin
-                             selected = node.sortedNodeID 
-    
-                       if selected != -1:
+                    if canExecute[node.sortedNodeID]:
+                       # Occupancy number after the execution
+                       # as explained in computeSchedule
+                       theMin = self._candidateOccupancy(self.sparseEvolutionForNode(node.sortedNodeID),
+                           b,normV,occupancy,top,bMax)
+                       if theMin is not None and theMin < 10000000:
+                          selected = node.sortedNodeID 
                           # We put the selected node at the end of the layer
                           # so that we do not always try the same node
                           # each time we analyze this layer
@@ -768,10 +954,8 @@ class Graph():
                           layer.remove(node)
                           layer.append(node)
                           break
-                # For breaking from the outer loop too
-                else:
-                    continue
-                break
+                if selected != -1:
+                   break
                 # No node could be scheduled because of not enough data
                 # in the FIFOs. It should not occur if there is a null
                 # space of dimension 1. So, it is probably a bug if
@@ -782,27 +966,20 @@ class Graph():
             # Now  we have evaluated all schedulable nodes for this run
             # and selected the one giving the smallest FIFO increase
     
-            # Implementation for static scheduling
-            # Real evolution vector for selected node
-            # evol =  self.evolutionVectorForNode(selected)
-            # Keep track that this node has been schedule
-            # n = n - evol
-            # Compute new fifo state
-            # fifoChange = np.dot(t,evol)
-            # b = fifoChange + b
-    
             # Implementation for cyclo static scheduling
-            #print("selected")
-            fifoChange = self.evolutionVectorForNode(selected,test=False)
-            b = fifoChange + b
-            # For cyclo static, we create an evolution vector 
-            # which contains a 1
-            # at a node position only if this node has executed
-            # its period.
-            # Otherwise the null vector is not decreased
-            v = np.zeros(len(self._sortedNodes))
-            v[selected] = self._sortedNodes[selected].executeNode() 
-            n = n - v
+            self._executeNode(selected,b,normV,occupancy,allFIFOs,evolutionTime)
+            # For cyclo static, the null vector is decreased
+            # only if the node has executed its period.
+            if self._sortedNodes[selected].executeNode():
+               n[selected] = n[selected] - 1
+               if n[selected] == 0:
+                  remaining = remaining - 1
+
+            for k in self._connectedNodes[selected]:
+                newValue = self._canExecute(k,n,b,bMax)
+                if newValue != canExecute[k]:
+                   nbInLayer[layerOfNode[k]] += 1 if newValue else -1
+                   canExecute[k] = newValue
     
     
             if config.displayFIFOSizes:
@@ -810,9 +987,6 @@ class Graph():
                 
             schedule.append(selected)
     
-            # Analyze FIFOs to know if a FIFOs write is
-            # followed immediately by a FIFO read of same size
-            analyzeStep(fifoChange,allFIFOs,evolutionTime)
             evolutionTime = evolutionTime + 1
         return(schedule)
 
@@ -823,7 +997,7 @@ class Graph():
         # only one output.
         self.insertDuplicates()
 
-        networkMatrix = self.topologyMatrix()
+        networkMatrix = self.sparseTopologyMatrix()
         #print(networkMatrix)
 
         if config.sinkPriority:
@@ -835,10 +1009,9 @@ class Graph():
 
         # Init values
         initB = self.initEvolutionVector
-        initN = self.nullVector(networkMatrix)
+        initN = self.sparseNullVector(networkMatrix,len(self._sortedNodes))
         #print(initB)
         #print(initN)
-        #print(np.dot(networkMatrix,initN))
 
         # nullVector is giving the number of repetitions
         # for a node cycle.
@@ -850,20 +1023,16 @@ class Graph():
 
         # Current values (copys)
         b = np.array(initB)
-        n = np.array(initN)
+        n = list(initN)
 
         if config.displayFIFOSizes:
            for edge in self._sortedEdges:
              print("%s:%s -> %s:%s" % (edge[0].owner.nodeID,edge[0].name,edge[1].owner.nodeID,edge[1].name))
            print(b)
-
-        # Topology matrix
-        t = np.array(networkMatrix)
-        #print(t)
-        #print(n)
+        b = 1.0*b
 
         # Define the list of FIFOs objects
-        nbFIFOS = t.shape[0]
+        nbFIFOS = len(networkMatrix)
         allFIFOs = [] 
         for i in range(nbFIFOS):
             allFIFOs.append(FIFODesc(i,self.defaultFIFOClass))
@@ -902,50 +1071,50 @@ class Graph():
         # minimum maximum occupancy number after the run.
         bMax = 1.0*np.array(initB)
 
+        # The FIFO state is updated in place and only for
+        # the FIFOs connected to the executed node.
+        # The occupancy numbers are tracked in the same way.
+        occupancy = b / normV
+        self._maxNodeIOs = max([len(x) for x in self._nodeIOs])
+        nbNodes = len(self._sortedNodes)
+
+        # Occupancy number after the execution of a node is the max of
+        # the occupancy of the FIFOs changed by the node (localOccupancy)
+        # and of the other FIFOs.
+        # localOccupancy is only updated for the nodes connected to the
+        # FIFOs changed by the executed node.
+        # It is infinite when a node cannot be executed.
+        localOccupancy = np.array([self._localOccupancy(k,n,b,normV) for k in range(nbNodes)])
+
 
         schedule=[]
 
-        zeroVec = np.zeros(len(self._sortedNodes))
+        remaining = sum([1 for x in n if x != 0])
         evolutionTime = 0
         #print(self._sortedNodes)
         # While there are remaining node periods to schedule
-        while (n != zeroVec).any():
+        while remaining > 0:
             #print("")
             #print(n)
             # Look for the best node to schedule
             # which is the one giving the minimum FIFO increase
-            
-            # None selected
-            selected = -1
-
-            # Min FIFO size found
-            minVal = 10000000
-
-            
-            for node in self._sortedNodes:
-                # If the node can be scheduled
-                if n[node.sortedNodeID] > 0:
-                   # Evolution vector for static scheduling
-                   # v = self.evolutionVectorForNode(nodeID)
-                   # for cyclo static we need the new fifo state
-                   newB = self.evolutionVectorForNode(node.sortedNodeID) + b
-                   # New fifos size after this evolution
-                   # For static scheduling, fifo update would have been
-                   # newB = np.dot(t,v) + b
-                   #print(newB)
-            
-                   # Check that there is no FIFO underflow:
-                   if np.all(newB >= 0):
-                      # Total FIFO size for this possible execution
-                      # We normalize to get the occupancy number as explained above
-                      theMin = (1.0*np.array(newB) / normV).max()
-                      # If this possible evolution is giving smaller FIFO size
-                      # (measured in occupancy number) then it is selected
-                      
-                      if theMin <= minVal:
-                         minVal = theMin
-                         selected = node.sortedNodeID 
-
+            top = self._maxOccupancies(occupancy)
+
+            # Occupancy of the FIFOs not changed by a node.
+            # It is the biggest occupancy except for the nodes
+            # connected to the FIFO with the biggest occupancy
+            others = np.full(nbNodes,occupancy[top[0]])
+            for k in self._fifoNodes[top[0]]:
+                others[k] = self._otherOccupancy(k,occupancy,top)
+
+            # Occupancy number for each possible execution
+            # The last node with the minimum value is selected
+            theMin = np.maximum(localOccupancy,others)
+            minVal = theMin.min()
+            if minVal <= 10000000:
+               selected = int(np.flatnonzero(theMin == minVal)[-1])
+            else:
+               selected = -1
 
             # No node could be scheduled because of not enough data
             # in the FIFOs. It should not occur if there is a null
@@ -956,39 +1125,28 @@ class Graph():
             # Now  we have evaluated all schedulable nodes for this run
             # and selected the one giving the smallest FIFO increase
 
-            # Implementation for static scheduling
-            # Real evolution vector for selected node
-            # evol =  self.evolutionVectorForNode(selected)
-            # Keep track that this node has been schedule
-            # n = n - evol
-            # Compute new fifo state
-            # fifoChange = np.dot(t,evol)
-            # b = fifoChange + b
-
             # Implementation for cyclo static scheduling
             #print("selected")
-            fifoChange = self.evolutionVectorForNode(selected,test=False)
-            b = fifoChange + b
-            # For cyclo static, we create an evolution vector 
-            # which contains a 1
-            # at a node position only if this node has executed
-            # its period.
-            # Otherwise the null vector is not decreased
-            v = np.zeros(len(self._sortedNodes))
-            v[selected] = self._sortedNodes[selected].executeNode() 
-            n = n - v
+            self._executeNode(selected,b,normV,occupancy,allFIFOs,evolutionTime,
+                analyze=not mustDoSinkPrioritization,bMax=bMax)
+            # For cyclo static, the null vector is decreased
+            # only if the node has executed its period.
+            if self._sortedNodes[selected].executeNode():
+               n[selected] = n[selected] - 1
+               if n[selected] == 0:
+                  remaining = remaining - 1
+
+            # Update the occupancy of the nodes connected
+            # to the changed FIFOs
+            for k in self._connectedNodes[selected]:
+                localOccupancy[k] = self._localOccupancy(k,n,b,normV)
 
 
             if config.displayFIFOSizes and not mustDoSinkPrioritization:
                print(b)
             
-            bMax = np.maximum(b,bMax)
             schedule.append(selected)
 
-            # Analyze FIFOs to know if a FIFOs write is
-            # followed immediately by a FIFO read of same size
-            if not mustDoSinkPrioritization:
-               analyzeStep(fifoChange,allFIFOs,evolutionTime)
             evolutionTime = evolutionTime + 1
 
         fifoMax=np.floor(bMax).astype(np.int32)
@@ -1130,6 +1288,11 @@ class Schedule:
         """Write graphviz into file f""" 
         cmsisdsp.cg.scheduler.pythoncode.gencode(self,directory,config)
 
+    def nativecode(self,directory,config=Configuration(),**buildArgs):
+        """Generate and compile the C++ scheduler for the host
+           and return a Python callable running it""" 
+        return(cmsisdsp.cg.scheduler.nativecode.build(self,directory,config,**buildArgs))
+
     def graphviz(self,f,config=Configuration()):
         """Write graphviz into file f""" 
         cmsisdsp.cg.scheduler.graphviz.gengraph(self,f,config)
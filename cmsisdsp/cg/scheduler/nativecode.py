@@ -0,0 +1,327 @@
+###########################################
+# Project:      CMSIS DSP Library
+# Title:        nativecode.py
+# Description:  Native backend for scheduler
+#
+# $Date:        29 July 2021
+# $Revision:    V1.10.0
+#
+# Target Processor: Cortex-M and Cortex-A cores
+# -------------------------------------------------------------------- */
+#
+# Copyright (C) 2010-2023 ARM Limited or its affiliates. All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+############################################
+"""Native backend : the C++ scheduler is compiled for the host
+   into a shared library and run from Python with ctypes."""
+
+from jinja2 import Environment, PackageLoader, select_autoescape
+import copy
+import ctypes
+import glob
+import hashlib
+import itertools
+import os
+import os.path
+import shlex
+import subprocess
+import sys
+import sysconfig
+
+import numpy as np
+
+from .config import *
+from .standard import NativePythonSource,NativePythonSink,NativePythonNode
+import cmsisdsp.cg.scheduler.ccode
+
+class NoOptionalArgsInNative(Exception):
+    pass
+
+class NativeBuildError(Exception):
+    pass
+
+# Numpy datatype of the C types used by the scheduler
+_NPTYPES = {
+  "float64_t" : np.float64,
+  "float32_t" : np.float32,
+  "float16_t" : np.float16,
+  "q31_t" : np.int32,
+  "q15_t" : np.int16,
+  "q7_t" : np.int8,
+  "uint32_t" : np.uint32,
+  "uint16_t" : np.uint16,
+  "uint8_t" : np.uint8,
+  "int32_t" : np.int32,
+  "int16_t" : np.int16,
+  "int8_t" : np.int8
+}
+
+_buildCounter = itertools.count()
+
+_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int,ctypes.c_char_p,
+                             ctypes.c_void_p,ctypes.c_int,
+                             ctypes.c_void_p,ctypes.c_int)
+
+def nativeName(config):
+    """Prefix of the C API of the native scheduler"""
+    return("%s_native" % config.schedulerCFileName)
+
+def defaultCMSISDSPRoot():
+    """CMSIS-DSP folder containing Include, Source and ComputeGraph.
+       It is given by the CMSISDSP environment variable or it is
+       the folder containing the cmsisdsp package (development install)"""
+    if "CMSISDSP" in os.environ:
+       return(os.environ["CMSISDSP"])
+    here = os.path.dirname(os.path.abspath(__file__))
+    return(os.path.abspath(os.path.join(here,"..","..","..")))
+
+def gencode(sched,directory,config):
+    """Generate the C++ scheduler and the C API used from Python"""
+    if config.cOptionalArgs:
+       raise NoOptionalArgsInNative
+
+    # The header for the Python nodes is included after
+    # the app nodes
+    config = copy.copy(config)
+    name = nativeName(config)
+    if not config.postCustomCName:
+       config.postCustomCName = "%s.h" % name
+
+    env = Environment(
+       loader=PackageLoader("cmsisdsp.cg.scheduler"),
+       autoescape=select_autoescape(),
+       trim_blocks=True
+    )
+
+    cmsisdsp.cg.scheduler.ccode.gencode(sched,directory,config)
+
+    htemplate = env.get_template("native.h")
+    ctemplate = env.get_template("native.cpp")
+
+    hfile=os.path.join(directory,"%s.h" % name)
+    cfile=os.path.join(directory,"%s.cpp" % name)
+
+    with open(hfile,"w") as f:
+         print(htemplate.render(config=config,
+            sched=sched,
+            nativeName=name
+            ),file=f)
+
+    with open(cfile,"w") as f:
+         print(ctemplate.render(config=config,
+            sched=sched,
+            nativeName=name
+            ),file=f)
+
+    return([os.path.join(directory,"%s.cpp" % config.schedulerCFileName),cfile])
+
+def _compiler(var,default):
+    compiler = os.environ.get(var,sysconfig.get_config_var(var) or default)
+    return(shlex.split(compiler))
+
+def _newest(folders):
+    """Modification time of the newest C source or header in the folders"""
+    newest = 0
+    for d in folders:
+        for f in glob.glob(os.path.join(d,"**","*.[ch]"),recursive=True):
+            newest = max(newest,os.path.getmtime(f))
+    return(newest)
+
+def _buildKey(compilers,flags):
+    """Key of the objects built with some compilers and flags"""
+    return(hashlib.sha1(repr((compilers,flags)).encode("utf-8")).hexdigest()[:16])
+
+def _compile(compiler,flags,src,obj,dependencies=0):
+    # Objects are reused if they are more recent than the source
+    # and than the files it depends on (dependencies is the modification
+    # time of the newest one)
+    if os.path.exists(obj) and \
+       os.path.getmtime(obj) >= max(os.path.getmtime(src),dependencies):
+       return
+    cmd = compiler + flags + ["-c",src,"-o",obj]
+    res = subprocess.run(cmd,stdout=subprocess.PIPE,stderr=subprocess.STDOUT,text=True)
+    if res.returncode != 0:
+       raise NativeBuildError("%s\n%s" % (" ".join(cmd),res.stdout))
+
+def cmsisdspSources(root):
+    """CMSIS-DSP sources for the native scheduler : one source including
+       all the functions for each folder. The f16 functions are not used."""
+    sources = []
+    for d in sorted(glob.glob(os.path.join(root,"Source","*"))):
+        src = os.path.join(d,"%s.c" % os.path.basename(d))
+        if os.path.exists(src):
+           sources.append(src)
+    return(sources)
+
+def build(sched,directory,config=Configuration(),
+          includes=(),sources=(),
+          cmsisdspRoot=None,
+          flags=("-O3",)):
+    """Generate, compile and load the native scheduler.
+
+    sched :: Schedule to compile
+    directory :: Folder for the generated code and build products
+    includes :: Folders for AppNodes.h, custom.h and other headers
+    sources :: Other C or C++ sources (for the app nodes)
+    cmsisdspRoot :: CMSIS-DSP folder (defaultCMSISDSPRoot() by default)
+    flags :: Compilation flags
+    """
+    if sys.platform == 'win32':
+       raise NativeBuildError("The native scheduler is only supported with gcc or clang")
+
+    if cmsisdspRoot is None:
+       cmsisdspRoot = defaultCMSISDSPRoot()
+
+    os.makedirs(directory,exist_ok=True)
+
+    cmsisdspFiles = cmsisdspSources(cmsisdspRoot) if config.CMSISDSP else []
+    allSources = gencode(sched,directory,config) + list(sources) + cmsisdspFiles
+
+    incs = [directory] + list(includes) + [
+      os.path.join(cmsisdspRoot,"Include"),
+      os.path.join(cmsisdspRoot,"PrivateInclude"),
+      os.path.join(cmsisdspRoot,"ComputeGraph","cg","src"),
+      os.path.join(cmsisdspRoot,"ComputeGraph","cg","nodes","cpp")]
+    commonFlags = ["-fPIC","-D__GNUC_PYTHON__"] + ["-I%s" % x for x in incs] + list(flags)
+    cc = _compiler("CC","cc")
+    cxx = _compiler("CXX","c++")
+
+    # The objects built with other compilers or flags are
+    # kept in other folders
+    objDir = os.path.join(directory,"native_build",_buildKey((cc,cxx),commonFlags))
+    os.makedirs(objDir,exist_ok=True)
+
+    # A CMSIS-DSP source is including all the sources of its folder
+    # and the CMSIS-DSP headers
+    cmsisdspHeaders = _newest([os.path.join(cmsisdspRoot,"Include"),
+                               os.path.join(cmsisdspRoot,"PrivateInclude")])
+
+    objs = []
+    for src in allSources:
+        base = os.path.splitext(os.path.basename(src))[0]
+        obj = os.path.join(objDir,"%s.o" % base)
+        # Only the CMSIS-DSP objects are reused. The other sources
+        # depend on headers like AppNodes.h and are always compiled.
+        if src in cmsisdspFiles:
+           dependencies = max(cmsisdspHeaders,_newest([os.path.dirname(src)]))
+        else:
+           dependencies = 0
+           if os.path.exists(obj):
+              os.remove(obj)
+        if src.endswith(".c"):
+           _compile(cc,commonFlags + ["-Wno-attributes","-Wno-unused-function"],src,obj,dependencies)
+        else:
+           _compile(cxx,commonFlags + ["-std=c++11"],src,obj,dependencies)
+        objs.append(obj)
+
+    # A library already loaded in the process is not loaded again
+    # by ctypes. So each build is using a new name.
+    name = nativeName(config)
+    suffix = sysconfig.get_config_var("SHLIB_SUFFIX") or ".so"
+    for old in glob.glob(os.path.join(directory,"lib%s_*%s" % (name,suffix))):
+        os.remove(old)
+    lib = os.path.join(directory,"lib%s_%d_%d%s" % (name,os.getpid(),next(_buildCounter),suffix))
+    cmd = cxx + ["-shared"] + objs + ["-o",lib,"-lm"]
+    res = subprocess.run(cmd,stdout=subprocess.PIPE,stderr=subprocess.STDOUT,text=True)
+    if res.returncode != 0:
+       raise NativeBuildError("%s\n%s" % (" ".join(cmd),res.stdout))
+
+    return(NativeScheduler(sched,lib,config))
+
+class NativeScheduler:
+    """Scheduler compiled for the host.
+
+    The scheduler is run by calling the object. It returns
+    (nbSchedule,error) like the Python scheduler.
+
+    The nodes NativePythonSource, NativePythonSink and NativePythonNode
+    are calling the Python functions registered with setNode.
+    They are receiving numpy arrays which are views of the FIFO buffers
+    (no copy). The GIL is released while the scheduler is running
+    C++ code."""
+
+    def __init__(self,sched,lib,config=Configuration()):
+        self._name = nativeName(config)
+        self._lib = ctypes.CDLL(os.path.abspath(lib))
+
+        self._run = getattr(self._lib,"%s_run" % self._name)
+        self._run.restype = ctypes.c_uint32
+        self._run.argtypes = [ctypes.POINTER(ctypes.c_int)]
+
+        self._buffer = getattr(self._lib,"%s_buffer" % self._name)
+        self._buffer.restype = ctypes.c_void_p
+        self._buffer.argtypes = [ctypes.c_int]
+
+        # Datatypes of the IOs of the Python nodes
+        self._pythonNodes = {}
+        for node in sched.nodes:
+            if isinstance(node,(NativePythonSource,NativePythonSink,NativePythonNode)):
+               ins,outs = node.allIOs()
+               inType = _NPTYPES[ins[0].ctype] if ins else None
+               outType = _NPTYPES[outs[0].ctype] if outs else None
+               self._pythonNodes[node.nodeName.encode("utf-8")] = (inType,outType)
+
+        self._buffers = []
+        for i,buf in enumerate(sched._graph._allBuffers):
+            nptype = _NPTYPES.get(buf._theType.ctype)
+            self._buffers.append(self._view(self._buffer(i),buf._length,nptype))
+
+        self._functions = {}
+        self._exception = None
+        self._callback = _CALLBACK(self._call)
+        getattr(self._lib,"%s_set_callback" % self._name)(self._callback)
+
+    def _view(self,ptr,nb,nptype):
+        if nptype is None or ptr is None:
+           return(None)
+        size = nb * np.dtype(nptype).itemsize
+        return(np.frombuffer((ctypes.c_char * size).from_address(ptr),dtype=nptype))
+
+    def _call(self,name,a,nbIn,b,nbOut):
+        try:
+           inType,outType = self._pythonNodes[name]
+           args = []
+           if inType is not None:
+              args.append(self._view(a,nbIn,inType))
+           if outType is not None:
+              args.append(self._view(b,nbOut,outType))
+           err = self._functions[name](*args)
+           return(0 if err is None else int(err))
+        except BaseException as e:
+           # Stop the scheduler and raise the exception in Python
+           self._exception = e
+           return(-1)
+
+    def setNode(self,name,f):
+        """Function for a Python node.
+           f(i) for a sink, f(o) for a source and f(i,o) for a node.
+           It returns an error code or None."""
+        self._functions[name.encode("utf-8")] = f
+
+    @property
+    def buffers(self):
+        """Numpy views of the FIFO buffers"""
+        return(self._buffers)
+
+    def __call__(self):
+        error = ctypes.c_int(0)
+        self._exception = None
+        nbSchedule = self._run(ctypes.byref(error))
+        if self._exception is not None:
+           e = self._exception
+           self._exception = None
+           raise e
+        return(nbSchedule,error.value)
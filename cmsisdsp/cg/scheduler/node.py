@@ -469,7 +469,7 @@ class BaseNode:
     def args(self):
         """String of fifo args for object initialization
             with literal argument and variable arguments"""
-        allArgs=self.listOfargs
+        allArgs=list(self.listOfargs)
         # Add specific argrs after FIFOs
         if self.schedArgs:
             for lit in self.schedArgs:
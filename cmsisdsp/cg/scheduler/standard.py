@@ -262,4 +262,43 @@ class VHTSink(GenericNode):
     @property
     def typeName(self):
         return "VHTSink"
-        
\ No newline at end of file
+        
+##################
+#
+# Nodes implemented by a Python function when the
+# scheduler is compiled with the native backend
+# (Schedule.nativecode)
+#
+# The Python function is registered on the native scheduler
+# with setNode(name,f) and receives views of the FIFO buffers
+
+class NativePythonSource(GenericSource):
+    def __init__(self,name,theType,outLength):
+        GenericSource.__init__(self,name)
+        self.addOutput("o",theType,outLength)
+        self.addLiteralArg(name)
+
+    @property
+    def typeName(self):
+        return "NativePythonSource"
+
+class NativePythonSink(GenericSink):
+    def __init__(self,name,theType,inLength):
+        GenericSink.__init__(self,name)
+        self.addInput("i",theType,inLength)
+        self.addLiteralArg(name)
+
+    @property
+    def typeName(self):
+        return "NativePythonSink"
+
+class NativePythonNode(GenericNode):
+    def __init__(self,name,inType,inLength,outType,outLength):
+        GenericNode.__init__(self,name)
+        self.addInput("i",inType,inLength)
+        self.addOutput("o",outType,outLength)
+        self.addLiteralArg(name)
+
+    @property
+    def typeName(self):
+        return "NativePythonNode"
@@ -0,0 +1,64 @@
+/*
+
+Generated with CMSIS-DSP Compute Graph Scripts.
+The generated code is not covered by CMSIS-DSP license.
+
+The support classes and code is covered by CMSIS-DSP license.
+
+*/
+
+/*
+
+C API of the native scheduler used from Python with ctypes.
+
+*/
+
+{% if config.CMSISDSP -%}
+#include "arm_math.h"
+{% else %}
+#include <cstdint>
+#include <cstddef>
+{% endif %}
+#include "{{config.customCName}}"
+#include "{{config.schedulerCFileName}}.h"
+
+/* FIFO buffers defined in the scheduler */
+{% for buf in sched._graph._allBuffers %}
+extern {{buf._theType.ctype}} {{config.prefix}}buf{{buf._bufferID}}[];
+{% endfor %}
+
+static void *{{nativeName}}_buffers[]={
+{% for buf in sched._graph._allBuffers %}
+    (void*){{config.prefix}}buf{{buf._bufferID}},
+{% endfor %}
+    NULL
+};
+
+typedef int (*cg_native_callback_t)(const char *name,
+                                    void *in,int nbIn,
+                                    void *out,int nbOut);
+
+extern "C" {
+
+cg_native_callback_t {{nativeName}}_callback=NULL;
+
+void {{nativeName}}_set_callback(cg_native_callback_t callback)
+{
+    {{nativeName}}_callback = callback;
+}
+
+void *{{nativeName}}_buffer(int id)
+{
+    if ((id < 0) || (id >= {{sched._graph._allBuffers|length}}))
+    {
+       return(NULL);
+    }
+    return({{nativeName}}_buffers[id]);
+}
+
+uint32_t {{nativeName}}_run(int *error)
+{
+    return({{config.schedName}}(error));
+}
+
+}
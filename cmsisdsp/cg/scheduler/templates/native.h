@@ -0,0 +1,110 @@
+/*
+
+Generated with CMSIS-DSP Compute Graph Scripts.
+The generated code is not covered by CMSIS-DSP license.
+
+The support classes and code is covered by CMSIS-DSP license.
+
+*/
+
+#ifndef _{{nativeName |upper()}}_H_
+#define _{{nativeName |upper()}}_H_
+
+/*
+
+Nodes of the native scheduler implemented by Python functions.
+
+The buffers of the FIFOs are passed to the Python function
+which is reading and writing them without any copy.
+
+*/
+typedef int (*cg_native_callback_t)(const char *name,
+                                    void *in,int nbIn,
+                                    void *out,int nbOut);
+
+extern "C" cg_native_callback_t {{nativeName}}_callback;
+
+template<typename OUT,int outputSize>
+class NativePythonSource: public GenericSource<OUT,outputSize>
+{
+public:
+    NativePythonSource(FIFOBase<OUT> &dst,const char *name):
+    GenericSource<OUT,outputSize>(dst),mName(name){};
+
+    int prepareForRunning() override
+    {
+        if (this->willOverflow())
+        {
+           return(CG_SKIP_EXECUTION_ID_CODE); // Skip execution
+        }
+
+        return(0);
+    };
+
+    int run() override
+    {
+        OUT *b=this->getWriteBuffer();
+        return({{nativeName}}_callback(mName,NULL,0,b,outputSize));
+    };
+
+protected:
+    const char *mName;
+};
+
+template<typename IN,int inputSize>
+class NativePythonSink: public GenericSink<IN,inputSize>
+{
+public:
+    NativePythonSink(FIFOBase<IN> &src,const char *name):
+    GenericSink<IN,inputSize>(src),mName(name){};
+
+    int prepareForRunning() override
+    {
+        if (this->willUnderflow())
+        {
+           return(CG_SKIP_EXECUTION_ID_CODE); // Skip execution
+        }
+
+        return(0);
+    };
+
+    int run() override
+    {
+        IN *a=this->getReadBuffer();
+        return({{nativeName}}_callback(mName,a,inputSize,NULL,0));
+    };
+
+protected:
+    const char *mName;
+};
+
+template<typename IN, int inputSize,typename OUT,int outputSize>
+class NativePythonNode: public GenericNode<IN,inputSize,OUT,outputSize>
+{
+public:
+    NativePythonNode(FIFOBase<IN> &src,FIFOBase<OUT> &dst,const char *name):
+    GenericNode<IN,inputSize,OUT,outputSize>(src,dst),mName(name){};
+
+    int prepareForRunning() override
+    {
+        if (this->willOverflow() ||
+            this->willUnderflow())
+        {
+           return(CG_SKIP_EXECUTION_ID_CODE); // Skip execution
+        }
+
+        return(0);
+    };
+
+    int run() override
+    {
+        IN *a=this->getReadBuffer();
+        OUT *b=this->getWriteBuffer();
+        return({{nativeName}}_callback(mName,a,inputSize,b,outputSize));
+    };
+
+protected:
+    const char *mName;
+};
+
+#endif
@@ -32,11 +32,11 @@ def convert(samples,format):
 
      """
     if format==Q31:
-       return(f.toQ31(np.array(samples)))
+       return(f.toQ31(samples))
     if format==Q15:
-       return(f.toQ15(np.array(samples)))
+       return(f.toQ15(samples))
     if format==Q7:
-       return(f.toQ7(np.array(samples)))
+       return(f.toQ7(samples))
     if format==F64:
         return(np.array(samples).astype(dtype=np.float64))
     if format==F32:
@@ -0,0 +1,511 @@
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+import cmsisdsp.plans as plans
+
+# FFT convolution and correlation.
+#
+# The impulse response is split into partitions of B samples and the
+# signal is processed by blocks of B samples with FFT of length
+# N = 2*B (uniformly partitioned convolution). The spectrums of the
+# last blocks are kept in a frequency domain delay line so the impulse
+# response can be longer than the biggest FFT of CMSIS-DSP.
+#
+# The f32 transforms are arm_rfft_fast_f32 (f64 for F64). The q31 and
+# q15 transforms are arm_cfft_q31 : the q15 samples are converted to
+# q31 since the q15 cfft is keeping too few bits after its scaling by
+# 1/N. The fixed point spectrums are multiplied in double and
+# renormalized for each block before the inverse transform.
+#
+# Error versus the direct kernels (arm_conv_q31 and arm_conv_q15, same
+# for the correlations) with signals using their full range:
+# - Q31 : relative error below 2**-20 of the biggest output
+#   (the error is given by the truncations in arm_cfft_q31)
+# - Q15 : at most 1 LSB
+# With OverlapAdd, the outputs are the sum of two inverse transforms
+# and the Q31 error is below 2**-19.
+# The FFT results are saturated where the direct q31 kernels are
+# wrapping on overflow.
+
+#: Biggest FFT length of arm_rfft_fast_f32 and arm_cfft_q31
+MAXFFTLENGTH = 4096
+#: Smallest FFT length of arm_rfft_fast_f32
+MINFFTLENGTH = 32
+
+# Costs (in ns on a desktop CPU) used to select the direct or FFT method.
+# Direct kernels : cost of a multiply accumulate. The f32 and q15
+# kernels of the host build are the reference loop testing all the
+# pairs of samples : (na+nb)**2/2 iterations instead of na*nb.
+_DIRECTCOST = {dt.F64:0.4,dt.F32:0.5,dt.Q31:0.35,dt.Q15:0.55}
+_PAIRLOOP = (dt.F32,dt.Q15)
+# FFT method : cost of a call, of a block, of a butterfly of the
+# transforms and of a complex multiply accumulate in the delay line
+_FFTCOST = {dt.F64:(50000,1300,0.9,3.5),
+            dt.F32:(50000,140,1.0,3.0),
+            dt.Q31:(100000,1100,2.5,4.0),
+            dt.Q15:(100000,1100,2.5,4.0)}
+
+_INPUTTYPES = {dt.F64:np.float64,
+               dt.F32:np.float32,
+               dt.Q31:np.int32,
+               dt.Q15:np.int16}
+
+# Left shift converting the samples to q31 and right shift of the
+# sum of products giving the result in the format of the direct kernels
+_PRESHIFT = {dt.Q31:0,dt.Q15:16}
+_OUTSHIFT = {dt.Q31:31,dt.Q15:15}
+
+def _checkType(dtype):
+    if dtype not in _INPUTTYPES:
+       raise dt.UnknownCMSISDSPDataType("Unsupported datatype %s" % dtype)
+
+def _headroom(x):
+    """
+     Left shift of q31 samples using their full range.
+
+    """
+    if len(x) == 0:
+       return(0)
+    maxAbs = int(np.max(np.abs(x.astype(np.int64))))
+    return(max(0,31 - maxAbs.bit_length()))
+
+def _toQ31(x,dtype,shift):
+    return((x.astype(np.int64) << (_PRESHIFT[dtype] + shift)).astype(np.int32))
+
+def defaultBlockSize(nbTaps,nbSamples=None):
+    """
+     Block size used for an impulse response : the FFT length is the
+     smallest power of 2 bigger than twice the impulse response and
+     the signal (between MINFFTLENGTH and MAXFFTLENGTH).
+
+     :param nbTaps: Length of the impulse response.
+     :type nbTaps: int
+     :param nbSamples: Length of the signal (unknown for a stream).
+     :type nbSamples: int
+     :return: Block size (half of the FFT length).
+     :rtype: int
+
+    """
+    n = nbTaps if nbSamples is None else min(nbTaps,nbSamples)
+    fftLen = 1 << int(max(n-1,1)).bit_length()+1
+    return(min(max(fftLen,MINFFTLENGTH),MAXFFTLENGTH) >> 1)
+
+def _unpack(packed):
+    # Output of arm_rfft_fast_f32 : real part of the first and
+    # last bins followed by the complex bins 1 .. N/2-1
+    nb = packed.shape[1] >> 1
+    bins = np.empty((packed.shape[0],nb+1),dtype=np.complex128)
+    bins[:,0] = packed[:,0]
+    bins[:,nb] = packed[:,1]
+    bins[:,1:nb] = packed[:,2:].astype(np.float64).view(np.complex128)
+    return(bins)
+
+def _pack(bins,dtype):
+    nb = bins.shape[1] - 1
+    packed = np.empty((bins.shape[0],2*nb),dtype=dtype)
+    packed[:,0] = bins[:,0].real
+    packed[:,1] = bins[:,nb].real
+    packed[:,2:] = bins[:,1:nb].view(np.float64)
+    return(packed)
+
+class _Transform:
+    """
+     Real FFT of a block of frames (one frame per row) and
+     inverse FFT of their spectrums (N/2+1 bins).
+
+    """
+    def __init__(self,fftLen,dtype):
+        self._fftLen = fftLen
+        self._dtype = dtype
+        if dtype == dt.F32:
+           self._S = plans.rfftFast(fftLen)
+        elif dtype == dt.F64:
+           self._S = plans.rfftFast(fftLen,dt.F64)
+        else:
+           self._S = plans.cfft(fftLen,dt.Q31)
+
+    def forward(self,frames):
+        if self._dtype == dt.F32:
+           return(_unpack(dsp.arm_rfft_fast_batch_f32(self._S,frames,0)))
+        if self._dtype == dt.F64:
+           return(_unpack(np.array([dsp.arm_rfft_fast_f64(self._S,f,0) for f in frames])))
+        # The q31 cfft is scaling the spectrum by 1/N
+        buf = np.zeros((frames.shape[0],2*self._fftLen),dtype=np.int32)
+        buf[:,0::2] = frames
+        res = np.empty_like(buf)
+        for row,out in zip(buf,res):
+            dsp.arm_cfft_q31(self._S,row,0,1,out=out)
+        bins = res[:,:self._fftLen+2].astype(np.float64).view(np.complex128)
+        return(bins)
+
+    def inverse(self,bins):
+        if self._dtype == dt.F32:
+           return(dsp.arm_rfft_fast_batch_f32(self._S,_pack(bins,np.float32),1))
+        if self._dtype == dt.F64:
+           packed = _pack(bins,np.float64)
+           return(np.array([dsp.arm_rfft_fast_f64(self._S,f,1) for f in packed]))
+        # Each spectrum is scaled by a power of 2 to use the full
+        # range of the q31 samples (with one bit of headroom)
+        nb = self._fftLen >> 1
+        full = np.empty((bins.shape[0],self._fftLen),dtype=np.complex128)
+        full[:,:nb+1] = bins
+        full[:,nb+1:] = np.conj(bins[:,nb-1:0:-1])
+        full = full.view(np.float64)
+        maxAbs = np.max(np.abs(full),axis=1)
+        exponents = np.where(maxAbs > 0,np.ceil(np.log2(np.maximum(maxAbs,1e-300))) - 30,0)
+        buf = np.rint(full * np.exp2(-exponents)[:,None]).astype(np.int32)
+        res = np.empty_like(buf)
+        for row,out in zip(buf,res):
+            dsp.arm_cfft_q31(self._S,row,1,1,out=out)
+        # The inverse q31 cfft is the inverse DFT (scaled by 1/N)
+        return(res[:,0::2] * np.exp2(exponents)[:,None])
+
+class _Convolver:
+    """
+     Uniformly partitioned convolution of a stream with an
+     impulse response. For the fixed point datatypes, inputShift is a
+     left shift of the input samples known to have some headroom
+     (to keep more bits in the transforms). When saturate is False,
+     the fixed point outputs are float64 samples in the format of the
+     direct kernel without rounding and saturation.
+
+    """
+    def __init__(self,h,dtype=dt.F32,blockSize=None,inputShift=0,saturate=True):
+        _checkType(dtype)
+        h = np.asarray(h,dtype=_INPUTTYPES[dtype])
+        if len(h) == 0:
+           raise ValueError("the impulse response must not be empty")
+        if blockSize is None:
+           blockSize = defaultBlockSize(len(h))
+        if blockSize & (blockSize - 1) or not (MINFFTLENGTH <= 2*blockSize <= MAXFFTLENGTH):
+           raise ValueError("the block size must be a power of 2 between %d and %d" % (MINFFTLENGTH >> 1,MAXFFTLENGTH >> 1))
+        self._dtype = dtype
+        self._saturate = saturate
+        self._nbTaps = len(h)
+        self._B = blockSize
+        self._N = 2*blockSize
+        self._P = (len(h) + blockSize - 1) // blockSize
+        self._transform = _Transform(self._N,dtype)
+
+        if dtype in _PRESHIFT:
+           hShift = _headroom(h.astype(np.int64) << _PRESHIFT[dtype])
+           h = _toQ31(h,dtype,hShift)
+           self._inputShift = inputShift
+           # Result of the inverse transforms to the format of the
+           # direct kernel : the forward q31 transforms are scaled by 1/N
+           self._scale = float(self._N)**2 * np.exp2(-(_OUTSHIFT[dtype] + 2*_PRESHIFT[dtype] + hShift + inputShift))
+        taps = np.zeros(self._P*self._B,dtype=h.dtype)
+        taps[:len(h)] = h
+        partitions = np.zeros((self._P,self._N),dtype=h.dtype)
+        partitions[:,:self._B] = taps.reshape(self._P,self._B)
+        self._H = self._transform.forward(partitions)
+        self.reset()
+
+    def reset(self):
+        """
+         Clear the state : samples waiting for a complete block
+         and delay line.
+
+        """
+        self._pending = np.zeros(0,dtype=_INPUTTYPES[self._dtype])
+        self._history = np.zeros((self._P-1,self._N//2+1),dtype=np.complex128)
+        self._resetBlocks()
+
+    @property
+    def blockSize(self):
+        return(self._B)
+
+    @property
+    def nbTaps(self):
+        return(self._nbTaps)
+
+    def _output(self,y):
+        if self._dtype == dt.F32:
+           return(y.astype(np.float32))
+        if self._dtype == dt.F64:
+           return(y)
+        if not self._saturate:
+           return(y*self._scale)
+        info = np.iinfo(_INPUTTYPES[self._dtype])
+        return(np.clip(np.floor(y*self._scale + 0.5),info.min,info.max).astype(info.dtype))
+
+    def _convolveBlocks(self,frames):
+        X = self._transform.forward(frames)
+        nb = X.shape[0]
+        if self._P > 1:
+           X = np.concatenate((self._history,X))
+        Y = X[self._P-1:] * self._H[0]
+        for p in range(1,self._P):
+            Y += X[self._P-1-p:self._P-1-p+nb] * self._H[p]
+        if self._P > 1:
+           self._history = X[-(self._P-1):]
+        return(self._transform.inverse(Y))
+
+    def process(self,x):
+        """
+         Convolution of the samples of a chunk of any length.
+         The output samples are computed by blocks : the samples not
+         yet used by a block are kept by the convolver.
+
+         :param x: Samples of the chunk.
+         :type x: array
+         :return: Output samples of the completed blocks (possibly none).
+          All the outputs followed by the output of flush are the full
+          convolution of the stream.
+         :rtype: array
+
+        """
+        x = np.asarray(x,dtype=_INPUTTYPES[self._dtype])
+        if self._pending.size:
+           x = np.concatenate((self._pending,x))
+        nbBlocks = len(x) // self._B
+        self._pending = x[nbBlocks*self._B:]
+        if self._dtype in _PRESHIFT:
+           x = _toQ31(x[:nbBlocks*self._B],self._dtype,self._inputShift)
+        else:
+           x = x[:nbBlocks*self._B]
+        # Blocks are processed in groups to limit the memory used
+        # by the spectrums of a long signal
+        group = max(1,(1 << 22) // self._N)
+        y = [self._blocks(x[start:start + group*self._B].reshape(-1,self._B))
+             for start in range(0,len(x),group*self._B)]
+        if not y:
+           return(self._output(np.zeros(0)))
+        return(self._output(np.concatenate(y)))
+
+    def flush(self):
+        """
+         End of the stream : output samples of the pending samples
+         and of the tail of the impulse response. The convolver is reset.
+
+         :return: Remaining output samples.
+         :rtype: array
+
+        """
+        nbOutputs = len(self._pending) + self._nbTaps - 1
+        nbZeros = -nbOutputs % self._B + (nbOutputs - len(self._pending))
+        y = self.process(np.zeros(nbZeros,dtype=_INPUTTYPES[self._dtype]))[:nbOutputs]
+        self.reset()
+        return(y)
+
+class OverlapSave(_Convolver):
+    """
+     Streaming convolution with overlap-save : the FFT are computed on
+     the previous block followed by the new block and the first half
+     of the circular convolution is discarded.
+
+     :param h: Impulse response.
+     :type h: array
+     :param dtype: Datatype (F64, F32, Q31 or Q15).
+     :type dtype: int
+     :param blockSize: Number of samples of a block (half of the FFT length).
+     :type blockSize: int
+
+    """
+    def _resetBlocks(self):
+        self._previous = np.zeros(self._B,dtype=np.int32 if self._dtype in _PRESHIFT else _INPUTTYPES[self._dtype])
+
+    def _blocks(self,blocks):
+        samples = np.concatenate((self._previous,blocks.reshape(-1)))
+        frames = np.lib.stride_tricks.sliding_window_view(samples,self._N)[::self._B]
+        self._previous = samples[-self._B:]
+        y = self._convolveBlocks(np.ascontiguousarray(frames))
+        return(y[:,self._B:].reshape(-1))
+
+class OverlapAdd(_Convolver):
+    """
+     Streaming convolution with overlap-add : the FFT are computed on
+     the new block followed by zeros and the second half of the linear
+     convolution is added to the next block.
+
+     :param h: Impulse response.
+     :type h: array
+     :param dtype: Datatype (F64, F32, Q31 or Q15).
+     :type dtype: int
+     :param blockSize: Number of samples of a block (half of the FFT length).
+     :type blockSize: int
+
+    """
+    def _resetBlocks(self):
+        self._tail = np.zeros(self._B)
+
+    def _blocks(self,blocks):
+        frames = np.zeros((blocks.shape[0],self._N),dtype=blocks.dtype)
+        frames[:,:self._B] = blocks
+        y = self._convolveBlocks(frames)
+        out = y[:,:self._B].astype(np.float64)
+        out[1:] += y[:-1,self._B:]
+        out[0] += self._tail
+        self._tail = y[-1,self._B:].astype(np.float64)
+        return(out.reshape(-1))
+
+def _directCost(nbA,nbB,dtype):
+    if dtype in _PAIRLOOP:
+       return(_DIRECTCOST[dtype]*(nbA + nbB)**2/2)
+    return(_DIRECTCOST[dtype]*nbA*nbB)
+
+def _fftCost(nbA,nbB,dtype):
+    B = defaultBlockSize(min(nbA,nbB),max(nbA,nbB))
+    N = 2*B
+    nbBlocks = (nbA + nbB - 1 + B - 1) // B
+    nbPartitions = (min(nbA,nbB) + B - 1) // B
+    call,block,butterfly,mac = _FFTCOST[dtype]
+    return(call + nbBlocks*(block + butterfly*N*np.log2(N) + mac*nbPartitions*(B+1)))
+
+def _useFFT(nbA,nbB,dtype,method):
+    if method == "fft":
+       return(True)
+    if method == "direct":
+       return(False)
+    if method != "auto":
+       raise ValueError("the method must be auto, direct or fft")
+    return(_fftCost(nbA,nbB,dtype) < _directCost(nbA,nbB,dtype))
+
+def _convolveFFT(a,b,dtype,saturate=True):
+    # The shortest signal is the impulse response
+    if len(a) < len(b):
+       a,b = b,a
+    B = defaultBlockSize(len(b),len(a))
+    if dtype in _PRESHIFT:
+       inputShift = _headroom(a.astype(np.int64) << _PRESHIFT[dtype])
+    else:
+       inputShift = 0
+    c = OverlapSave(b,dtype,B,inputShift=inputShift,saturate=saturate)
+    return(np.concatenate((c.process(a),c.flush())))
+
+def convolve(a,b,dtype=dt.F32,method="auto"):
+    """
+     Convolution of two signals. The result is the one of
+     arm_conv_f32 (q31, q15) : all the len(a)+len(b)-1 samples.
+
+     :param a: First signal.
+     :type a: array
+     :param b: Second signal.
+     :type b: array
+     :param dtype: Datatype (F64, F32, Q31 or Q15).
+     :type dtype: int
+     :param method: auto (chosen with the lengths), direct or fft.
+     :type method: str
+     :return: Convolution.
+     :rtype: array
+
+    """
+    _checkType(dtype)
+    a = np.asarray(a,dtype=_INPUTTYPES[dtype])
+    b = np.asarray(b,dtype=_INPUTTYPES[dtype])
+    if len(a) == 0 or len(b) == 0:
+       raise ValueError("the signals must not be empty")
+    useFFT = _useFFT(len(a),len(b),dtype,method)
+    # There is no direct f64 convolution
+    if dtype == dt.F64:
+       if method == "direct":
+          raise ValueError("no direct convolution for this datatype")
+       useFFT = True
+    if useFFT:
+       return(_convolveFFT(a,b,dtype))
+    f = {dt.F32:dsp.arm_conv_f32,dt.Q31:dsp.arm_conv_q31,dt.Q15:dsp.arm_conv_q15}[dtype]
+    return(f(a,len(a),b,len(b)))
+
+def _correlateFull(a,b,dtype,method,saturate=True):
+    # Correlation of a with b for the lags -(len(b)-1) .. len(a)-1
+    # (like np.correlate with mode full)
+    if _useFFT(len(a),len(b),dtype,method):
+       return(_convolveFFT(a,b[::-1],dtype,saturate))
+    f = {dt.F64:dsp.arm_correlate_f64,dt.F32:dsp.arm_correlate_f32,
+         dt.Q31:dsp.arm_correlate_q31,dt.Q15:dsp.arm_correlate_q15}[dtype]
+    if len(a) >= len(b):
+       out = np.zeros(2*len(a)-1,dtype=_INPUTTYPES[dtype])
+       f(a,len(a),b,len(b),out=out)
+       return(out[len(a)-len(b):])
+    out = np.zeros(2*len(b)-1,dtype=_INPUTTYPES[dtype])
+    f(a,len(a),b,len(b),out=out)
+    return(out[:len(a)+len(b)-1])
+
+def correlate(a,b,dtype=dt.F32,method="auto"):
+    """
+     Correlation of two signals. The result has the layout of
+     arm_correlate_f32 (f64, q31, q15) : 2*max(len(a),len(b))-1 samples
+     with the len(a)+len(b)-1 samples of the correlation at the end
+     when a is the longest signal and at the start otherwise (the
+     other samples are zero).
+
+     :param a: First signal.
+     :type a: array
+     :param b: Second signal.
+     :type b: array
+     :param dtype: Datatype (F64, F32, Q31 or Q15).
+     :type dtype: int
+     :param method: auto (chosen with the lengths), direct or fft.
+     :type method: str
+     :return: Correlation.
+     :rtype: array
+
+    """
+    _checkType(dtype)
+    a = np.asarray(a,dtype=_INPUTTYPES[dtype])
+    b = np.asarray(b,dtype=_INPUTTYPES[dtype])
+    if len(a) == 0 or len(b) == 0:
+       raise ValueError("the signals must not be empty")
+    c = _correlateFull(a,b,dtype,method)
+    out = np.zeros(2*max(len(a),len(b))-1,dtype=c.dtype)
+    if len(a) >= len(b):
+       out[len(a)-len(b):] = c
+    else:
+       out[:len(c)] = c
+    return(out)
+
+def lagPeak(a,b,dtype=dt.F32,maxLag=None,absolute=False,interpolate=False,method="auto"):
+    """
+     Lag of the maximum of the correlation of two signals (time
+     delay estimation). The lag is positive when a is late :
+     a[n] = b[n-lag] gives the peak at lag.
+
+     For the fixed point datatypes, the FFT correlation is not
+     saturated (the sums of long signals are often out of the range of
+     the q31 and q15 formats) : the value is a float in the format of
+     the direct kernels. The direct kernels are saturating (q15) or
+     wrapping (q31) and the peak may be wrong for long signals.
+
+     :param a: First signal.
+     :type a: array
+     :param b: Second signal.
+     :type b: array
+     :param dtype: Datatype (F64, F32, Q31 or Q15).
+     :type dtype: int
+     :param maxLag: Only the lags between -maxLag and maxLag are searched.
+     :type maxLag: int
+     :param absolute: Search the maximum of the absolute value.
+     :type absolute: bool
+     :param interpolate: Fractional lag given by a parabola through
+      the peak and its neighbours.
+     :type interpolate: bool
+     :param method: auto (chosen with the lengths), direct or fft.
+     :type method: str
+     :return: Lag and value of the correlation at the lag
+      (the value is at the closest integer lag when interpolating).
+     :rtype: tuple
+
+    """
+    _checkType(dtype)
+    a = np.asarray(a,dtype=_INPUTTYPES[dtype])
+    b = np.asarray(b,dtype=_INPUTTYPES[dtype])
+    if len(a) == 0 or len(b) == 0:
+       raise ValueError("the signals must not be empty")
+    c = _correlateFull(a,b,dtype,method,saturate=False)
+    lags = np.arange(-(len(b)-1),len(a))
+    if maxLag is not None:
+       keep = np.abs(lags) <= maxLag
+       c,lags = c[keep],lags[keep]
+       if len(c) == 0:
+          raise ValueError("no lag in the search range")
+    v = c.astype(np.float64)
+    if absolute:
+       v = np.abs(v)
+    i = int(np.argmax(v))
+    lag = int(lags[i])
+    if interpolate and 0 < i < len(v)-1:
+       d = v[i-1] - 2*v[i] + v[i+1]
+       if d != 0:
+          return(lag + 0.5*(v[i-1] - v[i+1])/d,c[i])
+       return(float(lag),c[i])
+    return(lag,c[i])
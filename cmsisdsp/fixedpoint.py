@@ -1,5 +1,50 @@
 import numpy as np
 
+def _toFixedPoint(x,shift,dtype,out=None,overwrite=False,chunkSize=None):
+     """
+     Saturating conversion of an array of floats to a fixed point format.
+     The samples are scaled, rounded to nearest (half to even like np.round)
+     and saturated.
+
+     In chunked mode, the samples are converted chunkSize samples at a time
+     and a temporary buffer of only one chunk is used. It is useful for
+     memory mapped arrays bigger than the memory.
+
+     """
+     x = np.asanyarray(x)
+     info = np.iinfo(dtype)
+
+     if out is None:
+          out = np.empty(x.shape,dtype=dtype)
+     elif out.dtype != dtype or out.shape != x.shape:
+          raise ValueError("out must be an array of %s with shape %s" % (np.dtype(dtype).name,x.shape))
+
+     # The input can only be used as temporary buffer if it is an array
+     # of float64 which is not converted by asanyarray
+     overwrite = overwrite and x.dtype == np.float64 and x.flags.writeable
+
+     if chunkSize is None or x.size <= chunkSize:
+          chunks = [(x,out)]
+     else:
+          if not out.flags.c_contiguous:
+             raise ValueError("out must be C contiguous in chunked mode")
+          srcFlat = x.reshape(-1)
+          dstFlat = out.reshape(-1)
+          chunks = ((srcFlat[i:i+chunkSize],dstFlat[i:i+chunkSize])
+                    for i in range(0,x.size,chunkSize))
+
+     for src,dst in chunks:
+          if overwrite:
+             tmp = src
+             np.multiply(src,1<<shift,out=tmp)
+          else:
+             tmp = np.asarray(np.multiply(src,1<<shift,dtype=np.float64))
+          np.round(tmp,out=tmp)
+          np.clip(tmp,info.min,info.max,out=tmp)
+          dst[...] = tmp
+
+     return(out)
+
 def q31sat(x):
      if x > 0x7FFFFFFF:
           return(np.int32(0x7FFFFFFF))
@@ -10,17 +55,23 @@ def q31sat(x):
 
 q31satV=np.vectorize(q31sat)
 
-def toQ31(x):
+def toQ31(x,out=None,overwrite=False,chunkSize=None):
      """
      Return an array of Q31 scalars from an array of floats
 
      :param x: array of float.
      :type x: array
+     :param out: Optional array of Q31 scalars receiving the result.
+     :type out: array
+     :param overwrite: The input (array of float64) can be used as temporary buffer.
+     :type overwrite: bool
+     :param chunkSize: Convert chunkSize samples at a time (all samples by default).
+     :type chunkSize: int
      :return: array of Q31 scalars.
      :rtype: array
 
      """
-     return(q31satV(np.round(np.array(x) * (1<<31))))
+     return(_toFixedPoint(x,31,np.int32,out=out,overwrite=overwrite,chunkSize=chunkSize))
 
 def q15sat(x):
      if x > 0x7FFF:
@@ -32,17 +83,23 @@ def q15sat(x):
 
 q15satV=np.vectorize(q15sat)
 
-def toQ15(x):
+def toQ15(x,out=None,overwrite=False,chunkSize=None):
      """
      Return an array of Q15 scalars from an array of floats
 
      :param x: array of float.
      :type x: array
+     :param out: Optional array of Q15 scalars receiving the result.
+     :type out: array
+     :param overwrite: The input (array of float64) can be used as temporary buffer.
+     :type overwrite: bool
+     :param chunkSize: Convert chunkSize samples at a time (all samples by default).
+     :type chunkSize: int
      :return: array of Q15 scalars.
      :rtype: array
 
      """
-     return(q15satV(np.round(np.array(x) * (1<<15))))
+     return(_toFixedPoint(x,15,np.int16,out=out,overwrite=overwrite,chunkSize=chunkSize))
 
 def q7sat(x):
      if x > 0x7F:
@@ -54,17 +111,23 @@ def q7sat(x):
 
 q7satV=np.vectorize(q7sat)
 
-def toQ7(x):
+def toQ7(x,out=None,overwrite=False,chunkSize=None):
      """
      Return an array of Q7 scalars from an array of floats
 
      :param x: array of float.
      :type x: array
+     :param out: Optional array of Q7 scalars receiving the result.
+     :type out: array
+     :param overwrite: The input (array of float64) can be used as temporary buffer.
+     :type overwrite: bool
+     :param chunkSize: Convert chunkSize samples at a time (all samples by default).
+     :type chunkSize: int
      :return: array of Q7 scalars.
      :rtype: array
 
      """
-     return(q7satV(np.round(np.array(x) * (1<<7))))
+     return(_toFixedPoint(x,7,np.int8,out=out,overwrite=overwrite,chunkSize=chunkSize))
 
 def Q31toF32(x):
      """
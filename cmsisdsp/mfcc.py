@@ -1,3 +1,6 @@
+import functools
+import hashlib
+import os
 import numpy as np
 import cmsisdsp.datatype as dt
 
@@ -25,9 +28,106 @@ def melSpaceToFrequency(mels):
     """
     return 700.0 * (np.exp(mels / 1127.0) - 1.0)
 
+#: Directory of the disk cache (no disk cache when None)
+_cacheDirectory = None
+
+def setCacheDirectory(path):
+    """
+     Enable a disk cache for the Mel filters and DCT matrixes.
+     The tables are saved as .npz files in the directory and
+     are reused by the next runs. The memory cache is always enabled.
+
+     :param path: Directory of the cache (None to disable the disk cache).
+     :type path: str
+
+    """
+    global _cacheDirectory
+    if path is not None:
+       os.makedirs(path,exist_ok=True)
+    _cacheDirectory = path
+
+def clearCache():
+    """
+     Clear the memory cache of the Mel filters and DCT matrixes.
+     The disk cache is not cleared.
+
+    """
+    _melFilterArrays.cache_clear()
+    _dctArray.cache_clear()
+
+def _cached(name,key,build):
+    """
+     Tables from the disk cache if enabled, or built and saved in the
+     disk cache.
+
+    """
+    if _cacheDirectory is None:
+       return(build())
+
+    digest = hashlib.sha1(repr((name,)+key).encode("utf-8")).hexdigest()
+    path = os.path.join(_cacheDirectory,"%s_%s.npz" % (name,digest))
+    if os.path.exists(path):
+       with np.load(path) as data:
+          return(tuple(data["arr_%d" % i] for i in range(len(data.files))))
+
+    arrays = build()
+    # Write to a temporary file so that a concurrent run never sees
+    # a partial file
+    tmp = "%s.%d.tmp" % (path,os.getpid())
+    with open(tmp,"wb") as f:
+       np.savez(f,*arrays)
+    os.replace(tmp,path)
+    return(arrays)
+
+def _buildMelFilters(dtype,fmin, fmax, numOfMelFilters,fs,FFTSize):
+    nbBins = int(FFTSize // 2 + 1)
+
+    fmin_mel = frequencyToMelSpace(fmin)
+    fmax_mel = frequencyToMelSpace(fmax)
+    mels = np.linspace(fmin_mel, fmax_mel, num=numOfMelFilters+2)
+
+
+    linearfreqs = np.linspace( 0, fs/2.0, nbBins )
+    spectrogrammels = frequencyToMelSpace(linearfreqs)[1:]
+
+    # One filter per row
+    left = mels[:-2,np.newaxis]
+    center = mels[1:-1,np.newaxis]
+    right = mels[2:,np.newaxis]
+    upper = (spectrogrammels - left)/(center - left)
+    lower = (right - spectrogrammels)/(right - center)
+
+    filters = np.zeros((numOfMelFilters,nbBins))
+    filters[:,1:] = np.maximum(0.0,np.minimum(upper,lower))
+
+    # Each filter is the block of non zero values starting
+    # with the first non zero value
+    nonZero = filters != 0.0
+    positions = np.arange(nbBins)
+    filtPos = np.argmax(nonZero,axis=1)
+    ended = ~nonZero & (positions > filtPos[:,np.newaxis])
+    filtEnd = np.where(np.any(ended,axis=1),np.argmax(ended,axis=1),nbBins) - 1
+    filtLen = filtEnd - filtPos + 1
+
+    inFilter = (positions >= filtPos[:,np.newaxis]) & (positions <= filtEnd[:,np.newaxis])
+    packedFilters = dt.convert(filters[inFilter],dtype)
+
+    return(filtLen,filtPos,packedFilters)
+
+@functools.lru_cache(maxsize=128)
+def _melFilterArrays(dtype,fmin, fmax, numOfMelFilters,fs,FFTSize):
+    key = (dtype,fmin, fmax, numOfMelFilters,fs,FFTSize)
+    arrays = _cached("mel",key,lambda : _buildMelFilters(*key))
+    for a in arrays:
+        a.flags.writeable = False
+    return(arrays)
+
 def melFilterMatrix(dtype,fmin, fmax, numOfMelFilters,fs,FFTSize):
     """
-     Sparse matrix in a specific format and encoding the filters in Mel space
+     Sparse matrix in a specific format and encoding the filters in Mel space.
+
+     The result is cached in memory for each set of arguments (and on disk
+     if enabled with setCacheDirectory).
 
      :param dtype: The datatype to use for the matrix coefficients.
      :type dtype: int
@@ -45,53 +145,31 @@ def melFilterMatrix(dtype,fmin, fmax, numOfMelFilters,fs,FFTSize):
      :rtype: A tuple
 
     """
-    filters = np.zeros((numOfMelFilters,int(FFTSize/2+1)))
-    zeros = np.zeros(int(FFTSize // 2 ))
-
-
-    fmin_mel = frequencyToMelSpace(fmin)
-    fmax_mel = frequencyToMelSpace(fmax)
-    mels = np.linspace(fmin_mel, fmax_mel, num=numOfMelFilters+2)
-
-
-    linearfreqs = np.linspace( 0, fs/2.0, int(FFTSize // 2 + 1) )
-    spectrogrammels = frequencyToMelSpace(linearfreqs)[1:]
-
-
-    filtPos=[]
-    filtLen=[]
-    totalLen = 0
-    packedFilters = []
-    for n in range(numOfMelFilters):
+    filtLen,filtPos,packedFilters = _melFilterArrays(dtype,fmin, fmax, numOfMelFilters,fs,FFTSize)
+    return filtLen.tolist(),filtPos.tolist(),packedFilters.copy()
 
-      
-      upper = (spectrogrammels - mels[n])/(mels[n+1]-mels[n]) 
-      lower = (mels[n+2] - spectrogrammels)/(mels[n+2]-mels[n+1])
 
+def _buildDct(dtype,numOfDctOutputs, numOfMelFilters):
+    s=(np.linspace(1,numOfMelFilters,numOfMelFilters) - 0.5)/numOfMelFilters
+    i=np.arange(numOfDctOutputs)[:,np.newaxis]
 
-      filters[n, :] = np.hstack([0,np.maximum(zeros,np.minimum(upper,lower))])
-      nb = 0 
-      startFound = False
-      for sample in filters[n, :]:
-        if not startFound and sample != 0.0:
-            startFound = True 
-            startPos = nb
-
-        if startFound and sample == 0.0:
-           endPos = nb - 1 
-           break
-        nb = nb + 1 
-      filtLen.append(endPos - startPos+1)
-      totalLen += endPos - startPos + 1
-      filtPos.append(startPos)
-      packedFilters += list(filters[n, startPos:endPos+1])
+    result = np.cos(i * np.pi*s) * np.sqrt(2.0/numOfMelFilters)
 
-    return filtLen,filtPos,dt.convert(packedFilters,dtype)
+    return(dt.convert(result.reshape(numOfDctOutputs*numOfMelFilters),dtype),)
 
+@functools.lru_cache(maxsize=128)
+def _dctArray(dtype,numOfDctOutputs, numOfMelFilters):
+    key = (dtype,numOfDctOutputs, numOfMelFilters)
+    result, = _cached("dct",key,lambda : _buildDct(*key))
+    result.flags.writeable = False
+    return(result)
 
 def dctMatrix(dtype,numOfDctOutputs, numOfMelFilters):
     """
-     Dct matrix in a specific format
+     Dct matrix in a specific format.
+
+     The result is cached in memory for each set of arguments (and on disk
+     if enabled with setCacheDirectory).
 
      :param dtype: The datatype to use for the matrix coefficients.
      :type dtype: int
@@ -103,12 +181,4 @@ def dctMatrix(dtype,numOfDctOutputs, numOfMelFilters):
      :rtype: array of dtype
 
     """
-    result = np.zeros((numOfDctOutputs,numOfMelFilters))
-    s=(np.linspace(1,numOfMelFilters,numOfMelFilters) - 0.5)/numOfMelFilters
-
-    for i in range(0, numOfDctOutputs):
-        result[i,:]=np.cos(i * np.pi*s) * np.sqrt(2.0/numOfMelFilters)
-        
-    return dt.convert(result.reshape(numOfDctOutputs*numOfMelFilters),dtype)
-
-
+    return _dctArray(dtype,numOfDctOutputs, numOfMelFilters).copy()
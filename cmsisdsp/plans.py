@@ -0,0 +1,320 @@
+import collections
+import hashlib
+import threading
+import numpy as np
+import cmsisdsp as dsp
+import cmsisdsp.datatype as dt
+
+# Process wide registry of the initialized transform instances (plans).
+#
+# The instances of the cfft, rfft, dct4 and mfcc are only read by the
+# transforms : one instance can be shared by all the users of the
+# same transform and by several threads. The temporary buffers are
+# not part of the plans : each caller has its own (see Scratch).
+
+#: Default maximum number of plans kept in the registry
+DEFAULT_MAXSIZE = 64
+
+_lock = threading.RLock()
+# key -> instance
+_plans = collections.OrderedDict()
+_maxSize = DEFAULT_MAXSIZE
+_hits = 0
+_misses = 0
+_evictions = 0
+
+def _evict():
+    global _evictions
+    while len(_plans) > _maxSize:
+        _plans.popitem(last=False)
+        _evictions += 1
+
+def _get(key,build):
+    """
+     Plan from the registry or built and added to the registry.
+
+    """
+    global _hits,_misses
+    with _lock:
+        plan = _plans.get(key)
+        if plan is not None:
+           _hits += 1
+           _plans.move_to_end(key)
+           return(plan)
+        _misses += 1
+        plan = build()
+        _plans[key] = plan
+        _evict()
+        return(plan)
+
+def _checkStatus(status,name):
+    if status != 0:
+       raise ValueError("%s failed with status %d" % (name,status))
+
+def _checkType(dtype,types):
+    if dtype not in types:
+       raise dt.UnknownCMSISDSPDataType("Unsupported datatype %s" % dtype)
+
+_CFFT = {dt.F32:("arm_cfft_instance_f32","arm_cfft_init_f32"),
+         dt.F16:("arm_cfft_instance_f16","arm_cfft_init_f16"),
+         dt.Q31:("arm_cfft_instance_q31","arm_cfft_init_q31"),
+         dt.Q15:("arm_cfft_instance_q15","arm_cfft_init_q15")}
+
+def cfft(length,dtype=dt.F32):
+    """
+     Shared cfft instance. The direction of the transform is an
+     argument of arm_cfft_f32 so the same instance is used for
+     the cfft and the icfft.
+
+     :param length: Number of complex samples.
+     :type length: int
+     :param dtype: Datatype (F32, F16, Q31 or Q15).
+     :type dtype: int
+     :return: Initialized instance.
+     :rtype: CMSIS-DSP cfft instance
+
+    """
+    _checkType(dtype,_CFFT)
+    def build():
+        instance,init = _CFFT[dtype]
+        S = getattr(dsp,instance)()
+        _checkStatus(getattr(dsp,init)(S,length),init)
+        return(S)
+    return(_get(("cfft",length,dtype),build))
+
+_RFFTFAST = {dt.F64:("arm_rfft_fast_instance_f64","arm_rfft_fast_init_f64"),
+             dt.F32:("arm_rfft_fast_instance_f32","arm_rfft_fast_init_f32"),
+             dt.F16:("arm_rfft_fast_instance_f16","arm_rfft_fast_init_f16")}
+
+def rfftFast(length,dtype=dt.F32):
+    """
+     Shared rfft_fast instance. The direction of the transform is an
+     argument of arm_rfft_fast_f32.
+
+     :param length: Number of real samples.
+     :type length: int
+     :param dtype: Datatype (F64, F32 or F16).
+     :type dtype: int
+     :return: Initialized instance.
+     :rtype: CMSIS-DSP rfft_fast instance
+
+    """
+    _checkType(dtype,_RFFTFAST)
+    def build():
+        instance,init = _RFFTFAST[dtype]
+        S = getattr(dsp,instance)()
+        _checkStatus(getattr(dsp,init)(S,length),init)
+        return(S)
+    return(_get(("rfftFast",length,dtype),build))
+
+_RFFT = {dt.Q31:("arm_rfft_instance_q31","arm_rfft_init_q31"),
+         dt.Q15:("arm_rfft_instance_q15","arm_rfft_init_q15")}
+
+def rfft(length,ifftFlag=0,bitReverseFlag=1,dtype=dt.Q31):
+    """
+     Shared fixed point rfft instance. The direction of the transform
+     is given to the init function so there is one plan per direction.
+
+     :param length: Number of real samples.
+     :type length: int
+     :param ifftFlag: 1 for the inverse transform.
+     :type ifftFlag: int
+     :param bitReverseFlag: 1 for an output in normal order.
+     :type bitReverseFlag: int
+     :param dtype: Datatype (Q31 or Q15).
+     :type dtype: int
+     :return: Initialized instance.
+     :rtype: CMSIS-DSP rfft instance
+
+    """
+    _checkType(dtype,_RFFT)
+    def build():
+        instance,init = _RFFT[dtype]
+        S = getattr(dsp,instance)()
+        _checkStatus(getattr(dsp,init)(S,length,ifftFlag,bitReverseFlag),init)
+        return(S)
+    return(_get(("rfft",length,dtype,ifftFlag,bitReverseFlag),build))
+
+_DCT4 = {dt.F32:("arm_dct4_instance_f32","arm_rfft_instance_f32","arm_cfft_radix4_instance_f32","arm_dct4_init_f32"),
+         dt.Q31:("arm_dct4_instance_q31","arm_rfft_instance_q31","arm_cfft_radix4_instance_q31","arm_dct4_init_q31"),
+         dt.Q15:("arm_dct4_instance_q15","arm_rfft_instance_q15","arm_cfft_radix4_instance_q15","arm_dct4_init_q15")}
+
+def dct4(length,normalize,dtype=dt.F32):
+    """
+     Shared dct4 instance. The rfft and cfft instances used by the
+     dct4 are kept alive by the dct4 instance.
+
+     :param length: Number of samples.
+     :type length: int
+     :param normalize: Normalizing factor (float for F32, integer in
+      the fixed point format for Q31 and Q15).
+     :type normalize: float or int
+     :param dtype: Datatype (F32, Q31 or Q15).
+     :type dtype: int
+     :return: Initialized instance.
+     :rtype: CMSIS-DSP dct4 instance
+
+    """
+    _checkType(dtype,_DCT4)
+    def build():
+        instance,rfftInstance,cfftInstance,init = _DCT4[dtype]
+        S = getattr(dsp,instance)()
+        S_RFFT = getattr(dsp,rfftInstance)()
+        S_CFFT = getattr(dsp,cfftInstance)()
+        _checkStatus(getattr(dsp,init)(S,S_RFFT,S_CFFT,length,length>>1,normalize),init)
+        return(S)
+    return(_get(("dct4",length,dtype,normalize),build))
+
+_MFCC = {dt.F32:("arm_mfcc_instance_f32","arm_mfcc_init_f32"),
+         dt.F16:("arm_mfcc_instance_f16","arm_mfcc_init_f16"),
+         dt.Q31:("arm_mfcc_instance_q31","arm_mfcc_init_q31"),
+         dt.Q15:("arm_mfcc_instance_q15","arm_mfcc_init_q15")}
+
+def mfcc(fftLen,nbMelFilters,nbDctOutputs,dctCoefs,filterPos,filterLengths,filterCoefs,windowCoefs,dtype=dt.F32):
+    """
+     Shared mfcc instance. The arguments are the ones of arm_mfcc_init_f32.
+     The tables are part of the key of the plan (a digest of their content).
+
+     The init function is keeping its own copy of the tables and this
+     memory is not released : using the registry instead of a new
+     instance for each user is also avoiding those copies.
+
+     :param fftLen: FFT length.
+     :type fftLen: int
+     :param nbMelFilters: Number of Mel filters.
+     :type nbMelFilters: int
+     :param nbDctOutputs: Number of DCT outputs.
+     :type nbDctOutputs: int
+     :param dctCoefs: DCT matrix.
+     :type dctCoefs: array
+     :param filterPos: Position of the Mel filters.
+     :type filterPos: array
+     :param filterLengths: Length of the Mel filters.
+     :type filterLengths: array
+     :param filterCoefs: Coefficients of the Mel filters.
+     :type filterCoefs: array
+     :param windowCoefs: Window.
+     :type windowCoefs: array
+     :param dtype: Datatype (F32, F16, Q31 or Q15).
+     :type dtype: int
+     :return: Initialized instance.
+     :rtype: CMSIS-DSP mfcc instance
+
+    """
+    _checkType(dtype,_MFCC)
+    tables = (dctCoefs,filterPos,filterLengths,filterCoefs,windowCoefs)
+    digest = hashlib.sha1()
+    for t in tables:
+        t = np.ascontiguousarray(t)
+        digest.update(str((t.dtype.str,t.shape)).encode("utf-8"))
+        digest.update(t.data)
+    def build():
+        instance,init = _MFCC[dtype]
+        S = getattr(dsp,instance)()
+        _checkStatus(getattr(dsp,init)(S,fftLen,nbMelFilters,nbDctOutputs,*tables),init)
+        return(S)
+    return(_get(("mfcc",fftLen,dtype,nbMelFilters,nbDctOutputs,digest.hexdigest()),build))
+
+class Scratch:
+    """
+     Temporary buffer of one user of a shared plan. The buffer is
+     allocated the first time it is used. A scratch must not be
+     shared between threads.
+
+     :param length: Number of samples.
+     :type length: int
+     :param dtype: Numpy datatype of the buffer.
+     :type dtype: numpy dtype
+
+    """
+    def __init__(self,length,dtype=np.float32):
+        self._length = length
+        self._dtype = dtype
+        self._buffer = None
+
+    @property
+    def buffer(self):
+        if self._buffer is None:
+           self._buffer = np.zeros(self._length,dtype=self._dtype)
+        return(self._buffer)
+
+_SCRATCHTYPES = {dt.F32:np.float32,
+                 dt.F16:np.float16,
+                 dt.Q31:np.int32,
+                 dt.Q15:np.int16}
+
+def dct4Scratch(length,dtype=dt.F32):
+    """
+     State buffer of arm_dct4_f32 (and q31, q15).
+
+     :param length: Number of samples of the dct4.
+     :type length: int
+     :param dtype: Datatype (F32, Q31 or Q15).
+     :type dtype: int
+     :return: Scratch of 2*length samples.
+     :rtype: Scratch
+
+    """
+    _checkType(dtype,_DCT4)
+    return(Scratch(2*length,_SCRATCHTYPES[dtype]))
+
+def mfccScratch(fftLen,dtype=dt.F32):
+    """
+     Temporary buffer of arm_mfcc_f32 (and f16, q31, q15).
+     It is a q31 buffer for the q15 mfcc.
+
+     :param fftLen: FFT length of the mfcc.
+     :type fftLen: int
+     :param dtype: Datatype (F32, F16, Q31 or Q15).
+     :type dtype: int
+     :return: Scratch of 2*fftLen samples.
+     :rtype: Scratch
+
+    """
+    _checkType(dtype,_MFCC)
+    return(Scratch(2*fftLen,_SCRATCHTYPES[dt.Q31 if dtype == dt.Q15 else dtype]))
+
+def stats():
+    """
+     Statistics of the registry.
+
+     :return: hits, misses, evictions, size (number of plans) and maxSize.
+     :rtype: dict
+
+    """
+    with _lock:
+        return({"hits":_hits,
+                "misses":_misses,
+                "evictions":_evictions,
+                "size":len(_plans),
+                "maxSize":_maxSize})
+
+def setMaxSize(maxSize):
+    """
+     Maximum number of plans kept in the registry. The least
+     recently used plans are evicted first. An evicted plan remains
+     valid for the users still having it.
+
+     :param maxSize: Maximum number of plans (at least 1).
+     :type maxSize: int
+
+    """
+    global _maxSize
+    if maxSize < 1:
+       raise ValueError("the maximum size must be at least 1")
+    with _lock:
+        _maxSize = maxSize
+        _evict()
+
+def clear():
+    """
+     Remove all the plans from the registry and reset the statistics.
+     The plans remain valid for the users still having them.
+
+    """
+    global _hits,_misses,_evictions
+    with _lock:
+        _plans.clear()
+        _hits = 0
+        _misses = 0
+        _evictions = 0
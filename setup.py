@@ -1,7 +1,10 @@
 #from distutils.core import setup, Extension
 from setuptools import setup, Extension,find_packages
+from setuptools.command.build_ext import build_ext
 from distutils.util import convert_path
+import copy
 import glob
+import platform
 import numpy
 import sys
 import os
@@ -19,7 +22,10 @@ includes = [os.path.join(ROOT,"Include"),os.path.join(ROOT,"PrivateInclude"),os.
 if sys.platform == 'win32':
   cflags = ["-DWIN","-DCMSISDSP","-DUNALIGNED_SUPPORT_DISABLE"] 
 else:
-  cflags = ["-Wno-attributes","-Wno-unused-function","-Wno-unused-variable","-Wno-implicit-function-declaration","-DCMSISDSP","-D__GNUC_PYTHON__"]
+  # float16_t is defined by the wrapper (cmsisdsp_f16.h) for hosts
+  # without __fp16
+  cflags = ["-Wno-attributes","-Wno-unused-function","-Wno-unused-variable","-Wno-implicit-function-declaration","-DCMSISDSP","-D__GNUC_PYTHON__",
+            "-include","cmsisdsp_f16.h"]
 
 transform = glob.glob(os.path.join(ROOT,"Source","TransformFunctions","*.c"))
 
@@ -44,6 +50,7 @@ except:
 fastmath = glob.glob(os.path.join(ROOT,"Source","FastMathFunctions","*.c"))
 try:
   fastmath.remove(os.path.join(ROOT,"Source","FastMathFunctions","FastMathFunctions.c"))
+  fastmath.remove(os.path.join(ROOT,"Source","FastMathFunctions","FastMathFunctionsF16.c"))
 except:
   pass
 
@@ -184,19 +191,28 @@ def isnotmissing(src):
   name=os.path.splitext(os.path.basename(src))[0]
   return(not (name in missing))
 
+def withf16(number):
+  return(True)
+
+# The f16 functions are only wrapped for some modules and when the
+# compiler is supporting _Float16 (ARM_FLOAT16_SUPPORTED). Otherwise the
+# f16 sources are empty.
 # If there are too many files, the linker command is failing on Windows.
-# So f16 functions are removed since they are not currently available in the wrapper.
+# So f16 functions are removed on Windows (they are not supported by
+# MSVC).
 # A next version will have to structure this wrapper more cleanly so that the
 # build can work even with more functions
+if sys.platform == 'win32':
+  withf16 = notf16
 
-filtering = list(filter(isnotmissing,list(filter(notf16, filteringMod))))
-matrix = list(filter(isnotmissing,list(filter(notf16, matrixMod))))
-support = list(filter(isnotmissing,list(filter(notf16, supportMod))))
-statistics = list(filter(isnotmissing,list(filter(notf16, statisticsMod))))
+filtering = list(filter(isnotmissing,list(filter(withf16, filteringMod))))
+matrix = list(filter(isnotmissing,list(filter(withf16, matrixMod))))
+support = list(filter(isnotmissing,list(filter(withf16, supportMod))))
+statistics = list(filter(isnotmissing,list(filter(withf16, statisticsMod))))
 complexf = list(filter(isnotmissing,list(filter(notf16, complexfMod))))
-basic = list(filter(isnotmissing,list(filter(notf16, basicMod))))
+basic = list(filter(isnotmissing,list(filter(withf16, basicMod))))
 controller = list(filter(isnotmissing,list(filter(notf16, controllerMod))))
-transform = list(filter(isnotmissing,list(filter(notf16, transformMod))))
+transform = list(filter(isnotmissing,list(filter(withf16, transformMod))))
 interpolation = list(filter(isnotmissing,list(filter(notf16, interpolationMod))))
 quaternion = list(filter(isnotmissing,list(filter(notf16, quaternionMod))))
 fastmath = list(filter(isnotmissing,list(filter(notf16, fastmathMod))))
@@ -239,8 +255,131 @@ moduleBayes = mkModule('cmsisdsp_bayes',bayes,"BayesFunctions",flagsForCommonWit
 moduleSVM = mkModule('cmsisdsp_svm',svm,"SVMFunctions",flagsForCommonWithoutFFT)
 moduleWindow = mkModule('cmsisdsp_window',window,"WindowFunctions",flagsForCommonWithoutFFT)
 
-
-
+defaultModules = [moduleFiltering ,
+                  moduleMatrix,
+                  moduleSupport,
+                  moduleStatistics,
+                  moduleComplexf,
+                  moduleBasic,
+                  moduleController,
+                  moduleTransform,
+                  moduleInterpolation, 
+                  moduleQuaternion,
+                  moduleFastmath,
+                  moduleDistance,
+                  moduleBayes,
+                  moduleSVM,
+                  moduleWindow
+                  ]
+
+# Host SIMD variants of the modules.
+# The variants are built when the environment variable CMSISDSP_HOST_SIMD
+# is set : 1 for all the variants of the host architecture or a comma
+# separated list of variants (like avx2).
+# The best variant supported by the CPU is selected when the module is
+# loaded (cmsisdsp/_cpu.py) and the default module is used otherwise.
+# The x86 variants are only enabling the auto-vectorization for wider
+# vectors : the operations and their order are the same so the
+# results are the same as the default modules.
+# The neon variant is using the Neon code of CMSIS-DSP.
+if sys.platform == 'win32':
+  simdFlags = {"avx2" : ["/arch:AVX2"],
+               "avx512" : ["/arch:AVX512"]}
+else:
+  simdFlags = {"avx2" : ["-mavx2","-ffp-contract=off"],
+               "avx512" : ["-mavx512f","-mavx512bw","-mavx512dq","-mavx512vl","-ffp-contract=off"],
+               "neon" : ["-DARM_MATH_NEON"]}
+
+hostVariants = {"x86_64" : ["avx2","avx512"],
+                "amd64" : ["avx2","avx512"],
+                "aarch64" : ["neon"],
+                "arm64" : ["neon"]}
+
+def simdVariants():
+  selected = os.environ.get("CMSISDSP_HOST_SIMD","").strip().lower()
+  if selected in ["","0","no","none"]:
+     return([])
+  if selected in ["1","yes","all"]:
+     return(hostVariants.get(platform.machine().lower(),[]))
+  variants = [x.strip() for x in selected.split(",")]
+  for v in variants:
+      if not v in simdFlags:
+         print('setup.py: Error: Unknown SIMD variant %s' % v, file=sys.stderr)
+         sys.exit(1)
+  return(variants)
+
+def mkVariant(module,variant):
+  name = "%s_%s" % (module.name,variant)
+  ext = copy.deepcopy(module)
+  ext.name = name
+  ext.define_macros = ext.define_macros + [("MODINITNAME",name)]
+  ext.extra_compile_args = ext.extra_compile_args + simdFlags[variant]
+  ext.simdVariant = variant
+  return(ext)
+
+variantModules = [mkVariant(m,v) for v in simdVariants() for m in defaultModules]
+
+class build_ext_variants(build_ext):
+  """The variants are compiling the same sources as the default
+     modules with other flags. Their objects are built in
+     their own folder."""
+  def build_extension(self,ext):
+      variant = getattr(ext,"simdVariant",None)
+      if variant is None:
+         return(build_ext.build_extension(self,ext))
+      cmd = copy.copy(self)
+      cmd.build_temp = os.path.join(self.build_temp,variant)
+      return(build_ext.build_extension(cmd,ext))
+
+
+
+
+# Order of the modules in the package. When a name is defined
+# by several modules, the last one is used (like with the
+# previous "from module import *" in cmsisdsp/__init__.py)
+wrapperModules = ["filtering","matrix","support","statistics",
+  "complexf","basic","controller","transform","interpolation",
+  "quaternion","fastmath","distance","bayes","svm","window"]
+
+def genIndex():
+  """Generate cmsisdsp/_index.py : the module defining each function
+     and type of the wrapper. It is used by cmsisdsp/__init__.py to load
+     an extension module only when one of its names is used.
+     The index is not generated if the C sources are not available."""
+  srcDir = os.path.join(ROOT,"PythonWrapper","cmsisdsp_pkg","src")
+  index = {}
+  for m in wrapperModules:
+      name = "cmsisdsp_%s" % m
+      src = os.path.join(srcDir,"%s.c" % name)
+      if not os.path.exists(src):
+         return
+      with open(src) as f:
+           code = f.read()
+      code = re.sub(r"/\*.*?\*/","",code,flags=re.S)
+      code = re.sub(r"//.*","",code)
+      table = re.search(r"PyMethodDef\s+CMSISDSPMethods\[\]\s*=\s*\{(.*?)\{NULL",code,flags=re.S)
+      names = re.findall(r'\{\s*"(\w+)"',table.group(1)) if table else []
+      names += re.findall(r"^\s*ADDTYPE\((\w+)\)",code,flags=re.M)
+      for n in names:
+          index[n] = name
+
+  lines = ["# Generated by setup.py. Do not edit.",
+           "# Extension module defining each name of the cmsisdsp package.",
+           "",
+           "MODULES = [%s]" % ",\n           ".join(['"cmsisdsp_%s"' % m for m in wrapperModules]),
+           "",
+           "INDEX = {"]
+  lines += ['  "%s" : "%s",' % (n,index[n]) for n in sorted(index)]
+  lines += ["}",""]
+  content = "\n".join(lines)
+
+  dst = os.path.join(ROOT,"cmsisdsp","_index.py")
+  if os.path.exists(dst):
+     with open(dst) as f:
+          if f.read() == content:
+             return
+  with open(dst,"w") as f:
+       f.write(content)
 
 def build():
   if sys.version_info.major < 3:
@@ -252,6 +391,8 @@ def build():
   with open(ver_path) as ver_file:
       exec(ver_file.read(), main_ns)
 
+  genIndex()
+
   setup (name = 'cmsisdsp',
          version = main_ns['__version__'],
          packages=["cmsisdsp",
@@ -263,22 +404,8 @@ def build():
          description = 'CMSIS-DSP Python API',
          long_description=open("PythonWrapper_README.md").read(),
          long_description_content_type='text/markdown',
-         ext_modules = [moduleFiltering ,
-                        moduleMatrix,
-                        moduleSupport,
-                        moduleStatistics,
-                        moduleComplexf,
-                        moduleBasic,
-                        moduleController,
-                        moduleTransform,
-                        moduleInterpolation, 
-                        moduleQuaternion,
-                        moduleFastmath,
-                        moduleDistance,
-                        moduleBayes,
-                        moduleSVM,
-                        moduleWindow
-                        ],
+         ext_modules = defaultModules + variantModules,
+         cmdclass = {"build_ext" : build_ext_variants},
          include_package_data=True,
          author = 'Copyright (C) 2010-2022 ARM Limited or its affiliates. All rights reserved.',
          author_email = 'christophe.favergeon@arm.com',